@@ -0,0 +1,3 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Performance benchmarks of the Intersector operations."""
@@ -0,0 +1,100 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Benchmark the cost of a log call in the section loop.
+
+Emits the per-plane message of ``intersect_with_plane`` many times with each
+logging setup of :func:`intersector.utils.logger.setup_logging`, writing to
+``os.devnull``, and prints the time per call seen by the loop and the time
+per call including the listener thread draining the queue.
+
+Example:
+    python -m benchmarks.logging_overhead --calls 20000
+
+"""
+
+import logging
+import os
+import time
+from contextlib import redirect_stderr, redirect_stdout
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from intersector.utils.logger import setup_logging, stop_logging
+
+console = Console()
+
+# Setup name -> (log format, queued, whether the message level is enabled).
+SETUPS = {
+    "rich": ("rich", False, True),
+    "rich, queued": ("rich", True, True),
+    "json": ("json", False, True),
+    "json, queued": ("json", True, True),
+    "below level": ("rich", False, False),
+}
+
+MESSAGE = "✂️  Intersecting shape with plane at (%s,%s,%s) normal (%s,%s,%s)"
+
+
+def log_overhead(setup: str, calls: int) -> dict:
+    """Time ``calls`` log calls with one logging setup.
+
+    Returns:
+        dict: The setup name and the microseconds per call seen by the loop
+            (``loop_us``) and until every record is written (``total_us``).
+
+    """
+    log_format, queued, enabled = SETUPS[setup]
+    log = logging.getLogger("intersector.operations.intersect")
+    emit = log.info if enabled else log.debug
+
+    with (
+        open(os.devnull, "w", encoding="utf-8") as devnull,
+        redirect_stdout(devnull),
+        redirect_stderr(devnull),
+    ):
+        setup_logging(log_format=log_format, queued=queued, stream=devnull)
+        start = time.perf_counter()
+        for i in range(calls):
+            emit(MESSAGE, 0.0, 0.0, float(i), 0.0, 0.0, 1.0)
+        loop = time.perf_counter() - start
+        stop_logging()
+        total = time.perf_counter() - start
+
+    return {
+        "setup": setup,
+        "loop_us": loop / calls * 1e6,
+        "total_us": total / calls * 1e6,
+    }
+
+
+@click.command()
+@click.option(
+    "--calls",
+    type=click.IntRange(min=1),
+    default=20000,
+    show_default=True,
+    help="Number of log calls per setup.",
+)
+def main(calls: int):
+    """Run the logging benchmark and print the cost of each setup.
+
+    Args:
+        calls (int): Number of log calls per setup.
+
+    """
+    rows = [log_overhead(setup, calls) for setup in SETUPS]
+    setup_logging()
+
+    table = Table(title=f"Log call cost ({calls} calls)")
+    table.add_column("Setup")
+    table.add_column("Loop µs/call", justify="right")
+    table.add_column("Total µs/call", justify="right")
+    for row in rows:
+        table.add_row(row["setup"], f"{row['loop_us']:.2f}", f"{row['total_us']:.2f}")
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
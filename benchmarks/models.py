@@ -0,0 +1,119 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Synthetic models of controlled complexity for the benchmarks.
+
+Every generator lays its bodies out on a grid in the XY plane, all spanning
+``0 <= z <= SIZE``, so a horizontal plane at mid-height crosses every body.
+"""
+
+import math
+
+from OCC.Core.BRep import BRep_Builder
+from OCC.Core.BRepFilletAPI import BRepFilletAPI_MakeFillet
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
+from OCC.Core.gp import gp_Pnt
+from OCC.Core.TopAbs import TopAbs_EDGE, TopAbs_FACE
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopoDS import TopoDS_Compound, topods
+
+SIZE = 10.0
+GAP = 5.0
+
+
+def count_faces(shape) -> int:
+    """Return the number of faces of a shape.
+
+    Returns:
+        int: The number of faces.
+
+    """
+    count = 0
+    explorer = TopExp_Explorer(shape, TopAbs_FACE)
+    while explorer.More():
+        count += 1
+        explorer.Next()
+    return count
+
+
+def _compound(shapes):
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    for shape in shapes:
+        builder.Add(compound, shape)
+    return compound
+
+
+def _grid(count: int):
+    """Yield the corner of each of ``count`` cells of a square grid.
+
+    Yields:
+        gp_Pnt: The lower corner of the next cell.
+
+    """
+    side = math.ceil(math.sqrt(count))
+    for i in range(count):
+        row, col = divmod(i, side)
+        yield gp_Pnt(col * (SIZE + GAP), row * (SIZE + GAP), 0.0)
+
+
+def _box(corner):
+    return BRepPrimAPI_MakeBox(corner, SIZE, SIZE, SIZE).Shape()
+
+
+def _filleted_box(corner, radius: float):
+    box = _box(corner)
+    fillet = BRepFilletAPI_MakeFillet(box)
+    explorer = TopExp_Explorer(box, TopAbs_EDGE)
+    while explorer.More():
+        fillet.Add(radius, topods.Edge(explorer.Current()))
+        explorer.Next()
+    return fillet.Shape()
+
+
+def boxes(count: int):
+    """Build a compound of ``count`` boxes (6 faces each).
+
+    Returns:
+        TopoDS_Compound: The boxes.
+
+    """
+    return _compound(_box(corner) for corner in _grid(count))
+
+
+def filleted(count: int, radius: float = SIZE / 5):
+    """Build a compound of ``count`` boxes with all edges filleted.
+
+    Each body has 26 faces, most of them cylindrical or spherical.
+
+    Returns:
+        TopoDS_Compound: The filleted boxes.
+
+    """
+    return _compound(_filleted_box(corner, radius) for corner in _grid(count))
+
+
+def assembly(depth: int, fanout: int = 2):
+    """Build nested compounds ``depth`` levels deep around box leaves.
+
+    Each level groups ``fanout`` sub-assemblies, giving ``fanout ** depth``
+    boxes in total.
+
+    Returns:
+        TopoDS_Compound: The assembly.
+
+    """
+    leaves = [_box(corner) for corner in _grid(fanout**depth)]
+    for _ in range(depth):
+        leaves = [
+            _compound(leaves[i : i + fanout]) for i in range(0, len(leaves), fanout)
+        ]
+    return leaves[0]
+
+
+# Model family name: (generator, sizes of the full and of the quick suite).
+MODELS = {
+    "boxes": (boxes, [1, 4, 16, 64, 256], [1, 4, 16]),
+    "filleted": (filleted, [1, 4, 16, 64], [1, 4]),
+    "assembly": (assembly, [1, 3, 5, 7], [1, 3]),
+}
@@ -0,0 +1,419 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Benchmark the STEP and section operations on synthetic models.
+
+Times ``export_step``, ``read_step``, ``intersect_with_plane``,
+``is_intersection_valid`` and ``TriangleMesh.from_shape`` on every model of
+:mod:`benchmarks.models`, prints the throughput and scaling of each
+operation, and saves the results as JSON. A previous results file can be
+given to flag regressions. Each run uses one or more OpenCascade execution
+policies; with both ``serial`` and ``parallel`` the speedup is reported.
+
+Example:
+    python -m benchmarks.run --quick --output bench.json
+    python -m benchmarks.run --compare bench.json
+    python -m benchmarks.run --policy serial --policy parallel
+
+"""
+
+import json
+import logging
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from importlib import metadata
+
+import click
+from OCC.Core.BRepTools import breptools
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.models import MODELS, SIZE, count_faces
+from intersector.operations.intersect import (
+    intersect_with_plane,
+    is_intersection_valid,
+)
+from intersector.operations.mesh_slicing import TriangleMesh
+from intersector.utils.execution import ExecutionPolicy, set_policy
+from intersector.utils.file_handler import export_step, read_step
+
+console = Console()
+
+OPERATIONS = [
+    "export_step",
+    "read_step",
+    "intersect_with_plane",
+    "is_intersection_valid",
+    "mesh_from_shape",
+]
+
+# Execution policies a run can be repeated with.
+POLICIES = {
+    "serial": ExecutionPolicy(),
+    "parallel": ExecutionPolicy(threads=0, parallel_booleans=True, parallel_mesh=True),
+}
+
+
+def measure(fn, repeat: int) -> list[float]:
+    """Call ``fn`` ``repeat`` times.
+
+    Returns:
+        list[float]: The duration of each call, in seconds.
+
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def scaling_exponent(faces, seconds) -> float | None:
+    """Fit ``seconds ~ faces ** k`` by least squares in log-log space.
+
+    Returns:
+        float | None: The exponent ``k``, or None with fewer than two points.
+
+    """
+    points = [
+        (math.log(f), math.log(s))
+        for f, s in zip(faces, seconds, strict=True)
+        if f and s
+    ]
+    if len({x for x, _ in points}) < 2:  # noqa: PLR2004
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    num = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    den = sum((x - mean_x) ** 2 for x, _ in points)
+    return num / den
+
+
+def _record(  # noqa: PLR0913, PLR0917
+    model: str, size: int, faces: int, operation: str, policy: str, times
+) -> dict:
+    median = statistics.median(times)
+    return {
+        "model": model,
+        "size": size,
+        "faces": faces,
+        "operation": operation,
+        "policy": policy,
+        "repeat": len(times),
+        "median_s": median,
+        "min_s": min(times),
+        "faces_per_s": faces / median if median else None,
+    }
+
+
+def _mesh(shape) -> TriangleMesh:
+    """Tessellate a shape from scratch, dropping its previous triangulation.
+
+    Returns:
+        TriangleMesh: The mesh of the shape.
+
+    """
+    breptools.Clean(shape)
+    return TriangleMesh.from_shape(shape)
+
+
+def bench_model(  # noqa: PLR0913, PLR0917
+    model: str, size: int, repeat: int, workdir: str, policy: str = "serial"
+) -> list[dict]:
+    """Benchmark every operation on one model under one execution policy.
+
+    Returns:
+        list[dict]: One record per operation.
+
+    """
+    set_policy(POLICIES[policy])
+    generator = MODELS[model][0]
+    shape = generator(size)
+    faces = count_faces(shape)
+    path = os.path.join(workdir, f"{model}_{size}.stp")
+    point, normal = (0.0, 0.0, SIZE / 2), (0.0, 0.0, 1.0)
+    section = intersect_with_plane(shape, point, normal)
+
+    timed = {
+        "export_step": lambda: export_step(shape, path),
+        "read_step": lambda: read_step(path),
+        "intersect_with_plane": lambda: intersect_with_plane(shape, point, normal),
+        "is_intersection_valid": lambda: is_intersection_valid(section),
+        "mesh_from_shape": lambda: _mesh(shape),
+    }
+    return [
+        _record(
+            model, size, faces, operation, policy, measure(timed[operation], repeat)
+        )
+        for operation in OPERATIONS
+    ]
+
+
+def scaling(results) -> list[dict]:
+    """Fit the scaling exponent of each operation on each model family.
+
+    Returns:
+        list[dict]: One ``{"model", "operation", "policy", "exponent"}`` per
+            model, operation and policy.
+
+    """
+    curves = {}
+    for r in results:
+        key = (r["model"], r["operation"], r.get("policy", "serial"))
+        curves.setdefault(key, []).append(r)
+    return [
+        {
+            "model": model,
+            "operation": operation,
+            "policy": policy,
+            "exponent": scaling_exponent(
+                [r["faces"] for r in rows], [r["median_s"] for r in rows]
+            ),
+        }
+        for (model, operation, policy), rows in curves.items()
+    ]
+
+
+def speedup(results) -> list[dict]:
+    """Compare the parallel results with the serial ones of the same run.
+
+    Returns:
+        list[dict]: ``{"model", "size", "operation", "speedup"}`` for every
+            result measured under both policies, ``speedup`` being the
+            serial over the parallel median time.
+
+    """
+    serial = {
+        (r["model"], r["size"], r["operation"]): r
+        for r in results
+        if r.get("policy", "serial") == "serial"
+    }
+    rows = []
+    for r in results:
+        old = serial.get((r["model"], r["size"], r["operation"]))
+        if r.get("policy") != "parallel" or not old or not r["median_s"]:
+            continue
+        rows.append(
+            {
+                "model": r["model"],
+                "size": r["size"],
+                "operation": r["operation"],
+                "speedup": old["median_s"] / r["median_s"],
+            }
+        )
+    return rows
+
+
+def compare(results, baseline, threshold: float) -> list[dict]:
+    """Match results with a baseline and flag the slower ones.
+
+    Args:
+        results (list[dict]): Current results.
+        baseline (list[dict]): Results of a previous run.
+        threshold (float): Slowdown ratio above which a result regressed.
+
+    Returns:
+        list[dict]: ``{"model", "size", "operation", "policy", "ratio",
+            "regressed"}`` for every result also present in the baseline.
+
+    """
+
+    def key(r):
+        return r["model"], r["size"], r["operation"], r.get("policy", "serial")
+
+    previous = {key(r): r for r in baseline}
+    rows = []
+    for r in results:
+        old = previous.get(key(r))
+        if not old or not old["median_s"]:
+            continue
+        ratio = r["median_s"] / old["median_s"]
+        rows.append(
+            {
+                "model": r["model"],
+                "size": r["size"],
+                "operation": r["operation"],
+                "policy": r.get("policy", "serial"),
+                "ratio": ratio,
+                "regressed": ratio > threshold,
+            }
+        )
+    return rows
+
+
+def _environment() -> dict:
+    try:
+        version = metadata.version("intersector")
+    except metadata.PackageNotFoundError:
+        version = None
+    return {
+        "intersector": version,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+
+
+def _print_results(results, curves) -> None:
+    table = Table(title="Benchmark results")
+    columns = ("model", "size", "faces", "operation", "policy", "median ms", "faces/s")
+    for column in columns:
+        table.add_column(
+            column,
+            justify="left" if column in {"model", "operation", "policy"} else "right",
+        )
+    for r in results:
+        table.add_row(
+            r["model"],
+            str(r["size"]),
+            str(r["faces"]),
+            r["operation"],
+            r["policy"],
+            f"{r['median_s'] * 1000:.2f}",
+            f"{r['faces_per_s']:.0f}" if r["faces_per_s"] else "-",
+        )
+    console.print(table)
+
+    table = Table(title="Scaling exponent (time ~ faces^k)")
+    for column in ("model", "operation", "policy", "k"):
+        table.add_column(column)
+    for c in curves:
+        k = c["exponent"]
+        table.add_row(
+            c["model"], c["operation"], c["policy"], "-" if k is None else f"{k:.2f}"
+        )
+    console.print(table)
+
+
+def _print_speedup(rows) -> None:
+    table = Table(title="Parallel speedup (serial / parallel time)")
+    for column in ("model", "size", "operation", "speedup"):
+        table.add_column(column)
+    for row in rows:
+        style = "green" if row["speedup"] > 1 else "red"
+        table.add_row(
+            row["model"],
+            str(row["size"]),
+            row["operation"],
+            f"[{style}]x{row['speedup']:.2f}[/{style}]",
+        )
+    console.print(table)
+
+
+def _print_comparison(rows, threshold: float) -> None:
+    table = Table(title=f"Comparison with baseline (regression above x{threshold:g})")
+    for column in ("model", "size", "operation", "policy", "ratio"):
+        table.add_column(column)
+    for row in rows:
+        style = "red" if row["regressed"] else "green"
+        table.add_row(
+            row["model"],
+            str(row["size"]),
+            row["operation"],
+            row["policy"],
+            f"[{style}]x{row['ratio']:.2f}[/{style}]",
+        )
+    console.print(table)
+
+
+@click.command()
+@click.option(
+    "--output",
+    default="benchmarks.json",
+    show_default=True,
+    help="JSON file the results are written to.",
+)
+@click.option(
+    "--model",
+    "models",
+    multiple=True,
+    type=click.Choice(sorted(MODELS)),
+    help="Model family to benchmark. Can be repeated (default: all).",
+)
+@click.option("--quick", is_flag=True, help="Benchmark the small models only.")
+@click.option("--repeat", type=click.IntRange(min=1), default=5, show_default=True)
+@click.option(
+    "--policy",
+    "policies",
+    multiple=True,
+    type=click.Choice(sorted(POLICIES)),
+    help="OpenCascade execution policy. Can be repeated (default: serial).",
+)
+@click.option(
+    "--compare",
+    "baseline",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Results of a previous run to compare against.",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=1.0),
+    default=1.25,
+    show_default=True,
+    help="Slowdown ratio reported as a regression with --compare.",
+)
+def main(  # noqa: PLR0913, PLR0917
+    output, models, quick, repeat, policies, baseline, threshold
+):
+    """Run the benchmarks and save their results.
+
+    Args:
+        output (str): JSON file the results are written to.
+        models (tuple[str, ...]): Model families to benchmark.
+        quick (bool): Whether to benchmark the small models only.
+        repeat (int): Number of timed calls per operation.
+        policies (tuple[str, ...]): Execution policies to run with.
+        baseline (str | None): Results file to compare against.
+        threshold (float): Slowdown ratio reported as a regression.
+
+    Raises:
+        SystemExit: With status 1 if a result regressed against the baseline.
+
+    """
+    logging.getLogger("intersector").setLevel(logging.WARNING)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="intersector-bench-") as workdir:
+        for model in models or MODELS:
+            _, full, small = MODELS[model]
+            for size in small if quick else full:
+                for policy in policies or ["serial"]:
+                    console.print(f"⏱️  {model} x{size} ({policy})")
+                    results.extend(bench_model(model, size, repeat, workdir, policy))
+
+    curves = scaling(results)
+    speedups = speedup(results)
+    _print_results(results, curves)
+    if speedups:
+        _print_speedup(speedups)
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "environment": _environment(),
+                "results": results,
+                "scaling": curves,
+                "speedup": speedups,
+            },
+            f,
+            indent=2,
+        )
+    console.print(f"✅ [green]Results written to [bold]{output}[/bold][/green]")
+
+    if baseline:
+        with open(baseline, encoding="utf-8") as f:
+            rows = compare(results, json.load(f)["results"], threshold)
+        _print_comparison(rows, threshold)
+        if any(row["regressed"] for row in rows):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Session-based Python API for embedding intersector in services.
+
+An :class:`Intersector` session owns the shapes it loads, the STEP cache, a
+thread running the OpenCascade work on those shapes and, once output files
+are requested, a pool of worker processes. Its coroutines hand the work to
+them, so a service can await sections from its event loop without blocking
+it. Failures raise exceptions instead of returning ``None`` or ``False``.
+
+Closing the session, or leaving its ``with`` / ``async with`` block, drops
+every shape and section from the OpenCascade thread, stops the workers and
+removes their resident BRep files, so the OpenCascade memory is released at
+a known point rather than whenever the session is garbage collected.
+
+Example:
+    async with Intersector() as session:
+        part = await session.load("part.stp")
+        edges = await session.section(part, ["0,0,10:0,0,1"])
+        svg = await session.export(part, ["0,0,10:0,0,1"], fmt="svg")
+
+"""
+
+import asyncio
+import gc
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from intersector.operations.session import SectionSession
+from intersector.server import check_section_options, section_job
+from intersector.utils.execution import current_policy, set_policy
+from intersector.utils.file_handler import read_step, shape_to_bytes
+from intersector.utils.plane_sets import parse_plane_list
+
+log = logging.getLogger(__name__)
+
+
+class Intersector:
+    """Session owning loaded shapes, their section state and the workers.
+
+    Sections run on a single OpenCascade thread, one after the other, and
+    reuse the face index and recent results of each shape (see
+    :class:`SectionSession`). Exports run in the worker processes, which
+    keep the shapes resident between calls. Unloading or replacing a shape
+    removes its BRep file once the exports in flight are done with it, and
+    each worker drops its copy of the shape at its next export.
+
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        cache=None,
+        max_cached: int = 64,
+        executor=None,
+    ):
+        """Create a session.
+
+        Args:
+            workers (int | None): Size of the export process pool. Defaults
+                to one process per CPU.
+            cache (StepCache | None): STEP cache used when loading shapes.
+            max_cached (int): Number of recent sections kept per shape.
+            executor (concurrent.futures.Executor | None): Executor running
+                the export jobs instead of the process pool.
+
+        Raises:
+            ValueError: If ``max_cached`` is negative.
+
+        """
+        if max_cached < 0:
+            raise ValueError("Number of cached sections cannot be negative")
+
+        self._workers = workers
+        self._cache = cache
+        self._max_cached = max_cached
+        self._pool = executor
+        self._occ = ThreadPoolExecutor(1, thread_name_prefix="intersector-occ")
+        self._shapes = {}
+        self._dir = None
+        self._closed = False
+
+    @property
+    def shapes(self) -> list[str]:
+        """The ids of the loaded shapes, sorted."""
+        return sorted(self._shapes)
+
+    def shape(self, shape_id: str):
+        """Return a loaded shape.
+
+        Args:
+            shape_id (str): The shape id.
+
+        Returns:
+            TopoDS_Shape: The shape.
+
+        """
+        return self._entry(shape_id)["shape"]
+
+    def _entry(self, shape_id: str) -> dict:
+        """Return the state of a loaded shape.
+
+        Returns:
+            dict: The shape, its source path, section session, BRep file,
+                number of exports in flight and whether it was unloaded.
+
+        Raises:
+            RuntimeError: If the session is closed.
+            KeyError: If no shape is loaded under ``shape_id``.
+
+        """
+        if self._closed:
+            raise RuntimeError("The session is closed")
+        if shape_id not in self._shapes:
+            raise KeyError(f"Unknown shape id: {shape_id!r}")
+        return self._shapes[shape_id]
+
+    async def _run_occ(self, fn, *args):
+        """Run ``fn(*args)`` on the OpenCascade thread.
+
+        Returns:
+            Any: The return value of ``fn``.
+
+        Raises:
+            RuntimeError: If the session is closed.
+
+        """
+        if self._closed:
+            raise RuntimeError("The session is closed")
+        return await asyncio.get_running_loop().run_in_executor(self._occ, fn, *args)
+
+    def _read(self, path: str):
+        """Read a STEP file on the OpenCascade thread.
+
+        Returns:
+            TopoDS_Shape: The shape.
+
+        Raises:
+            ValueError: If the STEP file cannot be read.
+
+        """
+        shape = read_step(path, cache=self._cache)
+        if shape is None:
+            raise ValueError(f"Failed to read STEP file: '{path}'")
+        return shape
+
+    async def load(self, path: str, shape_id: str | None = None) -> str:
+        """Load a STEP file, replacing any shape loaded under the same id.
+
+        Args:
+            path (str): Path to the STEP file.
+            shape_id (str | None): Id of the shape. Defaults to the file stem.
+
+        Returns:
+            str: The shape id.
+
+        """
+        shape_id = shape_id or os.path.splitext(os.path.basename(path))[0]
+        shape = await self._run_occ(self._read, path)
+        previous = self._shapes.get(shape_id)
+        self._shapes[shape_id] = {
+            "shape": shape,
+            "path": path,
+            "session": None,
+            "brep": None,
+            "exports": 0,
+            "released": False,
+        }
+        if previous:
+            await self._drop(previous)
+
+        log.info("📦 Loaded shape '%s' from %s", shape_id, path)
+        return shape_id
+
+    async def unload(self, shape_id: str) -> None:
+        """Drop a shape and release its OpenCascade memory.
+
+        The workers' copies of the shape are dropped at their next export,
+        or when the session is closed.
+
+        Args:
+            shape_id (str): The shape id.
+
+        """
+        entry = self._entry(shape_id)
+        del self._shapes[shape_id]
+        await self._drop(entry)
+
+    async def _drop(self, entry: dict) -> None:
+        """Release an unloaded shape, unless exports still use its BRep file.
+
+        The last export in flight releases it instead.
+
+        """
+        entry["released"] = True
+        if not entry["exports"]:
+            await self._run_occ(self._release, [entry])
+
+    def _sections(self, entry: dict, planes) -> list:
+        """Section a shape on the OpenCascade thread.
+
+        Returns:
+            list[TopoDS_Shape]: The section of each plane.
+
+        """
+        if entry["session"] is None:
+            entry["session"] = SectionSession(
+                entry["shape"], max_cached=self._max_cached
+            )
+        return [entry["session"].section(point, normal) for point, normal in planes]
+
+    async def section(self, shape_id: str, planes) -> list:
+        """Intersect a loaded shape with planes.
+
+        Args:
+            shape_id (str): The shape id.
+            planes (list): Planes as ``'x,y,z:nx,ny,nz'`` strings or
+                ``(point, normal)`` pairs.
+
+        Returns:
+            list[TopoDS_Shape]: The section edges of each plane, in order;
+                an empty compound where a plane misses the shape.
+
+        """
+        entry = self._entry(shape_id)
+        planes = parse_plane_list(planes)
+        return await self._run_occ(self._sections, entry, planes)
+
+    def _write_brep(self, entry: dict) -> str:
+        """Store a shape as the BRep file the workers load it from.
+
+        Returns:
+            str: The BRep path.
+
+        """
+        if entry["brep"] is None:
+            if self._dir is None:
+                self._dir = tempfile.mkdtemp(prefix="intersector-session-")
+            path = os.path.join(self._dir, f"{uuid.uuid4().hex}.brep")
+            with open(path, "wb") as f:
+                f.write(shape_to_bytes(entry["shape"]))
+            entry["brep"] = path
+        return entry["brep"]
+
+    async def export(  # noqa: PLR0913, PLR0917
+        self,
+        shape_id: str,
+        planes,
+        fmt: str = "json",
+        engine: str = "brep",
+        deflection: float = 0.01,
+        combine: bool = True,
+    ) -> list[bytes]:
+        """Section a loaded shape in the worker pool and write the results.
+
+        Args:
+            shape_id (str): The shape id.
+            planes (list): Planes as ``'x,y,z:nx,ny,nz'`` strings or
+                ``(point, normal)`` pairs.
+            fmt (str): Output format: ``json``, ``npz``, ``svg``, ``dxf`` or
+                ``step``.
+            engine (str): ``brep`` or ``mesh``.
+            deflection (float): Polyline sampling and tessellation deflection.
+            combine (bool): Whether to write all sections into one output.
+
+        Returns:
+            list[bytes]: The content of the file the CLI would write, once
+                for all planes with ``combine``, otherwise once per plane.
+
+        """
+        entry = self._entry(shape_id)
+        planes = parse_plane_list(planes)
+        check_section_options(engine, fmt, deflection)
+
+        entry["exports"] += 1
+        try:
+            brep_path = await self._run_occ(self._write_brep, entry)
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    initializer=set_policy,
+                    initargs=(current_policy(),),
+                )
+            return await asyncio.get_running_loop().run_in_executor(
+                self._pool,
+                section_job,
+                brep_path,
+                planes,
+                engine,
+                fmt,
+                deflection,
+                combine,
+            )
+        finally:
+            entry["exports"] -= 1
+            if entry["released"] and not self._closed:
+                await self._drop(entry)
+
+    @staticmethod
+    def _release(entries) -> None:
+        """Drop shapes and sections on the OpenCascade thread."""
+        for entry in entries:
+            if entry["brep"]:
+                os.remove(entry["brep"])
+            entry.clear()
+        gc.collect()
+
+    def close(self) -> None:
+        """Release every shape, stop the workers and remove the BRep files.
+
+        Closing twice is a no-op. Shapes with exports still in flight are
+        dropped when those finish; their BRep files go with the session
+        directory.
+
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        entries = [entry for entry in self._shapes.values() if not entry["exports"]]
+        self._shapes.clear()
+        self._occ.submit(self._release, entries).result()
+        self._occ.shutdown()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+
+    def __enter__(self):
+        """Return the session.
+
+        Returns:
+            Intersector: This session.
+
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the session."""
+        self.close()
+
+    async def __aenter__(self):
+        """Return the session.
+
+        Returns:
+            Intersector: This session.
+
+        """
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the session without blocking the event loop."""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
@@ -1,26 +1,823 @@
 # Copyright (c) 2025 Yannis Arapakis
 # Licensed under the MIT License. See LICENSE file for details.
-"""Command-line interface for simple OpenCascade CAD operations."""
+"""Command-line interface for simple OpenCascade CAD operations.
+
+OpenCascade, NumPy and the display backend are only imported inside the code
+paths that need them, so ``--help`` and input validation errors return
+without paying their import cost.
+"""
+
+import os
 
 import click
 from rich.console import Console
 
-from intersector.operations.intersect import intersect_with_plane, is_intersection_valid
-from intersector.utils.file_handler import export_step, read_step
-from intersector.utils.logger import setup_logging
-from intersector.utils.parsing import parse_plane_input
-from intersector.utils.visualization import show_shapes
+from intersector.utils import profiling
+from intersector.utils.logger import LOG_FORMATS, setup_logging, stop_logging
+from intersector.utils.parsing import (
+    AXES,
+    OUTPUT_FORMATS,
+    output_format_from_path,
+    parse_plane_input,
+    parse_vector_input,
+)
+from intersector.utils.report import summary_format_from_path
 
 console = Console()
 
 
 @click.group()
 @click.option("--verbose", is_flag=True, help="Enable verbose logging.")
+@click.option(
+    "--log-format",
+    type=click.Choice(LOG_FORMATS),
+    default="rich",
+    show_default=True,
+    help="Render log records in the terminal, or write them to standard "
+    "error as JSON lines for unattended runs.",
+)
+@click.option(
+    "--log-queue",
+    is_flag=True,
+    help="Hand log records to a background thread that formats and writes "
+    "them, so sectioning never waits for the terminal.",
+)
+@click.option(
+    "--cache-dir",
+    envvar="INTERSECTOR_CACHE_DIR",
+    show_default="~/.cache/intersector",
+    help="Directory of the cache of parsed STEP files.",
+)
+@click.option(
+    "--cache-size",
+    type=click.IntRange(min=0),
+    default=1024,
+    show_default=True,
+    help="Size cap of the STEP cache in MB; least recently used entries are "
+    "evicted beyond it.",
+)
+@click.option("--no-cache", is_flag=True, help="Always re-read STEP files.")
+@click.option(
+    "--profile",
+    type=click.Path(dir_okay=False),
+    help="Record the wall time, CPU time and peak memory of each phase, and "
+    "write them as a JSON summary to this file and as a Chrome/Perfetto trace "
+    "next to it (*.trace.json).",
+)
+@click.option(
+    "--threads",
+    type=click.IntRange(min=0),
+    help="Size of the OpenCascade thread pool used by --parallel-booleans and "
+    "--parallel-mesh (0 uses one thread per CPU). Defaults to OpenCascade's.",
+)
+@click.option(
+    "--parallel-booleans",
+    is_flag=True,
+    help="Let OpenCascade run each section on its thread pool.",
+)
+@click.option(
+    "--parallel-mesh",
+    is_flag=True,
+    help="Let OpenCascade tessellate faces in parallel (--engine mesh).",
+)
+@click.option(
+    "--memory-budget",
+    type=click.IntRange(min=1),
+    help="Memory in MB the worker processes may use together. Workers are "
+    "only started, and batch files only sectioned, while the footprint "
+    "estimated from the input size and face count fits in it.",
+)
+@click.option(
+    "--max-tasks-per-worker",
+    type=click.IntRange(min=1),
+    help="Replace each worker process after this many jobs, returning the "
+    "memory its OpenCascade heap grew to.",
+)
 @click.pass_context
-def intersector(ctx, verbose):
+def intersector(  # noqa: PLR0913, PLR0917
+    ctx,
+    verbose,
+    log_format,
+    log_queue,
+    cache_dir,
+    cache_size: int,
+    no_cache,
+    profile,
+    threads,
+    parallel_booleans,
+    parallel_mesh,
+    memory_budget,
+    max_tasks_per_worker,
+):
     """Define the main CAD command group."""
     ctx.ensure_object(dict)
-    ctx.obj["log"] = setup_logging(verbose)
+    ctx.obj["log"] = setup_logging(verbose, log_format, log_queue)
+    if log_queue:
+        ctx.call_on_close(stop_logging)
+    ctx.obj["cache_dir"] = cache_dir
+    ctx.obj["cache_size"] = cache_size
+    ctx.obj["use_cache"] = not no_cache
+    ctx.obj["memory_budget"] = memory_budget
+    ctx.obj["max_tasks_per_worker"] = max_tasks_per_worker
+
+    if threads is not None or parallel_booleans or parallel_mesh:
+        from intersector.utils.execution import ExecutionPolicy, set_policy
+
+        set_policy(ExecutionPolicy(threads, parallel_booleans, parallel_mesh))
+
+    if profile:
+        profiling.start()
+        ctx.call_on_close(lambda: _write_profile(profile))
+
+
+def _write_profile(path: str) -> None:
+    """Stop profiling, write the summary and trace, and print the summary."""
+    profiler = profiling.stop()
+    if profiler is None:
+        return
+
+    trace_path = os.path.splitext(path)[0] + ".trace.json"
+    try:
+        profiler.write(path, trace_path)
+    except OSError as e:
+        console.print(f"[red]❌ Could not write profile:[/red] {e}")
+        return
+
+    summary = profiler.summary()
+    console.print(f"⏱️  Profile ({summary['wall_s']:.3f} s total):")
+    for name, entry in summary["phases"].items():
+        rss = entry["peak_rss"]
+        console.print(
+            f"   {name:<22} x{entry['count']:<4} wall {entry['wall_s']:8.3f} s"
+            f"  cpu {entry['cpu_s']:8.3f} s"
+            + (f"  peak {rss / 2**20:7.1f} MB" if rss is not None else "")
+        )
+    console.print(f"📄 Profile written to {path} and {trace_path}")
+
+
+def _step_cache(ctx):
+    """Return the STEP cache configured on the command group.
+
+    Returns:
+        StepCache: The cache of parsed STEP files.
+
+    """
+    from intersector.utils.step_cache import DEFAULT_CACHE_DIR, StepCache
+
+    obj = ctx.find_object(dict) or {}
+    return StepCache(
+        obj.get("cache_dir") or DEFAULT_CACHE_DIR,
+        obj.get("cache_size", 1024) * 1024 * 1024,
+    )
+
+
+def _section_cache(ctx):
+    """Return the section cache configured on the command group.
+
+    It lives in the ``sections`` subdirectory of the STEP cache and has the
+    same size cap.
+
+    Returns:
+        SectionCache: The cache of section results.
+
+    """
+    from intersector.utils.section_cache import SectionCache
+    from intersector.utils.step_cache import DEFAULT_CACHE_DIR
+
+    obj = ctx.find_object(dict) or {}
+    return SectionCache(
+        os.path.join(obj.get("cache_dir") or DEFAULT_CACHE_DIR, "sections"),
+        obj.get("cache_size", 1024) * 1024 * 1024,
+    )
+
+
+def _scheduler(ctx, workers: int | None = None):
+    """Return the worker scheduler configured on the command group.
+
+    Returns:
+        MemoryScheduler: The scheduler honoring ``--memory-budget`` and
+            ``--max-tasks-per-worker``.
+
+    """
+    from intersector.utils.scheduler import MemoryScheduler
+
+    obj = ctx.find_object(dict) or {}
+    budget = obj.get("memory_budget")
+    return MemoryScheduler(
+        budget * 1024 * 1024 if budget else None,
+        workers or None,
+        obj.get("max_tasks_per_worker"),
+    )
+
+
+def _load_step(ctx, in_step: str):
+    """Read the input STEP file, through the STEP cache unless disabled.
+
+    Returns:
+        TopoDS_Shape: The loaded shape.
+
+    Raises:
+        click.ClickException: If the STEP file cannot be read.
+
+    """
+    from intersector.utils.file_handler import read_step
+
+    obj = ctx.find_object(dict) or {}
+    cache = _step_cache(ctx) if obj.get("use_cache") else None
+
+    shape = read_step(in_step, cache=cache)
+    if shape is None:
+        raise click.ClickException(f"Failed to read STEP file: '{in_step}'")
+
+    console.print("✅  [green]Input file successfully loaded![/green]")
+    return shape
+
+
+def _collect_planes(in_planes, planes_file):
+    """Parse every plane given on the command line and in a planes file.
+
+    Planes files are parsed and validated in bulk (see
+    :mod:`intersector.utils.plane_sets`), and every normal is normalized.
+
+    Returns:
+        PlaneSet: The (point, normal) pairs, command-line planes first.
+
+    Raises:
+        click.ClickException: If no plane is given or a definition is invalid.
+
+    """
+    try:
+        pairs = [parse_plane_input(p) for p in in_planes]
+    except ValueError as e:
+        raise click.ClickException(f"Invalid plane definition: {e}") from None
+
+    if not pairs and not planes_file:
+        raise click.ClickException(
+            "At least one plane is required (use --in-plane or --planes-file)."
+        )
+
+    import numpy as np
+
+    from intersector.utils.plane_sets import PlaneSet, load_planes, validate_planes
+
+    try:
+        parts = [validate_planes(pairs)]
+        if planes_file:
+            parts.append(load_planes(planes_file))
+        planes = PlaneSet(np.concatenate(parts))
+    except ValueError as e:
+        raise click.ClickException(f"Invalid plane definition: {e}") from None
+
+    if not planes:
+        raise click.ClickException(
+            "At least one plane is required (use --in-plane or --planes-file)."
+        )
+
+    return planes
+
+
+def _compute_sections(  # noqa: PLR0913, PLR0917
+    shape,
+    planes,
+    workers: int,
+    engine: str = "brep",
+    deflection: float = 0.05,
+    batch_size: int = 1,
+    scheduler=None,
+):
+    """Yield the intersection of ``shape`` with each plane, in order.
+
+    With the ``brep`` engine, a single worker runs the sections in-process;
+    more workers (or ``0`` for one per CPU) spread the planes over a process
+    pool, or the solids of the shape when there is only one plane; the
+    ``scheduler`` keeps that pool within its memory budget.
+    With several planes, the faces of the shape are indexed once so each
+    plane only sections the faces it can cross, and in-process, up to
+    ``batch_size`` parallel planes share one multi-tool boolean. The
+    ``mesh`` engine tessellates the shape once and cuts its triangles
+    instead.
+
+    Yields:
+        TopoDS_Shape | list: The section result of each plane, or its
+            segments with the ``mesh`` engine.
+
+    """
+    if engine == "mesh":
+        from intersector.operations.mesh_slicing import TriangleMesh
+
+        mesh = TriangleMesh.from_shape(shape, deflection)
+        for segments in mesh.sections(planes):
+            yield list(segments)
+        return
+
+    from intersector.operations.face_index import FaceIndex
+    from intersector.operations.intersect import (
+        intersect_with_plane,
+        intersect_with_planes,
+    )
+    from intersector.operations.parallel import (
+        intersect_with_plane_parallel,
+        intersect_with_planes_parallel,
+    )
+
+    if workers == 1 and batch_size > 1 and len(planes) > 1:
+        yield from intersect_with_planes(shape, planes, FaceIndex(shape), batch_size)
+    elif workers == 1:
+        index = FaceIndex(shape) if len(planes) > 1 else None
+        for point, normal in planes:
+            yield intersect_with_plane(shape, point, normal, index=index)
+    elif len(planes) == 1:
+        point, normal = planes[0]
+        yield intersect_with_plane_parallel(
+            shape, point, normal, workers or None, scheduler=scheduler
+        )
+    else:
+        yield from intersect_with_planes_parallel(
+            shape, planes, workers or None, scheduler=scheduler
+        )
+
+
+def _gather_sections(  # noqa: PLR0913, PLR0917
+    sections, valid, rows, summarize=None, kept=None, warn: bool = False
+):
+    """Yield the non-empty sections, summarizing every section if requested.
+
+    Args:
+        sections (Iterable[tuple]): ``(point, normal, result)`` of each plane.
+        valid (Callable): Whether a section result is non-empty.
+        rows (list): Receives the summary of every section.
+        summarize (Callable | None): ``(point, normal, result) -> dict``.
+        kept (list | None): Receives the non-empty sections as well.
+        warn (bool): Whether to report the planes missing the shape.
+
+    Yields:
+        tuple: ``(point, normal, result)`` of each non-empty section.
+
+    """
+    for point, normal, result in sections:
+        if summarize:
+            rows.append(summarize(point, normal, result))
+        # ---- Validate intersection ----
+        if valid(result):
+            if kept is not None:
+                kept.append((point, normal, result))
+            yield point, normal, result
+        elif warn:
+            console.print(
+                f"[yellow]⚠️  No intersection with plane {point}:{normal}."
+                "[/yellow]"
+            )
+
+
+def _stream_sections(  # noqa: PLR0913, PLR0917
+    in_step: str, planes, engine: str, deflection: float, sampled: bool
+):
+    """Yield the merged sections of each plane, streaming the STEP roots.
+
+    Yields:
+        TopoDS_Shape | list: The sections of each plane over all roots, as a
+            compound, or as polylines when ``sampled`` or segments with the
+            ``mesh`` engine.
+
+    """
+    from intersector.operations.streaming import section_step_streaming
+
+    yield from section_step_streaming(
+        in_step, planes, engine, deflection, polylines=sampled
+    )
+
+
+_engine_option = click.option(
+    "--engine",
+    type=click.Choice(["brep", "mesh"]),
+    default="brep",
+    show_default=True,
+    help="Section engine: exact B-rep booleans, or fast approximate cuts of a "
+    "triangle mesh (polyline formats only).",
+)
+
+
+def _output_options(default: str):
+    """Return a decorator adding the output options shared by the commands.
+
+    Args:
+        default (str): Default output file.
+
+    Returns:
+        Callable: The decorator adding ``--output``, ``--format``,
+            ``--combine``, ``--wires``, ``--faces``, ``--summary``,
+            ``--deflection`` and ``--show/--no-show``.
+
+    """
+    root, ext = os.path.splitext(default)
+    options = [
+        click.option(
+            "--output",
+            "--out-step",
+            "output",
+            default=default,
+            show_default=True,
+            help="Output file. Without --combine, several results are numbered "
+            f"(e.g. {root}_001{ext}).",
+        ),
+        click.option(
+            "--format",
+            "fmt",
+            type=click.Choice(sorted(set(OUTPUT_FORMATS.values()))),
+            help="Output format. Defaults to the one matching the --output "
+            "extension. Formats other than step write the sections sampled "
+            "into polylines.",
+        ),
+        click.option(
+            "--combine",
+            is_flag=True,
+            help="Write all results into a single file.",
+        ),
+        click.option(
+            "--wires",
+            is_flag=True,
+            help="Chain the section edges into ordered wires (one polyline "
+            "per wire in polyline formats).",
+        ),
+        click.option(
+            "--faces",
+            is_flag=True,
+            help="Assemble the closed section loops into planar faces with "
+            "holes (their outer and hole outlines in polyline formats).",
+        ),
+        click.option(
+            "--summary",
+            type=click.Path(dir_okay=False),
+            help="Write the length, area, loop count and 2D bounding box of "
+            "every section to this .json or .csv table. Without an explicit "
+            "--output or --format, only the table is written.",
+        ),
+        click.option(
+            "--deflection",
+            type=click.FloatRange(min=0, min_open=True),
+            default=0.01,
+            show_default=True,
+            help="Chordal deflection used to sample section edges into "
+            "polylines, and to tessellate the shape with --engine mesh.",
+        ),
+        click.option(
+            "--show/--no-show",
+            default=None,
+            help="Display the results in a 3D viewer. Defaults to showing them "
+            "for step output only.",
+        ),
+    ]
+
+    def decorator(command):
+        for option in reversed(options):
+            command = option(command)
+        return command
+
+    return decorator
+
+
+def _output_format(output: str, fmt, engine: str, show) -> str:
+    """Return the output format, inferred from ``output`` when not given.
+
+    Returns:
+        str: The output format name.
+
+    Raises:
+        click.ClickException: If the format cannot be inferred, or the mesh
+            engine is combined with STEP output or the viewer.
+
+    """
+    fmt = fmt or output_format_from_path(output)
+    if fmt is None:
+        raise click.ClickException(
+            f"Cannot infer the output format of '{output}'; use --format."
+        )
+    if engine == "mesh" and (fmt == "step" or show):
+        raise click.ClickException(
+            "--engine mesh only writes polyline formats (npz, json, svg, dxf) "
+            "and cannot --show."
+        )
+    return fmt
+
+
+def _sections_requested(ctx, summary) -> bool:
+    """Return whether the section files are written.
+
+    With ``--summary``, they are only written if ``--output`` or
+    ``--format`` is given explicitly.
+
+    Returns:
+        bool: True if the sections are exported.
+
+    Raises:
+        click.ClickException: If the summary file has an unknown extension.
+
+    """
+    if not summary:
+        return True
+    if summary_format_from_path(summary) is None:
+        raise click.ClickException(
+            f"Cannot write a summary to '{summary}'; use a .json or .csv file."
+        )
+    return any(
+        ctx.get_parameter_source(name) is not click.core.ParameterSource.DEFAULT
+        for name in ("output", "fmt")
+    )
+
+
+def _summarizer(engine: str, sampled: bool, deflection: float):
+    """Return the function summarizing one section result.
+
+    Returns:
+        Callable: ``(point, normal, result) -> dict``.
+
+    """
+    from intersector.operations.analytics import polyline_summary, section_summary
+
+    if engine == "mesh" or sampled:
+        return polyline_summary
+    return lambda point, normal, result: section_summary(
+        result, point, normal, deflection
+    )
+
+
+def _write_summary(rows, path: str) -> None:
+    """Write the section summaries.
+
+    Raises:
+        click.ClickException: If writing the summary fails.
+
+    """
+    from intersector.utils.report import export_summary
+
+    if not export_summary(rows, path):
+        raise click.ClickException("Failed to export section summary.") from None
+
+    console.print(
+        f"📊 [green]Summary of {len(rows)} sections saved to '{path}'.[/green]"
+    )
+
+
+def _assembly_mode(wires: bool, faces: bool):
+    """Return how the section edges are assembled before export.
+
+    Returns:
+        str | None: ``wires``, ``faces``, or None to keep the loose edges.
+
+    Raises:
+        click.ClickException: If both ``--wires`` and ``--faces`` are given.
+
+    """
+    if wires and faces:
+        raise click.ClickException("Give at most one of --wires or --faces.")
+    return "wires" if wires else "faces" if faces else None
+
+
+def _assemble_sections(sections, fmt: str, mode):
+    """Assemble the edges of each section into wires or faces.
+
+    Args:
+        sections (list[tuple]): ``(point, normal, result)`` of each section,
+            where ``result`` is the section shape for STEP output and its
+            polylines or segments for the other formats.
+        fmt (str): Output format.
+        mode (str | None): ``wires``, ``faces``, or None to keep the edges.
+
+    Returns:
+        Iterable[tuple]: The sections with their results assembled.
+
+    """
+    if mode is None:
+        return sections
+
+    from intersector.operations import wires
+
+    if fmt == "step":
+        from intersector.operations.intersect import combine_shapes
+
+        def assemble(point, normal, result):
+            if mode == "wires":
+                return combine_shapes(wires.section_wires(result))
+            return combine_shapes(wires.section_faces(result, point, normal))
+
+    else:
+
+        def assemble(point, normal, result):  # noqa: ARG001
+            if mode == "wires":
+                return [points for points, _ in wires.chain_polylines(result)]
+            return wires.face_polylines(result, normal)
+
+    return (
+        (point, normal, assemble(point, normal, result))
+        for point, normal, result in sections
+    )
+
+
+def _sample_sections(sections, deflection: float):
+    """Sample the edges of B-rep section results into polylines.
+
+    Returns:
+        Iterator[tuple]: ``(point, normal, polylines)`` of each section.
+
+    """
+    from intersector.operations.discretize import section_polylines
+
+    return (
+        (point, normal, section_polylines(result, deflection))
+        for point, normal, result in sections
+    )
+
+
+def _export_results(  # noqa: PLR0913, PLR0917
+    sections, output: str, fmt: str, combine: bool, total: int = 0
+) -> int:
+    """Export section results to one or several files.
+
+    Each result is handed to a background writer as soon as it is produced,
+    so files are written while the next sections are computed.
+
+    Args:
+        sections (Iterable[tuple]): ``(point, normal, result)`` of each
+            section, where ``result`` is the section shape for STEP output and
+            its polylines for the other formats.
+        output (str): Output file name (or numbering template).
+        fmt (str): Output format.
+        combine (bool): Whether to write all sections into one file.
+        total (int): Upper bound on the number of sections, setting the width
+            of the file numbers.
+
+    Returns:
+        int: The number of sections exported.
+
+    Raises:
+        click.ClickException: If exporting a result fails.
+
+    """
+    from intersector.utils.result_writer import BackgroundWriter
+
+    if fmt == "step":
+        from intersector.operations.intersect import combine_shapes
+        from intersector.utils.file_handler import export_step
+
+        write = export_step
+    else:
+        from intersector.utils.polylines import export_polylines
+
+        def write(output_sections, path):
+            return export_polylines(output_sections, path, fmt)
+
+    count = 0
+    with BackgroundWriter(write, output, total) as writer:
+        if combine:
+            sections = list(sections)
+            count = len(sections)
+            if count and fmt != "step":
+                writer.put(sections)
+            elif count:
+                results = [result for _, _, result in sections]
+                writer.put(combine_shapes(results) if count > 1 else results[0])
+        else:
+            for section in sections:
+                count += 1
+                writer.put(section[2] if fmt == "step" else [section])
+
+        # ---- Wait for the writer ----
+        with profiling.phase("cli.export"):
+            paths = writer.close()
+
+    if writer.failed:
+        raise click.ClickException("Failed to export intersection result.") from None
+
+    for output_path in paths:
+        console.print(
+            "✅ [green]Intersection computed successfully. [/green]"
+            f"[green]Result saved to '{output_path}'.[/green]"
+        )
+    return count
+
+
+def _export_sections(  # noqa: PLR0913, PLR0917
+    sections, output: str, fmt: str, combine: bool, mode, deflection, total: int
+) -> int:
+    """Sample, assemble and export sections as they are computed.
+
+    Args:
+        sections (Iterable[tuple]): ``(point, normal, result)`` of each
+            non-empty section.
+        output (str): Output file name (or numbering template).
+        fmt (str): Output format.
+        combine (bool): Whether to write all sections into one file.
+        mode (str | None): ``wires``, ``faces``, or None to keep the edges.
+        deflection (float | None): Chordal deflection sampling B-rep results
+            into polylines, or None if they are exported as they are.
+        total (int): Upper bound on the number of sections.
+
+    Returns:
+        int: The number of sections exported.
+
+    """
+    if deflection is not None:
+        sections = _sample_sections(sections, deflection)
+    sections = _assemble_sections(sections, fmt, mode)
+    return _export_results(sections, output, fmt, combine, total)
+
+
+def _show_results(shape, sections, show: bool) -> None:
+    """Display the input shape and the section results in a 3D viewer.
+
+    Raises:
+        click.ClickException: If visualization of shapes fails.
+
+    """
+    if not show:
+        return
+
+    from intersector.utils.visualization import show_shapes
+
+    if not show_shapes([shape, *(result for _, _, result in sections)]):
+        raise click.ClickException("Error displaying shapes")
+
+
+def _cached_sections(  # noqa: PLR0913, PLR0917
+    ctx, in_step: str, shape, planes, workers: int, batch_size: int
+):
+    """Return the sections of each plane, computing only the uncached ones.
+
+    A single plane with several workers is spread over the solids of the
+    shape, which gives another result than sectioning the whole shape, so
+    those sections are cached apart. A missing plane among several is
+    sectioned in-process like the others.
+
+    Returns:
+        Iterator: The section of each plane, in order.
+
+    """
+    from intersector.utils.section_cache import section_settings
+    from intersector.utils.step_cache import StepCache
+
+    solids = workers != 1 and len(planes) == 1
+    return _section_cache(ctx).sections(
+        StepCache.key(in_step),
+        planes,
+        lambda missing: _compute_sections(
+            shape,
+            missing,
+            workers if solids or len(missing) > 1 else 1,
+            batch_size=batch_size,
+            scheduler=_scheduler(ctx),
+        ),
+        settings=section_settings("brep", "solids" if solids else "planes"),
+    )
+
+
+def _check_section_source(  # noqa: PLR0913, PLR0917
+    engine: str,
+    stream: bool,
+    cache_sections: bool,
+    show,
+    timeout=None,
+    workers: int = 1,
+    batch_planes: int = 1,
+) -> None:
+    """Reject the options that do not combine with streaming, caching or timeouts.
+
+    Raises:
+        click.ClickException: If ``--show`` is used with ``--stream``,
+            ``--cache-sections`` with ``--stream`` or the mesh engine,
+            ``--timeout`` with any of them or with several workers, or
+            ``--batch-planes`` with ``--stream``, ``--timeout``, the mesh
+            engine or several workers.
+
+    """
+    if stream and show:
+        raise click.ClickException("--show cannot be used with --stream.")
+    if cache_sections and (stream or engine == "mesh"):
+        raise click.ClickException(
+            "--cache-sections cannot be used with --stream or --engine mesh."
+        )
+    if timeout and (stream or cache_sections or engine == "mesh" or workers != 1):
+        raise click.ClickException(
+            "--timeout cannot be used with --stream, --cache-sections, "
+            "--engine mesh or --workers."
+        )
+    if batch_planes > 1 and (stream or timeout or engine == "mesh" or workers != 1):
+        raise click.ClickException(
+            "--batch-planes cannot be used with --stream, --timeout, "
+            "--engine mesh or --workers."
+        )
+
+
+def _report_timeouts(timed_out, planes, on_timeout: str, rows) -> None:
+    """Flag the sections that ran out of time in the summary and the console."""
+    if rows:
+        for i in timed_out:
+            rows[i]["timed_out"] = True
+    if timed_out:
+        outcome = "approximated" if on_timeout == "mesh" else "skipped"
+        console.print(
+            f"[yellow]⏱️  {len(timed_out)} of {len(planes)} section(s) exceeded "
+            f"--timeout and were {outcome}.[/yellow]"
+        )
 
 
 @intersector.command()
@@ -32,78 +829,631 @@ def intersector(ctx, verbose):
 )
 @click.option(
     "--in-plane",
-    required=True,
-    help="Plane definition in point-normal form 'x,y,z:nx,ny,nz'.",
+    "in_planes",
+    multiple=True,
+    help="Plane definition in point-normal form 'x,y,z:nx,ny,nz'. "
+    "Can be repeated to intersect with several planes.",
+)
+@click.option(
+    "--planes-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="File of planes: a .csv with 'x,y,z,nx,ny,nz' rows, a .npy array "
+    "of shape (N, 2, 3) or (N, 6), or text with one 'x,y,z:nx,ny,nz' "
+    "definition per line.",
+)
+@_engine_option
+@_output_options("intersection.stp")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of worker processes sectioning planes in parallel, or the "
+    "solids of the shape for a single plane (0 uses one per CPU).",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Transfer and section the STEP roots one at a time, keeping only "
+    "their sections, so memory scales with the largest root instead of the "
+    "whole file. Runs in-process, without the STEP cache or the viewer.",
+)
+@click.option(
+    "--cache-sections",
+    is_flag=True,
+    help="Reuse the sections of this STEP file computed by earlier runs, "
+    "keyed by its content and the canonical plane, and store the new ones "
+    "(brep engine only).",
+)
+@click.option(
+    "--batch-planes",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Section up to this many parallel planes with a single multi-tool "
+    "boolean, preparing the shape once per batch (brep engine, --workers 1).",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Seconds each exact section may take. Sections run in a worker "
+    "process that is killed when a plane runs over (brep engine, --workers 1).",
+)
+@click.option(
+    "--on-timeout",
+    type=click.Choice(["mesh", "skip"]),
+    default="mesh",
+    show_default=True,
+    help="What a plane over --timeout gets: an approximate section cut from "
+    "a tessellation of the shape, or no section. Either way it is reported, "
+    "and flagged as timed_out in the --summary table.",
 )
 @click.pass_context
-def intersect(ctx, in_step: str, in_plane: str):
-    """Compute the intersection between a 3D shape and a plane.
+def intersect(  # noqa: PLR0913, PLR0914, PLR0917
+    ctx,
+    in_step: str,
+    in_planes,
+    planes_file,
+    engine: str,
+    output: str,
+    fmt,
+    combine,
+    wires: bool,
+    faces: bool,
+    summary,
+    deflection: float,
+    show,
+    workers: int,
+    stream: bool,
+    cache_sections: bool,
+    batch_planes: int,
+    timeout,
+    on_timeout: str,
+):
+    """Compute the intersection between a 3D shape and one or more planes.
 
-    This command loads a 3D model from a STEP file and computes its intersection
-    with a user-defined plane. The plane is defined using a point and a normal
-    vector in the form `'x,y,z:nx,ny,nz'`. The resulting intersection is exported
-    to a new file called `intersection.stp` and optionally visualized.
+    This command loads a 3D model from a STEP file once and computes its
+    intersection with every user-defined plane. A plane is defined using a
+    point and a normal vector in the form `'x,y,z:nx,ny,nz'`; planes can be
+    given with repeated `--in-plane` options and/or a `--planes-file`. Each
+    result is exported to its own file (or to a single file with `--combine`),
+    as STEP or as sampled polylines (NPZ, JSON, SVG, DXF), and STEP results
+    are visualized together.
 
     Example:
         intersector intersect --in-step box.step --in-plane "0,0,0:0,0,1"
+        intersector intersect --in-step box.step --planes-file stations.txt
+        intersector intersect --in-step box.step --in-plane "0,0,0:0,0,1" \
+            --output section.npz
 
     Args:
         ctx (click.Context): Click context object containing configuration.
         in_step (str): Path to the input STEP file.
-        in_plane (str): Plane definition in `'x,y,z:nx,ny,nz'` format.
+        in_planes (tuple[str, ...]): Plane definitions in `'x,y,z:nx,ny,nz'`
+            format.
+        planes_file (str | None): Path to a CSV, NPY or plane-string file.
+        engine (str): Section engine, ``brep`` or ``mesh``.
+        output (str): Output file name (or numbering template).
+        fmt (str | None): Output format, inferred from ``output`` if None.
+        combine (bool): Whether to export all results into one file.
+        wires (bool): Whether to chain the section edges into wires.
+        faces (bool): Whether to assemble the section loops into faces.
+        summary (str | None): JSON or CSV file receiving the summary of
+            every section.
+        deflection (float): Chordal deflection used to sample polylines
+            and to tessellate the shape for the mesh engine.
+        show (bool | None): Whether to open the 3D viewer (default: for
+            STEP output only).
+        workers (int): Number of worker processes (0 for one per CPU).
+        stream (bool): Whether to section the STEP roots one at a time.
+        cache_sections (bool): Whether to go through the section cache.
+        batch_planes (int): Number of parallel planes per multi-tool boolean.
+        timeout (float | None): Seconds each exact section may take.
+        on_timeout (str): ``mesh`` to approximate the sections over
+            ``timeout``, ``skip`` to leave them empty.
 
     Raises:
         click.ClickException: If the input plane format is invalid.
+        click.ClickException: If the output format cannot be inferred or
+            does not suit the engine, ``--show`` is used with ``--stream``,
+            ``--cache-sections`` with ``--stream`` or the mesh engine,
+            ``--timeout`` with either or with several workers, both
+            ``--wires`` and ``--faces`` are given, or the summary file has
+            an unknown extension.
         click.ClickException: If the STEP file cannot be read.
         click.ClickException: If the intersection computation fails.
-        click.ClickException: If exporting the result to a STEP file fails.
+        click.ClickException: If exporting the result fails.
         click.ClickException: If visualization of shapes fails.
 
     """
-    output_step = "intersection.stp"
-
-    # ---- STEP file reading ----
-    shape = read_step(in_step)
-    if shape is None:
-        raise click.ClickException(f"Failed to read STEP file: '{in_step}'")
+    # ---- Plane parsing ----
+    with profiling.phase("cli.parse"):
+        planes = _collect_planes(in_planes, planes_file)
+        export = _sections_requested(ctx, summary)
+        fmt = _output_format(output, fmt, engine, show) if export else None
+        mode = _assembly_mode(wires, faces)
+        _check_section_source(
+            engine, stream, cache_sections, show, timeout, workers, batch_planes
+        )
+    sampled = stream and fmt != "step"
+    summarize = _summarizer(engine, sampled, deflection) if summary else None
 
-    console.print("✅  [green]Input file successfully loaded![/green]")
+    with profiling.phase("cli.import"):
+        from intersector.operations.intersect import is_intersection_valid
 
-    # ---- Plane parsing ----
-    try:
-        point, normal = parse_plane_input(in_plane)
-    except ValueError as e:
-        raise click.ClickException(f"Invalid plane definition: {e}") from None
+    # ---- STEP file reading ----
+    shape = None
+    if not stream:
+        with profiling.phase("cli.load"):
+            shape = _load_step(ctx, in_step)
 
     # ---- Intersection operation ----
+    timed_out = []
+    if stream:
+        computed = _stream_sections(in_step, planes, engine, deflection, sampled)
+    elif timeout:
+        from intersector.operations.timeouts import intersect_with_planes_timeout
+
+        computed = intersect_with_planes_timeout(
+            shape, planes, timeout, on_timeout, deflection, timed_out
+        )
+    elif cache_sections:
+        computed = _cached_sections(ctx, in_step, shape, planes, workers, batch_planes)
+    else:
+        computed = _compute_sections(
+            shape,
+            planes,
+            workers,
+            engine,
+            deflection,
+            batch_planes,
+            scheduler=_scheduler(ctx),
+        )
+    valid = len if engine == "mesh" or sampled else is_intersection_valid
+    show = fmt == "step" and not stream if show is None else show
+    rows, kept = [], []
+    sections = _gather_sections(
+        (
+            (point, normal, result)
+            for (point, normal), result in zip(planes, computed, strict=True)
+        ),
+        valid,
+        rows,
+        summarize,
+        kept if export and show else None,
+        warn=len(planes) > 1,
+    )
+    sample = engine == "brep" and fmt != "step" and not stream
     try:
-        result = intersect_with_plane(shape, point, normal)
+        with profiling.phase("cli.intersect"):
+            # ---- Export result, overlapped with the intersections ----
+            if export:
+                count = _export_sections(
+                    sections,
+                    output,
+                    fmt,
+                    combine,
+                    mode,
+                    deflection if sample else None,
+                    len(planes),
+                )
+            else:
+                count = sum(1 for _ in sections)
     except ValueError as e:
         raise click.ClickException(f"Invalid input to intersection: {e}") from None
     except RuntimeError as e:
         raise click.ClickException(f"Intersection computation failed: {e}") from None
 
-    # ---- Validate intersection ----
-    if is_intersection_valid(result):
-        # ---- Export result ----
-        if not export_step(result, output_step):
-            raise click.ClickException(
-                "Failed to export intersection result."
-            ) from None
+    _report_timeouts(timed_out, planes, on_timeout, rows)
+    if summary:
+        _write_summary(rows, summary)
+        if not export:
+            return
 
+    if not count:
         console.print(
-            "✅ [green]Intersection computed successfully. [/green]"
-            f"[green]Result saved to '{output_step}'.[/green]"
+            "✅ [red]❌ No intersection between the input shape "
+            "and the given plane.[/red]"
         )
+        return
 
-        # ---- Visualization (optional) ----
-        if not show_shapes([shape, result]):
-            raise click.ClickException("Error displaying shapes")
-    else:
+    # ---- Visualization (optional) ----
+    with profiling.phase("cli.show"):
+        _show_results(shape, kept, show)
+
+
+def _slice_layers(  # noqa: PLR0913, PLR0917
+    shape, normal, step: float, engine: str, deflection: float
+):
+    """Section a shape with evenly spaced planes.
+
+    Returns:
+        list[tuple]: ``(point, normal, result)`` of every layer, where
+            ``result`` is the section shape, or its segments with the
+            ``mesh`` engine.
+
+    """
+    from intersector.operations.mesh_slicing import TriangleMesh, slice_mesh
+    from intersector.operations.slicing import slice_shape
+
+    if engine == "mesh":
+        mesh = TriangleMesh.from_shape(shape, deflection)
+        return [
+            (point, layer_normal, list(segments))
+            for point, layer_normal, segments in slice_mesh(mesh, normal, step)
+        ]
+    return list(slice_shape(shape, normal, step))
+
+
+@intersector.command(name="slice")
+@click.option(
+    "--in-step",
+    type=click.Path(exists=True),
+    required=True,
+    help="Path to the input STEP file.",
+)
+@click.option(
+    "--axis",
+    type=click.Choice(sorted(AXES), case_sensitive=False),
+    help="Slice along a coordinate axis.",
+)
+@click.option(
+    "--direction",
+    help="Slice along an arbitrary direction given as 'nx,ny,nz'.",
+)
+@click.option(
+    "--step",
+    type=click.FloatRange(min=0, min_open=True),
+    required=True,
+    help="Distance between consecutive slicing planes.",
+)
+@_engine_option
+@_output_options("slice.stp")
+@click.pass_context
+def slice_command(  # noqa: PLR0913, PLR0917
+    ctx,
+    in_step: str,
+    axis,
+    direction,
+    step: float,
+    engine: str,
+    output: str,
+    fmt,
+    combine,
+    wires: bool,
+    faces: bool,
+    summary,
+    deflection: float,
+    show,
+):
+    """Slice a 3D shape into a stack of evenly spaced parallel sections.
+
+    The planes are perpendicular to `--axis` (or `--direction`) and cover the
+    bounding box of the shape, one plane in the middle of each `--step` thick
+    layer. Each plane is only intersected with the faces it can reach, which
+    keeps large layer stacks fast.
+
+    Example:
+        intersector slice --in-step part.step --axis z --step 0.2
+
+    Args:
+        ctx (click.Context): Click context object containing configuration.
+        in_step (str): Path to the input STEP file.
+        axis (str | None): Coordinate axis to slice along.
+        direction (str | None): Slicing direction in `'nx,ny,nz'` format.
+        step (float): Distance between consecutive planes.
+        engine (str): Section engine, ``brep`` or ``mesh``.
+        output (str): Output file name (or numbering template).
+        fmt (str | None): Output format, inferred from ``output`` if None.
+        combine (bool): Whether to export all layers into one file.
+        wires (bool): Whether to chain the section edges into wires.
+        faces (bool): Whether to assemble the section loops into faces.
+        summary (str | None): JSON or CSV file receiving the summary of
+            every layer.
+        deflection (float): Chordal deflection used to sample polylines
+            and to tessellate the shape for the mesh engine.
+        show (bool | None): Whether to open the 3D viewer (default: for
+            STEP output only).
+
+    Raises:
+        click.ClickException: If the slicing direction is missing or invalid.
+        click.ClickException: If the output format cannot be inferred or
+            does not suit the engine, both ``--wires`` and ``--faces`` are
+            given, or the summary file has an unknown extension.
+        click.ClickException: If the STEP file cannot be read.
+        click.ClickException: If the slicing computation fails.
+        click.ClickException: If exporting the result fails.
+        click.ClickException: If visualization of shapes fails.
+
+    """
+    # ---- Direction parsing ----
+    if (axis is None) == (direction is None):
+        raise click.ClickException("Give exactly one of --axis or --direction.")
+
+    try:
+        normal = AXES[axis.lower()] if axis else parse_vector_input(direction)
+    except ValueError as e:
+        raise click.ClickException(f"Invalid slicing direction: {e}") from None
+
+    export = _sections_requested(ctx, summary)
+    fmt = _output_format(output, fmt, engine, show) if export else None
+    mode = _assembly_mode(wires, faces)
+
+    from intersector.operations.intersect import is_intersection_valid
+
+    # ---- STEP file reading ----
+    shape = _load_step(ctx, in_step)
+
+    # ---- Slicing operation ----
+    valid = len if engine == "mesh" else is_intersection_valid
+    try:
+        layers = _slice_layers(shape, normal, step, engine, deflection)
+        results = [layer for layer in layers if valid(layer[2])]
+    except ValueError as e:
+        raise click.ClickException(f"Invalid input to slicing: {e}") from None
+    except RuntimeError as e:
+        raise click.ClickException(f"Slicing computation failed: {e}") from None
+
+    if summary:
+        from intersector.operations.analytics import summarize_sections
+
+        _write_summary(
+            summarize_sections(layers, deflection, sampled=engine == "mesh"), summary
+        )
+        if not export:
+            return
+
+    if not results:
+        console.print("✅ [red]❌ No layer intersects the input shape.[/red]")
+        return
+
+    console.print(f"✅ [green]{len(results)} non-empty layers computed.[/green]")
+
+    # ---- Export result ----
+    sample = engine == "brep" and fmt != "step"
+    _export_sections(
+        results,
+        output,
+        fmt,
+        combine,
+        mode,
+        deflection if sample else None,
+        len(results),
+    )
+
+    # ---- Visualization (optional) ----
+    _show_results(shape, results, fmt == "step" if show is None else show)
+
+
+@intersector.command()
+@click.option(
+    "--in-step",
+    "in_steps",
+    multiple=True,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Path to an input STEP file. Repeat it for every file of the batch.",
+)
+@click.option(
+    "--in-plane",
+    "in_planes",
+    multiple=True,
+    help="Plane definition in point-normal form 'x,y,z:nx,ny,nz'. "
+    "Can be repeated to intersect with several planes.",
+)
+@click.option(
+    "--planes-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="File of planes, as for the intersect command.",
+)
+@_engine_option
+@click.option(
+    "--output-dir",
+    type=click.Path(file_okay=False),
+    default=".",
+    show_default=True,
+    help="Directory receiving one output file per input, named after it.",
+)
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(sorted(set(OUTPUT_FORMATS.values()))),
+    default="step",
+    show_default=True,
+    help="Output format. Formats other than step write the sections sampled "
+    "into polylines.",
+)
+@click.option(
+    "--deflection",
+    type=click.FloatRange(min=0, min_open=True),
+    default=0.01,
+    show_default=True,
+    help="Chordal deflection used to sample section edges into polylines, "
+    "and to tessellate the shapes with --engine mesh.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Number of worker processes, each sectioning one file at a time "
+    "(0 uses one per CPU).",
+)
+@click.pass_context
+def batch(  # noqa: PLR0913, PLR0917
+    ctx,
+    in_steps,
+    in_planes,
+    planes_file,
+    engine: str,
+    output_dir: str,
+    fmt: str,
+    deflection: float,
+    workers: int,
+):
+    """Intersect many STEP files with the same planes, one worker per file.
+
+    Files are sectioned in worker processes and each one is written to its
+    own output file in `--output-dir`, combining all its sections. With the
+    group's `--memory-budget`, a file only starts once its estimated
+    footprint fits next to the files in progress, and
+    `--max-tasks-per-worker` replaces the workers after that many files.
+
+    Example:
+        intersector --memory-budget 8192 batch --in-step a.step \
+            --in-step b.step --planes-file stations.txt --output-dir sections
+
+    Args:
+        ctx (click.Context): Click context object containing configuration.
+        in_steps (tuple[str, ...]): Paths to the input STEP files.
+        in_planes (tuple[str, ...]): Plane definitions in `'x,y,z:nx,ny,nz'`
+            format.
+        planes_file (str | None): Path to a CSV, NPY or plane-string file.
+        engine (str): Section engine, ``brep`` or ``mesh``.
+        output_dir (str): Directory receiving the output files.
+        fmt (str): Output format.
+        deflection (float): Chordal deflection used to sample polylines
+            and to tessellate the shapes for the mesh engine.
+        workers (int): Number of worker processes (0 for one per CPU).
+
+    Raises:
+        click.ClickException: If a plane definition is invalid, the mesh
+            engine is used with step output, or sectioning a file fails.
+
+    """
+    planes = _collect_planes(in_planes, planes_file)
+    if engine == "mesh" and fmt == "step":
+        raise click.ClickException(
+            "--engine mesh only writes polyline formats (npz, json, svg, dxf)."
+        )
+
+    from intersector.operations.batch import section_files
+
+    os.makedirs(output_dir, exist_ok=True)
+    try:
+        for path, output, count in section_files(
+            in_steps,
+            planes,
+            output_dir,
+            fmt,
+            engine,
+            deflection,
+            _scheduler(ctx, workers),
+        ):
+            if count:
+                console.print(f"✅ {path}: {count} section(s) written to {output}")
+            else:
+                console.print(f"[red]❌ {path}: no intersection.[/red]")
+    except (ValueError, RuntimeError) as e:
+        raise click.ClickException(f"Batch sectioning failed: {e}") from None
+
+
+@intersector.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    help="Listen on this Unix socket instead of a TCP port.",
+)
+@click.option("--host", default="127.0.0.1", show_default=True, help="TCP host.")
+@click.option("--port", type=click.IntRange(0, 65535), default=8765, show_default=True)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Number of worker processes answering section requests "
+    "(0 uses one per CPU).",
+)
+@click.option(
+    "--preload",
+    "preload",
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="STEP file to load at startup, registered under its file stem. "
+    "Can be repeated.",
+)
+@click.pass_context
+def serve(  # noqa: PLR0913, PLR0917
+    ctx, socket_path, host: str, port: int, workers: int, preload
+):
+    """Serve section requests against shapes kept in memory.
+
+    The server speaks newline-delimited JSON on a Unix socket or a localhost
+    TCP port; see :mod:`intersector.server` for the requests it accepts.
+
+    Example:
+        intersector serve --socket /tmp/intersector.sock --preload box.step
+
+    Args:
+        ctx (click.Context): Click context object containing configuration.
+        socket_path (str | None): Unix socket to listen on.
+        host (str): TCP host, used without ``--socket``.
+        port (int): TCP port, used without ``--socket``.
+        workers (int): Number of worker processes (0 for one per CPU).
+        preload (tuple[str, ...]): STEP files to load at startup.
+
+    """
+    import asyncio
+
+    from intersector.server import IntersectionServer
+    from intersector.server import serve as run_server
+
+    obj = ctx.find_object(dict) or {}
+    server = IntersectionServer(
+        workers=workers or None,
+        cache=_step_cache(ctx) if obj.get("use_cache") else None,
+    )
+
+    async def main():
+        for path in preload:
+            response = await server.handle({"op": "load", "path": path})
+            if not response["ok"]:
+                server.close()
+                raise click.ClickException(response["error"])
+        await run_server(server, socket_path, host, port)
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        console.print("👋 Server stopped.")
+
+
+@intersector.command()
+@click.option("--clear", is_flag=True, help="Remove every cached shape.")
+@click.option(
+    "--sections",
+    is_flag=True,
+    help="Act on the cache of section results instead of parsed STEP files.",
+)
+@click.pass_context
+def cache(ctx, clear, sections):
+    """Show the statistics of the STEP or section cache, or clear it.
+
+    Args:
+        ctx (click.Context): Click context object containing configuration.
+        clear (bool): Whether to empty the cache.
+        sections (bool): Whether to act on the section cache.
+
+    """
+    brep_cache = _section_cache(ctx) if sections else _step_cache(ctx)
+    name = "Section" if sections else "STEP"
+    if clear:
+        brep_cache.clear()
         console.print(
-            "✅ [red]❌ No intersection between the input shape "
-            "and the given plane.[/red]"
+            f"✅ [green]{name} cache '{brep_cache.directory}' cleared.[/green]"
         )
+        return
+
+    stats = brep_cache.stats()
+    lookups = stats["hits"] + stats["misses"]
+    ratio = f" ({stats['hits'] / lookups:.0%})" if lookups else ""
+    console.print(f"📂 {name} cache: {brep_cache.directory}")
+    console.print(
+        f"   {stats['entries']} entries, "
+        f"{stats['bytes'] / 2**20:.1f} of {stats['max_bytes'] / 2**20:.0f} MB"
+    )
+    console.print(f"   {stats['hits']} hits{ratio}, {stats['misses']} misses")
 
 
 def main():
@@ -6,6 +6,6 @@ This package provides modules for performing geometric operations
 on CAD shapes, such as intersections.
 """
 
-from .intersect import intersect_with_plane
+from .intersect import combine_shapes, intersect_with_plane
 
-__all__ = ["intersect_with_plane"]
+__all__ = ["intersect_with_plane", "combine_shapes"]
@@ -0,0 +1,242 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Section analytics: length, area, loop count and 2D bounding box.
+
+A section result is walked once: each edge contributes its exact length
+(``GProp``) and its sampled points, from which the loops are chained and
+nested and the bounding box is taken in the plane frame used by the SVG
+writer. The closed loops are then assembled from the same edges into planar
+faces whose exact area is measured with ``GProp`` as well. Sampled sections
+and mesh segments are summarized from their polylines alone, their area
+being that of the polygons.
+"""
+
+import logging
+
+import numpy as np
+from OCC.Core.BRepGProp import brepgprop
+from OCC.Core.GProp import GProp_GProps
+from OCC.Core.TopAbs import TopAbs_EDGE
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopoDS import topods
+
+from intersector.operations.discretize import DEFAULT_DEFLECTION, edge_points
+from intersector.operations.wires import (
+    DEFAULT_TOLERANCE,
+    chain_segments,
+    join_chain,
+    loop_faces,
+    nest_loops,
+    signed_area,
+)
+from intersector.utils.polylines import plane_frame
+
+log = logging.getLogger(__name__)
+
+
+def _loop_stats(polylines, normal, tolerance: float) -> tuple[dict, tuple]:
+    """Chain the polylines and measure the area enclosed by their loops.
+
+    Returns:
+        tuple[dict, tuple]: ``loops``, ``open_chains`` and net ``area``
+            (outer boundaries minus their holes), and the steps of each
+            closed chain, its polygon and their nesting.
+
+    """
+    kept = [i for i, p in enumerate(polylines) if len(p)]
+    chains = chain_segments(
+        [polylines[i][0] for i in kept], [polylines[i][-1] for i in kept], tolerance
+    )
+    loops = [[(kept[j], rev) for j, rev in steps] for steps, closed in chains if closed]
+    polygons = [join_chain(polylines, steps) for steps in loops]
+    nesting = nest_loops(polygons, normal)
+    area = sum(
+        abs(signed_area(polygons[outer], normal))
+        - sum(abs(signed_area(polygons[hole], normal)) for hole in holes)
+        for outer, holes in nesting
+    )
+    stats = {
+        "loops": len(loops),
+        "open_chains": len(chains) - len(loops),
+        "area": float(area),
+    }
+    return stats, (loops, polygons, nesting)
+
+
+def _face_area(faces) -> float:
+    """Return the exact area of planar faces.
+
+    Returns:
+        float: The net area of the faces, holes excluded.
+
+    """
+    area = 0.0
+    for face in faces:
+        props = GProp_GProps()
+        brepgprop.SurfaceProperties(face, props)
+        area += props.Mass()
+    return area
+
+
+def _plane_bounds(polylines, normal) -> dict:
+    """Return the bounding box of the polylines in the plane frame.
+
+    Returns:
+        dict: ``umin``, ``vmin``, ``umax`` and ``vmax``.
+
+    """
+    u, v = plane_frame(normal)
+    points = np.concatenate(polylines)
+    flat = np.column_stack([points @ u, points @ v])
+    (umin, vmin), (umax, vmax) = flat.min(axis=0), flat.max(axis=0)
+    return {
+        "umin": float(umin),
+        "vmin": float(vmin),
+        "umax": float(umax),
+        "vmax": float(vmax),
+    }
+
+
+def polyline_summary(  # noqa: PLR0913, PLR0917
+    plane_point,
+    plane_normal,
+    polylines,
+    lengths=None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    chains=None,
+) -> dict:
+    """Summarize a section given as polylines.
+
+    Args:
+        plane_point (tuple[float, float, float]): A point on the plane.
+        plane_normal (tuple[float, float, float]): The plane's normal.
+        polylines (Sequence[numpy.ndarray] | None): ``(N, 3)`` points of
+            each edge or segment of the section.
+        lengths (Sequence[float] | None): Exact length of each polyline.
+            Measured along the polylines when omitted.
+        tolerance (float): Distance under which two end points are joined
+            into the same loop.
+        chains (list | None): Receives the steps of each closed chain of
+            polylines (see :func:`chain_segments`), its polygon and the
+            nesting of the loops (see :func:`nest_loops`).
+
+    Returns:
+        dict: The plane (``px``..``nz``), whether the section is ``valid``,
+            its number of ``edges``, total ``length``, net ``area`` enclosed
+            by its closed ``loops`` (that of the polygons through the
+            polyline points), number of ``open_chains``, its bounding
+            box ``umin``, ``vmin``, ``umax``, ``vmax`` in the plane frame
+            (None for an empty section), and ``timed_out``, False until a
+            caller bounding the section time sets it.
+
+    """
+    polylines = [np.asarray(p, dtype=float) for p in polylines or []]
+    px, py, pz = plane_point
+    nx, ny, nz = plane_normal
+    summary = {
+        "px": px,
+        "py": py,
+        "pz": pz,
+        "nx": nx,
+        "ny": ny,
+        "nz": nz,
+        "valid": bool(polylines),
+        "edges": len(polylines),
+        "length": 0.0,
+        "area": 0.0,
+        "loops": 0,
+        "open_chains": 0,
+        "umin": None,
+        "vmin": None,
+        "umax": None,
+        "vmax": None,
+        "timed_out": False,
+    }
+    if not polylines:
+        return summary
+
+    if lengths is None:
+        lengths = [np.linalg.norm(np.diff(p, axis=0), axis=1).sum() for p in polylines]
+    summary["length"] = float(sum(lengths))
+
+    stats, loops = _loop_stats(polylines, plane_normal, tolerance)
+    if chains is not None:
+        chains.extend(loops)
+    summary.update(stats)
+    summary.update(_plane_bounds(polylines, plane_normal))
+    return summary
+
+
+def section_summary(
+    shape, plane_point, plane_normal, deflection: float = DEFAULT_DEFLECTION
+) -> dict:
+    """Summarize a B-rep section result in one traversal of its edges.
+
+    Lengths and the area are exact; the loops and bounding box are found
+    from the edges sampled with ``deflection``, and the faces whose area is
+    measured are built from the same edges and loops.
+
+    Args:
+        shape (TopoDS_Shape | None): A section result of the plane.
+        plane_point (tuple[float, float, float]): A point on the plane.
+        plane_normal (tuple[float, float, float]): The plane's normal.
+        deflection (float): Chordal deflection used to sample the edges.
+
+    Returns:
+        dict: The summary described in :func:`polyline_summary`.
+
+    Raises:
+        ValueError: If the deflection is not positive.
+
+    """
+    if deflection <= 0:
+        raise ValueError("Deflection must be positive")
+
+    edges, polylines, lengths = [], [], []
+    if shape is not None:
+        explorer = TopExp_Explorer(shape, TopAbs_EDGE)
+        while explorer.More():
+            edge = topods.Edge(explorer.Current())
+            props = GProp_GProps()
+            brepgprop.LinearProperties(edge, props)
+            edges.append(edge)
+            lengths.append(props.Mass())
+            polylines.append(edge_points(edge, deflection))
+            explorer.Next()
+
+    chains = []
+    summary = polyline_summary(
+        plane_point, plane_normal, polylines, lengths, chains=chains
+    )
+    if summary["loops"]:
+        faces = loop_faces(edges, *chains, plane_point, plane_normal)
+        summary["area"] = _face_area(faces)
+    return summary
+
+
+def summarize_sections(
+    sections, deflection: float = DEFAULT_DEFLECTION, sampled: bool = False
+) -> list[dict]:
+    """Summarize a batch of sections.
+
+    Args:
+        sections (Iterable[tuple]): ``(point, normal, result)`` of each
+            section, including the planes that missed the shape.
+        deflection (float): Chordal deflection used to sample B-rep edges.
+        sampled (bool): Whether the results are already polylines or mesh
+            segments rather than section shapes.
+
+    Returns:
+        list[dict]: One summary per section, in order.
+
+    """
+    rows = [
+        (
+            polyline_summary(point, normal, result)
+            if sampled
+            else section_summary(result, point, normal, deflection)
+        )
+        for point, normal, result in sections
+    ]
+    log.debug("📊 Summarized %s sections", len(rows))
+    return rows
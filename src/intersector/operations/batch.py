@@ -0,0 +1,166 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Sectioning of many STEP files, one worker job per file.
+
+Each job reads its STEP file, sections it with every plane and writes the
+non-empty sections to one output file, so a worker only holds one shape and
+its sections at a time. The jobs are run by a
+:class:`~intersector.utils.scheduler.MemoryScheduler`, which starts them
+within a memory budget estimated from the size and face count of each file.
+"""
+
+import logging
+import os
+
+from intersector.operations.discretize import section_polylines
+from intersector.operations.face_index import FaceIndex
+from intersector.operations.intersect import (
+    combine_shapes,
+    intersect_with_plane,
+    is_intersection_valid,
+)
+from intersector.operations.mesh_slicing import TriangleMesh
+from intersector.utils.file_handler import export_step, read_step
+from intersector.utils.plane_sets import PlaneSet
+from intersector.utils.polylines import export_polylines
+from intersector.utils.scheduler import MemoryScheduler, step_footprint
+
+log = logging.getLogger(__name__)
+
+
+def section_file(  # noqa: PLR0913, PLR0917
+    in_step: str,
+    planes,
+    output: str,
+    fmt: str = "step",
+    engine: str = "brep",
+    deflection: float = 0.05,
+) -> int:
+    """Section a STEP file with every plane and write the non-empty sections.
+
+    Args:
+        in_step (str): Path to the STEP file.
+        planes (Sequence[tuple]): The (point, normal) pairs.
+        output (str): Path of the output file.
+        fmt (str): Output format: ``step``, ``npz``, ``json``, ``svg`` or
+            ``dxf``; the mesh engine only writes polyline formats.
+        engine (str): ``brep`` or ``mesh``.
+        deflection (float): Polyline sampling and tessellation deflection.
+
+    Returns:
+        int: The number of non-empty sections written, 0 when no plane
+            crosses the shape and nothing is written.
+
+    Raises:
+        ValueError: If the STEP file cannot be read.
+        RuntimeError: If writing the output fails.
+
+    """
+    shape = read_step(in_step)
+    if shape is None:
+        raise ValueError(f"Failed to read STEP file: '{in_step}'")
+
+    if engine == "mesh":
+        mesh = TriangleMesh.from_shape(shape, deflection)
+        sections = [
+            (point, normal, list(segments))
+            for (point, normal), segments in zip(
+                planes, mesh.sections(planes), strict=True
+            )
+            if len(segments)
+        ]
+    else:
+        index = FaceIndex(shape) if len(planes) > 1 else None
+        sections = [
+            (point, normal, result)
+            for point, normal in planes
+            if is_intersection_valid(
+                result := intersect_with_plane(shape, point, normal, index=index)
+            )
+        ]
+    if not sections:
+        return 0
+
+    if fmt == "step":
+        written = export_step(combine_shapes(r for _, _, r in sections), output)
+    else:
+        if engine == "brep":
+            sections = [
+                (point, normal, section_polylines(result, deflection))
+                for point, normal, result in sections
+            ]
+        written = export_polylines(sections, output, fmt)
+    if not written:
+        raise RuntimeError(f"Failed to write {fmt} output: '{output}'")
+    return len(sections)
+
+
+def batch_outputs(in_steps, output_dir: str, fmt: str) -> list[str]:
+    """Return the output path of each input file.
+
+    Outputs are named after the input file stems; inputs sharing a stem are
+    numbered so that no output overwrites another.
+
+    Returns:
+        list[str]: The output paths, in input order.
+
+    """
+    extension = "stp" if fmt == "step" else fmt
+    outputs, seen = [], {}
+    for path in in_steps:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        seen[stem] = seen.get(stem, 0) + 1
+        if seen[stem] > 1:
+            stem = f"{stem}_{seen[stem]}"
+        outputs.append(os.path.join(output_dir, f"{stem}.{extension}"))
+    return outputs
+
+
+def section_files(  # noqa: PLR0913, PLR0917
+    in_steps,
+    planes,
+    output_dir: str,
+    fmt: str = "step",
+    engine: str = "brep",
+    deflection: float = 0.05,
+    scheduler=None,
+):
+    """Section several STEP files in worker processes, one job per file.
+
+    Args:
+        in_steps (Sequence[str]): Paths to the STEP files.
+        planes (Sequence[tuple]): The (point, normal) pairs. Each job gets
+            them as a :class:`PlaneSet`, pickled as one array.
+        output_dir (str): Directory receiving one output file per input.
+        fmt (str): Output format (see :func:`section_file`).
+        engine (str): ``brep`` or ``mesh``.
+        deflection (float): Polyline sampling and tessellation deflection.
+        scheduler (MemoryScheduler | None): Scheduler running the jobs.
+            Defaults to one without a memory budget.
+
+    Yields:
+        tuple[str, str, int]: The input path, output path and number of
+            non-empty sections of each file, in input order.
+
+    """
+    scheduler = scheduler or MemoryScheduler()
+    if not isinstance(planes, PlaneSet):
+        planes = PlaneSet(planes)
+    outputs = batch_outputs(in_steps, output_dir, fmt)
+    footprints = [step_footprint(path) for path in in_steps]
+
+    log.info(
+        "📚 Sectioning %s file(s), about %.0f MB in total",
+        len(in_steps),
+        sum(footprints) / 2**20,
+    )
+    jobs = [
+        (path, planes, output, fmt, engine, deflection)
+        for path, output in zip(in_steps, outputs, strict=True)
+    ]
+    for (path, output), count in zip(
+        zip(in_steps, outputs, strict=True),
+        scheduler.map(section_file, jobs, footprints),
+        strict=True,
+    ):
+        yield path, output, count
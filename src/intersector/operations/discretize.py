@@ -0,0 +1,83 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Discretization of section edges into polylines.
+
+Samples every edge of a section result into an ``(N, 3)`` NumPy array of
+points, for consumers that only need point lists rather than B-rep geometry.
+"""
+
+import logging
+
+import numpy as np
+from OCC.Core.BRepAdaptor import BRepAdaptor_Curve
+from OCC.Core.GCPnts import GCPnts_QuasiUniformDeflection
+from OCC.Core.TopAbs import TopAbs_EDGE, TopAbs_REVERSED
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopoDS import topods
+
+log = logging.getLogger(__name__)
+
+DEFAULT_DEFLECTION = 0.01
+
+
+def edge_points(edge, deflection: float = DEFAULT_DEFLECTION) -> np.ndarray:
+    """Sample an edge into points spaced by a chordal deflection.
+
+    Points follow the orientation of the edge. If the sampler fails, the
+    edge is reduced to its two end points.
+
+    Args:
+        edge (TopoDS_Edge): The edge to sample.
+        deflection (float): Maximum distance between the curve and the chords
+            joining consecutive points.
+
+    Returns:
+        numpy.ndarray: ``(N, 3)`` array of points, ``N >= 2``.
+
+    """
+    curve = BRepAdaptor_Curve(edge)
+    sampler = GCPnts_QuasiUniformDeflection(curve, deflection)
+    if sampler.IsDone() and sampler.NbPoints() >= 2:  # noqa: PLR2004
+        points = [sampler.Value(i) for i in range(1, sampler.NbPoints() + 1)]
+    else:
+        log.debug("Edge sampling failed, keeping its end points only")
+        points = [
+            curve.Value(curve.FirstParameter()),
+            curve.Value(curve.LastParameter()),
+        ]
+
+    array = np.array([(p.X(), p.Y(), p.Z()) for p in points], dtype=float)
+    if edge.Orientation() == TopAbs_REVERSED:
+        array = array[::-1]
+    return array
+
+
+def section_polylines(shape, deflection: float = DEFAULT_DEFLECTION):
+    """Sample every edge of a section result into a polyline.
+
+    Args:
+        shape (TopoDS_Shape): A section result, e.g. from
+            :func:`intersect_with_plane`.
+        deflection (float): Chordal deflection used to sample the edges.
+
+    Returns:
+        list[numpy.ndarray]: One ``(N, 3)`` array per edge, in exploration
+            order.
+
+    Raises:
+        ValueError: If the deflection is not positive.
+
+    """
+    if deflection <= 0:
+        raise ValueError("Deflection must be positive")
+
+    polylines = []
+    if shape is None:
+        return polylines
+
+    explorer = TopExp_Explorer(shape, TopAbs_EDGE)
+    while explorer.More():
+        polylines.append(edge_points(topods.Edge(explorer.Current()), deflection))
+        explorer.Next()
+
+    return polylines
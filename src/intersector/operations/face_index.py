@@ -0,0 +1,190 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Spatial index over the faces (or other sub-shapes) of a shape.
+
+Stores the axis-aligned bounding box of every face in NumPy arrays so that a
+plane can be tested against all faces at once, before any OpenCascade boolean
+work is started.
+"""
+
+import logging
+
+import numpy as np
+from OCC.Core.Bnd import Bnd_Box
+from OCC.Core.BRepBndLib import brepbndlib
+from OCC.Core.TopAbs import TopAbs_FACE
+from OCC.Core.TopExp import TopExp_Explorer
+
+log = logging.getLogger(__name__)
+
+
+class BoxIndex:
+    """Bounding-box index of a list of shapes.
+
+    Boxes are stored as centers and half-sizes, so the signed distances of
+    all eight corners of every box to a plane reduce to one matrix-vector
+    product: a box straddles the plane when ``|n . (c - p)| <= |n| . h``.
+
+    Attributes:
+        shapes (list[TopoDS_Shape]): The indexed shapes, in input order.
+        centers (numpy.ndarray): ``(N, 3)`` array of box centers.
+        half_sizes (numpy.ndarray): ``(N, 3)`` array of box half-sizes.
+
+    """
+
+    def __init__(self, shapes):
+        """Build the index over ``shapes``.
+
+        Shapes without geometry (void bounding box) are left out since no
+        plane can cross them.
+
+        Args:
+            shapes (Iterable[TopoDS_Shape]): The shapes to index.
+
+        """
+        self.shapes = []
+        bounds = []
+        for shape in shapes:
+            box = Bnd_Box()
+            brepbndlib.Add(shape, box)
+            if not box.IsVoid():
+                self.shapes.append(shape)
+                bounds.append(box.Get())
+
+        bounds = np.asarray(bounds, dtype=float).reshape(-1, 6)
+        lower, upper = bounds[:, :3], bounds[:, 3:]
+        self.centers = (lower + upper) / 2.0
+        self.half_sizes = (upper - lower) / 2.0
+
+        if len(self.shapes):
+            self._lower = lower.min(axis=0)
+            self._upper = upper.max(axis=0)
+
+    def __len__(self) -> int:
+        """Return the number of indexed shapes.
+
+        Returns:
+            int: The number of indexed shapes.
+
+        """
+        return len(self.shapes)
+
+    def extents(self, direction) -> tuple[np.ndarray, np.ndarray]:
+        """Return the extent of every face box along ``direction``.
+
+        Args:
+            direction (tuple[float, float, float]): The projection direction.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: The lowest and highest
+                projection of each box on ``direction``.
+
+        """
+        direction = np.asarray(direction, dtype=float)
+        middle = self.centers @ direction
+        radius = self.half_sizes @ np.abs(direction)
+        return middle - radius, middle + radius
+
+    def candidates(self, plane_point, plane_normal, tolerance: float = 0.0):
+        """Return the indices of the shapes whose box straddles a plane.
+
+        Args:
+            plane_point (tuple[float, float, float]): A point on the plane.
+            plane_normal (tuple[float, float, float]): The plane's normal.
+            tolerance (float): Extra distance by which boxes are enlarged.
+
+        Returns:
+            numpy.ndarray: Indices into :attr:`shapes`, in increasing order.
+
+        Raises:
+            ValueError: If the plane normal is a zero vector.
+
+        """
+        normal = np.asarray(plane_normal, dtype=float)
+        length = np.linalg.norm(normal)
+        if length == 0.0:
+            raise ValueError("Plane normal cannot be a zero vector")
+        normal /= length
+
+        if not len(self.shapes):
+            return np.empty(0, dtype=int)
+
+        offset = normal @ np.asarray(plane_point, dtype=float)
+
+        # Fast exit: the plane misses the box of the whole shape.
+        middle = normal @ (self._lower + self._upper) / 2.0
+        radius = np.abs(normal) @ (self._upper - self._lower) / 2.0
+        if abs(middle - offset) > radius + tolerance:
+            return np.empty(0, dtype=int)
+
+        lo, hi = self.extents(normal)
+        return np.flatnonzero((lo <= offset + tolerance) & (hi >= offset - tolerance))
+
+    def candidate_shapes(self, plane_point, plane_normal, tolerance: float = 0.0):
+        """Return the shapes whose bounding box straddles a plane.
+
+        Args:
+            plane_point (tuple[float, float, float]): A point on the plane.
+            plane_normal (tuple[float, float, float]): The plane's normal.
+            tolerance (float): Extra distance by which boxes are enlarged.
+
+        Returns:
+            list[TopoDS_Shape]: The candidate shapes.
+
+        """
+        return [
+            self.shapes[i]
+            for i in self.candidates(plane_point, plane_normal, tolerance)
+        ]
+
+
+class FaceIndex(BoxIndex):
+    """Bounding-box index of the faces of a shape.
+
+    The index is built once per loaded shape.
+
+    Attributes:
+        faces (list[TopoDS_Face]): The indexed faces, in exploration order.
+
+    """
+
+    def __init__(self, shape):
+        """Build the index over the faces of ``shape``.
+
+        Args:
+            shape (TopoDS_Shape): The shape whose faces are indexed.
+
+        Raises:
+            ValueError: If the shape is None.
+
+        """
+        if shape is None:
+            raise ValueError("Shape cannot be None")
+
+        faces = []
+        explorer = TopExp_Explorer(shape, TopAbs_FACE)
+        while explorer.More():
+            faces.append(explorer.Current())
+            explorer.Next()
+        super().__init__(faces)
+
+        log.debug("🗂️  Indexed %s faces", len(self.faces))
+
+    @property
+    def faces(self) -> list:
+        """The indexed faces, in exploration order."""
+        return self.shapes
+
+    def candidate_faces(self, plane_point, plane_normal, tolerance: float = 0.0):
+        """Return the faces whose bounding box straddles a plane.
+
+        Args:
+            plane_point (tuple[float, float, float]): A point on the plane.
+            plane_normal (tuple[float, float, float]): The plane's normal.
+            tolerance (float): Extra distance by which boxes are enlarged.
+
+        Returns:
+            list[TopoDS_Face]: The candidate faces.
+
+        """
+        return self.candidate_shapes(plane_point, plane_normal, tolerance)
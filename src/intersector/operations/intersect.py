@@ -8,14 +8,29 @@ Supports plane definitions via point-normal form.
 
 import logging
 
+import numpy as np
+from OCC.Core.BRep import BRep_Builder
+from OCC.Core.BRepAdaptor import BRepAdaptor_Curve
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
 from OCC.Core.gp import gp_Dir, gp_Pln, gp_Pnt
 from OCC.Core.TopAbs import TopAbs_EDGE
 from OCC.Core.TopExp import TopExp_Explorer
-from OCC.Core.TopoDS import TopoDS_Shape
+from OCC.Core.TopoDS import TopoDS_Compound, TopoDS_Shape, topods
+from OCC.Core.TopTools import TopTools_ListOfShape
 from OCC.Extend.ShapeFactory import make_face
 
-log = logging.getLogger("__name__")
+from intersector.utils.execution import current_policy
+from intersector.utils.geometry import canonical_plane
+from intersector.utils.profiling import phase
+
+log = logging.getLogger(__name__)
+
+# Planes sectioned together by `intersect_with_planes`, bounding the size of
+# the combined section held at once.
+DEFAULT_BATCH_SIZE = 64
+
+# Quantum used to group planes by direction and offset.
+PLANE_TOLERANCE = 1e-9
 
 
 def is_intersection_valid(intersection_shape: TopoDS_Shape) -> bool:
@@ -37,11 +52,12 @@ def is_intersection_valid(intersection_shape: TopoDS_Shape) -> bool:
     if intersection_shape is None:
         return False
 
-    explorer = TopExp_Explorer(intersection_shape, TopAbs_EDGE)
-    return explorer.More()
+    with phase("section.is_valid"):
+        explorer = TopExp_Explorer(intersection_shape, TopAbs_EDGE)
+        return explorer.More()
 
 
-def intersect_with_plane(shape, plane_point, plane_normal):
+def intersect_with_plane(shape, plane_point, plane_normal, index=None):
     """Compute intersection between a TopoDS_Shape and a plane (point + normal).
 
     Creates a plane from the given point and normal vector, then performs a
@@ -49,10 +65,15 @@ def intersect_with_plane(shape, plane_point, plane_normal):
     OpenCascade’s `BRepAlgoAPI_Section`. Returns the resulting intersection
     edges as a `TopoDS_Shape`.
 
+    When a `FaceIndex` of the shape is given, only the faces whose bounding
+    box straddles the plane are sectioned, and a plane that misses every face
+    returns an empty compound without any boolean work.
+
     Args:
         shape (TopoDS_Shape): The input 3D solid or surface.
         plane_point (tuple[float, float, float]): A point on the plane.
         plane_normal (tuple[float, float, float]): The plane's normal vector.
+        index (FaceIndex | None): Optional face index built from ``shape``.
 
     Raises:
         ValueError: shape is none.
@@ -73,13 +94,207 @@ def intersect_with_plane(shape, plane_point, plane_normal):
     plane = gp_Pln(point, normal)
 
     log.info(
-        f"✂️  Intersecting shape with plane at ({px},{py},{pz}) normal ({nx},{ny},{nz})"
+        "✂️  Intersecting shape with plane at (%s,%s,%s) normal (%s,%s,%s)",
+        px,
+        py,
+        pz,
+        nx,
+        ny,
+        nz,
     )
 
-    section = BRepAlgoAPI_Section(shape, make_face(plane))
-    section.Build()
+    if index is not None:
+        with phase("section.candidates"):
+            faces = index.candidate_faces(plane_point, plane_normal)
+        log.debug("🗂️  %s of %s faces straddle the plane", len(faces), len(index))
+        if not faces:
+            return combine_shapes([])
+        shape = combine_shapes(faces)
+
+    with phase("section.Build"):
+        section = BRepAlgoAPI_Section(shape, make_face(plane), False)
+        section.SetRunParallel(current_policy().parallel_booleans)
+        section.Build()
 
     if not section.IsDone():
         raise RuntimeError("Intersection operation failed: section not completed.")
 
     return section.Shape()
+
+
+def _parallel_groups(planes):
+    """Group planes by direction, merging coincident planes.
+
+    Returns:
+        dict: ``normal -> {offset: [plane indices]}``, where ``normal`` is the
+            canonical unit normal and ``offset`` the plane offset along it.
+
+    """
+    groups = {}
+    for i, (point, normal) in enumerate(planes):
+        direction, offset = canonical_plane(point, normal, PLANE_TOLERANCE)
+        groups.setdefault(direction, {}).setdefault(offset, []).append(i)
+    return groups
+
+
+def _split_by_offset(section: TopoDS_Shape, normal, offsets) -> list:
+    """Split the edges of a multi-plane section by the plane they lie on.
+
+    Each edge goes to the plane whose offset is nearest to the offset of the
+    midpoint of the edge.
+
+    Args:
+        section (TopoDS_Shape): The section of a shape with parallel planes.
+        normal (numpy.ndarray): The unit normal shared by the planes.
+        offsets (numpy.ndarray): The sorted plane offsets along ``normal``.
+
+    Returns:
+        list[TopoDS_Compound]: The section edges of each plane.
+
+    """
+    edges = [[] for _ in offsets]
+    explorer = TopExp_Explorer(section, TopAbs_EDGE)
+    while explorer.More():
+        edge = topods.Edge(explorer.Current())
+        curve = BRepAdaptor_Curve(edge)
+        mid = curve.Value((curve.FirstParameter() + curve.LastParameter()) / 2)
+        offset = normal @ (mid.X(), mid.Y(), mid.Z())
+        i = int(np.searchsorted(offsets, offset))
+        if i == len(offsets) or (i and offset - offsets[i - 1] < offsets[i] - offset):
+            i -= 1
+        edges[i].append(edge)
+        explorer.Next()
+    return [combine_shapes(plane_edges) for plane_edges in edges]
+
+
+def _section_parallel_planes(shape, normal, offsets, index=None) -> list:
+    """Section a shape with parallel planes in a single boolean operation.
+
+    Every plane face is a tool of one ``BRepAlgoAPI_Section``, so the shape
+    side of the operation (bounding boxes, interferences, pave blocks) is
+    prepared once for all planes. With a face index, the shape is reduced
+    to the faces straddling any of the planes.
+
+    Args:
+        shape (TopoDS_Shape): The input 3D solid or surface.
+        normal (numpy.ndarray): The unit normal shared by the planes.
+        offsets (numpy.ndarray): The sorted, distinct plane offsets.
+        index (FaceIndex | None): Optional face index built from ``shape``.
+
+    Returns:
+        list[TopoDS_Compound]: The section edges of each plane.
+
+    Raises:
+        RuntimeError: If the intersection operation fails.
+
+    """
+    if index is not None:
+        with phase("section.candidates"):
+            lo, hi = index.extents(normal)
+            crossed = np.searchsorted(offsets, lo, side="left") < np.searchsorted(
+                offsets, hi, side="right"
+            )
+            faces = [index.faces[i] for i in np.flatnonzero(crossed)]
+        log.debug("🗂️  %s of %s faces straddle the planes", len(faces), len(index))
+        if not faces:
+            return [combine_shapes([]) for _ in offsets]
+        shape = combine_shapes(faces)
+
+    arguments = TopTools_ListOfShape()
+    arguments.Append(shape)
+    tools = TopTools_ListOfShape()
+    direction = gp_Dir(*normal)
+    for offset in offsets:
+        point = gp_Pnt(*(normal * offset))
+        tools.Append(make_face(gp_Pln(point, direction)))
+
+    with phase("section.Build"):
+        section = BRepAlgoAPI_Section()
+        section.SetArguments(arguments)
+        section.SetTools(tools)
+        section.SetRunParallel(current_policy().parallel_booleans)
+        section.Build()
+
+    if not section.IsDone():
+        raise RuntimeError("Intersection operation failed: section not completed.")
+
+    with phase("section.split"):
+        return _split_by_offset(section.Shape(), normal, offsets)
+
+
+def intersect_with_planes(
+    shape, planes, index=None, batch_size: int = DEFAULT_BATCH_SIZE
+):
+    """Yield the intersection of a shape with each plane, batching booleans.
+
+    Planes are taken ``batch_size`` at a time. Within a batch, parallel
+    planes are sectioned together by a single multi-tool
+    ``BRepAlgoAPI_Section``, whose result is split back into one compound
+    of edges per plane; coincident planes share their result. Planes of
+    different directions are never combined, since their unbounded faces
+    would cut each other, so a batch of planes with distinct directions
+    costs one boolean per plane, as with :func:`intersect_with_plane`.
+
+    Args:
+        shape (TopoDS_Shape): The input 3D solid or surface.
+        planes (Sequence[tuple]): The ``(point, normal)`` pairs.
+        index (FaceIndex | None): Optional face index built from ``shape``.
+        batch_size (int): Number of planes sectioned together at most.
+
+    Yields:
+        TopoDS_Shape: The section edges of each plane, in order.
+
+    Raises:
+        ValueError: If the shape is None, a plane normal is a zero vector or
+            ``batch_size`` is not positive.
+
+    """
+    if shape is None:
+        raise ValueError("Shape cannot be None")
+    if batch_size < 1:
+        raise ValueError("Batch size must be positive")
+
+    for start in range(0, len(planes), batch_size):
+        batch = planes[start : start + batch_size]
+        results = [None] * len(batch)
+        for direction, by_offset in _parallel_groups(batch).items():
+            normal = np.asarray(direction, dtype=float) * PLANE_TOLERANCE
+            normal /= np.linalg.norm(normal)
+            offsets = np.array(sorted(by_offset), dtype=float) * PLANE_TOLERANCE
+            log.info(
+                "✂️  Intersecting shape with %s planes along (%.6g,%.6g,%.6g)",
+                len(offsets),
+                normal[0],
+                normal[1],
+                normal[2],
+            )
+            sections = _section_parallel_planes(shape, normal, offsets, index)
+            for key, section in zip(sorted(by_offset), sections, strict=True):
+                for i in by_offset[key]:
+                    results[i] = section
+        yield from results
+
+
+def combine_shapes(shapes) -> TopoDS_Compound:
+    """Gather several shapes into a single compound.
+
+    Used to merge the results of a multi-plane intersection into one shape
+    that can be exported or displayed at once.
+
+    Args:
+        shapes (Iterable[TopoDS_Shape]): The shapes to combine. ``None``
+            entries are skipped.
+
+    Returns:
+        TopoDS_Compound: A compound holding every given shape.
+
+    """
+    builder = BRep_Builder()
+    compound = TopoDS_Compound()
+    builder.MakeCompound(compound)
+
+    for shape in shapes:
+        if shape is not None:
+            builder.Add(compound, shape)
+
+    return compound
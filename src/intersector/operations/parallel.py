@@ -0,0 +1,293 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Parallel intersection of shapes with planes.
+
+Many planes are spread over worker processes plane by plane; a single plane
+crossing a large compound is spread over them solid by solid.
+
+The input shape is serialized once into a binary BRep blob and loaded by every
+worker process when it starts, so jobs only carry the plane definition (and
+part numbers) and the (small) section result back.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from OCC.Core.TopAbs import TopAbs_EDGE, TopAbs_FACE, TopAbs_SOLID, TopAbs_VERTEX
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopoDS import TopoDS_Iterator
+
+from intersector.operations.face_index import BoxIndex, FaceIndex
+from intersector.operations.intersect import combine_shapes, intersect_with_plane
+from intersector.utils.execution import current_policy, set_policy
+from intersector.utils.file_handler import shape_from_bytes, shape_to_bytes
+from intersector.utils.scheduler import MemoryScheduler, estimate_footprint
+
+log = logging.getLogger(__name__)
+
+# Shape and face index loaded once per worker process by `_init_worker`.
+_worker_shape = None
+_worker_index = None
+
+# Parts loaded once per worker process by `_init_parts_worker`.
+_worker_parts = None
+
+# Planes handed to the pool at a time. The pool submits all the planes it is
+# given at once, so a large plane set is sliced rather than converted whole.
+_PLANE_WINDOW = 4096
+
+
+def _init_worker(shape_blob: bytes, policy) -> None:
+    """Load the shared shape into the worker process and index its faces."""
+    global _worker_shape, _worker_index  # noqa: PLW0603
+    set_policy(policy)
+    _worker_shape = shape_from_bytes(shape_blob)
+    _worker_index = FaceIndex(_worker_shape)
+
+
+def _section_task(plane) -> bytes:
+    """Intersect the worker's shape with one plane.
+
+    Returns:
+        bytes: The section result serialized as a binary BRep blob.
+
+    """
+    point, normal = plane
+    result = intersect_with_plane(_worker_shape, point, normal, index=_worker_index)
+    return shape_to_bytes(result)
+
+
+def default_workers() -> int:
+    """Return the number of worker processes used when none is given.
+
+    Returns:
+        int: The number of CPUs available to this process.
+
+    """
+    return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else 1
+
+
+def count_faces(shape) -> int:
+    """Count the faces of a shape.
+
+    Returns:
+        int: The number of faces, shared faces counted once per use.
+
+    """
+    count = 0
+    explorer = TopExp_Explorer(shape, TopAbs_FACE)
+    while explorer.More():
+        count += 1
+        explorer.Next()
+    return count
+
+
+def _workers_within_budget(scheduler, blob: bytes, shape, workers: int) -> int:
+    """Cap the workers of a shape to the scheduler's memory budget.
+
+    Every worker loads the whole shape, so each one needs the estimated
+    footprint of the shape.
+
+    Returns:
+        int: The number of workers to start.
+
+    """
+    if scheduler.budget is None:
+        return workers
+
+    footprint = estimate_footprint(len(blob), count_faces(shape))
+    allowed = scheduler.workers_for(footprint, workers)
+    if allowed < workers:
+        log.warning(
+            "[yellow]⚠️  The memory budget fits %s of %s worker(s).[/yellow]",
+            allowed,
+            workers,
+        )
+    return allowed
+
+
+def intersect_with_planes_parallel(
+    shape, planes, workers: int | None = None, scheduler=None
+):
+    """Intersect a shape with several planes using a pool of worker processes.
+
+    The shape is shipped to each worker once, as a binary BRep blob, and the
+    planes are spread across the workers, a window of planes at a time.
+    Results are yielded in the same order as ``planes``.
+
+    Args:
+        shape (TopoDS_Shape): The input 3D solid or surface.
+        planes (Sequence[tuple]): The (point, normal) pairs to intersect
+            with, such as a :class:`~intersector.utils.plane_sets.PlaneSet`.
+        workers (int | None): Number of worker processes. Defaults to the
+            number of available CPUs.
+        scheduler (MemoryScheduler | None): Scheduler capping the workers to
+            its memory budget, recycling them and recording their peak RSS.
+
+    Yields:
+        TopoDS_Shape: The intersection result of each plane, in order.
+
+    Raises:
+        ValueError: If the shape is None or ``workers`` is not positive.
+
+    Note:
+        Failures inside a worker are re-raised in the caller; a worker that
+        dies abruptly surfaces as ``BrokenProcessPool`` (a ``RuntimeError``).
+
+    """
+    if shape is None:
+        raise ValueError("Shape cannot be None")
+
+    workers = workers or default_workers()
+    if workers < 1:
+        raise ValueError("Number of workers must be positive")
+
+    workers = min(workers, max(1, len(planes)))
+
+    scheduler = scheduler or MemoryScheduler()
+    blob = shape_to_bytes(shape)
+    workers = _workers_within_budget(scheduler, blob, shape, workers)
+    chunksize = max(1, min(len(planes), _PLANE_WINDOW) // (workers * 4))
+
+    log.info("⚙️  Intersecting %s planes with %s worker(s)", len(planes), workers)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(blob, current_policy()),
+        **scheduler.pool_options(),
+    ) as pool:
+        for start in range(0, len(planes), _PLANE_WINDOW):
+            window = planes[start : start + _PLANE_WINDOW]
+            for result in scheduler.imap(pool, _section_task, window, chunksize):
+                yield shape_from_bytes(result)
+    scheduler.report()
+
+
+def shape_parts(shape) -> list:
+    """Split a shape into parts that can be sectioned independently.
+
+    Returns:
+        list[TopoDS_Shape]: The solids of the shape, then the faces that do
+            not belong to any solid, then one compound of the free edges,
+            wires and vertices that do not belong to any face, if any.
+
+    """
+    parts = []
+    explorer = TopExp_Explorer(shape, TopAbs_SOLID)
+    while explorer.More():
+        parts.append(explorer.Current())
+        explorer.Next()
+
+    explorer = TopExp_Explorer(shape, TopAbs_FACE, TopAbs_SOLID)
+    while explorer.More():
+        parts.append(explorer.Current())
+        explorer.Next()
+
+    loose = []
+    for kind, owner in ((TopAbs_EDGE, TopAbs_FACE), (TopAbs_VERTEX, TopAbs_EDGE)):
+        explorer = TopExp_Explorer(shape, kind, owner)
+        while explorer.More():
+            loose.append(explorer.Current())
+            explorer.Next()
+    if loose:
+        parts.append(combine_shapes(loose))
+    return parts
+
+
+def _init_parts_worker(parts_blob: bytes, policy) -> None:
+    """Load the shared parts into the worker process."""
+    global _worker_parts  # noqa: PLW0603
+    set_policy(policy)
+    iterator = TopoDS_Iterator(shape_from_bytes(parts_blob))
+    _worker_parts = []
+    while iterator.More():
+        _worker_parts.append(iterator.Value())
+        iterator.Next()
+
+
+def _section_parts_task(task) -> bytes:
+    """Intersect some of the worker's parts with a plane.
+
+    Returns:
+        bytes: The section result serialized as a binary BRep blob.
+
+    """
+    numbers, point, normal = task
+    parts = combine_shapes(_worker_parts[i] for i in numbers)
+    return shape_to_bytes(intersect_with_plane(parts, point, normal))
+
+
+def intersect_with_plane_parallel(
+    shape, plane_point, plane_normal, workers: int | None = None, scheduler=None
+):
+    """Intersect a shape with one plane, sectioning its solids in parallel.
+
+    The shape is split into its solids (and faces outside any solid); the
+    parts whose bounding box misses the plane are dropped, and the others
+    are sectioned in batches by a pool of worker processes. The section
+    results are merged back into one compound. Shapes without faces or with
+    fewer than two crossed parts are sectioned in-process.
+
+    Args:
+        shape (TopoDS_Shape): The input shape, typically a compound.
+        plane_point (tuple[float, float, float]): A point on the plane.
+        plane_normal (tuple[float, float, float]): The plane's normal vector.
+        workers (int | None): Number of worker processes. Defaults to the
+            number of available CPUs.
+        scheduler (MemoryScheduler | None): Scheduler capping the workers to
+            its memory budget, recycling them and recording their peak RSS.
+
+    Returns:
+        TopoDS_Compound: The intersection edges of all parts.
+
+    Raises:
+        ValueError: If the shape is None or ``workers`` is not positive.
+
+    Note:
+        Solids are sectioned independently, so a face shared by two solids
+        contributes its section edges twice.
+
+    """
+    if shape is None:
+        raise ValueError("Shape cannot be None")
+
+    workers = workers or default_workers()
+    if workers < 1:
+        raise ValueError("Number of workers must be positive")
+
+    parts = shape_parts(shape)
+    if not parts:
+        return intersect_with_plane(shape, plane_point, plane_normal)
+
+    parts = BoxIndex(parts).candidate_shapes(plane_point, plane_normal)
+    if len(parts) < 2 or workers == 1:  # noqa: PLR2004
+        if not parts:
+            return combine_shapes([])
+        return intersect_with_plane(combine_shapes(parts), plane_point, plane_normal)
+
+    workers = min(workers, len(parts))
+
+    scheduler = scheduler or MemoryScheduler()
+    crossed = combine_shapes(parts)
+    blob = shape_to_bytes(crossed)
+    workers = _workers_within_budget(scheduler, blob, crossed, workers)
+    batches = min(len(parts), workers * 4)
+    tasks = [
+        (range(start, len(parts), batches), plane_point, plane_normal)
+        for start in range(batches)
+    ]
+
+    log.info("⚙️  Intersecting %s parts with %s worker(s)", len(parts), workers)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_parts_worker,
+        initargs=(blob, current_policy()),
+        **scheduler.pool_options(),
+    ) as pool:
+        blobs = list(scheduler.imap(pool, _section_parts_task, tasks))
+    scheduler.report()
+
+    return combine_shapes(shape_from_bytes(blob) for blob in blobs)
@@ -0,0 +1,178 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Warm-started sectioning of one shape with a stream of nearby planes.
+
+A :class:`SectionSession` prepares a shape once (face index, extent of every
+face along the plane normal, sorted for binary search) and then answers
+plane positions one after the other, as when a plane is dragged through the
+shape in a viewer. Between two positions only the faces whose box the plane
+entered or left are visited to update the set of crossed faces, and the
+section boolean only sees the crossed faces. Recent results are kept, so
+going back to a previous position costs nothing.
+"""
+
+import logging
+from collections import OrderedDict
+
+import numpy as np
+
+from intersector.operations.face_index import FaceIndex
+from intersector.operations.intersect import combine_shapes, intersect_with_plane
+
+log = logging.getLogger(__name__)
+
+
+def _between(order, values, low: float, high: float) -> np.ndarray:
+    """Return the faces whose sorted ``values`` lie in ``(low, high]``.
+
+    Returns:
+        numpy.ndarray: Face numbers, taken from ``order``.
+
+    """
+    start, stop = np.searchsorted(values, [low, high], side="right")
+    return order[start:stop]
+
+
+class SectionSession:
+    """Section one shape with successive planes, reusing prepared data.
+
+    Attributes:
+        shape (TopoDS_Shape): The sectioned shape.
+        index (FaceIndex): The face index of the shape.
+        changed (int): Number of faces whose crossing status was updated by
+            the last call to :meth:`section`.
+
+    """
+
+    def __init__(self, shape, index: FaceIndex | None = None, max_cached: int = 64):
+        """Prepare a shape for sectioning.
+
+        Args:
+            shape (TopoDS_Shape): The shape to section.
+            index (FaceIndex | None): A face index already built from
+                ``shape``. Built here when omitted.
+            max_cached (int): Number of recent section results kept.
+
+        Raises:
+            ValueError: If the shape is None or ``max_cached`` is negative.
+
+        """
+        if shape is None:
+            raise ValueError("Shape cannot be None")
+        if max_cached < 0:
+            raise ValueError("Number of cached sections cannot be negative")
+
+        self.shape = shape
+        self.index = index if index is not None else FaceIndex(shape)
+        self.changed = 0
+        self._max_cached = max_cached
+        self._results = OrderedDict()
+        self._normal = None
+        self._offset = None
+
+    def _prepare(self, normal: tuple) -> None:
+        """Compute the face extents along a new plane normal."""
+        self._normal = normal
+        self._offset = None
+        self._lo, self._hi = self.index.extents(normal)
+        self._lo_order = np.argsort(self._lo, kind="stable")
+        self._hi_order = np.argsort(self._hi, kind="stable")
+        self._lo_sorted = self._lo[self._lo_order]
+        self._hi_sorted = self._hi[self._hi_order]
+        self._crossed = np.zeros(len(self.index), dtype=bool)
+        log.debug("🧭 Prepared %s face extents along %s", len(self.index), normal)
+
+    def _move(self, offset: float) -> None:
+        """Update the crossed faces for the plane at ``offset``."""
+        previous = self._offset
+        if previous is None:
+            self._crossed = (self._lo <= offset) & (self._hi >= offset)
+            self.changed = len(self._crossed)
+        elif offset > previous:
+            # Faces ending in [previous, offset) are left behind, faces
+            # starting in (previous, offset] are entered if long enough.
+            left = _between(
+                self._hi_order,
+                self._hi_sorted,
+                *np.nextafter([previous, offset], -np.inf),
+            )
+            entered = _between(self._lo_order, self._lo_sorted, previous, offset)
+            self._crossed[left] = False
+            self._crossed[entered] = self._hi[entered] >= offset
+            self.changed = len(left) + len(entered)
+        elif offset < previous:
+            # Mirror image: faces starting in (offset, previous] are left,
+            # faces ending in [offset, previous) are entered if long enough.
+            left = _between(self._lo_order, self._lo_sorted, offset, previous)
+            entered = _between(
+                self._hi_order,
+                self._hi_sorted,
+                *np.nextafter([offset, previous], -np.inf),
+            )
+            self._crossed[left] = False
+            self._crossed[entered] = self._lo[entered] <= offset
+            self.changed = len(left) + len(entered)
+        else:
+            self.changed = 0
+        self._offset = offset
+
+    def crossed_faces(self) -> list:
+        """Return the faces crossed by the last sectioned plane.
+
+        Returns:
+            list[TopoDS_Face]: The faces whose box straddles the plane.
+
+        """
+        if self._offset is None:
+            return []
+        return [self.index.faces[i] for i in np.flatnonzero(self._crossed)]
+
+    def section(self, plane_point, plane_normal):
+        """Intersect the shape with a plane.
+
+        Args:
+            plane_point (tuple[float, float, float]): A point on the plane.
+            plane_normal (tuple[float, float, float]): The plane's normal.
+
+        Returns:
+            TopoDS_Shape: The intersection edges, an empty compound when the
+                plane misses every face.
+
+        Raises:
+            ValueError: If the plane normal is a zero vector.
+
+        """
+        normal = np.asarray(plane_normal, dtype=float)
+        length = np.linalg.norm(normal)
+        if length == 0.0:
+            raise ValueError("Plane normal cannot be a zero vector")
+        normal = tuple(float(c) for c in normal / length)
+        offset = float(np.dot(normal, np.asarray(plane_point, dtype=float)))
+
+        if normal != self._normal:
+            self._prepare(normal)
+        self._move(offset)
+
+        key = (normal, offset)
+        if key in self._results:
+            self._results.move_to_end(key)
+            log.debug("♻️  Reusing the section at offset %s", offset)
+            return self._results[key]
+
+        faces = self.crossed_faces()
+        log.debug(
+            "🗂️  %s of %s faces crossed, %s updated",
+            len(faces),
+            len(self.index),
+            self.changed,
+        )
+        if faces:
+            result = intersect_with_plane(combine_shapes(faces), plane_point, normal)
+        else:
+            result = combine_shapes([])
+
+        if self._max_cached:
+            self._results[key] = result
+            if len(self._results) > self._max_cached:
+                self._results.popitem(last=False)
+        return result
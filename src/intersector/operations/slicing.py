@@ -0,0 +1,127 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Uniform layer-stack slicing of shapes.
+
+Slices a shape with a stack of evenly spaced parallel planes. Faces are
+sorted by their extent along the slicing direction and swept once, so each
+plane is only intersected with the faces it can actually touch.
+"""
+
+import logging
+import math
+
+import numpy as np
+
+from intersector.operations.face_index import FaceIndex
+from intersector.operations.intersect import combine_shapes, intersect_with_plane
+
+log = logging.getLogger(__name__)
+
+# Fraction of a step below which a layer boundary is taken to be exact.
+_LAYER_TOLERANCE = 1e-9
+
+
+def _unit(direction) -> tuple[float, float, float]:
+    """Return ``direction`` scaled to unit length.
+
+    Returns:
+        tuple[float, float, float]: The normalized direction.
+
+    Raises:
+        ValueError: If the direction has zero length.
+
+    """
+    length = math.sqrt(sum(c * c for c in direction))
+    if length == 0.0:
+        raise ValueError("Slicing direction cannot be a zero vector")
+
+    return tuple(c / length for c in direction)
+
+
+def layer_offsets(lo: float, hi: float, step: float) -> list[float]:
+    """Return the plane offsets of a uniform layer stack over ``[lo, hi]``.
+
+    Planes are placed in the middle of each full layer (``lo + step / 2``,
+    ``lo + 3 * step / 2``, ...), which keeps them off the bounding faces of
+    the shape where sections degenerate. A partial layer left at the top of
+    the range gets one plane in its own middle, so every offset lies
+    strictly inside the range.
+
+    Args:
+        lo (float): Start of the range along the slicing direction.
+        hi (float): End of the range along the slicing direction.
+        step (float): Layer thickness.
+
+    Returns:
+        list[float]: The plane offsets, in increasing order.
+
+    Raises:
+        ValueError: If ``step`` is not positive.
+
+    """
+    if step <= 0:
+        raise ValueError("Slicing step must be positive")
+
+    full = math.floor((hi - lo) / step + _LAYER_TOLERANCE)
+    offsets = [lo + (k + 0.5) * step for k in range(full)]
+    top = lo + full * step
+    if hi - top > _LAYER_TOLERANCE * step:
+        offsets.append((top + hi) / 2)
+    return offsets or [(lo + hi) / 2]
+
+
+def slice_shape(shape, direction, step: float):
+    """Slice a shape with evenly spaced planes along a direction.
+
+    The plane range is taken from the bounding boxes of the faces of the
+    shape (see :class:`FaceIndex`). Faces are sorted by the start of their
+    extent along ``direction``; while sweeping the planes in order, faces
+    enter the active set once the sweep reaches them and leave it once it
+    has passed them. Each plane is intersected only with the active faces
+    instead of the full shape.
+
+    Args:
+        shape (TopoDS_Shape): The input 3D solid or surface.
+        direction (tuple[float, float, float]): The slicing direction, i.e.
+            the normal shared by every plane.
+        step (float): Distance between consecutive planes.
+
+    Yields:
+        tuple: ``(point, normal, result)`` for each plane, in sweep order,
+            where ``result`` is the section as a TopoDS_Shape.
+
+    Raises:
+        ValueError: If the shape is None, the direction is a zero vector or
+            the step is not positive.
+
+    """
+    if shape is None:
+        raise ValueError("Shape cannot be None")
+
+    normal = _unit(direction)
+    index = FaceIndex(shape)
+    lo, hi = index.extents(normal)
+    if not len(index):
+        return
+
+    offsets = layer_offsets(float(lo.min()), float(hi.max()), step)
+    order = np.argsort(lo, kind="stable")
+
+    log.info("🔪 Slicing %s faces with %s planes", len(index), len(offsets))
+
+    active = []
+    next_face = 0
+    for offset in offsets:
+        while next_face < len(order) and lo[order[next_face]] <= offset:
+            active.append(order[next_face])
+            next_face += 1
+        active = [i for i in active if hi[i] >= offset]
+
+        point = tuple(c * offset for c in normal)
+        if active:
+            result = intersect_with_plane(
+                combine_shapes(index.faces[i] for i in active), point, normal
+            )
+        else:
+            result = combine_shapes([])
+        yield point, normal, result
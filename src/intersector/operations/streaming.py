@@ -0,0 +1,114 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Memory-bounded sectioning of STEP files, one root at a time.
+
+Each root of the file is transferred, sectioned with every plane and
+released before the next one is transferred, so the B-rep memory peak is
+set by the largest root rather than by the whole assembly. Only the section
+results, which are much smaller than the solids they are cut from, are kept.
+"""
+
+import logging
+
+from intersector.operations.discretize import DEFAULT_DEFLECTION, section_polylines
+from intersector.operations.face_index import FaceIndex
+from intersector.operations.intersect import (
+    combine_shapes,
+    intersect_with_plane,
+    is_intersection_valid,
+)
+from intersector.operations.mesh_slicing import TriangleMesh
+from intersector.utils.file_handler import iter_step_roots
+
+log = logging.getLogger(__name__)
+
+
+def _section_root(shape, planes, engine: str, deflection: float, polylines: bool):
+    """Section one root with every plane.
+
+    Returns:
+        list: For each plane, the section result, or its polylines or mesh
+            segments, or None if the plane misses the root.
+
+    """
+    if engine == "mesh":
+        mesh = TriangleMesh.from_shape(shape, deflection)
+        return [list(segments) or None for segments in mesh.sections(planes)]
+
+    index = FaceIndex(shape) if len(planes) > 1 else None
+    results = []
+    for point, normal in planes:
+        result = intersect_with_plane(shape, point, normal, index=index)
+        if not is_intersection_valid(result):
+            results.append(None)
+        elif polylines:
+            results.append(section_polylines(result, deflection))
+        else:
+            results.append(result)
+    return results
+
+
+def stream_sections(  # noqa: PLR0913, PLR0917
+    filename: str,
+    planes,
+    engine: str = "brep",
+    deflection: float = DEFAULT_DEFLECTION,
+    polylines: bool = False,
+):
+    """Section a STEP file root by root.
+
+    Args:
+        filename (str): Path to the STEP file.
+        planes (list[tuple]): The (point, normal) pairs.
+        engine (str): ``brep`` for exact sections or ``mesh`` for segments of
+            the tessellated roots.
+        deflection (float): Polyline sampling deflection, or tessellation
+            deflection with the ``mesh`` engine.
+        polylines (bool): With the ``brep`` engine, sample each section into
+            polylines right away instead of keeping its B-rep edges.
+
+    Yields:
+        tuple[int, int, list]: The root number, the number of roots, and the
+            partial result of each plane on that root (None where the plane
+            misses it).
+
+    """
+    for number, total, shape in iter_step_roots(filename):
+        results = _section_root(shape, planes, engine, deflection, polylines)
+        del shape
+        hits = sum(r is not None for r in results)
+        log.info(
+            "🧱 Root %s/%s: %s of %s planes cut it", number, total, hits, len(planes)
+        )
+        yield number, total, results
+
+
+def section_step_streaming(  # noqa: PLR0913, PLR0917
+    filename: str,
+    planes,
+    engine: str = "brep",
+    deflection: float = DEFAULT_DEFLECTION,
+    polylines: bool = False,
+) -> list:
+    """Section a STEP file root by root and merge the partial results.
+
+    Takes the same arguments as :func:`stream_sections`.
+
+    Returns:
+        list: For each plane, the compound of its partial sections, or their
+            concatenated polylines or segments with ``polylines`` or the
+            ``mesh`` engine. Planes missing every root get an empty compound
+            or list.
+
+    """
+    parts = [[] for _ in planes]
+    for _, _, results in stream_sections(
+        filename, planes, engine, deflection, polylines
+    ):
+        for plane_parts, result in zip(parts, results, strict=True):
+            if result is not None:
+                plane_parts.append(result)
+
+    if engine == "brep" and not polylines:
+        return [combine_shapes(p) for p in parts]
+    return [[item for part in p for item in part] for p in parts]
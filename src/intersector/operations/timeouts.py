@@ -0,0 +1,287 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Exact sections under a time budget, with an approximate fallback.
+
+OpenCascade booleans cannot be interrupted from Python, and a plane grazing
+tangent faces or slivers can keep ``BRepAlgoAPI_Section.Build`` busy for
+minutes. A :class:`TimedSectioner` therefore runs the exact sections in a
+worker process holding the shape and its face index. When a section does not
+come back within the budget, the worker is killed and restarted for the next
+plane, and the plane gets either an approximate section cut from a
+tessellation of the shape or an empty result.
+"""
+
+import logging
+import multiprocessing
+
+import numpy as np
+from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Copy, BRepBuilderAPI_MakeEdge
+from OCC.Core.gp import gp_Pnt
+
+from intersector.operations.face_index import FaceIndex
+from intersector.operations.intersect import combine_shapes, intersect_with_plane
+from intersector.operations.mesh_slicing import DEFAULT_DEFLECTION, TriangleMesh
+from intersector.utils.execution import current_policy, set_policy
+from intersector.utils.file_handler import shape_from_bytes, shape_to_bytes
+
+log = logging.getLogger(__name__)
+
+# What a plane gets when its exact section runs out of time.
+TIMEOUT_FALLBACKS = ("mesh", "skip")
+
+# Segments shorter than this are dropped when building fallback edges.
+_MIN_SEGMENT = 1e-9
+
+# Seconds a worker may take to load and index the shape, at the least.
+_LOAD_TIMEOUT = 300.0
+
+# Workers are spawned: forking while the writer and log threads run could
+# copy their locks in a held state.
+_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def _serve(conn, shape_blob: bytes, policy) -> None:
+    """Section the worker's shape with the planes received on ``conn``.
+
+    Sends ``None`` once the shape is loaded, then ``(True, blob)`` with the
+    BRep blob of each section, or ``(False, exception)`` when it fails.
+    Stops when it receives ``None``.
+
+    """
+    set_policy(policy)
+    shape = shape_from_bytes(shape_blob)
+    index = FaceIndex(shape)
+    conn.send(None)
+
+    while (plane := conn.recv()) is not None:
+        point, normal = plane
+        try:
+            result = intersect_with_plane(shape, point, normal, index=index)
+            conn.send((True, shape_to_bytes(result)))
+        except Exception as e:  # noqa: BLE001 - re-raised by the caller
+            conn.send((False, e))
+
+
+def segments_to_shape(segments):
+    """Build straight edges from section segments.
+
+    Args:
+        segments (numpy.ndarray): ``(K, 2, 3)`` array of segments, as
+            returned by :meth:`TriangleMesh.section`.
+
+    Returns:
+        TopoDS_Compound: One edge per segment, degenerate segments skipped.
+
+    """
+    edges = [
+        BRepBuilderAPI_MakeEdge(gp_Pnt(*start), gp_Pnt(*end)).Edge()
+        for start, end in np.asarray(segments, dtype=float).reshape(-1, 2, 3)
+        if np.linalg.norm(end - start) > _MIN_SEGMENT
+    ]
+    return combine_shapes(edges)
+
+
+class TimedSectioner:
+    """Exact sections of a shape, each bounded by a time budget.
+
+    Attributes:
+        timeout (float): Seconds each exact section may take.
+        fallback (str): ``mesh`` to cut an approximate section from a
+            tessellation of the shape on timeout, ``skip`` to return an
+            empty section.
+        timed_out (int): Number of sections that ran out of time.
+
+    """
+
+    def __init__(
+        self,
+        shape,
+        timeout: float,
+        fallback: str = "mesh",
+        deflection: float = DEFAULT_DEFLECTION,
+    ):
+        """Create a sectioner; its worker starts with the first section.
+
+        Args:
+            shape (TopoDS_Shape): The input shape.
+            timeout (float): Seconds each exact section may take.
+            fallback (str): ``mesh`` or ``skip`` (see :attr:`fallback`).
+            deflection (float): Tessellation deflection of the ``mesh``
+                fallback.
+
+        Raises:
+            ValueError: If the shape is None, the timeout or deflection is
+                not positive, or the fallback is unknown.
+
+        """
+        if shape is None:
+            raise ValueError("Shape cannot be None")
+        if timeout <= 0:
+            raise ValueError("Timeout must be positive")
+        if fallback not in TIMEOUT_FALLBACKS:
+            raise ValueError(f"Unknown timeout fallback: {fallback!r}")
+        if deflection <= 0:
+            raise ValueError("Deflection must be positive")
+
+        self.timeout = timeout
+        self.fallback = fallback
+        self.timed_out = 0
+        self._shape = shape
+        self._blob = None
+        self._deflection = deflection
+        self._mesh = None
+        self._process = None
+        self._conn = None
+
+    def _start(self) -> None:
+        """Start the worker and wait until it has loaded the shape.
+
+        Loading and indexing the shape do not count against the timeout, but
+        may take no longer than the larger of the timeout and five minutes.
+
+        Raises:
+            RuntimeError: If the worker dies or hangs while loading the shape.
+
+        """
+        if self._blob is None:
+            self._blob = shape_to_bytes(self._shape)
+        self._conn, child = _CONTEXT.Pipe()
+        self._process = _CONTEXT.Process(
+            target=_serve,
+            args=(child, self._blob, current_policy()),
+            daemon=True,
+        )
+        self._process.start()
+        child.close()
+        load_timeout = max(self.timeout, _LOAD_TIMEOUT)
+        if not self._conn.poll(load_timeout):
+            self._stop(kill=True)
+            raise RuntimeError(
+                f"Section worker did not load the shape within {load_timeout}s"
+            )
+        try:
+            self._conn.recv()
+        except EOFError:
+            self._stop(kill=True)
+            raise RuntimeError("Section worker died while loading the shape") from None
+
+    def _stop(self, kill: bool = False) -> None:
+        """Stop the worker, killing it if it is busy."""
+        if self._process is None:
+            return
+        if kill:
+            self._process.kill()
+        else:
+            self._conn.send(None)
+        self._process.join()
+        self._conn.close()
+        self._process = self._conn = None
+
+    def _approximate(self, point, normal):
+        """Cut the section of a plane from the tessellated shape.
+
+        A copy of the shape is tessellated, so the caller's shape does not
+        keep the triangulation.
+
+        Returns:
+            TopoDS_Compound: The section segments as straight edges.
+
+        """
+        if self._mesh is None:
+            shape = BRepBuilderAPI_Copy(self._shape).Shape()
+            self._mesh = TriangleMesh.from_shape(shape, self._deflection)
+        return segments_to_shape(self._mesh.section(point, normal))
+
+    def section(self, plane_point, plane_normal):
+        """Intersect the shape with a plane within the time budget.
+
+        Args:
+            plane_point (tuple[float, float, float]): A point on the plane.
+            plane_normal (tuple[float, float, float]): The plane's normal.
+
+        Returns:
+            tuple[TopoDS_Shape, bool]: The section, and whether the exact
+                section ran out of time and the result is the fallback's.
+
+        Raises:
+            RuntimeError: If the worker dies during the section.
+
+        """
+        if self._process is None:
+            self._start()
+
+        point, normal = tuple(plane_point), tuple(plane_normal)
+        self._conn.send((point, normal))
+        if self._conn.poll(self.timeout):
+            try:
+                ok, payload = self._conn.recv()
+            except EOFError:
+                self._stop(kill=True)
+                raise RuntimeError("Section worker died during a section") from None
+            if not ok:
+                raise payload
+            return shape_from_bytes(payload), False
+
+        self._stop(kill=True)
+        self.timed_out += 1
+        log.warning(
+            "[yellow]⏱️  Section with plane %s:%s exceeded %ss; %s.[/yellow]",
+            point,
+            normal,
+            self.timeout,
+            "using an approximate section"
+            if self.fallback == "mesh"
+            else "skipping the plane",
+        )
+        if self.fallback == "mesh":
+            return self._approximate(point, normal), True
+        return combine_shapes([]), True
+
+    def close(self) -> None:
+        """Stop the worker and drop the fallback mesh."""
+        self._stop()
+        self._mesh = None
+
+    def __enter__(self):
+        """Return the sectioner.
+
+        Returns:
+            TimedSectioner: This sectioner.
+
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop the worker."""
+        self.close()
+
+
+def intersect_with_planes_timeout(  # noqa: PLR0913, PLR0917
+    shape,
+    planes,
+    timeout: float,
+    fallback: str = "mesh",
+    deflection: float = DEFAULT_DEFLECTION,
+    timed_out=None,
+):
+    """Intersect a shape with several planes, bounding each section's time.
+
+    Args:
+        shape (TopoDS_Shape): The input shape.
+        planes (Iterable[tuple]): The (point, normal) pairs.
+        timeout (float): Seconds each exact section may take.
+        fallback (str): ``mesh`` or ``skip`` (see :class:`TimedSectioner`).
+        deflection (float): Tessellation deflection of the ``mesh`` fallback.
+        timed_out (list | None): Receives the positions of the planes whose
+            exact section ran out of time.
+
+    Yields:
+        TopoDS_Shape: The section of each plane, in order.
+
+    """
+    with TimedSectioner(shape, timeout, fallback, deflection) as sectioner:
+        for i, (point, normal) in enumerate(planes):
+            result, late = sectioner.section(point, normal)
+            if late and timed_out is not None:
+                timed_out.append(i)
+            yield result
@@ -0,0 +1,427 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Assembly of section edges into ordered wires and planar faces.
+
+A section result is a loose compound of edges. Their end points are welded
+with a spatial hash (a grid of cells the size of the tolerance, so each end
+point is only compared with the points of its neighbouring cells) and the
+edges are then walked end to end into chains, in time linear in the number
+of edges. Chains become wires, or polylines when the section was sampled,
+and closed chains are nested by containment into faces: an outer boundary
+and the holes directly inside it.
+"""
+
+import logging
+
+import numpy as np
+from OCC.Core.BRep import BRep_Builder, BRep_Tool
+from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeFace
+from OCC.Core.gp import gp_Dir, gp_Pln, gp_Pnt
+from OCC.Core.TopAbs import TopAbs_EDGE
+from OCC.Core.TopExp import TopExp_Explorer, topexp
+from OCC.Core.TopoDS import TopoDS_Wire, topods
+
+from intersector.operations.discretize import DEFAULT_DEFLECTION, edge_points
+from intersector.utils.polylines import plane_frame
+
+log = logging.getLogger(__name__)
+
+DEFAULT_TOLERANCE = 1e-6
+
+# Offsets of half of the 26 neighbouring cells; the other half is covered
+# when the neighbour itself is visited.
+_NEIGHBOURS = [
+    (i, j, k)
+    for i in (-1, 0, 1)
+    for j in (-1, 0, 1)
+    for k in (-1, 0, 1)
+    if (i, j, k) > (0, 0, 0)
+]
+
+
+def _weld(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Merge the points closer than ``tolerance`` into shared vertices.
+
+    Each point is compared with the points of its own grid cell and of the
+    neighbouring cells, and joined with every one within ``tolerance``;
+    points joined through a third point share its vertex as well.
+
+    Returns:
+        numpy.ndarray: The vertex number of each point.
+
+    """
+    grid = {}
+    for i, cell in enumerate(np.floor(points / tolerance).astype(np.int64).tolist()):
+        grid.setdefault(tuple(cell), []).append(i)
+
+    parent = list(range(len(points)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def join(a, b):
+        gaps = np.linalg.norm(points[a][:, None] - points[b][None], axis=2)
+        for i, j in zip(*np.nonzero(gaps <= tolerance), strict=True):
+            parent[find(b[j])] = find(a[i])
+
+    for (x, y, z), members in grid.items():
+        if len(members) > 1:
+            join(members, members)
+        for dx, dy, dz in _NEIGHBOURS:
+            others = grid.get((x + dx, y + dy, z + dz))
+            if others is not None:
+                join(members, others)
+
+    return np.array([find(i) for i in range(len(points))], dtype=np.int64)
+
+
+def chain_segments(starts, ends, tolerance: float = DEFAULT_TOLERANCE) -> list:
+    """Order pieces given by their end points into chains.
+
+    Pieces are joined where their end points are within ``tolerance``.
+    Open chains are walked from their free ends first, the remaining pieces
+    form closed loops. Where more than two pieces meet, a chain continues
+    with any of them.
+
+    Args:
+        starts (array-like): ``(N, 3)`` start point of each piece.
+        ends (array-like): ``(N, 3)`` end point of each piece.
+        tolerance (float): Distance under which two end points are joined.
+
+    Returns:
+        list[tuple[list[tuple[int, bool]], bool]]: For each chain, its pieces
+            as ``(piece number, reversed)`` in walking order, and whether it
+            is closed.
+
+    Raises:
+        ValueError: If the tolerance is not positive.
+
+    """
+    if tolerance <= 0:
+        raise ValueError("Tolerance must be positive")
+
+    starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+    count = len(starts)
+    if not count:
+        return []
+
+    vertices = _weld(np.concatenate([starts, ends]), tolerance)
+    first, last = vertices[:count].tolist(), vertices[count:].tolist()
+
+    incident = {}
+    for piece, (a, b) in enumerate(zip(first, last, strict=True)):
+        incident.setdefault(a, []).append(piece)
+        incident.setdefault(b, []).append(piece)
+
+    used = [False] * count
+
+    def walk(origin):
+        steps, vertex = [], origin
+        while True:
+            pieces = incident[vertex]
+            while pieces and used[pieces[-1]]:
+                pieces.pop()
+            if not pieces:
+                break
+            piece = pieces.pop()
+            used[piece] = True
+            if first[piece] == vertex:
+                steps.append((piece, False))
+                vertex = last[piece]
+            else:
+                steps.append((piece, True))
+                vertex = first[piece]
+        return steps, vertex == origin
+
+    free_ends = [v for v, pieces in incident.items() if len(pieces) % 2]
+    chains = []
+    for origin in free_ends + first:
+        steps, closed = walk(origin)
+        if steps:
+            chains.append((steps, closed))
+
+    log.debug("🔗 Chained %s pieces into %s chains", count, len(chains))
+    return chains
+
+
+def join_chain(polylines, steps) -> np.ndarray:
+    """Join the polylines of a chain in walking order.
+
+    Args:
+        polylines (Sequence[numpy.ndarray]): ``(N, 3)`` point arrays.
+        steps (list[tuple[int, bool]]): The chain, as returned by
+            :func:`chain_segments`.
+
+    Returns:
+        numpy.ndarray: The chained points, shared end points kept once.
+
+    """
+    parts = [polylines[i][::-1] if rev else polylines[i] for i, rev in steps]
+    return np.concatenate([parts[0], *(part[1:] for part in parts[1:])])
+
+
+def chain_polylines(polylines, tolerance: float = DEFAULT_TOLERANCE) -> list:
+    """Join polylines sharing end points into longer polylines.
+
+    Args:
+        polylines (Iterable[numpy.ndarray]): ``(N, 3)`` point arrays, e.g.
+            sampled section edges or mesh section segments.
+        tolerance (float): Distance under which two end points are joined.
+
+    Returns:
+        list[tuple[numpy.ndarray, bool]]: Each chained polyline and whether
+            it is closed. Closed polylines repeat their first point last.
+
+    """
+    polylines = [np.asarray(p, dtype=float) for p in polylines]
+    polylines = [p for p in polylines if len(p)]
+    chains = chain_segments(
+        [p[0] for p in polylines], [p[-1] for p in polylines], tolerance
+    )
+
+    return [(join_chain(polylines, steps), closed) for steps, closed in chains]
+
+
+def signed_area(points, normal) -> float:
+    """Return the area enclosed by a polygon, signed around ``normal``.
+
+    Returns:
+        float: Positive for a counterclockwise polygon seen from the side
+            ``normal`` points to.
+
+    """
+    u, v = plane_frame(normal)
+    points = np.asarray(points, dtype=float)
+    x, y = points @ u, points @ v
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def _contains(polygon: np.ndarray, point: np.ndarray) -> bool:
+    """Return whether a 2D point lies inside a 2D polygon (even-odd rule).
+
+    Returns:
+        bool: True if ``point`` is inside ``polygon``.
+
+    """
+    x, y = polygon[:, 0], polygon[:, 1]
+    nx, ny = np.roll(x, -1), np.roll(y, -1)
+    crosses = (y > point[1]) != (ny > point[1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        at = x + (point[1] - y) * (nx - x) / (ny - y)
+    return bool(np.count_nonzero(crosses & (point[0] < at)) % 2)
+
+
+def nest_loops(loops, normal) -> list[tuple[int, list[int]]]:
+    """Group closed loops into outer boundaries and their holes.
+
+    A loop inside an even number of other loops is an outer boundary, a
+    loop inside an odd number is a hole of the smallest loop around it.
+
+    Args:
+        loops (Sequence[numpy.ndarray]): ``(N, 3)`` points of each closed
+            loop, all in planes orthogonal to ``normal``.
+        normal (tuple[float, float, float]): The section plane normal.
+
+    Returns:
+        list[tuple[int, list[int]]]: The number of each outer loop with the
+            numbers of its holes, largest outer loop first.
+
+    """
+    u, v = plane_frame(normal)
+    flat = [np.column_stack([loop @ u, loop @ v]) for loop in loops]
+    areas = [abs(signed_area(loop, normal)) for loop in loops]
+    lower = [f.min(axis=0) for f in flat]
+    upper = [f.max(axis=0) for f in flat]
+
+    parents, depths = [], []
+    for j, loop in enumerate(flat):
+        probe = loop[0]
+        around = [
+            i
+            for i in range(len(flat))
+            if i != j
+            and areas[i] > areas[j]
+            and np.all(lower[i] <= probe)
+            and np.all(probe <= upper[i])
+            and _contains(flat[i], probe)
+        ]
+        depths.append(len(around))
+        parents.append(min(around, key=areas.__getitem__) if around else None)
+
+    faces = {j: [] for j in range(len(flat)) if depths[j] % 2 == 0}
+    for j, parent in enumerate(parents):
+        if depths[j] % 2 and parent in faces:
+            faces[parent].append(j)
+    return sorted(faces.items(), key=lambda face: -areas[face[0]])
+
+
+def face_polylines(polylines, normal, tolerance: float = DEFAULT_TOLERANCE) -> list:
+    """Chain polylines into closed loops ordered as faces.
+
+    Args:
+        polylines (Iterable[numpy.ndarray]): ``(N, 3)`` point arrays.
+        normal (tuple[float, float, float]): The section plane normal.
+        tolerance (float): Distance under which two end points are joined.
+
+    Returns:
+        list[numpy.ndarray]: For each face, its outer loop counterclockwise
+            around ``normal`` followed by its holes clockwise. Open chains
+            are dropped.
+
+    """
+    loops = [
+        points for points, closed in chain_polylines(polylines, tolerance) if closed
+    ]
+    result = []
+    for outer, holes in nest_loops(loops, normal):
+        for i, sign in [(outer, 1.0), *((hole, -1.0) for hole in holes)]:
+            loop = loops[i]
+            result.append(loop if signed_area(loop, normal) * sign > 0 else loop[::-1])
+    return result
+
+
+def _section_edges(shape) -> list:
+    """Return the edges of a section result.
+
+    Returns:
+        list[TopoDS_Edge]: The edges, in exploration order.
+
+    """
+    edges = []
+    if shape is None:
+        return edges
+    explorer = TopExp_Explorer(shape, TopAbs_EDGE)
+    while explorer.More():
+        edges.append(topods.Edge(explorer.Current()))
+        explorer.Next()
+    return edges
+
+
+def _point(vertex) -> tuple[float, float, float]:
+    p = BRep_Tool.Pnt(vertex)
+    return p.X(), p.Y(), p.Z()
+
+
+def _edge_chains(shape, tolerance: float):
+    """Chain the edges of a section result.
+
+    Returns:
+        tuple[list, list]: The edges, and their chains as returned by
+            :func:`chain_segments`.
+
+    """
+    edges = _section_edges(shape)
+    starts = [_point(topexp.FirstVertex(edge, True)) for edge in edges]
+    ends = [_point(topexp.LastVertex(edge, True)) for edge in edges]
+    return edges, chain_segments(starts, ends, tolerance)
+
+
+def _make_wire(edges, steps, closed: bool):
+    """Build a wire holding the chained edges in walking order.
+
+    Returns:
+        TopoDS_Wire: The wire.
+
+    """
+    builder = BRep_Builder()
+    wire = TopoDS_Wire()
+    builder.MakeWire(wire)
+    for i, reverse in steps:
+        builder.Add(wire, edges[i].Reversed() if reverse else edges[i])
+    wire.Closed(closed)
+    return wire
+
+
+def section_wires(shape, tolerance: float = DEFAULT_TOLERANCE) -> list:
+    """Assemble the edges of a section result into ordered wires.
+
+    Args:
+        shape (TopoDS_Shape): A section result, e.g. from
+            :func:`intersect_with_plane`.
+        tolerance (float): Distance under which two edge ends are joined.
+
+    Returns:
+        list[TopoDS_Wire]: One wire per chain of edges, closed loops flagged
+            as closed.
+
+    """
+    edges, chains = _edge_chains(shape, tolerance)
+    return [_make_wire(edges, steps, closed) for steps, closed in chains]
+
+
+def section_faces(  # noqa: PLR0913, PLR0917
+    shape,
+    plane_point,
+    plane_normal,
+    tolerance: float = DEFAULT_TOLERANCE,
+    deflection: float = DEFAULT_DEFLECTION,
+) -> list:
+    """Assemble the closed loops of a section result into planar faces.
+
+    Args:
+        shape (TopoDS_Shape): A section result of the plane.
+        plane_point (tuple[float, float, float]): A point on the plane.
+        plane_normal (tuple[float, float, float]): The plane's normal.
+        tolerance (float): Distance under which two edge ends are joined.
+        deflection (float): Chordal deflection of the polygons used to nest
+            the loops.
+
+    Returns:
+        list[TopoDS_Face]: One face per outer loop, with the loops directly
+            inside it as holes. Open chains are dropped.
+
+    """
+    edges, chains = _edge_chains(shape, tolerance)
+    loops = [steps for steps, closed in chains if closed]
+    points = {i: edge_points(edges[i], deflection) for steps in loops for i, _ in steps}
+    polygons = [join_chain(points, steps) for steps in loops]
+    nesting = nest_loops(polygons, plane_normal)
+    return loop_faces(edges, loops, polygons, nesting, plane_point, plane_normal)
+
+
+def loop_faces(  # noqa: PLR0913, PLR0917
+    edges, loops, polygons, nesting, plane_point, plane_normal
+) -> list:
+    """Build planar faces from closed chains of section edges.
+
+    Args:
+        edges (Sequence[TopoDS_Edge]): The section edges.
+        loops (Sequence[list[tuple[int, bool]]]): The steps of each closed
+            chain of ``edges``, as returned by :func:`chain_segments`.
+        polygons (Sequence[numpy.ndarray]): The sampled points of each loop.
+        nesting (list[tuple[int, list[int]]]): The loops nested into outer
+            boundaries and holes, as returned by :func:`nest_loops`.
+        plane_point (tuple[float, float, float]): A point on the plane.
+        plane_normal (tuple[float, float, float]): The plane's normal.
+
+    Returns:
+        list[TopoDS_Face]: One face per outer loop, with its holes.
+
+    """
+    wires = [_make_wire(edges, steps, True) for steps in loops]
+    plane = gp_Pln(gp_Pnt(*plane_point), gp_Dir(*plane_normal))
+    faces = []
+    for outer, holes in nesting:
+        bounds = [(outer, 1.0), *((hole, -1.0) for hole in holes)]
+        oriented = [
+            (
+                wires[i]
+                if signed_area(polygons[i], plane_normal) * sign > 0
+                else topods.Wire(wires[i].Reversed())
+            )
+            for i, sign in bounds
+        ]
+        maker = BRepBuilderAPI_MakeFace(plane, oriented[0], True)
+        for hole in oriented[1:]:
+            maker.Add(hole)
+        if maker.IsDone():
+            faces.append(maker.Face())
+        else:
+            log.warning("⚠️  Could not build a face from section loop %s", outer)
+
+    log.debug("🧩 Assembled %s faces from %s closed loops", len(faces), len(loops))
+    return faces
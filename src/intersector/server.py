@@ -0,0 +1,458 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Long-running intersection server keeping shapes resident in memory.
+
+The server listens on a Unix socket or a localhost TCP port and speaks
+newline-delimited JSON: every request is one JSON object on one line and is
+answered by one JSON object on one line. Requests from different connections
+are served concurrently.
+
+Shapes are parsed once on ``load`` and stored as binary BRep files in a
+private directory. Sections run in a pool of worker processes, each of which
+loads a shape from its BRep file on first use and keeps it, together with its
+section session or triangle mesh, for the following requests, so a client
+dragging a plane through a shape gets warm-started sections. A worker drops
+the shapes unloaded since its previous job.
+
+Requests:
+    ``{"op": "load", "path": "part.stp", "id": "part"}``
+    ``{"op": "section", "id": "part", "planes": ["0,0,1:0,0,1"],
+    "format": "json", "engine": "brep", "deflection": 0.01,
+    "combine": true}``
+    ``{"op": "list"}``, ``{"op": "unload", "id": "part"}``, ``{"op": "ping"}``
+
+Responses carry ``"ok": true`` and the result, or ``"ok": false`` and an
+``"error"`` message. Section results are the files the CLI would write, in
+``"text"`` for JSON, SVG and DXF or base64-encoded in ``"data"`` for NPZ and
+STEP; without ``combine`` there is one entry per plane in ``"results"``.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+from intersector.operations.discretize import section_polylines
+from intersector.operations.intersect import combine_shapes, is_intersection_valid
+from intersector.operations.mesh_slicing import TriangleMesh
+from intersector.operations.session import SectionSession
+from intersector.utils.execution import current_policy, set_policy
+from intersector.utils.file_handler import (
+    export_step,
+    read_step,
+    shape_from_bytes,
+    shape_to_bytes,
+)
+from intersector.utils.parsing import OUTPUT_FORMATS
+from intersector.utils.plane_sets import parse_plane_list
+from intersector.utils.polylines import export_polylines
+
+log = logging.getLogger(__name__)
+
+TEXT_FORMATS = {"json", "svg", "dxf"}
+
+# Shapes, section sessions and meshes loaded by this worker process.
+_worker_shapes = {}
+_worker_sessions = {}
+_worker_meshes = {}
+
+
+def _evict_unloaded() -> None:
+    """Drop the shapes, sessions and meshes whose BRep file was removed.
+
+    Unloading or reloading a shape removes its BRep file and every load gets
+    a new path, so these entries would never be used again.
+
+    """
+    for path in [p for p in _worker_shapes if not os.path.exists(p)]:
+        del _worker_shapes[path]
+    for path in [p for p in _worker_sessions if not os.path.exists(p)]:
+        del _worker_sessions[path]
+    for key in [k for k in _worker_meshes if not os.path.exists(k[0])]:
+        del _worker_meshes[key]
+
+
+def _worker_shape(brep_path: str):
+    """Return the shape stored at ``brep_path``, loading it on first use.
+
+    Returns:
+        TopoDS_Shape: The resident shape.
+
+    """
+    if brep_path not in _worker_shapes:
+        with open(brep_path, "rb") as f:
+            _worker_shapes[brep_path] = shape_from_bytes(f.read())
+    return _worker_shapes[brep_path]
+
+
+def _brep_sections(brep_path: str, planes):
+    """Section a resident shape with the exact B-rep engine.
+
+    Returns:
+        list[tuple]: ``(point, normal, result)`` of the non-empty sections.
+
+    """
+    if brep_path not in _worker_sessions:
+        _worker_sessions[brep_path] = SectionSession(_worker_shape(brep_path))
+    session = _worker_sessions[brep_path]
+
+    sections = []
+    for point, normal in planes:
+        result = session.section(point, normal)
+        if is_intersection_valid(result):
+            sections.append((point, normal, result))
+    return sections
+
+
+def _mesh_sections(brep_path: str, planes, deflection: float):
+    """Section a resident shape with the triangle-mesh engine.
+
+    Returns:
+        list[tuple]: ``(point, normal, segments)`` of the non-empty sections.
+
+    """
+    key = (brep_path, deflection)
+    if key not in _worker_meshes:
+        _worker_meshes[key] = TriangleMesh.from_shape(
+            _worker_shape(brep_path), deflection
+        )
+    mesh = _worker_meshes[key]
+
+    return [
+        (point, normal, list(segments))
+        for (point, normal), segments in zip(planes, mesh.sections(planes), strict=True)
+        if len(segments)
+    ]
+
+
+def _write_output(sections, fmt: str, engine: str, deflection: float) -> bytes:
+    """Write sections the way the CLI does and return the file content.
+
+    Returns:
+        bytes: The content of the output file.
+
+    Raises:
+        RuntimeError: If writing the output fails.
+
+    """
+    with tempfile.TemporaryDirectory(prefix="intersector-") as tmp:
+        path = os.path.join(tmp, "result." + fmt)
+        if fmt == "step":
+            written = export_step(combine_shapes(r for _, _, r in sections), path)
+        else:
+            if engine == "brep":
+                sections = [
+                    (point, normal, section_polylines(result, deflection))
+                    for point, normal, result in sections
+                ]
+            written = export_polylines(sections, path, fmt)
+
+        if not written:
+            raise RuntimeError(f"Failed to write {fmt} output")
+        with open(path, "rb") as f:
+            return f.read()
+
+
+def _string_field(request: dict, name: str, default=None) -> str:
+    """Return a string field of a request.
+
+    Returns:
+        str: The field, or ``default`` when it is missing.
+
+    Raises:
+        ValueError: If the field is not a string.
+
+    """
+    value = request.get(name, default)
+    if not isinstance(value, str):
+        raise ValueError(f"'{name}' must be a string")
+    return value
+
+
+def check_section_options(engine: str, fmt: str, deflection: float) -> None:
+    """Check the options of a section job.
+
+    Args:
+        engine (str): ``brep`` or ``mesh``.
+        fmt (str): Output format.
+        deflection (float): Polyline sampling and tessellation deflection.
+
+    Raises:
+        ValueError: If an option is unknown, the mesh engine is asked for
+            STEP output or the deflection is not positive.
+
+    """
+    if engine not in {"brep", "mesh"}:
+        raise ValueError(f"Unknown engine: {engine!r}")
+    if fmt not in set(OUTPUT_FORMATS.values()):
+        raise ValueError(f"Unknown format: {fmt!r}")
+    if engine == "mesh" and fmt == "step":
+        raise ValueError("The mesh engine only writes polyline formats")
+    if deflection <= 0:
+        raise ValueError("Deflection must be positive")
+
+
+def section_job(  # noqa: PLR0913, PLR0917
+    brep_path: str, planes, engine: str, fmt: str, deflection: float, combine: bool
+) -> list[bytes]:
+    """Compute the sections of a resident shape in a worker process.
+
+    Args:
+        brep_path (str): BRep file of the shape.
+        planes (list[tuple]): The (point, normal) pairs.
+        engine (str): ``brep`` or ``mesh``.
+        fmt (str): Output format.
+        deflection (float): Polyline sampling and tessellation deflection.
+        combine (bool): Whether to write all sections into one output.
+
+    Returns:
+        list[bytes]: One output for all planes with ``combine``, otherwise
+            one output per plane (empty sections included).
+
+    """
+    _evict_unloaded()
+    if engine == "mesh":
+        sections = _mesh_sections(brep_path, planes, deflection)
+    else:
+        sections = _brep_sections(brep_path, planes)
+
+    if combine:
+        return [_write_output(sections, fmt, engine, deflection)]
+
+    found = {
+        (tuple(point), tuple(normal)): s for s in sections for point, normal, _ in [s]
+    }
+    return [
+        _write_output([found[plane]] if plane in found else [], fmt, engine, deflection)
+        for plane in ((tuple(p), tuple(n)) for p, n in planes)
+    ]
+
+
+class IntersectionServer:
+    """Registry of resident shapes answering JSON section requests.
+
+    Attributes:
+        shapes (dict): BRep path and source STEP path of each loaded shape,
+            by shape id.
+
+    """
+
+    def __init__(self, executor=None, workers=None, cache=None):
+        """Create a server.
+
+        Args:
+            executor (concurrent.futures.Executor | None): Executor running
+                the section jobs. Defaults to a process pool.
+            workers (int | None): Size of the default process pool.
+            cache (StepCache | None): STEP cache used when loading shapes.
+
+        """
+        self.shapes = {}
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=workers, initializer=set_policy, initargs=(current_policy(),)
+        )
+        self._cache = cache
+        self._dir = tempfile.mkdtemp(prefix="intersector-server-")
+        self._lock = asyncio.Lock()
+
+    def close(self) -> None:
+        """Stop the workers and remove the resident BRep files."""
+        self._executor.shutdown(cancel_futures=True)
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def _load(self, path: str) -> str:
+        """Read a STEP file and store it as a BRep file.
+
+        Returns:
+            str: The BRep path.
+
+        Raises:
+            ValueError: If the STEP file cannot be read.
+
+        """
+        shape = read_step(path, cache=self._cache)
+        if shape is None:
+            raise ValueError(f"Failed to read STEP file: '{path}'")
+
+        brep_path = os.path.join(self._dir, f"{uuid.uuid4().hex}.brep")
+        with open(brep_path, "wb") as f:
+            f.write(shape_to_bytes(shape))
+        return brep_path
+
+    async def handle(self, request: dict) -> dict:
+        """Answer one request.
+
+        Returns:
+            dict: The response.
+
+        """
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Invalid request: not a JSON object"}
+        op = request.get("op")
+        handler = {
+            "ping": self._handle_ping,
+            "list": self._handle_list,
+            "load": self._handle_load,
+            "unload": self._handle_unload,
+            "section": self._handle_section,
+        }.get(op if isinstance(op, str) else None)
+        if handler is None:
+            return {"ok": False, "error": f"Unknown op: {op!r}"}
+
+        try:
+            return await handler(request)
+        except KeyError as e:
+            return {"ok": False, "error": f"Unknown shape id: {e.args[0]!r}"}
+        except (ValueError, RuntimeError, OSError) as e:
+            return {"ok": False, "error": str(e)}
+        except (TypeError, AttributeError) as e:
+            return {"ok": False, "error": f"Invalid request: {e}"}
+
+    @staticmethod
+    async def _handle_ping(_request: dict) -> dict:
+        return {"ok": True}
+
+    async def _handle_list(self, _request: dict) -> dict:
+        return {"ok": True, "shapes": sorted(self.shapes)}
+
+    async def _handle_unload(self, request: dict) -> dict:
+        os.remove(self.shapes.pop(_string_field(request, "id"))["brep"])
+        return {"ok": True}
+
+    async def _handle_load(self, request: dict) -> dict:
+        """Load a STEP file under the requested id, or its file stem.
+
+        Returns:
+            dict: The response.
+
+        Raises:
+            ValueError: If no path is given, or the id is not a string.
+
+        """
+        path = request.get("path")
+        if not isinstance(path, str):
+            raise ValueError("'path' is required")
+        shape_id = request.get("id") or os.path.splitext(os.path.basename(path))[0]
+        if not isinstance(shape_id, str):
+            raise ValueError("'id' must be a string")
+
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            brep_path = await loop.run_in_executor(None, self._load, path)
+            previous = self.shapes.get(shape_id)
+            self.shapes[shape_id] = {"brep": brep_path, "path": path}
+        if previous:
+            os.remove(previous["brep"])
+
+        log.info("📦 Loaded shape '%s' from %s", shape_id, path)
+        return {"ok": True, "id": shape_id}
+
+    async def _handle_section(self, request: dict) -> dict:
+        """Section a resident shape in the worker pool.
+
+        Returns:
+            dict: The response.
+
+        Raises:
+            ValueError: If the deflection is not a number.
+
+        """
+        entry = self.shapes[_string_field(request, "id")]
+        planes = parse_plane_list(request.get("planes"))
+        engine = _string_field(request, "engine", "brep")
+        fmt = _string_field(request, "format", "json")
+        try:
+            deflection = float(request.get("deflection", 0.01))
+        except (TypeError, ValueError):
+            raise ValueError("'deflection' must be a number") from None
+        combine = bool(request.get("combine", True))
+        check_section_options(engine, fmt, deflection)
+
+        loop = asyncio.get_running_loop()
+        outputs = await loop.run_in_executor(
+            self._executor,
+            section_job,
+            entry["brep"],
+            planes,
+            engine,
+            fmt,
+            deflection,
+            combine,
+        )
+
+        key = "text" if fmt in TEXT_FORMATS else "data"
+        encoded = [
+            out.decode("utf-8") if key == "text" else base64.b64encode(out).decode()
+            for out in outputs
+        ]
+        if combine:
+            return {"ok": True, "format": fmt, key: encoded[0]}
+        return {"ok": True, "format": fmt, "results": [{key: e} for e in encoded]}
+
+    async def _respond(self, line: bytes) -> dict:
+        """Answer one request line.
+
+        Returns:
+            dict: The response.
+
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {"ok": False, "error": f"Invalid request: {e}"}
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Invalid request: not a JSON object"}
+        return await self.handle(request)
+
+    async def _serve_connection(self, reader, writer) -> None:
+        """Answer the requests of one connection, one JSON line each."""
+        try:
+            while line := await reader.readline():
+                response = await self._respond(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            log.debug("Client connection lost")
+        finally:
+            writer.close()
+
+    async def start(self, socket_path=None, host="127.0.0.1", port=8765):
+        """Start listening on a Unix socket, or on ``host:port`` otherwise.
+
+        Returns:
+            asyncio.Server: The listening server.
+
+        """
+        if socket_path:
+            return await asyncio.start_unix_server(
+                self._serve_connection, path=socket_path, limit=2**26
+            )
+        return await asyncio.start_server(
+            self._serve_connection, host=host, port=port, limit=2**26
+        )
+
+
+async def serve(server: IntersectionServer, socket_path=None, host=None, port=None):
+    """Run ``server`` until cancelled.
+
+    Args:
+        server (IntersectionServer): The server to run.
+        socket_path (str | None): Unix socket path to listen on.
+        host (str | None): TCP host, used without ``socket_path``.
+        port (int | None): TCP port, used without ``socket_path``.
+
+    """
+    host, port = host or "127.0.0.1", port or 8765
+    listener = await server.start(socket_path, host, port)
+    address = socket_path or f"{host}:{port}"
+    log.info("🛰️  Intersection server listening on %s", address)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
@@ -4,8 +4,28 @@ Contains helper modules for logging configuration, file I/O,
 and other general-purpose functions used across the CAD CLI.
 """
 
-from .file_handler import export_step, read_step
+import importlib
+from typing import TYPE_CHECKING
+
 from .logger import setup_logging
-from .visualization import show_shapes
+
+if TYPE_CHECKING:
+    from .file_handler import export_step, read_step
+    from .visualization import show_shapes
+
+# OpenCascade-backed helpers are imported on first access (PEP 562), so that
+# light utilities such as parsing and logging do not pull in OCC.
+_LAZY_EXPORTS = {
+    "read_step": ".file_handler",
+    "export_step": ".file_handler",
+    "show_shapes": ".visualization",
+}
 
 __all__ = ["setup_logging", "read_step", "export_step", "show_shapes"]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,127 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""OpenCascade execution policy.
+
+OpenCascade can run boolean operations and meshing on its own thread pool.
+An :class:`ExecutionPolicy` decides whether it does and how many threads the
+pool has. The policy installed with :func:`set_policy` is honored by
+:func:`intersect_with_plane`, :meth:`TriangleMesh.from_shape` and the STEP
+file handlers, and is handed to worker processes so they run with the same
+settings.
+
+STEP translation itself is sequential in OpenCascade; the file handlers only
+apply the policy so that a shape read in a fresh process is sectioned with
+the configured pool.
+"""
+
+import logging
+
+from OCC.Core.BOPAlgo import BOPAlgo_Options
+from OCC.Core.OSD import OSD_Parallel, OSD_ThreadPool
+
+log = logging.getLogger(__name__)
+
+
+class ExecutionPolicy:
+    """Parallelism settings of the OpenCascade operations.
+
+    Attributes:
+        threads (int | None): Size of the OpenCascade thread pool; 0 uses one
+            thread per logical CPU and None keeps the OpenCascade default.
+        parallel_booleans (bool): Whether sections run their boolean
+            operations in parallel.
+        parallel_mesh (bool): Whether tessellation meshes faces in parallel.
+
+    """
+
+    def __init__(
+        self,
+        threads: int | None = None,
+        parallel_booleans: bool = False,
+        parallel_mesh: bool = False,
+    ):
+        """Create a policy.
+
+        Args:
+            threads (int | None): Size of the thread pool (0 for one thread
+                per logical CPU, None for the OpenCascade default).
+            parallel_booleans (bool): Run boolean operations in parallel.
+            parallel_mesh (bool): Mesh faces in parallel.
+
+        Raises:
+            ValueError: If ``threads`` is negative.
+
+        """
+        if threads is not None and threads < 0:
+            raise ValueError("Number of threads cannot be negative")
+
+        self.threads = threads
+        self.parallel_booleans = parallel_booleans
+        self.parallel_mesh = parallel_mesh
+        self._applied = False
+
+    def __repr__(self) -> str:
+        """Return a readable representation of the policy.
+
+        Returns:
+            str: The policy and its settings.
+
+        """
+        return (
+            f"ExecutionPolicy(threads={self.threads}, "
+            f"parallel_booleans={self.parallel_booleans}, "
+            f"parallel_mesh={self.parallel_mesh})"
+        )
+
+    def __getstate__(self) -> dict:
+        """Return the state to pickle, which is never marked as applied.
+
+        Returns:
+            dict: The settings of the policy.
+
+        """
+        return {**self.__dict__, "_applied": False}
+
+    def apply(self) -> None:
+        """Configure the global OpenCascade settings once per process."""
+        if self._applied:
+            return
+
+        if self.threads is not None:
+            OSD_Parallel.SetUseOcctThreads(True)
+            OSD_ThreadPool.DefaultPool().Init(self.threads or -1)
+        BOPAlgo_Options.SetParallelMode(self.parallel_booleans)
+        self._applied = True
+
+        log.debug("🧵 Applied %r", self)
+
+
+_policy = ExecutionPolicy()
+
+
+def set_policy(policy: ExecutionPolicy) -> None:
+    """Install the execution policy of this process.
+
+    Args:
+        policy (ExecutionPolicy): The policy to honor from now on.
+
+    """
+    global _policy  # noqa: PLW0603
+    _policy = policy
+    _policy.apply()
+
+
+def apply_policy() -> None:
+    """Apply the installed execution policy to OpenCascade, once per process."""
+    _policy.apply()
+
+
+def current_policy() -> ExecutionPolicy:
+    """Return the installed execution policy, applied to OpenCascade.
+
+    Returns:
+        ExecutionPolicy: The installed policy.
+
+    """
+    apply_policy()
+    return _policy
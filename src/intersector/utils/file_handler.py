@@ -6,7 +6,10 @@ including loading STEP files into shapes and exporting shapes into STEP files.
 
 import logging
 import os
+import tempfile
+import threading
 
+from OCC.Core.BinTools import bintools
 from OCC.Core.IFSelect import IFSelect_RetDone
 from OCC.Core.STEPControl import (
     STEPControl_AsIs,
@@ -15,8 +18,31 @@ from OCC.Core.STEPControl import (
 )
 from OCC.Core.TopoDS import TopoDS_Shape
 
+from intersector.utils.execution import apply_policy
+from intersector.utils.profiling import phase
+
 log = logging.getLogger(__name__)
 
+_local = threading.local()
+
+
+def _step_writer() -> STEPControl_Writer:
+    """Return this thread's STEP writer, emptied of its previous model.
+
+    Creating a writer sets up a STEP work session; reusing it across exports
+    only swaps in a new empty model.
+
+    Returns:
+        STEPControl_Writer: A writer ready for a new transfer.
+
+    """
+    writer = getattr(_local, "step_writer", None)
+    if writer is None:
+        writer = _local.step_writer = STEPControl_Writer()
+    else:
+        writer.Model(True)
+    return writer
+
 
 def export_step(shape: TopoDS_Shape, filename: str = "output.step") -> bool:
     """Export a TopoDS_Shape to a STEP file.
@@ -30,55 +56,169 @@ def export_step(shape: TopoDS_Shape, filename: str = "output.step") -> bool:
 
     """
     try:
-        writer = STEPControl_Writer()
-        writer.Transfer(shape, STEPControl_AsIs)
-        status = writer.Write(filename)
+        writer = _step_writer()
+        with phase("step.Transfer"):
+            writer.Transfer(shape, STEPControl_AsIs)
+        with phase("step.Write"):
+            status = writer.Write(filename)
 
         if status == IFSelect_RetDone:
             log.info(
                 "[green]✅ A Shape successfully exported to [/green]"
-                f"[green][bold]{filename}[/bold][/green]"
+                "[green][bold]%s[/bold][/green]",
+                filename,
             )
             return True
         else:
-            log.error(f"[red]❌ STEP export failed with status: {status}[/red]")
+            log.error("[red]❌ STEP export failed with status: %s[/red]", status)
             return False
 
     except (OSError, RuntimeError) as e:
-        log.error(f"[bold red]💥 Error exporting STEP file:[/bold red] {e}")
+        log.error("[bold red]💥 Error exporting STEP file:[/bold red] %s", e)
         return False
 
 
-def read_step(filename: str) -> TopoDS_Shape | None:
+def read_step(filename: str, cache=None) -> TopoDS_Shape | None:
     """Read a STEP file and return the corresponding TopoDS_Shape.
 
+    With a :class:`StepCache`, a file whose content was translated before is
+    loaded from the cache in binary BRep format instead, and a freshly
+    translated shape is added to the cache.
+
+    Args:
+        filename (str): Path to the STEP file.
+        cache (StepCache | None): Optional cache of transferred shapes.
+
     Returns:
         TopoDS_Shape | None: The shape if successfully read, None otherwise.
 
     """
     if not os.path.exists(filename):
-        log.error(f"[red]❌ File not found:[/red] {filename}")
+        log.error("[red]❌ File not found:[/red] %s", filename)
         return None
 
+    apply_policy()
+    key = None
+    if cache is not None:
+        try:
+            key = cache.key(filename)
+        except OSError as e:
+            log.warning("[yellow]⚠️  Could not hash STEP file:[/yellow] %s", e)
+        else:
+            with phase("step.cache_load"):
+                shape = cache.load(key)
+            if shape is not None:
+                log.info("[cyan]⚡ Loaded cached shape for:[/cyan] %s", filename)
+                return shape
+
     try:
-        log.info(f"[cyan]📂 Reading STEP file:[/cyan] {filename}")
+        log.info("[cyan]📂 Reading STEP file:[/cyan] %s", filename)
         reader = STEPControl_Reader()
-        status = reader.ReadFile(filename)
+        with phase("step.ReadFile"):
+            status = reader.ReadFile(filename)
 
         if status != IFSelect_RetDone:
-            log.error(f"[red]❌ Failed to read STEP file. Status: {status}[/red]")
+            log.error("[red]❌ Failed to read STEP file. Status: %s[/red]", status)
             return None
 
-        reader.TransferRoots()
-        shape = reader.OneShape()
+        with phase("step.TransferRoots"):
+            reader.TransferRoots()
+            shape = reader.OneShape()
 
         if shape.IsNull():
             log.error("[red]❌ No shape data found in the STEP file.[/red]")
             return None
 
         log.info("[green]✅ STEP file successfully loaded![/green]")
+        if key is not None:
+            with phase("step.cache_store"):
+                cache.store(key, shape)
         return shape
 
     except (FileNotFoundError, RuntimeError) as e:
-        log.error(f"[bold red]💥 Error reading STEP file:[/bold red] {e}")
+        log.error("[bold red]💥 Error reading STEP file:[/bold red] %s", e)
         return None
+
+
+def iter_step_roots(filename: str):
+    """Transfer the roots of a STEP file one at a time.
+
+    Unlike :func:`read_step`, which transfers every root into one compound,
+    each root is transferred only when the previous one has been consumed,
+    and released from the reader afterwards. The parsed STEP entities stay in
+    memory, but the B-rep shapes of only one root exist at a time, provided
+    the caller drops its references before asking for the next one.
+
+    Args:
+        filename (str): Path to the STEP file.
+
+    Yields:
+        tuple[int, int, TopoDS_Shape]: The 1-based root number, the number of
+            roots, and the shape of that root. Roots without shape data are
+            skipped.
+
+    Raises:
+        RuntimeError: If the STEP file cannot be read.
+
+    """
+    log.info("[cyan]📂 Streaming STEP file:[/cyan] %s", filename)
+    apply_policy()
+    reader = STEPControl_Reader()
+    with phase("step.ReadFile"):
+        status = reader.ReadFile(filename)
+    if status != IFSelect_RetDone:
+        raise RuntimeError(f"Failed to read STEP file. Status: {status}")
+
+    total = reader.NbRootsForTransfer()
+    for number in range(1, total + 1):
+        with phase("step.TransferRoot"):
+            transferred = reader.TransferRoot(number)
+            shape = reader.Shape(reader.NbShapes()) if transferred else None
+
+        if shape is None or shape.IsNull():
+            log.warning("[yellow]⚠️  STEP root %s has no shape data.[/yellow]", number)
+        else:
+            yield number, total, shape
+
+        shape = None
+        reader.ClearShapes()
+
+
+def shape_to_bytes(shape: TopoDS_Shape) -> bytes:
+    """Serialize a TopoDS_Shape into a binary BRep blob.
+
+    The native binary BRep format is much cheaper to write and read back than
+    STEP, which makes it suitable for shipping shapes between processes.
+
+    Args:
+        shape (TopoDS_Shape): The shape to serialize.
+
+    Returns:
+        bytes: The shape in OpenCascade binary BRep format.
+
+    """
+    with tempfile.TemporaryDirectory(prefix="intersector-") as tmp:
+        path = os.path.join(tmp, "shape.brep")
+        bintools.Write(shape, path)
+        with open(path, "rb") as f:
+            return f.read()
+
+
+def shape_from_bytes(blob: bytes) -> TopoDS_Shape:
+    """Rebuild a TopoDS_Shape from a binary BRep blob.
+
+    Args:
+        blob (bytes): Data produced by :func:`shape_to_bytes`.
+
+    Returns:
+        TopoDS_Shape: The deserialized shape.
+
+    """
+    shape = TopoDS_Shape()
+    with tempfile.TemporaryDirectory(prefix="intersector-") as tmp:
+        path = os.path.join(tmp, "shape.brep")
+        with open(path, "wb") as f:
+            f.write(blob)
+        bintools.Read(shape, path)
+
+    return shape
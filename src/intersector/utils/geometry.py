@@ -0,0 +1,57 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Plane geometry shared by the section operations and caches.
+
+A plane given by any of its points and a scaled or flipped normal is reduced
+to one canonical, quantized form. Multi-plane sections group coincident and
+parallel planes by it, and the section cache keys its entries with it.
+"""
+
+import numpy as np
+
+# Quantum of the canonical normal components and plane offset.
+DEFAULT_TOLERANCE = 1e-6
+
+
+def canonical_plane(point, normal, tolerance: float = DEFAULT_TOLERANCE):
+    """Return the canonical, quantized form of a plane.
+
+    The normal is scaled to unit length, and the plane is described by the
+    offset of its foot point (the point closest to the origin) along it.
+    Both are quantized to ``tolerance``, then the sign is fixed so that the
+    first non-zero normal component is positive.
+
+    Example:
+    >>> canonical_plane((5, 5, 2), (0, 0, -3), 0.5)
+    ((0, 0, 2), 4)
+
+    Args:
+        point (tuple[float, float, float]): A point on the plane.
+        normal (tuple[float, float, float]): The plane's normal.
+        tolerance (float): Quantum of the normal components and offset,
+            below 1 so that the largest unit normal component stays
+            non-zero once quantized.
+
+    Returns:
+        tuple[tuple[int, int, int], int]: The quantized unit normal and
+            offset, in multiples of ``tolerance``.
+
+    Raises:
+        ValueError: If the normal is zero or the tolerance is not between 0
+            and 1.
+
+    """
+    if not 0 < tolerance < 1:
+        raise ValueError("Tolerance must be between 0 and 1")
+
+    n = np.asarray(normal, dtype=float)
+    length = np.linalg.norm(n)
+    if length == 0.0:
+        raise ValueError("Plane normal cannot be a zero vector")
+    n /= length
+
+    quantized = np.rint(n / tolerance).astype(np.int64)
+    offset = int(np.rint(np.dot(np.asarray(point, dtype=float), n) / tolerance))
+    if quantized[np.flatnonzero(quantized)[0]] < 0:
+        quantized, offset = -quantized, -offset
+    return tuple(int(c) for c in quantized), offset
@@ -3,22 +3,116 @@
 Provides centralized configuration for logging across CLI commands.
 """
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import re
+import sys
+from datetime import UTC, datetime
 
 from rich.logging import RichHandler
 
+LOG_FORMATS = ("rich", "json")
 
-def setup_logging(verbose: bool = False) -> logging.Logger:
+# Rich markup tags such as "[green]" or "[/bold red]", dropped from JSON lines.
+_MARKUP = re.compile(r"\[/?[a-z][a-z ]*\]")
+
+_listener = None
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format each record as one JSON object per line, without Rich markup."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Return the JSON line of a record.
+
+        Args:
+            record (logging.LogRecord): The record to format.
+
+        Returns:
+            str: A JSON object with the time, level, logger and message, and
+                the traceback if an exception is attached.
+
+        """
+        entry = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": _MARKUP.sub("", record.getMessage()),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue records as they are, so that formatting happens in the listener.
+
+    ``QueueHandler`` formats the message before queueing it, so that records
+    can cross processes; the queue of :func:`setup_logging` stays in-process,
+    so the ``%`` formatting is deferred to the listener thread as well. The
+    arguments of a queued record must therefore not be mutated afterwards.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:  # noqa: PLR6301
+        """Return the record unchanged.
+
+        Args:
+            record (logging.LogRecord): The record to queue.
+
+        Returns:
+            logging.LogRecord: The same record.
+
+        """
+        return record
+
+
+def stop_logging() -> None:
+    """Flush the queued records and stop the listener thread, if any."""
+    global _listener  # noqa: PLW0603
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
+def setup_logging(
+    verbose: bool = False,
+    log_format: str = "rich",
+    queued: bool = False,
+    stream=None,
+) -> logging.Logger:
     """Configure and return the root logger.
 
+    With ``queued``, the logger only puts records on a queue, and a listener
+    thread formats and renders them, so the calling loop never waits for the
+    terminal. Call :func:`stop_logging` (also run at exit) to flush it.
+
     Args:
         verbose (bool, optional): If True, sets logging level to DEBUG.
             Defaults to INFO.
+        log_format (str): ``rich`` for the terminal, or ``json`` for one
+            JSON object per line, for unattended runs.
+        queued (bool): Whether to hand records to a listener thread.
+        stream (TextIO | None): Stream receiving the JSON lines. Defaults to
+            standard error.
 
     Returns:
         logging.Logger: Configured logger instance.
 
+    Raises:
+        ValueError: If the log format is unknown.
+
     """
+    global _listener  # noqa: PLW0603
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"Unknown log format: {log_format}")
+    stop_logging()
+
     level = logging.DEBUG if verbose else logging.INFO
 
     logging.basicConfig(
@@ -27,17 +121,28 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
         datefmt="[%X]",
     )
 
-    rich_handler = RichHandler(
-        rich_tracebacks=True,
-        markup=True,
-        show_time=True,
-        show_path=True,
-        log_time_format="[%X]",
-    )
+    if log_format == "json":
+        handler = logging.StreamHandler(stream or sys.stderr)
+        handler.setFormatter(JsonLinesFormatter())
+    else:
+        handler = RichHandler(
+            rich_tracebacks=True,
+            markup=True,
+            show_time=True,
+            show_path=True,
+            log_time_format="[%X]",
+        )
 
     logger = logging.getLogger("intersector")
     logger.handlers.clear()
-    logger.addHandler(rich_handler)
+    if queued:
+        records = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(
+            records, handler, respect_handler_level=True
+        )
+        _listener.start()
+        handler = RecordQueueHandler(records)
+    logger.addHandler(handler)
     logger.setLevel(level)
     logger.propagate = False
 
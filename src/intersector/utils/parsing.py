@@ -6,10 +6,27 @@ in geometric operations.
 """
 
 import logging
-from typing import Tuple
+import os
+from typing import List, Tuple
 
 log = logging.getLogger(__name__)
 
+AXES = {
+    "x": (1.0, 0.0, 0.0),
+    "y": (0.0, 1.0, 0.0),
+    "z": (0.0, 0.0, 1.0),
+}
+
+# Output formats by file extension.
+OUTPUT_FORMATS = {
+    ".stp": "step",
+    ".step": "step",
+    ".npz": "npz",
+    ".json": "json",
+    ".svg": "svg",
+    ".dxf": "dxf",
+}
+
 
 def parse_plane_input(
     plane_str: str,
@@ -52,3 +69,86 @@ def parse_plane_input(
         ) from exc
 
     return point, normal
+
+
+def parse_vector_input(vector_str: str) -> Tuple[float, float, float]:
+    """Parse a ``"x,y,z"`` string into a numeric 3D vector.
+
+    Example:
+    >>> parse_vector_input("0,0,1")
+    (0.0, 0.0, 1.0)
+
+    Args:
+        vector_str (str): Vector definition in the format ``"x,y,z"``.
+
+    Returns:
+        Tuple[float, float, float]: The vector components.
+
+    Raises:
+        ValueError: If the input string does not contain exactly three
+            numeric values.
+
+    """
+    EXPECTED_VECTOR_LEN = 3
+    try:
+        vector = tuple(float(v) for v in vector_str.split(","))
+        if len(vector) != EXPECTED_VECTOR_LEN:
+            raise ValueError()
+
+    except (ValueError, AttributeError) as exc:
+        log.error("❌ Invalid vector input '%s': %s", vector_str, exc)
+        raise ValueError("Vector format must be 'x,y,z' (e.g., 0,0,1)") from exc
+
+    return vector
+
+
+def parse_planes_file(
+    path: str,
+) -> List[Tuple[Tuple[float, float, float], Tuple[float, float, float]]]:
+    """Parse a text file holding one plane definition per line.
+
+    Each non-empty line must follow the ``"x,y,z:nx,ny,nz"`` format accepted
+    by :func:`parse_plane_input`. Blank lines and lines starting with ``#``
+    are ignored.
+
+    Args:
+        path (str): Path to the planes file.
+
+    Returns:
+        List[Tuple[Tuple[float, float, float], Tuple[float, float, float]]]:
+            The parsed (point, normal) pairs in file order.
+
+    Raises:
+        ValueError: If a line cannot be parsed. The message reports the
+            offending line number.
+
+    """
+    planes = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, raw_line in enumerate(f, start=1):
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                planes.append(parse_plane_input(line))
+            except ValueError as exc:
+                raise ValueError(f"{path}:{line_no}: {exc}") from exc
+
+    return planes
+
+
+def output_format_from_path(path: str) -> str | None:
+    """Return the output format matching the extension of ``path``.
+
+    Example:
+    >>> output_format_from_path("sections.NPZ")
+    'npz'
+
+    Args:
+        path (str): Output file path.
+
+    Returns:
+        str | None: The format name, or None for an unknown extension.
+
+    """
+    return OUTPUT_FORMATS.get(os.path.splitext(path)[1].lower())
@@ -0,0 +1,333 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Bulk loading and validation of plane sets.
+
+Plane files are parsed in one NumPy pass into an ``(N, 2, 3)`` array, where
+``planes[i, 0]`` is a point on plane ``i`` and ``planes[i, 1]`` its unit
+normal. Three layouts are read:
+
+* ``.csv``: one ``x,y,z,nx,ny,nz`` row per plane, with an optional header.
+* ``.npy``: an ``(N, 2, 3)`` or ``(N, 6)`` array, memory-mapped.
+* anything else: one ``x,y,z:nx,ny,nz`` definition per line, as accepted by
+  :func:`intersector.utils.parsing.parse_planes_file`.
+
+A :class:`PlaneSet` hands the array to the intersection code as a sequence
+of ``(point, normal)`` tuples, converted chunk by chunk while it is iterated.
+"""
+
+import io
+import logging
+import os
+import re
+import warnings
+from collections.abc import Sequence
+
+import numpy as np
+
+from intersector.utils.parsing import parse_plane_input, parse_planes_file
+
+log = logging.getLogger(__name__)
+
+# A plane string line: three fields, a ':' and three fields, without comment.
+_FIELDS = r"[^:,#\n]*(?:,[^:,#\n]*){2}"
+_PLANE_LINE = re.compile(rf"^{_FIELDS}:{_FIELDS}$", re.M)
+
+# A line holding data rather than blanks or a comment.
+_DATA_LINE = re.compile(r"^[ \t]*[^\s#]", re.M)
+
+# Plane file formats by file extension; other extensions hold plane strings.
+PLANE_FILE_FORMATS = {".csv": "csv", ".npy": "npy"}
+
+# Rows converted to Python tuples at a time while iterating a PlaneSet.
+ITER_CHUNK = 4096
+
+
+def _loadtxt(text: str) -> np.ndarray:
+    """Parse comma-separated rows of six numbers.
+
+    Returns:
+        numpy.ndarray: ``(N, 6)`` values, empty if there is no data row.
+
+    Raises:
+        ValueError: If a row is not numeric or does not have six values.
+
+    """
+    with warnings.catch_warnings():
+        # An empty file is reported by the caller, not as a warning.
+        warnings.simplefilter("ignore", UserWarning)
+        values = np.loadtxt(
+            io.StringIO(text), delimiter=",", comments="#", ndmin=2, dtype=float
+        )
+    if values.size == 0:
+        return np.empty((0, 6))
+    if values.shape[1] != 6:  # noqa: PLR2004
+        raise ValueError(f"expected 6 values per row, got {values.shape[1]}")
+    return values
+
+
+def _read_text(path: str) -> np.ndarray:
+    """Read ``x,y,z:nx,ny,nz`` lines in one pass.
+
+    The fast path only runs when every data line has the structure of a
+    plane string, so that merging the ``:`` into the fields cannot shift
+    values between point and normal. Other files, and files the fast path
+    cannot read, are parsed again line by line, which either succeeds or
+    reports the offending line number.
+
+    Returns:
+        numpy.ndarray: ``(N, 6)`` values.
+
+    """
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+
+    values = None
+    rows = len(_PLANE_LINE.findall(text))
+    if rows == len(_DATA_LINE.findall(text)):
+        try:
+            values = _loadtxt(text.replace(":", ","))
+        except ValueError:
+            values = None
+    if values is None or len(values) != rows:
+        values = np.array(parse_planes_file(path), dtype=float).reshape(-1, 6)
+    return values
+
+
+def _is_header(line: str) -> bool:
+    """Return whether a CSV line holds column names rather than numbers.
+
+    Returns:
+        bool: True if a value of the line is not a number.
+
+    """
+    try:
+        [float(v) for v in line.split(",")]
+    except ValueError:
+        return True
+    return False
+
+
+def _read_csv(path: str) -> np.ndarray:
+    """Read ``x,y,z,nx,ny,nz`` rows, skipping a header line if present.
+
+    Returns:
+        numpy.ndarray: ``(N, 6)`` values.
+
+    Raises:
+        ValueError: If a row cannot be parsed.
+
+    """
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+
+    data = (
+        line for line in lines if line.strip() and not line.lstrip().startswith("#")
+    )
+    first = next(data, None)
+    if first is not None and _is_header(first):
+        lines.remove(first)
+
+    try:
+        return _loadtxt("".join(lines))
+    except ValueError as exc:
+        raise ValueError(f"{path}: {exc}") from exc
+
+
+def _read_npy(path: str) -> np.ndarray:
+    """Memory-map an ``(N, 2, 3)`` or ``(N, 6)`` array.
+
+    Returns:
+        numpy.ndarray: ``(N, 6)`` values.
+
+    Raises:
+        ValueError: If the file is not a NumPy array of that shape.
+
+    """
+    try:
+        values = np.load(path, mmap_mode="r", allow_pickle=False)
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"{path}: not a NumPy .npy array ({exc})") from exc
+
+    if values.ndim not in {2, 3} or values.shape[1:] not in {(6,), (2, 3)}:
+        raise ValueError(
+            f"{path}: expected an (N, 2, 3) or (N, 6) array, got {values.shape}"
+        )
+    return values.reshape(len(values), 6)
+
+
+_READERS = {"csv": _read_csv, "npy": _read_npy, "text": _read_text}
+
+
+def plane_file_format(path: str) -> str:
+    """Return the plane file format matching the extension of ``path``.
+
+    Returns:
+        str: ``csv``, ``npy``, or ``text`` for plane strings.
+
+    """
+    return PLANE_FILE_FORMATS.get(os.path.splitext(path)[1].lower(), "text")
+
+
+def validate_planes(planes) -> np.ndarray:
+    """Check a plane array and normalize its normals.
+
+    Args:
+        planes (array-like): ``(N, 2, 3)`` or ``(N, 6)`` point and normal
+            components.
+
+    Returns:
+        numpy.ndarray: A new ``(N, 2, 3)`` float array with unit normals.
+
+    Raises:
+        ValueError: If the array has the wrong shape, a plane holds a NaN or
+            infinite value, or a normal is zero. The message reports the
+            (0-based) index of the first offending plane.
+
+    """
+    planes = np.array(planes, dtype=float)
+    if planes.size == 0:
+        return planes.reshape(0, 2, 3)
+    if planes.shape[1:] not in {(6,), (2, 3)}:
+        raise ValueError(f"Expected (N, 2, 3) plane array, got {planes.shape}")
+    planes = planes.reshape(-1, 2, 3)
+
+    bad = ~np.isfinite(planes).all(axis=(1, 2))
+    if bad.any():
+        raise ValueError(
+            f"{np.count_nonzero(bad)} plane(s) hold NaN or infinite values "
+            f"(first at index {np.argmax(bad)})"
+        )
+
+    norms = np.linalg.norm(planes[:, 1], axis=1)
+    bad = norms <= np.finfo(float).tiny
+    if bad.any():
+        raise ValueError(
+            f"{np.count_nonzero(bad)} plane(s) have a zero normal "
+            f"(first at index {np.argmax(bad)})"
+        )
+
+    planes[:, 1] /= norms[:, None]
+    return planes
+
+
+def load_planes(path: str) -> np.ndarray:
+    """Load, validate and normalize a plane file.
+
+    A file that cannot be parsed or holds an invalid plane raises a
+    ``ValueError`` naming the file, or the offending line or plane index.
+
+    Args:
+        path (str): Path to a ``.csv``, ``.npy`` or plane-string file.
+
+    Returns:
+        numpy.ndarray: The ``(N, 2, 3)`` planes in file order, with unit
+            normals.
+
+    Raises:
+        ValueError: If the file cannot be parsed or holds an invalid plane.
+
+    """
+    fmt = plane_file_format(path)
+    values = _READERS[fmt](path)
+    try:
+        planes = validate_planes(values)
+    except ValueError as exc:
+        raise ValueError(f"{path}: {exc}") from exc
+    log.debug("📐 Loaded %s planes from %s file %s", len(planes), fmt.upper(), path)
+    return planes
+
+
+class PlaneSet(Sequence):
+    """A sequence of ``(point, normal)`` tuples backed by an ``(N, 2, 3)`` array.
+
+    Planes are converted to tuples only as they are accessed, a chunk at a
+    time when iterating, so a large set never exists as Python objects all
+    at once.
+    """
+
+    def __init__(self, planes):
+        """Wrap validated planes.
+
+        Args:
+            planes (array-like): ``(N, 2, 3)`` points and normals, as returned
+                by :func:`validate_planes` or :func:`load_planes`.
+
+        """
+        self.array = np.asarray(planes, dtype=float).reshape(-1, 2, 3)
+
+    @classmethod
+    def from_pairs(cls, pairs) -> "PlaneSet":
+        """Validate ``(point, normal)`` pairs and wrap them.
+
+        Invalid planes raise the ``ValueError`` of :func:`validate_planes`.
+
+        Returns:
+            PlaneSet: The planes, with unit normals.
+
+        """
+        return cls(validate_planes(np.reshape(list(pairs), (-1, 2, 3))))
+
+    def __len__(self) -> int:
+        """Return the number of planes.
+
+        Returns:
+            int: The number of planes.
+
+        """
+        return len(self.array)
+
+    def __getitem__(self, index):
+        """Return one plane, or the planes of a slice.
+
+        Returns:
+            tuple | PlaneSet: A ``(point, normal)`` pair of 3-tuples, or a
+                PlaneSet for a slice.
+
+        """
+        if isinstance(index, slice):
+            return PlaneSet(self.array[index])
+        point, normal = self.array[index].tolist()
+        return tuple(point), tuple(normal)
+
+    def __iter__(self):
+        """Iterate over the planes, converting a chunk at a time.
+
+        Yields:
+            tuple: The ``(point, normal)`` pair of 3-tuples of each plane.
+
+        """
+        for start in range(0, len(self.array), ITER_CHUNK):
+            for point, normal in self.array[start : start + ITER_CHUNK].tolist():
+                yield tuple(point), tuple(normal)
+
+
+def parse_plane_list(planes) -> list:
+    """Parse a non-empty list of planes given as strings or point-normal pairs.
+
+    This is the plane input of the server requests and of
+    :class:`intersector.api.Intersector`.
+
+    Returns:
+        list[tuple]: The (point, normal) pairs, with unit normals.
+
+    Raises:
+        ValueError: If a plane is malformed, or has a zero or non-finite
+            component (see :func:`validate_planes`).
+
+    """
+    if not isinstance(planes, list) or not planes:
+        raise ValueError("'planes' must be a non-empty list")
+
+    parsed = []
+    for plane in planes:
+        if isinstance(plane, str):
+            parsed.append(parse_plane_input(plane))
+        else:
+            try:
+                point, normal = (tuple(float(c) for c in v) for v in plane)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid plane: {plane!r}") from e
+            if len(point) != 3 or len(normal) != 3:  # noqa: PLR2004
+                raise ValueError(f"Invalid plane: {plane!r}")
+            parsed.append((point, normal))
+    return list(PlaneSet.from_pairs(parsed))
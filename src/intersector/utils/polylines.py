@@ -0,0 +1,165 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Lightweight output formats for discretized sections.
+
+Writes sections sampled into polylines (see
+:mod:`intersector.operations.discretize`) as NPZ, JSON, SVG or DXF files.
+None of the writers needs OpenCascade.
+
+A section is a ``(point, normal, polylines)`` tuple: the plane it was cut
+with and its polylines, each an ``(N, 3)`` array of points.
+"""
+
+import json
+import logging
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+
+def plane_frame(normal) -> tuple[np.ndarray, np.ndarray]:
+    """Return two unit vectors spanning the plane orthogonal to ``normal``.
+
+    The frame only depends on the direction of ``normal``, so parallel
+    sections are drawn in the same 2D coordinates.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: The ``u`` and ``v`` axes.
+
+    """
+    n = np.asarray(normal, dtype=float)
+    n /= np.linalg.norm(n)
+    helper = np.eye(3)[np.argmin(np.abs(n))]
+    u = np.cross(helper, n)
+    u /= np.linalg.norm(u)
+    return u, np.cross(n, u)
+
+
+def _write_npz(sections, path: str) -> None:
+    """Write all points into one contiguous array with offset tables."""
+    polylines = [p for _, _, lines in sections for p in lines]
+    sizes = [len(p) for p in polylines]
+    counts = [len(lines) for _, _, lines in sections]
+
+    with open(path, "wb") as f:
+        np.savez_compressed(
+            f,
+            points=np.concatenate(polylines) if polylines else np.empty((0, 3)),
+            polyline_offsets=np.concatenate(([0], np.cumsum(sizes))).astype(int),
+            section_offsets=np.concatenate(([0], np.cumsum(counts))).astype(int),
+            planes=np.array(
+                [(*point, *normal) for point, normal, _ in sections], dtype=float
+            ).reshape(-1, 6),
+        )
+
+
+def _write_json(sections, path: str) -> None:
+    data = {
+        "sections": [
+            {
+                "point": list(point),
+                "normal": list(normal),
+                "polylines": [p.tolist() for p in lines],
+            }
+            for point, normal, lines in sections
+        ]
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def _write_svg(sections, path: str) -> None:
+    """Draw the sections projected on their plane, one group per section."""
+    projected = []
+    for _, normal, lines in sections:
+        u, v = plane_frame(normal)
+        projected.append([np.column_stack((p @ u, -(p @ v))) for p in lines])
+
+    points = [p for lines in projected for p in lines]
+    if points:
+        stacked = np.concatenate(points)
+        lo, hi = stacked.min(axis=0), stacked.max(axis=0)
+    else:
+        lo, hi = np.zeros(2), np.ones(2)
+    width, height = np.maximum(hi - lo, 1e-9)
+    stroke = max(width, height) / 500.0
+
+    out = [
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        f'viewBox="{lo[0]:g} {lo[1]:g} {width:g} {height:g}">',
+        f'<g fill="none" stroke="black" stroke-width="{stroke:g}">',
+    ]
+    for index, lines in enumerate(projected, start=1):
+        out.append(f'<g id="section_{index:03d}">')
+        for p in lines:
+            coords = " ".join(f"{x:g},{y:g}" for x, y in p)
+            out.append(f'<polyline points="{coords}"/>')
+        out.append("</g>")
+    out += ["</g>", "</svg>"]
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(out) + "\n")
+
+
+def _write_dxf(sections, path: str) -> None:
+    """Write an ASCII DXF (R12) with one 3D polyline per edge.
+
+    Each section goes on its own layer (``SECTION_001``, ...).
+    """
+    out = ["0", "SECTION", "2", "ENTITIES"]
+    for index, (_, _, lines) in enumerate(sections, start=1):
+        layer = f"SECTION_{index:03d}"
+        for p in lines:
+            closed = len(p) > 2 and np.allclose(p[0], p[-1])  # noqa: PLR2004
+            vertices = p[:-1] if closed else p
+            out += ["0", "POLYLINE", "8", layer, "66", "1", "70"]
+            out.append("9" if closed else "8")  # 3D polyline, 1 = closed
+            for x, y, z in vertices:
+                out += ["0", "VERTEX", "8", layer, "70", "32"]
+                out += ["10", f"{x:g}", "20", f"{y:g}", "30", f"{z:g}"]
+            out += ["0", "SEQEND", "8", layer]
+    out += ["0", "ENDSEC", "0", "EOF"]
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(out) + "\n")
+
+
+_WRITERS = {
+    "npz": _write_npz,
+    "json": _write_json,
+    "svg": _write_svg,
+    "dxf": _write_dxf,
+}
+
+
+def export_polylines(sections, filename: str, fmt: str) -> bool:
+    """Write discretized sections to a lightweight file format.
+
+    Args:
+        sections (Iterable[tuple]): ``(point, normal, polylines)`` tuples.
+        filename (str): Output filename.
+        fmt (str): One of ``npz``, ``json``, ``svg`` or ``dxf``.
+
+    Returns:
+        bool: True if the export succeeded, False otherwise.
+
+    Raises:
+        ValueError: If the format is not supported.
+
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unsupported polyline format: '{fmt}'")
+
+    try:
+        _WRITERS[fmt](list(sections), filename)
+    except OSError as e:
+        log.error("[bold red]💥 Error writing %s file:[/bold red] %s", fmt.upper(), e)
+        return False
+
+    log.info(
+        "[green]✅ Sections successfully exported to [/green]"
+        "[green][bold]%s[/bold][/green]",
+        filename,
+    )
+    return True
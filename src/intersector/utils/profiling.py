@@ -0,0 +1,198 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Built-in per-phase profiling.
+
+Code paths wrap their phases in :func:`phase`. Nothing is recorded until
+:func:`start` installs a :class:`Profiler`; from then on every phase records
+its wall time, CPU time and the peak resident set size of the process, until
+:func:`stop` hands the profiler back for export as a JSON summary or a
+Chrome/Perfetto trace (``chrome://tracing``, https://ui.perfetto.dev).
+
+Phases run in worker processes are not recorded.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+_profiler = None
+
+
+def peak_rss() -> int | None:
+    """Return the peak resident set size of this process.
+
+    Returns:
+        int | None: The peak RSS in bytes, or None where it is unavailable.
+
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Profiler:
+    """Recorder of the phases run while it is installed.
+
+    Attributes:
+        events (list[dict]): One record per completed phase, in completion
+            order, with its ``name``, ``start_s`` (since the profiler was
+            created), ``wall_s``, ``cpu_s``, ``peak_rss`` and ``tid``.
+
+    """
+
+    def __init__(self):
+        """Create an empty profiler starting its clock now."""
+        self.events = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        """Return the wall time since the profiler was created.
+
+        Returns:
+            float: Elapsed seconds.
+
+        """
+        return time.perf_counter() - self._origin
+
+    def record(self, name: str, start: float, wall: float, cpu: float) -> None:
+        """Add a completed phase.
+
+        Args:
+            name (str): Phase name.
+            start (float): Start time, in seconds since the profiler's origin.
+            wall (float): Wall time of the phase, in seconds.
+            cpu (float): Process CPU time of the phase, in seconds.
+
+        """
+        event = {
+            "name": name,
+            "start_s": start,
+            "wall_s": wall,
+            "cpu_s": cpu,
+            "peak_rss": peak_rss(),
+            "tid": threading.get_ident(),
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def summary(self) -> dict:
+        """Aggregate the phases by name.
+
+        Returns:
+            dict: The total wall time and peak RSS of the run, and for each
+                phase its call count, total wall and CPU time and the peak RSS
+                reached by its end.
+
+        """
+        phases = {}
+        for event in self.events:
+            entry = phases.setdefault(
+                event["name"],
+                {"count": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_rss": None},
+            )
+            entry["count"] += 1
+            entry["wall_s"] += event["wall_s"]
+            entry["cpu_s"] += event["cpu_s"]
+            if event["peak_rss"] is not None:
+                entry["peak_rss"] = max(entry["peak_rss"] or 0, event["peak_rss"])
+
+        return {"wall_s": self.elapsed(), "peak_rss": peak_rss(), "phases": phases}
+
+    def trace(self) -> dict:
+        """Convert the phases into Chrome trace events.
+
+        Returns:
+            dict: A trace in the Chrome Trace Event format.
+
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": event["name"],
+                "cat": "intersector",
+                "ph": "X",
+                "ts": event["start_s"] * 1e6,
+                "dur": event["wall_s"] * 1e6,
+                "pid": pid,
+                "tid": event["tid"],
+                "args": {"cpu_ms": event["cpu_s"] * 1e3, "peak_rss": event["peak_rss"]},
+            }
+            for event in self.events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, summary_path: str, trace_path: str | None = None) -> None:
+        """Write the JSON summary and, optionally, the Chrome trace.
+
+        Args:
+            summary_path (str): Output file of :meth:`summary`.
+            trace_path (str | None): Output file of :meth:`trace`.
+
+        """
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+        if trace_path:
+            with open(trace_path, "w", encoding="utf-8") as f:
+                json.dump(self.trace(), f)
+
+
+def start() -> Profiler:
+    """Install a new profiler recording every following phase.
+
+    Returns:
+        Profiler: The installed profiler.
+
+    """
+    global _profiler  # noqa: PLW0603
+    _profiler = Profiler()
+    return _profiler
+
+
+def stop() -> Profiler | None:
+    """Uninstall the current profiler.
+
+    Returns:
+        Profiler | None: The profiler that was installed, if any.
+
+    """
+    global _profiler  # noqa: PLW0603
+    profiler, _profiler = _profiler, None
+    return profiler
+
+
+@contextmanager
+def phase(name: str):
+    """Record the enclosed code as a phase of the installed profiler.
+
+    Does nothing when no profiler is installed. Can also decorate functions.
+
+    Args:
+        name (str): Phase name, e.g. ``step.ReadFile``.
+
+    Yields:
+        None: Control to the enclosed code.
+
+    """
+    profiler = _profiler
+    if profiler is None:
+        yield
+        return
+
+    start = profiler.elapsed()
+    cpu = time.process_time()
+    try:
+        yield
+    finally:
+        profiler.record(
+            name, start, profiler.elapsed() - start, time.process_time() - cpu
+        )
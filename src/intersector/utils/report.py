@@ -0,0 +1,94 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Export of section summaries as JSON or CSV tables.
+
+Each row is a summary from :mod:`intersector.operations.analytics`, one per
+plane. None of the writers needs OpenCascade.
+"""
+
+import csv
+import json
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+SUMMARY_FIELDS = [
+    "px",
+    "py",
+    "pz",
+    "nx",
+    "ny",
+    "nz",
+    "valid",
+    "edges",
+    "length",
+    "area",
+    "loops",
+    "open_chains",
+    "umin",
+    "vmin",
+    "umax",
+    "vmax",
+    "timed_out",
+]
+
+# Summary formats by file extension.
+SUMMARY_FORMATS = {".json": "json", ".csv": "csv"}
+
+
+def _write_json(rows, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"fields": SUMMARY_FIELDS, "sections": rows}, f, indent=1)
+
+
+def _write_csv(rows, path: str) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+_WRITERS = {"json": _write_json, "csv": _write_csv}
+
+
+def summary_format_from_path(path: str) -> str | None:
+    """Return the summary format matching the extension of ``path``.
+
+    Returns:
+        str | None: ``json`` or ``csv``, or None for an unknown extension.
+
+    """
+    return SUMMARY_FORMATS.get(os.path.splitext(path)[1].lower())
+
+
+def export_summary(rows, filename: str) -> bool:
+    """Write section summaries to a JSON or CSV table.
+
+    Args:
+        rows (Iterable[dict]): One summary per section.
+        filename (str): Output filename; its extension selects the format.
+
+    Returns:
+        bool: True if the export succeeded, False otherwise.
+
+    Raises:
+        ValueError: If the extension is neither ``.json`` nor ``.csv``.
+
+    """
+    fmt = summary_format_from_path(filename)
+    if fmt is None:
+        raise ValueError(f"Unsupported summary file: '{filename}' (use .json or .csv)")
+
+    try:
+        _WRITERS[fmt](list(rows), filename)
+    except OSError as e:
+        log.error("[bold red]💥 Error writing %s file:[/bold red] %s", fmt.upper(), e)
+        return False
+
+    log.info(
+        "[green]✅ Section summary exported to [/green]"
+        "[green][bold]%s[/bold][/green]",
+        filename,
+    )
+    return True
@@ -0,0 +1,173 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Background export of section results.
+
+A :class:`BackgroundWriter` hands each result to a writer thread through a
+bounded queue, so results are written while the next sections are computed.
+When the queue is full, :meth:`BackgroundWriter.put` blocks until the writer
+catches up: at most ``max_pending`` results wait in memory.
+
+OpenCascade keeps the GIL while it transfers and writes STEP data, so the
+overlap is largest when the sections are computed in worker processes
+(``--workers``) or when writing polylines, whose file I/O releases the GIL.
+"""
+
+import logging
+import os
+import queue
+import threading
+
+log = logging.getLogger(__name__)
+
+# Results waiting for the writer thread before put() blocks.
+DEFAULT_MAX_PENDING = 8
+
+_STOP = object()
+
+
+def numbered_path(path: str, index: int, total: int) -> str:
+    """Return the output path of the ``index``-th result out of ``total``.
+
+    A single result keeps ``path`` unchanged; otherwise a zero-padded index is
+    inserted before the extension (``intersection.stp`` becomes
+    ``intersection_001.stp``).
+
+    Returns:
+        str: The output path for this result.
+
+    """
+    if total == 1:
+        return path
+
+    root, ext = os.path.splitext(path)
+    width = max(3, len(str(total)))
+    return f"{root}_{index:0{width}d}{ext}"
+
+
+class BackgroundWriter:
+    """Writer thread exporting results to numbered files as they arrive.
+
+    Results are numbered in the order they are put. The first one is held
+    back until a second arrives, so a lone result is written to ``output``
+    itself and several results to numbered files (see :func:`numbered_path`).
+
+    After the first failed write, the remaining results are dropped.
+
+    Attributes:
+        paths (list[str]): The files written successfully, in order.
+        failed (list[str]): The files that could not be written.
+
+    """
+
+    def __init__(
+        self, write, output: str, total: int = 0, max_pending=DEFAULT_MAX_PENDING
+    ):
+        """Start the writer thread.
+
+        Args:
+            write (Callable): ``(result, path) -> bool`` exporting one result,
+                False if it failed.
+            output (str): Output file name, numbered for several results.
+            total (int): Upper bound on the number of results, setting the
+                width of the numbers.
+            max_pending (int): Results queued before :meth:`put` blocks.
+
+        Raises:
+            ValueError: If ``max_pending`` is not positive.
+
+        """
+        if max_pending < 1:
+            raise ValueError("max_pending must be positive")
+
+        self.paths = []
+        self.failed = []
+        self._write = write
+        self._output = output
+        self._total = max(total, 2)
+        self._count = 0
+        self._held = None
+        self._error = None
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(
+            target=self._run, name="intersector-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Write queued results until the stop marker."""
+        while (item := self._queue.get()) is not _STOP:
+            result, path = item
+            if self.failed or self._error:
+                continue
+            try:
+                ok = self._write(result, path)
+            except Exception as e:  # noqa: BLE001 - re-raised by close()
+                self._error = e
+                continue
+            (self.paths if ok else self.failed).append(path)
+
+    @property
+    def count(self) -> int:
+        """Number of results put so far."""
+        return self._count
+
+    def put(self, result) -> None:
+        """Queue a result for writing, blocking while the queue is full.
+
+        Args:
+            result: The data passed to ``write``.
+
+        """
+        self._count += 1
+        if self._count == 1:
+            self._held = result
+            return
+        if self._count == 2:  # noqa: PLR2004
+            self._enqueue(self._held, 1)
+            self._held = None
+        self._enqueue(result, self._count)
+
+    def _enqueue(self, result, index: int) -> None:
+        """Queue a result with its numbered path."""
+        self._queue.put((result, numbered_path(self._output, index, self._total)))
+
+    def close(self) -> list[str]:
+        """Write the held result, wait for the writer and stop it.
+
+        An exception raised by ``write`` is re-raised here.
+
+        Returns:
+            list[str]: The files written successfully, in order.
+
+        """
+        if self._held is not None:
+            self._queue.put((self._held, self._output))
+            self._held = None
+        self._stop()
+        if self._error is not None:
+            raise self._error
+        log.debug("💾 Wrote %s of %s results", len(self.paths), self._count)
+        return self.paths
+
+    def _stop(self) -> None:
+        """Stop the writer thread once the queued results are written."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def __enter__(self):
+        """Return the writer.
+
+        Returns:
+            BackgroundWriter: This writer.
+
+        """
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        """Close the writer if still open, or only stop it after an error."""
+        if exc_type is not None:
+            self._held = None
+            self._stop()
+        elif self._thread.is_alive():
+            self.close()
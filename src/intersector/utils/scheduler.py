@@ -0,0 +1,296 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Memory-budgeted scheduling of sectioning jobs over worker processes.
+
+Every job carries an estimate of the memory it needs, derived from the size
+of its input and its face count (see :func:`estimate_footprint`). The
+:class:`MemoryScheduler` submits jobs in order, and only while the estimates
+of the jobs in flight fit in the memory budget, so that several large STEP
+files are not transferred at once by workers sharing one machine. Workers can
+be replaced after a number of tasks, which returns the OpenCascade heap they
+grew to the system, and the peak RSS of every worker is recorded.
+
+The estimates are coarse by design: they only have to rank jobs and keep the
+sum of concurrent jobs in the right range. The measured peaks tell how far
+off they are for a given kind of model.
+"""
+
+import functools
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from intersector.utils.execution import current_policy, set_policy
+from intersector.utils.profiling import peak_rss
+
+log = logging.getLogger(__name__)
+
+# Memory held per byte of STEP text once the file is parsed and transferred.
+BYTES_PER_FILE_BYTE = 8
+
+# Memory held per face: geometry, face index entry and section results.
+BYTES_PER_FACE = 32 * 1024
+
+# STEP entities counted as faces by `count_step_faces`.
+STEP_FACE_ENTITIES = (b"ADVANCED_FACE(", b"FACE_SURFACE(")
+
+# Bytes read at a time when counting faces.
+_READ_CHUNK = 1 << 20
+
+
+def count_step_faces(path: str) -> int:
+    """Count the face entities of a STEP file without parsing it.
+
+    Args:
+        path (str): Path to the STEP file.
+
+    Returns:
+        int: The number of ``ADVANCED_FACE`` and ``FACE_SURFACE`` entities.
+
+    """
+    overlap = max(len(entity) for entity in STEP_FACE_ENTITIES) - 1
+    count = 0
+    tail = b""
+    with open(path, "rb") as f:
+        while chunk := f.read(_READ_CHUNK):
+            data = tail + chunk.upper()
+            count += sum(data.count(entity) for entity in STEP_FACE_ENTITIES)
+            # Keep the end of the chunk so an entity name split across two
+            # reads is found, without counting an entity twice.
+            tail = data[-overlap:]
+            count -= sum(tail.count(entity) for entity in STEP_FACE_ENTITIES)
+    return count + sum(tail.count(entity) for entity in STEP_FACE_ENTITIES)
+
+
+def estimate_footprint(nbytes: int, faces: int) -> int:
+    """Estimate the memory a job needs on top of an idle worker.
+
+    Args:
+        nbytes (int): Size of the input, as STEP text or a BRep blob.
+        faces (int): Number of faces of the input shape.
+
+    Returns:
+        int: The estimate in bytes.
+
+    """
+    return nbytes * BYTES_PER_FILE_BYTE + faces * BYTES_PER_FACE
+
+
+def step_footprint(path: str) -> int:
+    """Estimate the memory needed to load and section a STEP file.
+
+    Args:
+        path (str): Path to the STEP file.
+
+    Returns:
+        int: The estimate in bytes.
+
+    """
+    return estimate_footprint(os.path.getsize(path), count_step_faces(path))
+
+
+def _measured(fn, *args) -> tuple:
+    """Run a job in a worker and report the worker's peak RSS.
+
+    Returns:
+        tuple: The job's result, the worker's process id and its peak RSS in
+            bytes (None where unavailable).
+
+    """
+    return fn(*args), os.getpid(), peak_rss()
+
+
+class MemoryScheduler:
+    """Run jobs in worker processes within a memory budget.
+
+    Attributes:
+        budget (int | None): Memory budget in bytes, None for no limit.
+        workers (int | None): Number of worker processes, None for one per
+            CPU.
+        max_tasks_per_worker (int | None): Jobs run by a worker process
+            before it is replaced, None to keep workers for good.
+        peak_rss (dict): Highest peak RSS in bytes measured in each worker,
+            by process id.
+
+    """
+
+    def __init__(
+        self,
+        budget: int | None = None,
+        workers: int | None = None,
+        max_tasks_per_worker: int | None = None,
+        executor=None,
+    ):
+        """Create a scheduler.
+
+        Args:
+            budget (int | None): Memory budget in bytes for the jobs in
+                flight, None for no limit.
+            workers (int | None): Number of worker processes. Defaults to
+                the number of CPUs.
+            max_tasks_per_worker (int | None): Jobs run by a worker process
+                before it is replaced, None to keep workers for good.
+            executor (concurrent.futures.Executor | None): Executor running
+                the jobs of :meth:`map` instead of a process pool.
+
+        Raises:
+            ValueError: If the budget is negative, or ``workers`` or
+                ``max_tasks_per_worker`` is not positive.
+
+        """
+        if budget is not None and budget < 0:
+            raise ValueError("Memory budget cannot be negative")
+        if workers is not None and workers < 1:
+            raise ValueError("Number of workers must be positive")
+        if max_tasks_per_worker is not None and max_tasks_per_worker < 1:
+            raise ValueError("Number of tasks per worker must be positive")
+
+        self.budget = budget
+        self.workers = workers
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.peak_rss = {}
+        self._executor = executor
+
+    def workers_for(self, footprint: int, workers: int | None = None) -> int:
+        """Return how many workers can each hold a job of ``footprint``.
+
+        Args:
+            footprint (int): Estimated memory of one job, in bytes.
+            workers (int | None): The number wanted. Defaults to
+                :attr:`workers`, or one per CPU.
+
+        Returns:
+            int: The number of workers within the budget, at least one.
+
+        """
+        workers = workers or self.workers or os.cpu_count() or 1
+        if self.budget is None or footprint <= 0:
+            return workers
+        return max(1, min(workers, self.budget // footprint))
+
+    def pool_options(self) -> dict:
+        """Return the process pool options recycling the workers.
+
+        Returns:
+            dict: Keyword arguments for ``ProcessPoolExecutor``, replacing its
+                workers after :attr:`max_tasks_per_worker` jobs.
+
+        """
+        if self.max_tasks_per_worker is None:
+            return {}
+        # Worker recycling is not available with the fork start method.
+        return {
+            "mp_context": multiprocessing.get_context("spawn"),
+            "max_tasks_per_child": self.max_tasks_per_worker,
+        }
+
+    def _record(self, pid: int, peak) -> None:
+        """Record the peak RSS measured in a worker."""
+        if peak is not None:
+            self.peak_rss[pid] = max(self.peak_rss.get(pid, 0), peak)
+
+    def imap(self, pool, fn, items, chunksize: int = 1):
+        """Run ``fn(item)`` in ``pool`` for each item, like ``pool.map``.
+
+        Args:
+            pool (concurrent.futures.Executor): The pool, started with
+                :meth:`pool_options`.
+            fn (Callable): A picklable module-level function.
+            items (Iterable): Its arguments.
+            chunksize (int): Number of items sent to a worker at once.
+
+        Yields:
+            Any: The result of each item, in order.
+
+        """
+        for result, pid, peak in pool.map(
+            functools.partial(_measured, fn), items, chunksize=chunksize
+        ):
+            self._record(pid, peak)
+            yield result
+
+    def _fits(self, in_flight: int, footprint: int, busy: bool) -> bool:
+        """Return whether a job can start next to the jobs in flight.
+
+        A job larger than the whole budget still runs, alone.
+
+        Returns:
+            bool: Whether the job is admitted.
+
+        """
+        if self.budget is None or not busy:
+            if self.budget is not None and footprint > self.budget:
+                log.warning(
+                    "[yellow]⚠️  Job needs about %.0f MB, over the %.0f MB "
+                    "budget; running it alone.[/yellow]",
+                    footprint / 2**20,
+                    self.budget / 2**20,
+                )
+            return True
+        return in_flight + footprint <= self.budget
+
+    def map(self, fn, jobs, footprints):
+        """Run ``fn(*args)`` for each job and yield the results in order.
+
+        Jobs are submitted in order while their estimated footprints fit in
+        the budget next to the jobs already running; a job that does not fit
+        waits for running jobs to finish, and so do the jobs after it.
+
+        Args:
+            fn (Callable): A picklable module-level function.
+            jobs (Iterable[tuple]): The arguments of each call.
+            footprints (Iterable[int]): The estimated memory of each job, in
+                bytes.
+
+        Yields:
+            Any: The result of each job, in order.
+
+        """
+        pending = deque(zip(jobs, footprints, strict=True))
+        running = {}
+        done = {}
+        next_out = 0
+        submitted = 0
+        in_flight = 0
+
+        executor = self._executor or ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=set_policy,
+            initargs=(current_policy(),),
+            **self.pool_options(),
+        )
+        try:
+            while pending or running:
+                while pending and self._fits(in_flight, pending[0][1], bool(running)):
+                    args, footprint = pending.popleft()
+                    future = executor.submit(_measured, fn, *args)
+                    running[future] = (submitted, footprint)
+                    submitted += 1
+                    in_flight += footprint
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    number, footprint = running.pop(future)
+                    in_flight -= footprint
+                    done[number], pid, peak = future.result()
+                    self._record(pid, peak)
+
+                while next_out in done:
+                    yield done.pop(next_out)
+                    next_out += 1
+        finally:
+            if self._executor is None:
+                executor.shutdown(cancel_futures=True)
+
+        self.report()
+
+    def report(self) -> None:
+        """Log the highest peak RSS measured in the workers so far."""
+        if self.peak_rss:
+            log.info(
+                "🧠 Peak worker RSS %.0f MB over %s worker(s)",
+                max(self.peak_rss.values()) / 2**20,
+                len(self.peak_rss),
+            )
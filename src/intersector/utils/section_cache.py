@@ -0,0 +1,163 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Persistent cache of section results.
+
+Sections are stored in binary BRep format, keyed by the content hash of the
+input shape, the canonical form of the plane and the section settings. Two
+plane specifications describing the same plane (a scaled or flipped normal,
+another point on the plane) map to the same entry, so repeated runs return
+the stored result without any boolean work.
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+from intersector.utils.geometry import DEFAULT_TOLERANCE, canonical_plane
+from intersector.utils.step_cache import DEFAULT_CACHE_DIR, BRepCache
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SECTION_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, "sections")
+
+# Anything that changes the section computed for the same shape and plane
+# must be part of the key, so bump this when `intersect_with_plane` changes.
+SECTION_SETTINGS = "BRepAlgoAPI_Section:v1"
+
+# How the sections were computed: every plane against the whole shape, or a
+# single plane spread over the solids, which repeats the edges of the faces
+# the solids share.
+SECTION_PATHS = ("planes", "solids")
+
+
+def section_settings(engine: str = "brep", path: str = "planes") -> str:
+    """Return the settings part of the keys of sections computed one way.
+
+    Args:
+        engine (str): The section engine.
+        path (str): ``planes`` or ``solids`` (see ``SECTION_PATHS``).
+
+    Returns:
+        str: The settings, naming the engine and the path.
+
+    Raises:
+        ValueError: If the path is unknown.
+
+    """
+    if path not in SECTION_PATHS:
+        raise ValueError(f"Unknown section path: {path!r}")
+    return f"{SECTION_SETTINGS}:{engine}:{path}"
+
+
+class SectionCache(BRepCache):
+    """Cache of section results, keyed by shape, canonical plane and settings.
+
+    See :class:`BRepCache` for storage, eviction and statistics.
+
+    Attributes:
+        tolerance (float): Quantum of the canonical planes.
+
+    """
+
+    kind = "section"
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_SECTION_CACHE_DIR,
+        max_bytes=None,
+        tolerance: float = DEFAULT_TOLERANCE,
+    ):
+        """Create a cache rooted at ``directory``.
+
+        Args:
+            directory (str): The cache directory, created on first store.
+            max_bytes (int | None): The size cap in bytes. Defaults to
+                ``DEFAULT_MAX_BYTES``.
+            tolerance (float): Quantum of the canonical planes, between 0
+                and 1 (see :func:`canonical_plane`).
+
+        Raises:
+            ValueError: If ``max_bytes`` is negative or ``tolerance`` is not
+                between 0 and 1.
+
+        """
+        if not 0 < tolerance < 1:
+            raise ValueError("Tolerance must be between 0 and 1")
+
+        super().__init__(directory, max_bytes)
+        self.tolerance = tolerance
+
+    def key(  # noqa: PLR0913, PLR0917
+        self, shape_key: str, point, normal, settings: str | None = None
+    ) -> str:
+        """Return the cache key of the section of a shape with a plane.
+
+        Args:
+            shape_key (str): Content hash of the shape, e.g.
+                :meth:`StepCache.key` of its STEP file.
+            point (tuple[float, float, float]): A point on the plane.
+            normal (tuple[float, float, float]): The plane's normal.
+            settings (str | None): Section engine settings. Defaults to
+                :func:`section_settings` of the in-process brep engine.
+
+        Returns:
+            str: The hex digest of the shape, canonical plane and settings.
+
+        """
+        settings = settings or section_settings()
+        plane = canonical_plane(point, normal, self.tolerance)
+        payload = json.dumps([shape_key, *plane, self.tolerance, settings])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def sections(self, shape_key: str, planes, compute, settings=None):
+        """Yield the section of each plane, computing only the missing ones.
+
+        The missing planes are computed together in one ``compute`` call, so
+        that it can index or parallelize them; equivalent planes within the
+        batch are computed once. Fresh results are stored as they are
+        yielded, and old entries are evicted once all planes are done.
+
+        Args:
+            shape_key (str): Content hash of the shape.
+            planes (Sequence[tuple]): The (point, normal) pairs.
+            compute (Callable): ``planes -> Iterable[TopoDS_Shape]`` computing
+                the sections of a list of planes, in order.
+            settings (str | None): Section engine settings (see
+                :meth:`key`).
+
+        Yields:
+            TopoDS_Shape: The section of each plane, in order.
+
+        """
+        keys = [
+            self.key(shape_key, point, normal, settings) for point, normal in planes
+        ]
+        first_miss = {}
+        for i, key in enumerate(keys):
+            if key not in first_miss and key not in self:
+                first_miss[key] = i
+
+        self._count("hits", len(keys) - len(first_miss))
+        self._count("misses", len(first_miss))
+        log.info(
+            "🗃️  Section cache: %s of %s hits", len(keys) - len(first_miss), len(keys)
+        )
+
+        computed = iter(compute([planes[i] for i in first_miss.values()]))
+        try:
+            for i, key in enumerate(keys):
+                if first_miss.get(key) == i:
+                    result = next(computed)
+                    self.store(key, result, evict=False)
+                else:
+                    result = self.load(key, count=False)
+                    if result is None:  # evicted or unreadable since the lookup
+                        self._count("hits", -1)
+                        self._count("misses")
+                        result = next(iter(compute([planes[i]])))
+                        self.store(key, result, evict=False)
+                yield result
+        finally:
+            if first_miss:
+                self.evict()
@@ -0,0 +1,306 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Content-addressed on-disk cache of parsed STEP files.
+
+Translating a STEP file into a shape is by far the slowest part of loading a
+model. The transferred shape is stored in OpenCascade's native binary BRep
+format, keyed by the content hash of the STEP file and the reader settings,
+so later loads of the same file skip STEP translation entirely.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from OCC.Core.BinTools import bintools
+from OCC.Core.TopoDS import TopoDS_Shape
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join("~", ".cache")), "intersector"
+)
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Anything that changes the shape produced from the same STEP content must be
+# part of the key, so bump this when `read_step` changes how it transfers.
+READER_SETTINGS = "STEPControl_Reader:TransferRoots:OneShape:v1"
+
+_ENTRY_SUFFIX = ".brep"
+_STATS_FILE = "stats.json"
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(filename: str) -> str:
+    """Return the SHA-256 hex digest of the content of a file.
+
+    Returns:
+        str: The hex digest of the file content.
+
+    """
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BRepCache:
+    """Directory of shapes in binary BRep format with a size cap and LRU eviction.
+
+    Entries are ``<key>.brep`` files. A hit refreshes the modification time of
+    its entry, and eviction removes the entries with the oldest modification
+    time first until the cache fits in ``max_bytes``. Hit and miss counters
+    are kept in a small JSON file next to the entries, so they accumulate
+    across runs.
+
+    Cache failures never fail a load: they are logged and the caller falls
+    back to computing the shape.
+
+    Attributes:
+        directory (str): The cache directory.
+        max_bytes (int): The size cap of all entries together.
+
+    """
+
+    # Name of the cached shapes in log messages.
+    kind = "STEP"
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes=None):
+        """Create a cache rooted at ``directory``.
+
+        Args:
+            directory (str): The cache directory, created on first store.
+            max_bytes (int | None): The size cap in bytes. Defaults to
+                ``DEFAULT_MAX_BYTES``.
+
+        Raises:
+            ValueError: If ``max_bytes`` is negative.
+
+        """
+        max_bytes = DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+        if max_bytes < 0:
+            raise ValueError("Cache size cannot be negative")
+
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _ENTRY_SUFFIX)
+
+    @property
+    def _stats_path(self) -> str:
+        return os.path.join(self.directory, _STATS_FILE)
+
+    def __contains__(self, key: str) -> bool:
+        """Return whether an entry is stored under ``key``.
+
+        Returns:
+            bool: True if the entry exists; it is not counted as a lookup.
+
+        """
+        return os.path.exists(self._path(key))
+
+    def load(self, key: str, count: bool = True) -> TopoDS_Shape | None:
+        """Return the cached shape stored under ``key``, if any.
+
+        Args:
+            key (str): The cache key.
+            count (bool): Whether to record the lookup as a hit or a miss.
+
+        An entry that cannot be read is removed and counted as a miss, so
+        that it is computed and stored again.
+
+        Returns:
+            TopoDS_Shape | None: The cached shape on a hit, None on a miss.
+
+        """
+        path = self._path(key)
+        if not os.path.exists(path):
+            if count:
+                self._count("misses")
+            return None
+
+        shape = TopoDS_Shape()
+        try:
+            bintools.Read(shape, path)
+            os.utime(path)
+        except (OSError, RuntimeError) as e:
+            log.warning("[yellow]⚠️  %s cache lookup failed:[/yellow] %s", self.kind, e)
+            shape = None
+
+        if shape is None or shape.IsNull():
+            self._discard(path)
+            if count:
+                self._count("misses")
+            return None
+
+        if count:
+            self._count("hits")
+        return shape
+
+    def _discard(self, path: str) -> None:
+        """Remove an unreadable entry, unless another process already did."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log.warning(
+                "[yellow]⚠️  Could not remove %s cache entry:[/yellow] %s", self.kind, e
+            )
+        else:
+            log.debug("🧹 Removed unreadable cached %s shape %s", self.kind, path)
+
+    def store(self, key: str, shape: TopoDS_Shape, evict: bool = True) -> bool:
+        """Store a transferred shape under ``key`` and evict old entries.
+
+        The entry is written to a temporary file first and moved into place,
+        so concurrent readers never see a partial entry.
+
+        Args:
+            key (str): The cache key.
+            shape (TopoDS_Shape): The shape to store.
+            evict (bool): Whether to evict old entries right away, rather
+                than once after a batch of stores.
+
+        Returns:
+            bool: True if the shape was stored, False otherwise.
+
+        """
+        path = self._path(key)
+        tmp = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+            os.close(fd)
+            bintools.Write(shape, tmp)
+            os.replace(tmp, path)
+        except (OSError, RuntimeError) as e:
+            log.warning(
+                "[yellow]⚠️  Could not cache %s shape:[/yellow] %s", self.kind, e
+            )
+            return False
+        finally:
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+
+        if evict:
+            self.evict()
+        return os.path.exists(path)
+
+    def _entries(self) -> list[os.DirEntry]:
+        """Return the cache entries, least recently used first.
+
+        Entries removed by another process while listing are skipped. The
+        stat result of the returned entries is cached on them.
+
+        Returns:
+            list[os.DirEntry]: The ``.brep`` entries sorted by access order.
+
+        """
+        if not os.path.isdir(self.directory):
+            return []
+
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(_ENTRY_SUFFIX):
+                    continue
+                try:
+                    entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append(entry)
+        return sorted(entries, key=lambda e: e.stat().st_mtime)
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits its cap.
+
+        Returns:
+            int: The number of removed entries.
+
+        """
+        entries = self._entries()
+        total = sum(e.stat().st_size for e in entries)
+        removed = 0
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            total -= entry.stat().st_size
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                continue  # Evicted by another process meanwhile.
+            removed += 1
+
+        if removed:
+            log.debug("🧹 Evicted %s cached %s shape(s)", removed, self.kind)
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        for path in [entry.path for entry in self._entries()] + [self._stats_path]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _read_counters(self) -> dict:
+        try:
+            with open(self._stats_path, encoding="utf-8") as f:
+                counters = json.load(f)
+        except (OSError, ValueError):
+            counters = {}
+        return {name: int(counters.get(name, 0)) for name in ("hits", "misses")}
+
+    def _count(self, name: str, n: int = 1) -> None:
+        """Add ``n`` to a persisted hit or miss counter.
+
+        Counters are best effort: concurrent runs may lose an increment.
+        """
+        counters = self._read_counters()
+        counters[name] += n
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._stats_path, "w", encoding="utf-8") as f:
+                json.dump(counters, f)
+        except OSError as e:
+            log.debug("Could not update cache statistics: %s", e)
+
+    def stats(self) -> dict:
+        """Return the cache statistics.
+
+        Returns:
+            dict: ``entries``, ``bytes``, ``max_bytes``, ``hits`` and
+                ``misses``.
+
+        """
+        entries = self._entries()
+        return {
+            "entries": len(entries),
+            "bytes": sum(e.stat().st_size for e in entries),
+            "max_bytes": self.max_bytes,
+            **self._read_counters(),
+        }
+
+
+class StepCache(BRepCache):
+    """Cache of transferred STEP shapes, keyed by the content of the file.
+
+    See :class:`BRepCache` for storage, eviction and statistics.
+    """
+
+    @staticmethod
+    def key(filename: str) -> str:
+        """Return the cache key of a STEP file.
+
+        Returns:
+            str: The hex digest of the file content and reader settings.
+
+        """
+        digest = hashlib.sha256(file_digest(filename).encode())
+        digest.update(READER_SETTINGS.encode())
+        return digest.hexdigest()
@@ -8,7 +8,7 @@ import logging
 
 from OCC.Display.SimpleGui import init_display
 
-log = logging.getLogger("__name__")
+log = logging.getLogger(__name__)
 
 
 def show_shape(shape) -> None:
@@ -44,5 +44,5 @@ def show_shapes(shapes) -> bool:
         start_display()
         return True
     except (RuntimeError, TypeError) as e:
-        log.error(f"[bold red]💥 Error visualizing the shapes:[/bold red] {e}")
+        log.error("[bold red]💥 Error visualizing the shapes:[/bold red] %s", e)
         return False
@@ -0,0 +1,121 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.operations.analytics."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from intersector.operations import analytics
+
+PLANE = ((0.0, 0.0, 5.0), (0.0, 0.0, 1.0))
+
+
+def _square(side, z=5.0):
+    """Return the four edges of a square centered on the Z axis.
+
+    Returns:
+        list[numpy.ndarray]: ``(2, 3)`` segments, counterclockwise.
+
+    """
+    h = side / 2
+    corners = np.array([(-h, -h, z), (h, -h, z), (h, h, z), (-h, h, z)], float)
+    return list(np.stack([corners, np.roll(corners, -1, axis=0)], axis=1))
+
+
+class TestPolylineSummary:
+    """Tests for the polyline_summary function."""
+
+    @staticmethod
+    def test_square_with_hole():
+        """Test length, net area, loops and bounds of a holed square."""
+        edges = _square(4.0) + [e[::-1] for e in _square(2.0)]
+        edges.append(np.array([(5, 0, 5), (6, 0, 5)], float))
+
+        summary = analytics.polyline_summary(*PLANE, edges)
+
+        assert summary["valid"]
+        assert summary["edges"] == len(edges)
+        assert summary["length"] == pytest.approx(16.0 + 8.0 + 1.0)
+        assert summary["area"] == pytest.approx(16.0 - 4.0)
+        assert (summary["loops"], summary["open_chains"]) == (2, 1)
+        extents = sorted(
+            [summary["umax"] - summary["umin"], summary["vmax"] - summary["vmin"]]
+        )
+        assert extents == pytest.approx([4.0, 8.0])
+
+    @staticmethod
+    def test_given_lengths_are_used():
+        """Test that exact edge lengths override the polyline lengths."""
+        summary = analytics.polyline_summary(*PLANE, _square(1.0), [1.5] * 4)
+
+        assert summary["length"] == pytest.approx(6.0)
+
+    @staticmethod
+    @pytest.mark.parametrize("polylines", [None, []])
+    def test_empty_section(polylines):
+        """Test the summary of a plane missing the shape."""
+        summary = analytics.polyline_summary(*PLANE, polylines)
+
+        assert not summary["valid"]
+        assert (summary["edges"], summary["area"], summary["umin"]) == (0, 0.0, None)
+        assert (summary["pz"], summary["nz"]) == (5.0, 1.0)
+
+
+class TestSectionSummary:
+    """Tests for the section_summary function."""
+
+    @staticmethod
+    def test_edges_are_measured_in_one_pass():
+        """Test that each edge is measured with GProp and sampled once."""
+        edges = _square(2.0)
+        explorer = MagicMock()
+        explorer.More.side_effect = [True] * len(edges) + [False]
+        props = MagicMock()
+        props.Mass.return_value = 2.0
+
+        with (
+            patch.object(analytics, "TopExp_Explorer", return_value=explorer),
+            patch.object(analytics, "topods"),
+            patch.object(analytics, "GProp_GProps", return_value=props),
+            patch.object(analytics, "brepgprop") as mock_gprop,
+            patch.object(analytics, "edge_points", side_effect=edges) as mock_sample,
+            patch.object(analytics, "loop_faces", return_value=["face"]) as faces,
+        ):
+            summary = analytics.section_summary(MagicMock(), *PLANE, deflection=0.1)
+
+        assert mock_gprop.LinearProperties.call_count == len(edges)
+        assert mock_sample.call_count == len(edges)
+        # The faces are built from the loops found in the same pass.
+        loops, polygons, nesting = faces.call_args.args[1:4]
+        assert sorted(i for i, _ in loops[0]) == [0, 1, 2, 3]
+        assert len(polygons) == 1
+        assert nesting == [(0, [])]
+        assert summary["length"] == pytest.approx(8.0)
+        # The area is that of the face built from the loop, not the polygon.
+        mock_gprop.SurfaceProperties.assert_called_once_with("face", props)
+        assert summary["area"] == pytest.approx(2.0)
+
+    @staticmethod
+    def test_missing_section_and_bad_deflection():
+        """Test a None result and a non-positive deflection."""
+        assert not analytics.section_summary(None, *PLANE)["valid"]
+        with pytest.raises(ValueError, match="Deflection must be positive"):
+            analytics.section_summary(None, *PLANE, deflection=0)
+
+
+class TestSummarizeSections:
+    """Tests for the summarize_sections function."""
+
+    @staticmethod
+    def test_batch_keeps_plane_order():
+        """Test that every plane gets a row, in order."""
+        sections = [
+            ((0, 0, 1.0), (0, 0, 1), _square(1.0, z=1.0)),
+            ((0, 0, 2.0), (0, 0, 1), []),
+        ]
+
+        rows = analytics.summarize_sections(sections, sampled=True)
+
+        assert [(r["pz"], r["valid"]) for r in rows] == [(1.0, True), (2.0, False)]
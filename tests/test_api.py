@@ -0,0 +1,212 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.api."""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from intersector import api, server
+
+
+@pytest.fixture(name="occ")
+def fixture_occ():
+    """Replace the OpenCascade calls of the session with mocks.
+
+    Yields:
+        dict: The patched ``read_step``, ``SectionSession`` and ``section_job``.
+
+    """
+    with (
+        patch.object(api, "read_step") as mock_read,
+        patch.object(api, "SectionSession") as mock_session,
+        patch.object(api, "section_job") as mock_job,
+        patch.object(api, "shape_to_bytes", return_value=b"brep"),
+        patch.object(api, "log", MagicMock()),
+    ):
+        mock_read.side_effect = lambda path, cache=None: MagicMock(name=path)
+        mock_session.return_value.section.side_effect = lambda p, n: ("edges", p)
+        mock_job.side_effect = lambda brep, planes, *_: [brep.encode()]
+        yield {"read": mock_read, "session": mock_session, "job": mock_job}
+
+
+def _session():
+    return api.Intersector(executor=ThreadPoolExecutor(1))
+
+
+class TestIntersector:
+    """Tests for the Intersector session."""
+
+    @staticmethod
+    def test_load_and_section(occ):
+        """Test that sections reuse one section session per shape."""
+
+        async def run():
+            async with _session() as session:
+                part = await session.load("models/part.stp")
+                first = await session.section(part, ["0,0,1:0,0,2"])
+                second = await session.section(part, [((0, 0, 2), (0, 0, 1))])
+                return session.shapes, first, second
+
+        shapes, first, second = asyncio.run(run())
+
+        assert shapes == ["part"]
+        assert first == [("edges", (0.0, 0.0, 1.0))]
+        assert second == [("edges", (0.0, 0.0, 2.0))]
+        occ["session"].assert_called_once()
+
+    @staticmethod
+    @pytest.mark.usefixtures("occ")
+    def test_section_does_not_block_the_loop():
+        """Test that the event loop keeps running during a section."""
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def run():
+            with patch.object(api, "SectionSession") as mock_session:
+                mock_session.return_value.section.side_effect = (
+                    lambda p, n: time.sleep(0.2)
+                )
+                async with _session() as session:
+                    part = await session.load("part.stp")
+                    ticker = asyncio.create_task(tick())
+                    await session.section(part, ["0,0,0:0,0,1"])
+                    ticker.cancel()
+
+        asyncio.run(run())
+
+        assert len(ticks) > 5  # noqa: PLR2004
+
+    @staticmethod
+    def test_errors_are_raised(occ):
+        """Test unreadable files, unknown ids and invalid options."""
+        occ["read"].side_effect = lambda path, cache=None: None
+
+        async def run():
+            async with _session() as session:
+                with pytest.raises(ValueError, match="Failed to read"):
+                    await session.load("broken.stp")
+                with pytest.raises(KeyError, match="nope"):
+                    await session.section("nope", ["0,0,0:0,0,1"])
+                occ["read"].side_effect = lambda path, cache=None: MagicMock()
+                part = await session.load("part.stp")
+                with pytest.raises(ValueError, match="non-empty list"):
+                    await session.section(part, [])
+                with pytest.raises(ValueError, match="Unknown format"):
+                    await session.export(part, ["0,0,0:0,0,1"], fmt="pdf")
+
+        asyncio.run(run())
+
+    @staticmethod
+    def test_export_runs_jobs_on_a_resident_brep(occ):
+        """Test that exports reuse one BRep file per shape."""
+
+        async def run():
+            async with _session() as session:
+                part = await session.load("part.stp")
+                first = await session.export(part, ["0,0,0:0,0,1"], fmt="svg")
+                second = await session.export(part, ["0,0,1:0,0,1"], fmt="svg")
+                return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first == second
+        brep_path = first[0].decode()
+        assert brep_path.endswith(".brep")
+        assert not os.path.exists(brep_path)
+        assert occ["job"].call_args.args[2:] == ("brep", "svg", 0.01, True)
+
+    @staticmethod
+    @pytest.mark.usefixtures("occ")
+    def test_workers_drop_unloaded_shapes():
+        """Test that an export evicts the worker copies of unloaded shapes."""
+        resident = []
+
+        async def run():
+            async with _session() as session:
+                await session.load("part.stp")
+                await session.export("part", ["0,0,0:0,0,1"])
+                resident.append(set(server._worker_shapes))
+                await session.load("part.stp")
+                await session.export("part", ["0,0,0:0,0,1"])
+                resident.append(set(server._worker_shapes))
+
+        with (
+            patch.object(api, "section_job", server.section_job),
+            patch.object(server, "shape_from_bytes"),
+            patch.object(server, "SectionSession"),
+            patch.object(server, "_write_output", return_value=b""),
+            patch.dict(server._worker_shapes, clear=True),
+            patch.dict(server._worker_sessions, clear=True),
+        ):
+            asyncio.run(run())
+
+        first, second = resident
+        assert len(first) == len(second) == 1
+        assert first != second
+
+    @staticmethod
+    def test_unload_waits_for_exports_in_flight(occ):
+        """Test that unloading keeps the BRep file until its export is done."""
+        started, finish = threading.Event(), threading.Event()
+        seen = []
+
+        def job(brep, *_):
+            started.set()
+            finish.wait(5)
+            seen.append(os.path.exists(brep))
+            return [brep.encode()]
+
+        occ["job"].side_effect = job
+
+        async def run():
+            async with _session() as session:
+                part = await session.load("part.stp")
+                export = asyncio.create_task(session.export(part, ["0,0,0:0,0,1"]))
+                await asyncio.to_thread(started.wait, 5)
+                await session.unload(part)
+                finish.set()
+                return await export, session.shapes
+
+        result, shapes = asyncio.run(run())
+
+        assert seen == [True]
+        assert shapes == []
+        assert not os.path.exists(result[0].decode())
+
+    @staticmethod
+    def test_close_releases_everything(occ):
+        """Test that closing drops the shapes and refuses further work."""
+        session = _session()
+
+        async def load():
+            part = await session.load("part.stp")
+            await session.export(part, ["0,0,0:0,0,1"])
+            await session.load("other.stp")
+            await session.unload("other")
+            return part
+
+        part = asyncio.run(load())
+        with session:
+            assert session.shapes == ["part"]
+
+        assert session.shapes == []
+        session.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            asyncio.run(session.section(part, ["0,0,0:0,0,1"]))
+        assert occ["job"].call_count == 1
+
+    @staticmethod
+    def test_negative_cache_size_raises():
+        """Test that a negative number of cached sections is rejected."""
+        with pytest.raises(ValueError, match="negative"):
+            api.Intersector(max_cached=-1)
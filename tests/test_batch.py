@@ -0,0 +1,94 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.operations.batch."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from intersector.operations import batch
+from intersector.utils.scheduler import MemoryScheduler
+
+PLANES = [((0, 0, 0), (0, 0, 1)), ((0, 0, 5), (0, 0, 1))]
+
+
+class TestSectionFile:
+    """Tests for the section_file function."""
+
+    @staticmethod
+    @patch("intersector.operations.batch.export_step", return_value=True)
+    @patch("intersector.operations.batch.combine_shapes")
+    @patch("intersector.operations.batch.is_intersection_valid")
+    @patch("intersector.operations.batch.intersect_with_plane")
+    @patch("intersector.operations.batch.FaceIndex")
+    @patch("intersector.operations.batch.read_step")
+    def test_writes_non_empty_sections(  # noqa: PLR0913, PLR0917
+        mock_read, mock_index, mock_intersect, mock_valid, mock_combine, mock_export
+    ):
+        """Test that the valid sections are combined into one STEP file."""
+        mock_intersect.side_effect = ["hit", "miss"]
+        mock_valid.side_effect = lambda result: result == "hit"
+
+        count = batch.section_file("part.stp", PLANES, "out.stp")
+
+        assert count == 1
+        mock_index.assert_called_once_with(mock_read.return_value)
+        assert list(mock_combine.call_args.args[0]) == ["hit"]
+        mock_export.assert_called_once_with(mock_combine.return_value, "out.stp")
+
+    @staticmethod
+    @patch("intersector.operations.batch.export_step")
+    @patch("intersector.operations.batch.is_intersection_valid", return_value=False)
+    @patch("intersector.operations.batch.intersect_with_plane")
+    @patch("intersector.operations.batch.read_step")
+    def test_no_intersection_writes_nothing(
+        _mock_read, _mock_intersect, _mock_valid, mock_export
+    ):
+        """Test that nothing is written when no plane crosses the shape."""
+        assert batch.section_file("part.stp", PLANES[:1], "out.stp") == 0
+        mock_export.assert_not_called()
+
+    @staticmethod
+    @patch("intersector.operations.batch.read_step", return_value=None)
+    def test_unreadable_step_raises(_mock_read):
+        """Test that a STEP file that cannot be read is reported."""
+        with pytest.raises(ValueError, match="Failed to read STEP file"):
+            batch.section_file("part.stp", PLANES, "out.stp")
+
+
+class TestSectionFiles:
+    """Tests for the section_files function."""
+
+    @staticmethod
+    def test_batch_outputs_are_unique():
+        """Test that inputs sharing a stem get numbered outputs."""
+        outputs = batch.batch_outputs(["a/part.stp", "b/part.step"], "out", "json")
+
+        assert outputs == [
+            os.path.join("out", "part.json"),
+            os.path.join("out", "part_2.json"),
+        ]
+
+    @staticmethod
+    @patch("intersector.operations.batch.step_footprint", side_effect=[10, 20])
+    @patch("intersector.operations.batch.section_file", side_effect=[2, 0])
+    def test_jobs_run_through_scheduler(mock_section, mock_footprint):
+        """Test that every file is one job, with its estimated footprint."""
+        with ThreadPoolExecutor(2) as pool:
+            scheduler = MemoryScheduler(executor=pool)
+            scheduler.map = MagicMock(wraps=scheduler.map)
+            results = list(
+                batch.section_files(
+                    ["a.stp", "b.stp"], PLANES, "out", scheduler=scheduler
+                )
+            )
+
+        assert results == [
+            ("a.stp", os.path.join("out", "a.stp"), 2),
+            ("b.stp", os.path.join("out", "b.stp"), 0),
+        ]
+        assert scheduler.map.call_args.args[2] == [10, 20]
+        assert mock_section.call_count == 2  # noqa: PLR2004
+        assert mock_footprint.call_count == 2  # noqa: PLR2004
@@ -0,0 +1,95 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for the benchmark helpers in benchmarks.run."""
+
+import pytest
+
+from benchmarks import logging_overhead, run
+
+
+class TestScalingExponent:
+    """Tests for the scaling_exponent function."""
+
+    @staticmethod
+    @pytest.mark.parametrize("k", [0.0, 1.0, 2.0])
+    def test_power_law_exponent_is_recovered(k):
+        """Test that the fitted exponent of an exact power law is exact."""
+        faces = [6, 24, 96, 384]
+        seconds = [1e-3 * f**k for f in faces]
+
+        assert run.scaling_exponent(faces, seconds) == pytest.approx(k)
+
+    @staticmethod
+    def test_single_size_has_no_exponent():
+        """Test that one model size is not enough to fit a curve."""
+        assert run.scaling_exponent([6, 6], [0.1, 0.2]) is None
+
+
+class TestCompare:
+    """Tests for the compare function."""
+
+    @staticmethod
+    def test_slowdowns_above_threshold_are_flagged():
+        """Test that only matching results are compared and flagged."""
+
+        def record(operation, median, size=1):
+            return {
+                "model": "boxes",
+                "size": size,
+                "operation": operation,
+                "median_s": median,
+            }
+
+        baseline = [record("read_step", 1.0), record("export_step", 1.0)]
+        results = [
+            record("read_step", 1.1),
+            record("export_step", 2.0),
+            record("read_step", 5.0, size=4),
+        ]
+
+        rows = run.compare(results, baseline, threshold=1.25)
+
+        assert [(r["operation"], r["regressed"]) for r in rows] == [
+            ("read_step", False),
+            ("export_step", True),
+        ]
+
+
+class TestSpeedup:
+    """Tests for the speedup function."""
+
+    @staticmethod
+    def test_parallel_results_are_matched_with_serial_ones():
+        """Test that only results measured under both policies are reported."""
+
+        def record(operation, policy, median):
+            return {
+                "model": "boxes",
+                "size": 1,
+                "operation": operation,
+                "policy": policy,
+                "median_s": median,
+            }
+
+        results = [
+            record("read_step", "serial", 2.0),
+            record("read_step", "parallel", 1.0),
+            record("mesh_from_shape", "parallel", 1.0),
+        ]
+
+        rows = run.speedup(results)
+
+        assert [(r["operation"], r["speedup"]) for r in rows] == [("read_step", 2.0)]
+
+
+class TestLogOverhead:
+    """Tests for the log_overhead function."""
+
+    @staticmethod
+    @pytest.mark.parametrize("setup", list(logging_overhead.SETUPS))
+    def test_every_setup_is_timed(setup):
+        """Test that each logging setup reports its cost per call."""
+        row = logging_overhead.log_overhead(setup, 10)
+
+        assert row["setup"] == setup
+        assert 0 < row["loop_us"] <= row["total_us"]
@@ -2,12 +2,17 @@
 # Licensed under the MIT License. See LICENSE file for details.
 """Unit tests for the CLI intersect command."""
 
+import json
+import os
+import subprocess
+import sys
 from unittest import TestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
+import numpy as np
 from click.testing import CliRunner
 
-from intersector.cli import intersect
+from intersector.cli import intersect, intersector, slice_command
 
 
 class TestCLIIntersect(TestCase):
@@ -20,12 +25,16 @@ class TestCLIIntersect(TestCase):
     def test_intersect_successful(self):
         """Test a successful intersection between shape and plane."""
         with (
-            patch("intersector.cli.read_step") as mock_read_step,
+            patch("intersector.utils.file_handler.read_step") as mock_read_step,
             patch("intersector.cli.parse_plane_input") as mock_parse_plane_input,
-            patch("intersector.cli.intersect_with_plane") as mock_intersect_with_plane,
-            patch("intersector.cli.is_intersection_valid") as mock_is_valid,
-            patch("intersector.cli.export_step") as mock_export_step,
-            patch("intersector.cli.show_shapes") as mock_show_shapes,
+            patch(
+                "intersector.operations.intersect.intersect_with_plane"
+            ) as mock_intersect_with_plane,
+            patch(
+                "intersector.operations.intersect.is_intersection_valid"
+            ) as mock_is_valid,
+            patch("intersector.utils.file_handler.export_step") as mock_export_step,
+            patch("intersector.utils.visualization.show_shapes") as mock_show_shapes,
         ):
             mock_shape = MagicMock(name="TopoDS_Shape")
             mock_read_step.return_value = mock_shape
@@ -48,7 +57,7 @@ class TestCLIIntersect(TestCase):
 
     def test_intersect_file_not_found(self):
         """Test CLI behavior when STEP file cannot be read."""
-        with patch("intersector.cli.read_step", return_value=None):
+        with patch("intersector.utils.file_handler.read_step", return_value=None):
             with self.runner.isolated_filesystem():
                 with open("missing_file.stp", "w", encoding="utf-8") as f:
                     f.write("FAKE")
@@ -64,7 +73,7 @@ class TestCLIIntersect(TestCase):
     def test_invalid_plane_definition(self):
         """Test CLI handling of invalid plane input."""
         with (
-            patch("intersector.cli.read_step") as mock_read_step,
+            patch("intersector.utils.file_handler.read_step") as mock_read_step,
             patch("intersector.cli.parse_plane_input") as mock_parse_plane_input,
         ):
             mock_read_step.return_value = MagicMock(name="TopoDS_Shape")
@@ -85,9 +94,11 @@ class TestCLIIntersect(TestCase):
     def test_intersect_value_error(self):
         """Test CLI when intersection raises a ValueError."""
         with (
-            patch("intersector.cli.read_step") as mock_read,
+            patch("intersector.utils.file_handler.read_step") as mock_read,
             patch("intersector.cli.parse_plane_input") as mock_parse,
-            patch("intersector.cli.intersect_with_plane") as mock_intersect,
+            patch(
+                "intersector.operations.intersect.intersect_with_plane"
+            ) as mock_intersect,
         ):
 
             error_message = "Bad geometry"
@@ -111,9 +122,11 @@ class TestCLIIntersect(TestCase):
     def test_intersection_failure(self):
         """Test CLI when intersection operation fails (raises RuntimeError)."""
         with (
-            patch("intersector.cli.read_step") as mock_read_step,
+            patch("intersector.utils.file_handler.read_step") as mock_read_step,
             patch("intersector.cli.parse_plane_input") as mock_parse_plane_input,
-            patch("intersector.cli.intersect_with_plane") as mock_intersect_with_plane,
+            patch(
+                "intersector.operations.intersect.intersect_with_plane"
+            ) as mock_intersect_with_plane,
         ):
             error_message = "Intersection operation failed"
             mock_shape = MagicMock(name="TopoDS_Shape")
@@ -136,10 +149,14 @@ class TestCLIIntersect(TestCase):
     def test_intersect_invalid_result(self):
         """Test CLI when intersection result is invalid."""
         with (
-            patch("intersector.cli.read_step") as mock_read,
+            patch("intersector.utils.file_handler.read_step") as mock_read,
             patch("intersector.cli.parse_plane_input") as mock_parse,
-            patch("intersector.cli.intersect_with_plane") as mock_intersect,
-            patch("intersector.cli.is_intersection_valid") as mock_valid,
+            patch(
+                "intersector.operations.intersect.intersect_with_plane"
+            ) as mock_intersect,
+            patch(
+                "intersector.operations.intersect.is_intersection_valid"
+            ) as mock_valid,
         ):
 
             mock_shape = MagicMock(name="TopoDS_Shape")
@@ -162,11 +179,15 @@ class TestCLIIntersect(TestCase):
     def test_intersect_export_step_failure(self):
         """Test CLI when STEP export fails."""
         with (
-            patch("intersector.cli.read_step") as mock_read,
+            patch("intersector.utils.file_handler.read_step") as mock_read,
             patch("intersector.cli.parse_plane_input") as mock_parse,
-            patch("intersector.cli.intersect_with_plane") as mock_intersect,
-            patch("intersector.cli.is_intersection_valid") as mock_valid,
-            patch("intersector.cli.export_step") as mock_export,
+            patch(
+                "intersector.operations.intersect.intersect_with_plane"
+            ) as mock_intersect,
+            patch(
+                "intersector.operations.intersect.is_intersection_valid"
+            ) as mock_valid,
+            patch("intersector.utils.file_handler.export_step") as mock_export,
         ):
 
             mock_shape = MagicMock(name="TopoDS_Shape")
@@ -191,12 +212,16 @@ class TestCLIIntersect(TestCase):
     def test_intersect_show_shapes_failure(self):
         """Test CLI when visualization fails."""
         with (
-            patch("intersector.cli.read_step") as mock_read,
+            patch("intersector.utils.file_handler.read_step") as mock_read,
             patch("intersector.cli.parse_plane_input") as mock_parse,
-            patch("intersector.cli.intersect_with_plane") as mock_intersect,
-            patch("intersector.cli.is_intersection_valid") as mock_valid,
-            patch("intersector.cli.export_step") as mock_export,
-            patch("intersector.cli.show_shapes") as mock_show,
+            patch(
+                "intersector.operations.intersect.intersect_with_plane"
+            ) as mock_intersect,
+            patch(
+                "intersector.operations.intersect.is_intersection_valid"
+            ) as mock_valid,
+            patch("intersector.utils.file_handler.export_step") as mock_export,
+            patch("intersector.utils.visualization.show_shapes") as mock_show,
         ):
 
             mock_shape = MagicMock(name="TopoDS_Shape")
@@ -218,3 +243,1100 @@ class TestCLIIntersect(TestCase):
 
             assert result.exit_code != 0
             assert "Error displaying shapes" in result.output
+
+    def test_intersect_multiple_planes_loads_step_once(self):
+        """Test that repeated --in-plane options share one STEP load."""
+        with (
+            patch("intersector.utils.file_handler.read_step") as mock_read,
+            patch("intersector.operations.face_index.FaceIndex") as mock_index,
+            patch(
+                "intersector.operations.intersect.intersect_with_plane"
+            ) as mock_intersect,
+            patch(
+                "intersector.operations.intersect.is_intersection_valid",
+                return_value=True,
+            ),
+            patch(
+                "intersector.utils.file_handler.export_step", return_value=True
+            ) as mock_export,
+            patch("intersector.utils.visualization.show_shapes", return_value=True),
+        ):
+            mock_read.return_value = MagicMock(name="TopoDS_Shape")
+
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersect,
+                    [
+                        "--in-step",
+                        "dummy_shape.stp",
+                        "--in-plane",
+                        "0,0,0:0,0,1",
+                        "--in-plane",
+                        "0,0,10:0,0,1",
+                    ],
+                )
+
+            assert result.exit_code == 0, result.output
+            mock_read.assert_called_once()
+            exported = [c.args[1] for c in mock_export.call_args_list]
+            assert exported == ["intersection_001.stp", "intersection_002.stp"]
+            assert mock_intersect.call_count == len(exported)
+            mock_index.assert_called_once_with(mock_read.return_value)
+            for call in mock_intersect.call_args_list:
+                assert call.kwargs["index"] is mock_index.return_value
+
+    def test_intersect_planes_file_combined(self):
+        """Test planes read from a file and exported into one combined file."""
+        with (
+            patch("intersector.utils.file_handler.read_step") as mock_read,
+            patch("intersector.operations.face_index.FaceIndex"),
+            patch(
+                "intersector.operations.intersect.intersect_with_plane"
+            ) as mock_intersect,
+            patch(
+                "intersector.operations.intersect.is_intersection_valid",
+                return_value=True,
+            ),
+            patch("intersector.operations.intersect.combine_shapes") as mock_combine,
+            patch(
+                "intersector.utils.file_handler.export_step", return_value=True
+            ) as mock_export,
+            patch("intersector.utils.visualization.show_shapes", return_value=True),
+        ):
+            mock_read.return_value = MagicMock(name="TopoDS_Shape")
+
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+                with open("planes.txt", "w", encoding="utf-8") as f:
+                    f.write("# stations\n0,0,0:0,0,1\n\n0,0,5:0,0,1\n")
+
+                result = self.runner.invoke(
+                    intersect,
+                    [
+                        "--in-step",
+                        "dummy_shape.stp",
+                        "--planes-file",
+                        "planes.txt",
+                        "--combine",
+                    ],
+                )
+
+            assert result.exit_code == 0, result.output
+            assert mock_intersect.call_count == len(mock_combine.call_args.args[0])
+            mock_export.assert_called_once_with(
+                mock_combine.return_value, "intersection.stp"
+            )
+
+    def test_intersect_requires_a_plane(self):
+        """Test CLI error when neither --in-plane nor --planes-file is given."""
+        with patch("intersector.utils.file_handler.read_step") as mock_read:
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(intersect, ["--in-step", "dummy_shape.stp"])
+
+            assert result.exit_code != 0
+            assert "At least one plane is required" in result.output
+            mock_read.assert_not_called()
+
+    def test_intersect_with_workers_uses_parallel_executor(self):
+        """Test that --workers routes the planes through the process pool."""
+        with (
+            patch("intersector.utils.file_handler.read_step") as mock_read,
+            patch(
+                "intersector.operations.intersect.intersect_with_plane"
+            ) as mock_intersect,
+            patch(
+                "intersector.operations.parallel.intersect_with_planes_parallel"
+            ) as mock_parallel,
+            patch(
+                "intersector.operations.intersect.is_intersection_valid",
+                return_value=True,
+            ),
+            patch("intersector.utils.file_handler.export_step", return_value=True),
+            patch("intersector.utils.visualization.show_shapes", return_value=True),
+        ):
+            mock_read.return_value = MagicMock(name="TopoDS_Shape")
+            mock_parallel.return_value = iter([MagicMock(), MagicMock()])
+
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersect,
+                    [
+                        "--in-step",
+                        "dummy_shape.stp",
+                        "--in-plane",
+                        "0,0,0:0,0,1",
+                        "--in-plane",
+                        "0,0,10:0,0,1",
+                        "--workers",
+                        "4",
+                    ],
+                )
+
+            assert result.exit_code == 0, result.output
+            mock_intersect.assert_not_called()
+            mock_parallel.assert_called_once()
+            assert mock_parallel.call_args.args[2] == 4  # noqa: PLR2004
+
+    def test_intersect_single_plane_with_workers_splits_solids(self):
+        """Test that --workers with one plane parallelizes over solids."""
+        with (
+            patch("intersector.utils.file_handler.read_step") as mock_read,
+            patch(
+                "intersector.operations.parallel.intersect_with_plane_parallel"
+            ) as mock_parallel,
+            patch(
+                "intersector.operations.intersect.is_intersection_valid",
+                return_value=True,
+            ),
+            patch("intersector.utils.file_handler.export_step", return_value=True),
+        ):
+            mock_read.return_value = MagicMock(name="TopoDS_Shape")
+
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersect,
+                    [
+                        "--in-step",
+                        "dummy_shape.stp",
+                        "--in-plane",
+                        "0,0,0:0,0,1",
+                        "--workers",
+                        "0",
+                        "--no-show",
+                    ],
+                )
+
+            assert result.exit_code == 0, result.output
+            mock_parallel.assert_called_once_with(
+                mock_read.return_value,
+                (0.0, 0.0, 0.0),
+                (0.0, 0.0, 1.0),
+                None,
+                scheduler=ANY,
+            )
+
+    def test_intersect_polyline_output_skips_viewer(self):
+        """Test that --output with a polyline format writes points only."""
+        with (
+            patch("intersector.utils.file_handler.read_step") as mock_read,
+            patch("intersector.operations.intersect.intersect_with_plane"),
+            patch(
+                "intersector.operations.intersect.is_intersection_valid",
+                return_value=True,
+            ),
+            patch("intersector.operations.discretize.section_polylines") as mock_sample,
+            patch(
+                "intersector.utils.polylines.export_polylines", return_value=True
+            ) as mock_export,
+            patch("intersector.utils.visualization.show_shapes") as mock_show,
+        ):
+            mock_read.return_value = MagicMock(name="TopoDS_Shape")
+
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersect,
+                    [
+                        "--in-step",
+                        "dummy_shape.stp",
+                        "--in-plane",
+                        "0,0,1:0,0,1",
+                        "--output",
+                        "section.npz",
+                        "--deflection",
+                        "0.5",
+                    ],
+                )
+
+            assert result.exit_code == 0, result.output
+            assert mock_sample.call_args.args[1] == 0.5  # noqa: PLR2004
+            mock_export.assert_called_once_with(
+                [((0.0, 0.0, 1.0), (0.0, 0.0, 1.0), mock_sample.return_value)],
+                "section.npz",
+                "npz",
+            )
+            mock_show.assert_not_called()
+
+    def test_intersect_summary_only(self):
+        """Test that --summary alone writes one row per plane and no sections."""
+        with (
+            patch("intersector.utils.file_handler.read_step") as mock_read,
+            patch("intersector.operations.face_index.FaceIndex"),
+            patch("intersector.operations.intersect.intersect_with_plane"),
+            patch(
+                "intersector.operations.intersect.is_intersection_valid",
+                side_effect=[True, False],
+            ),
+            patch(
+                "intersector.operations.analytics.section_summary",
+                side_effect=[{"valid": True}, {"valid": False}],
+            ) as mock_summary,
+            patch(
+                "intersector.utils.report.export_summary", return_value=True
+            ) as mock_report,
+            patch("intersector.utils.file_handler.export_step") as mock_export,
+            patch("intersector.utils.visualization.show_shapes") as mock_show,
+        ):
+            mock_read.return_value = MagicMock(name="TopoDS_Shape")
+
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersect,
+                    ["--in-step", "dummy_shape.stp", "--summary", "qa.csv"]
+                    + ["--in-plane", "0,0,1:0,0,1", "--in-plane", "0,0,9:0,0,1"],
+                )
+
+            assert result.exit_code == 0, result.output
+            assert mock_summary.call_count == 2  # noqa: PLR2004
+            mock_report.assert_called_once_with(
+                [{"valid": True}, {"valid": False}], "qa.csv"
+            )
+            mock_export.assert_not_called()
+            mock_show.assert_not_called()
+
+    def test_intersect_summary_needs_json_or_csv(self):
+        """Test that an unknown summary extension is rejected up front."""
+        with patch("intersector.utils.file_handler.read_step") as mock_read:
+            result = self.runner.invoke(
+                intersect,
+                ["--in-step", __file__, "--in-plane", "0,0,1:0,0,1"]
+                + ["--summary", "qa.txt"],
+            )
+
+            assert result.exit_code != 0
+            assert "use a .json or .csv file" in result.output
+            mock_read.assert_not_called()
+
+    def test_intersect_stream_skips_full_load(self):
+        """Test that --stream sections root by root without read_step."""
+        with (
+            patch("intersector.utils.file_handler.read_step") as mock_read,
+            patch(
+                "intersector.operations.streaming.section_step_streaming"
+            ) as mock_stream,
+            patch(
+                "intersector.utils.polylines.export_polylines", return_value=True
+            ) as mock_export,
+            patch("intersector.utils.visualization.show_shapes") as mock_show,
+        ):
+            polylines = [np.zeros((2, 3))]
+            mock_stream.return_value = [polylines, []]
+
+            with self.runner.isolated_filesystem():
+                with open("plant.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersect,
+                    [
+                        "--in-step",
+                        "plant.stp",
+                        "--in-plane",
+                        "0,0,1:0,0,1",
+                        "--in-plane",
+                        "0,0,9:0,0,1",
+                        "--output",
+                        "section.json",
+                        "--combine",
+                        "--stream",
+                    ],
+                )
+
+            assert result.exit_code == 0, result.output
+            mock_read.assert_not_called()
+            assert mock_stream.call_args.kwargs == {"polylines": True}
+            mock_export.assert_called_once_with(
+                [((0.0, 0.0, 1.0), (0.0, 0.0, 1.0), polylines)],
+                "section.json",
+                "json",
+            )
+            mock_show.assert_not_called()
+
+    def test_intersect_stream_rejects_show(self):
+        """Test that the viewer cannot be requested while streaming."""
+        with self.runner.isolated_filesystem():
+            with open("plant.stp", "w", encoding="utf-8") as f:
+                f.write("FAKE")
+
+            result = self.runner.invoke(
+                intersect,
+                [
+                    "--in-step",
+                    "plant.stp",
+                    "--in-plane",
+                    "0,0,1:0,0,1",
+                    "--stream",
+                    "--show",
+                ],
+            )
+
+        assert result.exit_code != 0
+        assert "--stream" in result.output
+
+    def test_intersect_unknown_output_format(self):
+        """Test that an output extension without --format is rejected."""
+        with patch("intersector.utils.file_handler.read_step") as mock_read:
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersect,
+                    [
+                        "--in-step",
+                        "dummy_shape.stp",
+                        "--in-plane",
+                        "0,0,1:0,0,1",
+                        "--output",
+                        "section.txt",
+                    ],
+                )
+
+            assert result.exit_code != 0
+            assert "use --format" in result.output
+            mock_read.assert_not_called()
+
+
+class TestCLIPlanesFile(TestCase):
+    """Test suite for bulk plane files given to `intersect`."""
+
+    def setUp(self):
+        """Set up the Click test runner."""
+        self.runner = CliRunner()
+
+    def test_intersect_planes_npy_normalized(self):
+        """Test planes read from an NPY array, with normalized normals."""
+        with (
+            patch("intersector.utils.file_handler.read_step") as mock_read,
+            patch("intersector.operations.face_index.FaceIndex"),
+            patch(
+                "intersector.operations.intersect.intersect_with_plane"
+            ) as mock_intersect,
+            patch(
+                "intersector.operations.intersect.is_intersection_valid",
+                return_value=False,
+            ),
+        ):
+            mock_read.return_value = MagicMock(name="TopoDS_Shape")
+
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+                np.save("planes.npy", np.array([[(0, 0, 1), (0, 0, 4)]] * 3, float))
+
+                result = self.runner.invoke(
+                    intersect,
+                    ["--in-step", "dummy_shape.stp", "--planes-file", "planes.npy"]
+                    + ["--in-plane", "0,0,0:2,0,0", "--no-show"],
+                )
+
+            assert result.exit_code == 0, result.output
+            expected = [((0.0, 0.0, 0.0), (1.0, 0.0, 0.0))]
+            expected += [((0.0, 0.0, 1.0), (0.0, 0.0, 1.0))] * 3
+            assert [c.args[1:] for c in mock_intersect.call_args_list] == expected
+
+    def test_intersect_planes_csv_zero_normal(self):
+        """Test that a zero normal in a CSV planes file is rejected."""
+        with patch("intersector.utils.file_handler.read_step") as mock_read:
+            with self.runner.isolated_filesystem():
+                with open("planes.csv", "w", encoding="utf-8") as f:
+                    f.write("px,py,pz,nx,ny,nz\n0,0,0,0,0,1\n0,0,1,0,0,0\n")
+
+                result = self.runner.invoke(
+                    intersect,
+                    ["--in-step", __file__, "--planes-file", "planes.csv"],
+                )
+
+            assert result.exit_code != 0
+            assert "zero normal (first at index 1)" in result.output
+            mock_read.assert_not_called()
+
+    def test_intersect_batch_planes(self):
+        """Test that --batch-planes sections the planes with multi-tool booleans."""
+        with (
+            patch("intersector.utils.file_handler.read_step") as mock_read,
+            patch("intersector.operations.face_index.FaceIndex") as mock_index,
+            patch("intersector.operations.intersect.intersect_with_plane") as single,
+            patch(
+                "intersector.operations.intersect.intersect_with_planes",
+                side_effect=lambda shape, planes, index, size: [None] * len(planes),
+            ) as batched,
+        ):
+            mock_read.return_value = MagicMock(name="TopoDS_Shape")
+
+            result = self.runner.invoke(
+                intersect,
+                ["--in-step", __file__, "--in-plane", "0,0,0:0,0,1"]
+                + ["--in-plane", "0,0,1:0,0,1", "--batch-planes", "16"],
+            )
+
+            assert result.exit_code == 0, result.output
+            single.assert_not_called()
+            assert batched.call_args.args[2:] == (mock_index.return_value, 16)
+
+    def test_intersect_batch_planes_rejects_other_sources(self):
+        """Test that --batch-planes is refused where it would be ignored."""
+        for extra in (
+            ["--workers", "2"],
+            ["--stream"],
+            ["--timeout", "1"],
+            ["--engine", "mesh", "--format", "json"],
+        ):
+            with (
+                self.subTest(extra=extra),
+                patch("intersector.utils.file_handler.read_step") as mock_read,
+            ):
+                result = self.runner.invoke(
+                    intersect,
+                    ["--in-step", __file__, "--in-plane", "0,0,0:0,0,1"]
+                    + ["--batch-planes", "4", *extra],
+                )
+
+                assert result.exit_code != 0
+                assert "--batch-planes cannot be used" in result.output
+                mock_read.assert_not_called()
+
+
+class TestCLISlice(TestCase):
+    """Test suite for the `slice` CLI command."""
+
+    def setUp(self):
+        """Set up the Click test runner."""
+        self.runner = CliRunner()
+
+    def _invoke(self, args):
+        with self.runner.isolated_filesystem():
+            with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                f.write("FAKE")
+
+            return self.runner.invoke(
+                slice_command, ["--in-step", "dummy_shape.stp", *args]
+            )
+
+    def test_slice_along_axis_exports_layers(self):
+        """Test slicing along an axis exports every non-empty layer."""
+        with (
+            patch("intersector.utils.file_handler.read_step") as mock_read,
+            patch("intersector.operations.slicing.slice_shape") as mock_slice,
+            patch(
+                "intersector.operations.intersect.is_intersection_valid",
+                side_effect=[True, False],
+            ),
+            patch(
+                "intersector.utils.file_handler.export_step", return_value=True
+            ) as mock_export,
+            patch("intersector.utils.visualization.show_shapes", return_value=True),
+        ):
+            mock_read.return_value = MagicMock(name="TopoDS_Shape")
+            layer = MagicMock(name="layer")
+            mock_slice.return_value = iter(
+                [((0, 0, 0.1), (0, 0, 1), layer), ((0, 0, 0.3), (0, 0, 1), None)]
+            )
+
+            result = self._invoke(["--axis", "z", "--step", "0.2"])
+
+            assert result.exit_code == 0, result.output
+            assert mock_slice.call_args.args[1:] == ((0.0, 0.0, 1.0), 0.2)
+            mock_export.assert_called_once_with(layer, "slice.stp")
+
+    def test_slice_requires_one_direction(self):
+        """Test that --axis and --direction are mutually exclusive."""
+        with patch("intersector.utils.file_handler.read_step") as mock_read:
+            result = self._invoke(
+                ["--axis", "z", "--direction", "0,0,1", "--step", "1"]
+            )
+
+            assert result.exit_code != 0
+            assert "exactly one of --axis or --direction" in result.output
+            mock_read.assert_not_called()
+
+    def test_slice_invalid_direction(self):
+        """Test that a malformed --direction is reported."""
+        with patch("intersector.utils.file_handler.read_step"):
+            result = self._invoke(["--direction", "0,1", "--step", "1"])
+
+            assert result.exit_code != 0
+            assert "Invalid slicing direction" in result.output
+
+    def test_slice_mesh_engine_writes_segments(self):
+        """Test that --engine mesh slices a tessellation of the shape."""
+        with (
+            patch("intersector.utils.file_handler.read_step") as mock_read,
+            patch(
+                "intersector.operations.mesh_slicing.TriangleMesh.from_shape"
+            ) as mock_mesh,
+            patch("intersector.operations.mesh_slicing.slice_mesh") as mock_slice,
+            patch("intersector.operations.slicing.slice_shape") as mock_brep,
+            patch(
+                "intersector.utils.polylines.export_polylines", return_value=True
+            ) as mock_export,
+        ):
+            mock_read.return_value = MagicMock(name="TopoDS_Shape")
+            segments = np.zeros((2, 2, 3))
+            mock_slice.return_value = iter(
+                [((0, 0, 0.1), (0, 0, 1), segments), ((0, 0, 0.3), (0, 0, 1), [])]
+            )
+
+            result = self._invoke(
+                [
+                    "--axis",
+                    "z",
+                    "--step",
+                    "0.2",
+                    "--engine",
+                    "mesh",
+                    "--deflection",
+                    "0.1",
+                    "--output",
+                    "layers.json",
+                ]
+            )
+
+            assert result.exit_code == 0, result.output
+            mock_mesh.assert_called_once_with(mock_read.return_value, 0.1)
+            mock_brep.assert_not_called()
+            sections = mock_export.call_args.args[0]
+            assert [len(lines) for _, _, lines in sections] == [2]
+
+    def test_slice_mesh_segments_assembled_into_faces(self):
+        """Test that --faces chains mesh segments into oriented loops."""
+        square = np.array([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)], dtype=float)
+        segments = np.stack([square, np.roll(square, -1, axis=0)], axis=1)
+        with (
+            patch("intersector.utils.file_handler.read_step"),
+            patch("intersector.operations.mesh_slicing.TriangleMesh.from_shape"),
+            patch("intersector.operations.mesh_slicing.slice_mesh") as mock_slice,
+            patch(
+                "intersector.utils.polylines.export_polylines", return_value=True
+            ) as mock_export,
+        ):
+            mock_slice.return_value = iter([((0, 0, 0), (0, 0, 1), segments[::-1])])
+
+            result = self._invoke(
+                ["--axis", "z", "--step", "1", "--engine", "mesh", "--faces"]
+                + ["--output", "layers.json"]
+            )
+
+            assert result.exit_code == 0, result.output
+            ((_, _, loops),) = mock_export.call_args.args[0]
+            assert len(loops) == 1
+            assert loops[0].shape == (5, 3)
+
+    def test_wires_and_faces_are_exclusive(self):
+        """Test that --wires and --faces cannot be combined."""
+        with patch("intersector.utils.file_handler.read_step") as mock_read:
+            result = self._invoke(["--axis", "z", "--step", "1", "--wires", "--faces"])
+
+            assert result.exit_code != 0
+            assert "at most one of --wires or --faces" in result.output
+            mock_read.assert_not_called()
+
+    def test_mesh_engine_rejects_step_output(self):
+        """Test that the mesh engine cannot write STEP files."""
+        with patch("intersector.utils.file_handler.read_step") as mock_read:
+            result = self._invoke(["--axis", "z", "--step", "1", "--engine", "mesh"])
+
+            assert result.exit_code != 0
+            assert "only writes polyline formats" in result.output
+            mock_read.assert_not_called()
+
+
+class TestCLICache(TestCase):
+    """Test suite for the STEP cache options and the `cache` command."""
+
+    def setUp(self):
+        """Set up the Click test runner."""
+        self.runner = CliRunner()
+
+    def test_commands_read_through_the_cache(self):
+        """Test that the group's cache is handed to read_step."""
+        with (
+            patch("intersector.cli.setup_logging"),
+            patch("intersector.utils.step_cache.StepCache") as mock_cache_class,
+            patch(
+                "intersector.utils.file_handler.read_step", return_value=None
+            ) as mock_read,
+        ):
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersector,
+                    [
+                        "--cache-dir",
+                        "cache",
+                        "--cache-size",
+                        "2",
+                        "intersect",
+                        "--in-step",
+                        "dummy_shape.stp",
+                        "--in-plane",
+                        "0,0,0:0,0,1",
+                    ],
+                )
+
+            assert result.exit_code != 0
+            mock_cache_class.assert_called_once_with("cache", 2 * 1024 * 1024)
+            assert mock_read.call_args.kwargs["cache"] is mock_cache_class.return_value
+
+    def test_no_cache_bypasses_the_cache(self):
+        """Test that --no-cache reads the STEP file directly."""
+        with (
+            patch("intersector.cli.setup_logging"),
+            patch("intersector.utils.step_cache.StepCache"),
+            patch(
+                "intersector.utils.file_handler.read_step", return_value=None
+            ) as mock_read,
+        ):
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                self.runner.invoke(
+                    intersector,
+                    [
+                        "--no-cache",
+                        "intersect",
+                        "--in-step",
+                        "dummy_shape.stp",
+                        "--in-plane",
+                        "0,0,0:0,0,1",
+                    ],
+                )
+
+            assert mock_read.call_args.kwargs["cache"] is None
+
+    def test_cache_statistics(self):
+        """Test that the cache command reports hits and misses."""
+        with (
+            patch("intersector.cli.setup_logging"),
+            patch("intersector.utils.step_cache.StepCache") as mock_cache_class,
+        ):
+            mock_cache_class.return_value.stats.return_value = {
+                "entries": 2,
+                "bytes": 3 * 2**20,
+                "max_bytes": 1024 * 2**20,
+                "hits": 3,
+                "misses": 1,
+            }
+
+            result = self.runner.invoke(intersector, ["cache"])
+
+            assert result.exit_code == 0, result.output
+            assert "2 entries" in result.output
+            assert "3 hits (75%), 1 misses" in result.output
+
+    def test_cache_clear(self):
+        """Test that the cache command empties the cache with --clear."""
+        with (
+            patch("intersector.cli.setup_logging"),
+            patch("intersector.utils.step_cache.StepCache") as mock_cache_class,
+        ):
+            result = self.runner.invoke(intersector, ["cache", "--clear"])
+
+            assert result.exit_code == 0, result.output
+            mock_cache_class.return_value.clear.assert_called_once()
+
+    def test_cache_sections_computes_only_misses(self):
+        """Test that --cache-sections goes through the section cache."""
+        with (
+            patch("intersector.cli.setup_logging"),
+            patch("intersector.utils.step_cache.StepCache") as mock_cache_class,
+            patch("intersector.utils.section_cache.SectionCache") as mock_sections,
+            patch("intersector.utils.file_handler.read_step"),
+            patch("intersector.operations.face_index.FaceIndex"),
+            patch(
+                "intersector.operations.intersect.intersect_with_plane"
+            ) as mock_intersect,
+            patch(
+                "intersector.operations.intersect.is_intersection_valid",
+                return_value=False,
+            ),
+        ):
+            mock_cache_class.key.return_value = "shape-key"
+            mock_sections.return_value.sections.side_effect = (
+                lambda key, planes, compute, settings: [
+                    "cached",
+                    *compute(planes[1:]),
+                ]
+            )
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersector,
+                    [
+                        "--cache-dir",
+                        "cache",
+                        "intersect",
+                        "--in-step",
+                        "dummy_shape.stp",
+                        "--in-plane",
+                        "0,0,0:0,0,1",
+                        "--in-plane",
+                        "0,0,1:0,0,1",
+                        "--cache-sections",
+                    ],
+                )
+
+            assert result.exit_code == 0, result.output
+            mock_sections.assert_called_once_with(
+                os.path.join("cache", "sections"), 1024 * 1024 * 1024
+            )
+            call = mock_sections.return_value.sections.call_args
+            assert call.args[0] == "shape-key"
+            assert call.kwargs["settings"].endswith(":brep:planes")
+            mock_intersect.assert_called_once()
+            assert mock_intersect.call_args.args[1] == (0.0, 0.0, 1.0)
+
+    def test_cache_sections_rejects_mesh_engine(self):
+        """Test that --cache-sections requires the brep engine."""
+        with patch("intersector.cli.setup_logging"):
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersector,
+                    [
+                        "intersect",
+                        "--in-step",
+                        "dummy_shape.stp",
+                        "--in-plane",
+                        "0,0,0:0,0,1",
+                        "--engine",
+                        "mesh",
+                        "--output",
+                        "out.npz",
+                        "--cache-sections",
+                    ],
+                )
+
+            assert result.exit_code != 0
+            assert "--cache-sections" in result.output
+
+    def test_cache_sections_statistics(self):
+        """Test that the cache command reports the section cache with --sections."""
+        with (
+            patch("intersector.cli.setup_logging"),
+            patch("intersector.utils.section_cache.SectionCache") as mock_sections,
+        ):
+            mock_sections.return_value.stats.return_value = {
+                "entries": 1,
+                "bytes": 2**20,
+                "max_bytes": 1024 * 2**20,
+                "hits": 0,
+                "misses": 1,
+            }
+
+            result = self.runner.invoke(intersector, ["cache", "--sections"])
+
+            assert result.exit_code == 0, result.output
+            assert "Section cache" in result.output
+            assert "0 hits (0%), 1 misses" in result.output
+
+
+class TestCLIProfile(TestCase):
+    """Test suite for the `--profile` option."""
+
+    def setUp(self):
+        """Set up the Click test runner."""
+        self.runner = CliRunner()
+
+    def test_profile_writes_summary_and_trace(self):
+        """Test that the CLI phases end up in both profile files."""
+        with (
+            patch("intersector.cli.setup_logging"),
+            patch("intersector.utils.file_handler.read_step") as mock_read_step,
+            patch(
+                "intersector.operations.intersect.intersect_with_plane"
+            ) as mock_intersect,
+            patch(
+                "intersector.operations.intersect.is_intersection_valid",
+                return_value=True,
+            ),
+            patch("intersector.utils.file_handler.export_step", return_value=True),
+        ):
+            mock_read_step.return_value = MagicMock(name="TopoDS_Shape")
+            mock_intersect.return_value = MagicMock(name="section")
+
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersector,
+                    [
+                        "--no-cache",
+                        "--profile",
+                        "run.json",
+                        "intersect",
+                        "--in-step",
+                        "dummy_shape.stp",
+                        "--in-plane",
+                        "0,0,0:0,0,1",
+                        "--no-show",
+                    ],
+                )
+
+                with open("run.json", encoding="utf-8") as f:
+                    summary = json.load(f)
+                with open("run.trace.json", encoding="utf-8") as f:
+                    trace = json.load(f)
+
+            assert result.exit_code == 0, result.output
+            assert {"cli.load", "cli.intersect", "cli.export"} <= set(summary["phases"])
+            assert {e["name"] for e in trace["traceEvents"]} == set(summary["phases"])
+
+
+class TestCLIExecutionPolicy(TestCase):
+    """Test suite for the OpenCascade parallelism options."""
+
+    def setUp(self):
+        """Set up the Click test runner."""
+        self.runner = CliRunner()
+
+    def test_options_install_execution_policy(self):
+        """Test that --threads and the parallel flags reach the policy."""
+        with (
+            patch("intersector.cli.setup_logging"),
+            patch("intersector.utils.execution.set_policy") as mock_set,
+            patch("intersector.utils.step_cache.StepCache"),
+        ):
+            result = self.runner.invoke(
+                intersector,
+                ["--threads", "8", "--parallel-booleans", "cache", "--clear"],
+            )
+
+        assert result.exit_code == 0, result.output
+        (policy,) = mock_set.call_args.args
+        assert (policy.threads, policy.parallel_booleans, policy.parallel_mesh) == (
+            8,
+            True,
+            False,
+        )
+
+
+class TestCLIBatch(TestCase):
+    """Test suite for the batch command."""
+
+    def setUp(self):
+        """Set up the Click test runner."""
+        self.runner = CliRunner()
+
+    def test_batch_runs_files_within_memory_budget(self):
+        """Test that the files and scheduler settings reach the batch jobs."""
+        with patch("intersector.operations.batch.section_files") as mock_files:
+            mock_files.return_value = iter(
+                [
+                    ("a.stp", os.path.join("out", "a.stp"), 2),
+                    ("b.stp", os.path.join("out", "b.stp"), 0),
+                ]
+            )
+            with self.runner.isolated_filesystem():
+                for name in ("a.stp", "b.stp"):
+                    with open(name, "w", encoding="utf-8") as f:
+                        f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersector,
+                    [
+                        "--memory-budget",
+                        "512",
+                        "--max-tasks-per-worker",
+                        "4",
+                        "batch",
+                        "--in-step",
+                        "a.stp",
+                        "--in-step",
+                        "b.stp",
+                        "--in-plane",
+                        "0,0,0:0,0,1",
+                        "--output-dir",
+                        "out",
+                        "--workers",
+                        "2",
+                    ],
+                )
+                assert os.path.isdir("out")
+
+        assert result.exit_code == 0, result.output
+        assert "2 section(s) written" in result.output
+        assert "no intersection" in result.output
+        in_steps, planes, output_dir, fmt, engine, _, scheduler = (
+            mock_files.call_args.args
+        )
+        assert in_steps == ("a.stp", "b.stp")
+        assert len(planes) == 1
+        assert (output_dir, fmt, engine) == ("out", "step", "brep")
+        assert scheduler.budget == 512 * 1024 * 1024
+        assert (scheduler.workers, scheduler.max_tasks_per_worker) == (2, 4)
+
+    def test_batch_rejects_mesh_step_output(self):
+        """Test that the mesh engine needs a polyline format."""
+        with self.runner.isolated_filesystem():
+            with open("a.stp", "w", encoding="utf-8") as f:
+                f.write("FAKE")
+
+            result = self.runner.invoke(
+                intersector,
+                [
+                    "batch",
+                    "--in-step",
+                    "a.stp",
+                    "--in-plane",
+                    "0,0,0:0,0,1",
+                    "--engine",
+                    "mesh",
+                ],
+            )
+
+        assert result.exit_code != 0
+        assert "only writes polyline formats" in result.output
+
+
+class TestCLITimeout(TestCase):
+    """Test suite for the per-section time budget."""
+
+    def setUp(self):
+        """Set up the Click test runner."""
+        self.runner = CliRunner()
+
+    def test_timed_out_sections_are_flagged(self):
+        """Test that the planes over --timeout are reported and flagged."""
+
+        def sections(_shape, planes, *settings):
+            settings[-1].append(1)  # the second plane timed out
+            return iter([MagicMock() for _ in planes])
+
+        with (
+            patch("intersector.utils.file_handler.read_step"),
+            patch(
+                "intersector.operations.timeouts.intersect_with_planes_timeout",
+                side_effect=sections,
+            ) as mock_timeout,
+            patch(
+                "intersector.operations.intersect.is_intersection_valid",
+                return_value=True,
+            ),
+            patch(
+                "intersector.operations.analytics.section_summary",
+                side_effect=lambda *_: {"timed_out": False},
+            ),
+        ):
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersect,
+                    [
+                        "--in-step",
+                        "dummy_shape.stp",
+                        "--in-plane",
+                        "0,0,0:0,0,1",
+                        "--in-plane",
+                        "0,0,10:0,0,1",
+                        "--timeout",
+                        "2.5",
+                        "--on-timeout",
+                        "skip",
+                        "--summary",
+                        "summary.json",
+                    ],
+                )
+                with open("summary.json", encoding="utf-8") as f:
+                    rows = json.load(f)["sections"]
+
+        assert result.exit_code == 0, result.output
+        assert "1 of 2 section(s) exceeded --timeout and were skipped" in (
+            result.output
+        )
+        assert [row["timed_out"] for row in rows] == [False, True]
+        assert mock_timeout.call_args.args[2:5] == (2.5, "skip", 0.01)
+
+    def test_timeout_rejects_workers(self):
+        """Test that --timeout runs in-process planes only."""
+        with patch("intersector.utils.file_handler.read_step") as mock_read:
+            with self.runner.isolated_filesystem():
+                with open("dummy_shape.stp", "w", encoding="utf-8") as f:
+                    f.write("FAKE")
+
+                result = self.runner.invoke(
+                    intersect,
+                    [
+                        "--in-step",
+                        "dummy_shape.stp",
+                        "--in-plane",
+                        "0,0,0:0,0,1",
+                        "--timeout",
+                        "1",
+                        "--workers",
+                        "2",
+                    ],
+                )
+
+        assert result.exit_code != 0
+        assert "--timeout cannot be used" in result.output
+        mock_read.assert_not_called()
+
+
+class TestCLIStartup(TestCase):
+    """Guard the import cost of the CLI module."""
+
+    HEAVY_PACKAGES = ("OCC", "numpy", "PyQt5", "PySide2", "PySide6")
+
+    def _loaded_after(self, code):
+        """Run ``code`` in a fresh interpreter and list heavy modules it loaded.
+
+        Returns:
+            list[str]: The heavy top-level packages found in ``sys.modules``.
+
+        """
+        probe = (
+            f"import sys, json\n{code}\n"
+            "print(json.dumps(sorted({m.split('.')[0] for m in sys.modules})))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", probe],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        loaded = json.loads(out.splitlines()[-1])
+        return [name for name in loaded if name in self.HEAVY_PACKAGES]
+
+    def test_import_does_not_load_occ(self):
+        """Test that importing the CLI does not import OCC or NumPy."""
+        assert self._loaded_after("import intersector.cli") == []
+
+    def test_help_and_bad_plane_do_not_load_occ(self):
+        """Test that --help and plane validation errors stay lightweight."""
+        code = (
+            "from click.testing import CliRunner\n"
+            "from intersector.cli import intersector\n"
+            "CliRunner().invoke(intersector, ['--help'])\n"
+            "CliRunner().invoke(intersector, ['intersect', '--in-step', "
+            "sys.executable, '--in-plane', '0,0'])"
+        )
+        assert self._loaded_after(code) == []
@@ -0,0 +1,69 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.operations.discretize."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from intersector.operations import discretize
+
+
+def _pnt(x, y, z):
+    point = MagicMock()
+    point.X.return_value, point.Y.return_value, point.Z.return_value = x, y, z
+    return point
+
+
+class TestEdgePoints:
+    """Tests for the edge_points function."""
+
+    @staticmethod
+    @patch("intersector.operations.discretize.BRepAdaptor_Curve", MagicMock())
+    @patch("intersector.operations.discretize.GCPnts_QuasiUniformDeflection")
+    def test_sampled_points_follow_edge_orientation(mock_sampler_class):
+        """Test that a reversed edge yields its points in reverse order."""
+        sampler = mock_sampler_class.return_value
+        sampler.IsDone.return_value = True
+        sampler.NbPoints.return_value = 3
+        sampler.Value.side_effect = lambda i: _pnt(i, 0, 0)
+        edge = MagicMock()
+        edge.Orientation.return_value = discretize.TopAbs_REVERSED
+
+        points = discretize.edge_points(edge, 0.1)
+
+        np.testing.assert_array_equal(points, [(3, 0, 0), (2, 0, 0), (1, 0, 0)])
+        mock_sampler_class.assert_called_once()
+
+    @staticmethod
+    @patch("intersector.operations.discretize.log", MagicMock())
+    @patch("intersector.operations.discretize.BRepAdaptor_Curve")
+    @patch("intersector.operations.discretize.GCPnts_QuasiUniformDeflection")
+    def test_failed_sampling_keeps_end_points(mock_sampler_class, mock_curve_class):
+        """Test the fallback to the end points of the curve."""
+        mock_sampler_class.return_value.IsDone.return_value = False
+        curve = mock_curve_class.return_value
+        curve.FirstParameter.return_value = 0.0
+        curve.LastParameter.return_value = 1.0
+        curve.Value.side_effect = lambda t: _pnt(t, t, 0)
+
+        points = discretize.edge_points(MagicMock(), 0.1)
+
+        np.testing.assert_array_equal(points, [(0, 0, 0), (1, 1, 0)])
+
+
+class TestSectionPolylines:
+    """Tests for the section_polylines function."""
+
+    @staticmethod
+    def test_none_shape_has_no_polylines():
+        """Test that a missing section result yields no polyline."""
+        assert discretize.section_polylines(None) == []
+
+    @staticmethod
+    @pytest.mark.parametrize("deflection", [0, -1])
+    def test_non_positive_deflection_raises(deflection):
+        """Test that the deflection must be positive."""
+        with pytest.raises(ValueError, match="Deflection must be positive"):
+            discretize.section_polylines(MagicMock(), deflection)
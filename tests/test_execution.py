@@ -0,0 +1,82 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.utils.execution."""
+
+import pickle
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from intersector.utils import execution
+
+
+@pytest.fixture(name="occ")
+def fixture_occ():
+    """Replace the OpenCascade parallelism settings with mocks.
+
+    Yields:
+        MagicMock: Parent of the ``OSD_Parallel``, ``OSD_ThreadPool`` and
+            ``BOPAlgo_Options`` mocks.
+
+    """
+    occ = MagicMock()
+    with (
+        patch.object(execution, "OSD_Parallel", occ.parallel),
+        patch.object(execution, "OSD_ThreadPool", occ.pool),
+        patch.object(execution, "BOPAlgo_Options", occ.options),
+        patch.object(execution, "log", MagicMock()),
+        patch.object(execution, "_policy", execution.ExecutionPolicy()),
+    ):
+        yield occ
+
+
+class TestExecutionPolicy:
+    """Tests for the ExecutionPolicy class."""
+
+    @staticmethod
+    def test_thread_pool_is_sized_once(occ):
+        """Test that the pool is configured on the first apply only."""
+        policy = execution.ExecutionPolicy(threads=0, parallel_booleans=True)
+
+        policy.apply()
+        policy.apply()
+
+        occ.parallel.SetUseOcctThreads.assert_called_once_with(True)
+        occ.pool.DefaultPool.return_value.Init.assert_called_once_with(-1)
+        occ.options.SetParallelMode.assert_called_once_with(True)
+
+    @staticmethod
+    def test_default_policy_keeps_thread_pool(occ):
+        """Test that the default policy leaves the OpenCascade pool alone."""
+        execution.ExecutionPolicy().apply()
+
+        occ.pool.DefaultPool.assert_not_called()
+        occ.options.SetParallelMode.assert_called_once_with(False)
+
+    @staticmethod
+    def test_pickled_policy_is_applied_again(occ):
+        """Test that a policy shipped to a worker applies itself there."""
+        policy = execution.ExecutionPolicy(threads=4)
+        policy.apply()
+
+        copy = pickle.loads(pickle.dumps(policy))
+        execution.set_policy(copy)
+
+        assert repr(copy) == repr(policy)
+        assert execution.current_policy() is copy
+        assert occ.pool.DefaultPool.return_value.Init.call_count == 2  # noqa: PLR2004
+
+    @staticmethod
+    def test_apply_policy_applies_installed_policy(occ):
+        """Test that apply_policy configures OpenCascade once."""
+        with patch.object(execution, "_policy", execution.ExecutionPolicy(threads=2)):
+            execution.apply_policy()
+            execution.apply_policy()
+
+        occ.pool.DefaultPool.return_value.Init.assert_called_once_with(2)
+
+    @staticmethod
+    def test_negative_threads_raises():
+        """Test that a negative thread count is rejected."""
+        with pytest.raises(ValueError, match="negative"):
+            execution.ExecutionPolicy(threads=-1)
@@ -0,0 +1,141 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.operations.face_index."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from intersector.operations import face_index
+
+# Bounding boxes (xmin, ymin, zmin, xmax, ymax, zmax) of the fake faces.
+BOUNDS = {
+    "bottom": (0.0, 0.0, 0.0, 1.0, 1.0, 0.0),
+    "side": (0.0, 0.0, 0.0, 0.0, 1.0, 10.0),
+    "top": (0.0, 0.0, 10.0, 1.0, 1.0, 10.0),
+    "degenerate": None,
+}
+
+
+class _ListExplorer:
+    """Stand-in for TopExp_Explorer iterating over a fixed list of faces."""
+
+    def __init__(self, faces):
+        self._faces = list(faces)
+
+    def More(self):  # noqa: N802
+        """Return whether faces remain.
+
+        Returns:
+            bool: True while the explorer has a current face.
+
+        """
+        return bool(self._faces)
+
+    def Current(self):  # noqa: N802
+        """Return the current face.
+
+        Returns:
+            str: The current face.
+
+        """
+        return self._faces[0]
+
+    def Next(self):  # noqa: N802
+        """Advance to the next face."""
+        self._faces.pop(0)
+
+
+class _FakeBox:
+    """Stand-in for Bnd_Box filled by the fake brepbndlib.Add."""
+
+    bounds = None
+
+    def IsVoid(self):  # noqa: N802
+        """Return whether the box is empty.
+
+        Returns:
+            bool: True if no bounds were added.
+
+        """
+        return self.bounds is None
+
+    def Get(self):  # noqa: N802
+        """Return the box bounds.
+
+        Returns:
+            tuple: ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+
+        """
+        return self.bounds
+
+
+@pytest.fixture(name="index")
+def fixture_index():
+    """Build a FaceIndex over the fake faces.
+
+    Returns:
+        FaceIndex: The index over the faces of ``BOUNDS``.
+
+    """
+
+    def fake_add(face, box):
+        box.bounds = BOUNDS[face]
+
+    with (
+        patch.object(face_index, "TopExp_Explorer", return_value=_ListExplorer(BOUNDS)),
+        patch.object(face_index, "Bnd_Box", _FakeBox),
+        patch.object(face_index, "brepbndlib") as mock_lib,
+        patch.object(face_index, "log", MagicMock()),
+    ):
+        mock_lib.Add.side_effect = fake_add
+        return face_index.FaceIndex(MagicMock(name="shape"))
+
+
+class TestFaceIndex:
+    """Tests for the FaceIndex class."""
+
+    @staticmethod
+    def test_void_faces_are_skipped(index):
+        """Test that faces without a bounding box are not indexed."""
+        assert index.faces == ["bottom", "side", "top"]
+        assert len(index) == len(index.faces)
+
+    @staticmethod
+    def test_extents_along_axis(index):
+        """Test the projection of the boxes on a direction."""
+        lo, hi = index.extents((0, 0, 1))
+
+        np.testing.assert_allclose(lo, [0.0, 0.0, 10.0])
+        np.testing.assert_allclose(hi, [0.0, 10.0, 10.0])
+
+    @staticmethod
+    def test_candidates_keep_straddling_faces(index):
+        """Test that only boxes crossed by the plane are returned."""
+        assert index.candidate_faces((0, 0, 5), (0, 0, 1)) == ["side"]
+        assert index.candidate_faces((0, 0, 10), (0, 0, -3)) == ["side", "top"]
+
+    @staticmethod
+    def test_oblique_plane(index):
+        """Test a plane that is not aligned with the boxes."""
+        faces = index.candidate_faces((0.75, 0.75, 0.0), (1, 1, 0))
+
+        assert faces == ["bottom", "top"]
+
+    @staticmethod
+    def test_plane_missing_the_shape(index):
+        """Test that a plane outside the shape box yields no candidate."""
+        assert index.candidates((0, 0, 50), (0, 0, 1)).size == 0
+
+    @staticmethod
+    def test_zero_normal_raises(index):
+        """Test that a zero plane normal is rejected."""
+        with pytest.raises(ValueError, match="zero vector"):
+            index.candidates((0, 0, 0), (0, 0, 0))
+
+    @staticmethod
+    def test_none_shape_raises():
+        """Test that a missing shape is rejected."""
+        with pytest.raises(ValueError, match="Shape cannot be None"):
+            face_index.FaceIndex(None)
@@ -2,11 +2,20 @@
 # Licensed under the MIT License. See LICENSE file for details.
 """Unit tests for intersector.utils.file_handler."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from intersector.utils import file_handler
 
 
+@pytest.fixture(autouse=True)
+def _fresh_step_writer(monkeypatch):
+    """Give each test its own cache of per-thread STEP writers."""
+    monkeypatch.setattr(file_handler, "_local", threading.local())
+
+
 class TestExportStep:
     """Tests for the export_step function."""
 
@@ -40,6 +49,19 @@ class TestExportStep:
 
         assert result is False
 
+    @staticmethod
+    @patch("intersector.utils.file_handler.STEPControl_Writer")
+    def test_export_step_reuses_writer(mock_writer_class):
+        """Test that later exports reuse the writer with a new empty model."""
+        mock_writer = mock_writer_class.return_value
+        mock_writer.Write.return_value = file_handler.IFSelect_RetDone
+
+        assert file_handler.export_step(MagicMock(), "a.step")
+        assert file_handler.export_step(MagicMock(), "b.step")
+
+        mock_writer_class.assert_called_once_with()
+        mock_writer.Model.assert_called_once_with(True)
+
     @staticmethod
     @patch(
         "intersector.utils.file_handler.STEPControl_Writer",
@@ -119,3 +141,102 @@ class TestReadStep:
         """Test read_step handles exceptions gracefully."""
         result = file_handler.read_step("crash.step")
         assert result is None
+
+
+class TestReadStepCache:
+    """Tests for read_step with a STEP cache."""
+
+    @staticmethod
+    @patch("intersector.utils.file_handler.os.path.exists", return_value=True)
+    @patch("intersector.utils.file_handler.STEPControl_Reader")
+    def test_cache_hit_skips_translation(mock_reader_class, _mock_exists):
+        """Test that a cached shape is returned without reading the STEP."""
+        cache = MagicMock()
+
+        result = file_handler.read_step("cached.step", cache=cache)
+
+        assert result is cache.load.return_value
+        cache.load.assert_called_once_with(cache.key.return_value)
+        mock_reader_class.assert_not_called()
+
+    @staticmethod
+    @patch("intersector.utils.file_handler.os.path.exists", return_value=True)
+    @patch("intersector.utils.file_handler.STEPControl_Reader")
+    def test_cache_miss_stores_shape(mock_reader_class, _mock_exists):
+        """Test that a freshly translated shape is added to the cache."""
+        cache = MagicMock()
+        cache.load.return_value = None
+        mock_reader = mock_reader_class.return_value
+        mock_reader.ReadFile.return_value = file_handler.IFSelect_RetDone
+        mock_reader.OneShape.return_value.IsNull.return_value = False
+
+        result = file_handler.read_step("new.step", cache=cache)
+
+        assert result is mock_reader.OneShape.return_value
+        cache.store.assert_called_once_with(cache.key.return_value, result)
+
+
+class TestIterStepRoots:
+    """Tests for the iter_step_roots generator."""
+
+    @staticmethod
+    @patch("intersector.utils.file_handler.STEPControl_Reader")
+    def test_roots_are_released_one_by_one(mock_reader_class):
+        """Test that each root is cleared before the next is transferred."""
+        reader = mock_reader_class.return_value
+        reader.ReadFile.return_value = file_handler.IFSelect_RetDone
+        reader.NbRootsForTransfer.return_value = 3
+        reader.TransferRoot.side_effect = [True, False, True]
+        shapes = [MagicMock(name=f"root{i}") for i in range(2)]
+        for shape in shapes:
+            shape.IsNull.return_value = False
+        reader.Shape.side_effect = shapes
+
+        roots = file_handler.iter_step_roots("plant.stp")
+        assert next(roots) == (1, 3, shapes[0])
+        assert reader.ClearShapes.call_count == 0
+        assert next(roots) == (3, 3, shapes[1])
+        assert reader.ClearShapes.call_count == 2  # noqa: PLR2004
+        assert not list(roots)
+
+    @staticmethod
+    @patch("intersector.utils.file_handler.STEPControl_Reader")
+    def test_unreadable_file_raises(mock_reader_class):
+        """Test that a failed read raises RuntimeError."""
+        mock_reader_class.return_value.ReadFile.return_value = 999
+
+        with pytest.raises(RuntimeError, match="Failed to read"):
+            list(file_handler.iter_step_roots("bad.stp"))
+
+
+class TestBRepSerialization:
+    """Tests for the shape_to_bytes and shape_from_bytes functions."""
+
+    @staticmethod
+    @patch("intersector.utils.file_handler.bintools")
+    def test_shape_to_bytes_returns_written_file(mock_bintools):
+        """Test that the blob holds what BinTools wrote."""
+
+        def fake_write(_shape, path):
+            with open(path, "wb") as f:
+                f.write(b"BREP")
+
+        mock_bintools.Write.side_effect = fake_write
+
+        assert file_handler.shape_to_bytes(MagicMock()) == b"BREP"
+
+    @staticmethod
+    @patch("intersector.utils.file_handler.bintools")
+    def test_shape_from_bytes_reads_blob(mock_bintools):
+        """Test that BinTools reads back the given blob."""
+        seen = []
+
+        def fake_read(_shape, path):
+            with open(path, "rb") as f:
+                seen.append(f.read())
+
+        mock_bintools.Read.side_effect = fake_read
+
+        file_handler.shape_from_bytes(b"BREP")
+
+        assert seen == [b"BREP"]
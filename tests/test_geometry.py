@@ -0,0 +1,58 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.utils.geometry."""
+
+import pytest
+
+from intersector.utils import geometry
+
+
+class TestCanonicalPlane:
+    """Tests for the canonical_plane function."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("point", "normal"),
+        [
+            ((0, 0, 3), (0, 0, 1)),
+            ((7, -2, 3), (0, 0, 5)),
+            ((0, 0, 3), (0, 0, -1)),
+            ((1, 1, 3), (0, 0, -0.25)),
+        ],
+    )
+    def test_equivalent_planes(point, normal):
+        """Test that scaled, flipped and moved specifications agree."""
+        assert geometry.canonical_plane(point, normal) == (
+            (0, 0, 1_000_000),
+            3_000_000,
+        )
+
+    @staticmethod
+    def test_distinct_planes():
+        """Test that parallel planes at another offset differ."""
+        a = geometry.canonical_plane((0, 0, 3), (0, 0, 1))
+        b = geometry.canonical_plane((0, 0, 3.1), (0, 0, 1))
+
+        assert a != b
+
+    @staticmethod
+    def test_invalid_input():
+        """Test that a zero normal or tolerance is rejected."""
+        with pytest.raises(ValueError, match="zero vector"):
+            geometry.canonical_plane((0, 0, 0), (0, 0, 0))
+        with pytest.raises(ValueError, match="Tolerance"):
+            geometry.canonical_plane((0, 0, 0), (0, 0, 1), 0)
+
+    @staticmethod
+    @pytest.mark.parametrize("tolerance", [1.0, 3.0])
+    def test_coarse_tolerance_raises(tolerance):
+        """Test that a tolerance quantizing the whole normal to 0 is rejected."""
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            geometry.canonical_plane((0, 0, 0), (1, 1, 1), tolerance)
+
+    @staticmethod
+    def test_tolerance_below_one_keeps_a_component():
+        """Test that the largest component survives any tolerance below 1."""
+        direction, _ = geometry.canonical_plane((0, 0, 0), (1, 1, 1), 0.99)
+
+        assert direction == (1, 1, 1)
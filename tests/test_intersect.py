@@ -0,0 +1,221 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.operations.intersect."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from intersector.operations import intersect
+
+
+class TestIntersectWithPlane:
+    """Tests for the intersect_with_plane function."""
+
+    @staticmethod
+    def test_none_shape_raises():
+        """Test that a missing shape is rejected."""
+        with pytest.raises(ValueError, match="Shape cannot be None"):
+            intersect.intersect_with_plane(None, (0, 0, 0), (0, 0, 1))
+
+    @staticmethod
+    @patch("intersector.operations.intersect.log", MagicMock())
+    @patch("intersector.operations.intersect.combine_shapes")
+    @patch("intersector.operations.intersect.BRepAlgoAPI_Section")
+    def test_index_without_candidates_skips_section(mock_section, mock_combine):
+        """Test the fast exit when no indexed face straddles the plane."""
+        index = MagicMock()
+        index.candidate_faces.return_value = []
+
+        result = intersect.intersect_with_plane(
+            MagicMock(), (0, 0, 0), (0, 0, 1), index=index
+        )
+
+        assert result is mock_combine.return_value
+        mock_section.assert_not_called()
+
+    @staticmethod
+    @patch("intersector.operations.intersect.log", MagicMock())
+    @patch("intersector.operations.intersect.make_face")
+    @patch("intersector.operations.intersect.combine_shapes")
+    @patch("intersector.operations.intersect.BRepAlgoAPI_Section")
+    def test_index_sections_candidate_faces_only(
+        mock_section, mock_combine, mock_make_face
+    ):
+        """Test that only the candidate faces are handed to the section."""
+        index = MagicMock()
+        index.candidate_faces.return_value = ["face"]
+        mock_section.return_value.IsDone.return_value = True
+
+        result = intersect.intersect_with_plane(
+            MagicMock(), (0, 0, 0), (0, 0, 1), index=index
+        )
+
+        mock_combine.assert_called_once_with(["face"])
+        mock_section.assert_called_once_with(
+            mock_combine.return_value, mock_make_face.return_value, False
+        )
+        assert result is mock_section.return_value.Shape.return_value
+
+    @staticmethod
+    @patch("intersector.operations.intersect.log", MagicMock())
+    @patch("intersector.operations.intersect.make_face", MagicMock())
+    @patch("intersector.operations.intersect.BRepAlgoAPI_Section")
+    def test_failed_section_raises(mock_section):
+        """Test that an unfinished section raises RuntimeError."""
+        mock_section.return_value.IsDone.return_value = False
+
+        with pytest.raises(RuntimeError, match="section not completed"):
+            intersect.intersect_with_plane(MagicMock(), (0, 0, 0), (0, 0, 1))
+
+    @staticmethod
+    @patch("intersector.operations.intersect.log", MagicMock())
+    @patch("intersector.operations.intersect.make_face", MagicMock())
+    @patch("intersector.operations.intersect.current_policy")
+    @patch("intersector.operations.intersect.BRepAlgoAPI_Section")
+    def test_section_follows_execution_policy(mock_section, mock_policy):
+        """Test that parallel booleans are set before the section is built."""
+        section = mock_section.return_value
+        section.IsDone.return_value = True
+        mock_policy.return_value.parallel_booleans = True
+
+        intersect.intersect_with_plane(MagicMock(), (0, 0, 0), (0, 0, 1))
+
+        assert [c[0] for c in section.method_calls[:2]] == ["SetRunParallel", "Build"]
+        section.SetRunParallel.assert_called_once_with(True)
+
+
+def _fake_explorer(shapes):
+    """Return a TopExp_Explorer stand-in iterating over ``shapes``.
+
+    Returns:
+        MagicMock: The explorer.
+
+    """
+    explorer = MagicMock()
+    items = iter(shapes)
+    state = {"current": next(items, None)}
+
+    def advance():
+        state["current"] = next(items, None)
+
+    explorer.More.side_effect = lambda: state["current"] is not None
+    explorer.Current.side_effect = lambda: state["current"]
+    explorer.Next.side_effect = advance
+    return explorer
+
+
+def _fake_curve(z):
+    """Return a BRepAdaptor_Curve stand-in whose midpoint has height ``z``.
+
+    Returns:
+        MagicMock: The curve.
+
+    """
+    curve = MagicMock()
+    curve.FirstParameter.return_value = 0.0
+    curve.LastParameter.return_value = 1.0
+    curve.Value.return_value.X.return_value = 0.0
+    curve.Value.return_value.Y.return_value = 0.0
+    curve.Value.return_value.Z.return_value = z
+    return curve
+
+
+class TestIntersectWithPlanes:
+    """Tests for the intersect_with_planes function."""
+
+    @staticmethod
+    @patch("intersector.operations.intersect.log", MagicMock())
+    @patch("intersector.operations.intersect.make_face", MagicMock())
+    @patch("intersector.operations.intersect.TopTools_ListOfShape")
+    @patch("intersector.operations.intersect._split_by_offset")
+    @patch("intersector.operations.intersect.BRepAlgoAPI_Section")
+    def test_parallel_planes_share_one_section(mock_section, mock_split, mock_list):
+        """Test one boolean per direction, with coincident planes merged."""
+        mock_section.return_value.IsDone.return_value = True
+        mock_split.side_effect = lambda shape, normal, offsets: [
+            f"{normal[2]:+.0f}@{offset:g}" for offset in offsets
+        ]
+        planes = [
+            ((0, 0, 2), (0, 0, 1)),
+            ((0, 0, 0), (0, 0, 5)),
+            ((3, 0, 0), (1, 0, 0)),
+            ((1, 1, 2), (0, 0, -1)),
+        ]
+
+        results = list(intersect.intersect_with_planes(MagicMock(), planes))
+
+        assert mock_section.call_count == 2  # noqa: PLR2004
+        assert results[0] == results[3] == "+1@2"
+        assert results[1] == "+1@0"
+        assert results[2] == "+0@3"
+        tools = mock_list.return_value.Append.call_count
+        assert tools == 2 + 3  # arguments + distinct plane faces
+
+    @staticmethod
+    @patch("intersector.operations.intersect.log", MagicMock())
+    @patch("intersector.operations.intersect.make_face", MagicMock())
+    @patch("intersector.operations.intersect.TopTools_ListOfShape", MagicMock())
+    @patch("intersector.operations.intersect._split_by_offset")
+    @patch("intersector.operations.intersect.BRepAlgoAPI_Section")
+    def test_batches_bound_the_planes_per_section(mock_section, mock_split):
+        """Test that at most batch_size planes go into one section."""
+        mock_section.return_value.IsDone.return_value = True
+        mock_split.side_effect = lambda shape, normal, offsets: list(offsets)
+        planes = [((0, 0, z), (0, 0, 1)) for z in range(5)]
+
+        results = list(
+            intersect.intersect_with_planes(MagicMock(), planes, batch_size=2)
+        )
+
+        assert results == [0, 1, 2, 3, 4]
+        assert mock_section.call_count == 3  # noqa: PLR2004
+
+    @staticmethod
+    @patch("intersector.operations.intersect.make_face", MagicMock())
+    @patch("intersector.operations.intersect.TopTools_ListOfShape", MagicMock())
+    @patch("intersector.operations.intersect._split_by_offset", MagicMock())
+    @patch("intersector.operations.intersect.combine_shapes")
+    @patch("intersector.operations.intersect.BRepAlgoAPI_Section")
+    def test_index_keeps_faces_crossing_any_plane(mock_section, mock_combine):
+        """Test that faces between the planes are left out of the section."""
+        mock_section.return_value.IsDone.return_value = True
+        index = MagicMock()
+        index.faces = ["low", "middle", "high", "above"]
+        index.extents.return_value = (
+            np.array([-1.0, 0.5, 1.5, 5.0]),
+            np.array([0.2, 0.8, 2.5, 6.0]),
+        )
+
+        intersect._section_parallel_planes(
+            MagicMock(), np.array([0.0, 0.0, 1.0]), np.array([0.0, 2.0]), index
+        )
+
+        mock_combine.assert_called_once_with(["low", "high"])
+
+    @staticmethod
+    def test_invalid_batch_size_raises():
+        """Test that an empty batch is rejected."""
+        with pytest.raises(ValueError, match="Batch size"):
+            list(intersect.intersect_with_planes(MagicMock(), [], batch_size=0))
+
+    @staticmethod
+    @patch("intersector.operations.intersect.combine_shapes", side_effect=list)
+    @patch("intersector.operations.intersect.topods")
+    @patch(
+        "intersector.operations.intersect.BRepAdaptor_Curve", side_effect=_fake_curve
+    )
+    @patch("intersector.operations.intersect.TopExp_Explorer")
+    def test_split_assigns_edges_to_nearest_plane(
+        mock_explorer, mock_curve, mock_topods, mock_combine
+    ):
+        """Test that each edge goes to the plane nearest to its midpoint."""
+        mock_explorer.return_value = _fake_explorer([0.1, 1.9, 4.0, 9.0, -3.0])
+        mock_topods.Edge.side_effect = lambda z: z
+
+        result = intersect._split_by_offset(
+            MagicMock(), np.array([0.0, 0.0, 1.0]), np.array([0.0, 2.0, 5.0])
+        )
+
+        assert result == [[0.1, -3.0], [1.9], [4.0, 9.0]]
@@ -2,12 +2,20 @@
 # Licensed under the MIT License. See LICENSE file for details.
 """Unit tests for the logger setup utility."""
 
+import io
+import json
 import logging
 from unittest.mock import patch
 
+import pytest
 from rich.logging import RichHandler
 
-from intersector.utils.logger import setup_logging
+from intersector.utils.logger import (
+    JsonLinesFormatter,
+    RecordQueueHandler,
+    setup_logging,
+    stop_logging,
+)
 
 
 class TestLoggingSetup:
@@ -54,3 +62,77 @@ class TestLoggingSetup:
             show_path=True,
             log_time_format="[%X]",
         )
+
+
+class TestJsonLines:
+    """Unit tests for the JSON-lines log format."""
+
+    @staticmethod
+    def test_formatter_drops_markup():
+        """Test that a record becomes one JSON object without Rich markup."""
+        message = "[cyan]📂 Read:[/cyan] %s"
+        record = logging.LogRecord(
+            "intersector.x", logging.INFO, "x.py", 1, message, ("a",), None
+        )
+
+        entry = json.loads(JsonLinesFormatter().format(record))
+
+        assert entry["message"] == "📂 Read: a"
+        assert (entry["level"], entry["logger"]) == ("INFO", "intersector.x")
+
+    @staticmethod
+    def test_setup_logging_json_stream():
+        """Test that the json format writes one line per record."""
+        stream = io.StringIO()
+        logger = setup_logging(log_format="json", stream=stream)
+
+        logger.info("%s planes", 3)
+        logger.debug("hidden")
+
+        lines = stream.getvalue().splitlines()
+        assert [json.loads(line)["message"] for line in lines] == ["3 planes"]
+
+    @staticmethod
+    def test_unknown_format_raises():
+        """Test that an unknown log format is rejected."""
+        with pytest.raises(ValueError, match="Unknown log format"):
+            setup_logging(log_format="xml")
+
+
+class TestQueuedLogging:
+    """Unit tests for the queued logging mode."""
+
+    @staticmethod
+    def test_records_are_written_by_the_listener():
+        """Test that queued records are formatted after the call returns."""
+        stream = io.StringIO()
+        logger = setup_logging(log_format="json", queued=True, stream=stream)
+        assert isinstance(logger.handlers[0], RecordQueueHandler)
+
+        logger.info("Intersecting with plane at (%s,%s,%s)", 0, 0, 1)
+        stop_logging()
+
+        entry = json.loads(stream.getvalue())
+        assert entry["message"] == "Intersecting with plane at (0,0,1)"
+        setup_logging()
+
+    @staticmethod
+    def test_prepare_defers_formatting():
+        """Test that the queued record keeps its message and arguments."""
+        handler = RecordQueueHandler(None)
+        record = logging.LogRecord("x", logging.INFO, "x.py", 1, "%s", (1,), None)
+
+        assert handler.prepare(record) is record
+        assert (record.msg, record.args) == ("%s", (1,))
+
+    @staticmethod
+    def test_setup_logging_replaces_the_listener():
+        """Test that reconfiguring stops the previous listener thread."""
+        stream = io.StringIO()
+        logger = setup_logging(log_format="json", queued=True, stream=stream)
+        logger.info("first")
+
+        setup_logging()
+
+        assert "first" in stream.getvalue()
+        assert isinstance(logging.getLogger("intersector").handlers[0], RichHandler)
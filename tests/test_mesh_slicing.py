@@ -0,0 +1,124 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.operations.mesh_slicing."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from intersector.operations import mesh_slicing
+
+
+@pytest.fixture(name="cube")
+def fixture_cube():
+    """Build the closed triangle mesh of the unit cube.
+
+    Returns:
+        TriangleMesh: Twelve triangles over the eight cube corners.
+
+    """
+    vertices = [(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)]
+    quads = [
+        (0, 4, 6, 2),
+        (1, 5, 7, 3),
+        (0, 4, 5, 1),
+        (2, 6, 7, 3),
+        (0, 2, 3, 1),
+        (4, 6, 7, 5),
+    ]
+    triangles = [t for a, b, c, d in quads for t in ((a, b, c), (a, c, d))]
+    return mesh_slicing.TriangleMesh(vertices, triangles)
+
+
+def _length(segments):
+    return float(np.linalg.norm(segments[:, 0] - segments[:, 1], axis=1).sum())
+
+
+class TestTriangleMesh:
+    """Tests for the TriangleMesh class."""
+
+    @staticmethod
+    def test_section_of_cube_is_its_perimeter(cube):
+        """Test that a horizontal cut of the cube has a perimeter of 4."""
+        segments = cube.section((0, 0, 0.3), (0, 0, 2))
+
+        assert segments.shape == (8, 2, 3)
+        np.testing.assert_allclose(segments[..., 2], 0.3)
+        assert _length(segments) == pytest.approx(4.0)
+
+    @staticmethod
+    def test_oblique_section(cube):
+        """Test a diagonal cut through the middle of the cube."""
+        segments = cube.section((0.5, 0.5, 0.5), (1, 1, 1))
+
+        assert _length(segments) == pytest.approx(6 * np.sqrt(0.5))
+
+    @staticmethod
+    @pytest.mark.parametrize("batch", [1, 2, 256])
+    def test_slice_keeps_offset_order(cube, batch):
+        """Test that results follow the given offsets, whatever the batch."""
+        results = cube.slice((0, 0, 1), [0.75, 5.0, 0.25, -1.0], batch=batch)
+
+        assert [len(r) for r in results] == [8, 0, 8, 0]
+        np.testing.assert_allclose(results[0][..., 2], 0.75)
+        np.testing.assert_allclose(results[2][..., 2], 0.25)
+
+    @staticmethod
+    def test_sections_match_single_plane_sections(cube):
+        """Test that planes grouped by normal keep their order and results."""
+        planes = [
+            ((0, 0, 0.75), (0, 0, 1)),
+            ((0.5, 0.5, 0.5), (1, 1, 1)),
+            ((0, 0, 0.25), (0, 0, 2)),
+            ((0, 0, 5), (0, 0, 1)),
+        ]
+
+        with patch.object(cube, "slice", wraps=cube.slice) as mock_slice:
+            results = cube.sections(planes)
+
+        assert mock_slice.call_count == 2  # noqa: PLR2004
+        for (point, normal), segments in zip(planes, results, strict=True):
+            np.testing.assert_allclose(segments, cube.section(point, normal))
+
+    @staticmethod
+    def test_vertex_touching_plane_yields_no_segment():
+        """Test that a triangle touching the plane at one vertex is skipped."""
+        mesh = mesh_slicing.TriangleMesh([(0, 0, 1), (1, 0, 0), (0, 1, 0)], [(0, 1, 2)])
+
+        assert mesh.section((0, 0, 1), (0, 0, 1)).shape == (0, 2, 3)
+
+    @staticmethod
+    def test_empty_mesh():
+        """Test that an empty mesh yields empty sections."""
+        mesh = mesh_slicing.TriangleMesh([], [])
+
+        assert mesh.section((0, 0, 0), (0, 0, 1)).shape == (0, 2, 3)
+
+    @staticmethod
+    def test_zero_normal_raises(cube):
+        """Test that a zero plane normal is rejected."""
+        with pytest.raises(ValueError, match="zero vector"):
+            cube.section((0, 0, 0), (0, 0, 0))
+
+    @staticmethod
+    def test_from_shape_rejects_bad_input():
+        """Test the argument checks of from_shape."""
+        with pytest.raises(ValueError, match="Shape cannot be None"):
+            mesh_slicing.TriangleMesh.from_shape(None)
+        with pytest.raises(ValueError, match="Deflection must be positive"):
+            mesh_slicing.TriangleMesh.from_shape(MagicMock(), 0)
+
+
+class TestSliceMesh:
+    """Tests for the slice_mesh function."""
+
+    @staticmethod
+    @patch("intersector.operations.mesh_slicing.log", MagicMock())
+    def test_layers_cover_the_mesh(cube):
+        """Test that layers are placed like the B-rep slicer places them."""
+        layers = list(mesh_slicing.slice_mesh(cube, (0, 0, 2), 0.5))
+
+        assert [point for point, _, _ in layers] == [(0, 0, 0.25), (0, 0, 0.75)]
+        assert all(normal == (0.0, 0.0, 1.0) for _, normal, _ in layers)
+        assert all(len(segments) == 8 for _, _, segments in layers)  # noqa: PLR2004
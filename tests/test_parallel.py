@@ -0,0 +1,273 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.operations.parallel."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from intersector.operations import parallel
+from intersector.utils.plane_sets import PlaneSet
+
+
+class _InlineExecutor:
+    """Stand-in for ProcessPoolExecutor that runs tasks in-process."""
+
+    def __init__(self, max_workers, initializer, initargs):
+        self.max_workers = max_workers
+        initializer(*initargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @staticmethod
+    def map(fn, iterable, chunksize=1):
+        """Apply ``fn`` sequentially, ignoring ``chunksize``.
+
+        Returns:
+            Iterator: The results of ``fn`` in input order.
+
+        """
+        del chunksize
+        return map(fn, iterable)
+
+
+class TestIntersectWithPlanesParallel:
+    """Tests for the intersect_with_planes_parallel function."""
+
+    @staticmethod
+    @patch("intersector.operations.parallel.log", MagicMock())
+    @patch("intersector.operations.parallel.ProcessPoolExecutor", _InlineExecutor)
+    @patch("intersector.operations.parallel.FaceIndex")
+    @patch("intersector.operations.parallel.shape_from_bytes")
+    @patch("intersector.operations.parallel.shape_to_bytes")
+    @patch("intersector.operations.parallel.intersect_with_plane")
+    def test_results_are_returned_in_plane_order(
+        mock_intersect, mock_to_bytes, mock_from_bytes, mock_index
+    ):
+        """Test the shape is shipped once and results keep the plane order."""
+        shape = MagicMock(name="TopoDS_Shape")
+        worker_shape = MagicMock(name="worker_shape")
+        planes = [((0, 0, z), (0, 0, 1)) for z in range(3)]
+
+        mock_to_bytes.side_effect = lambda s: ("blob", s)
+        mock_from_bytes.side_effect = lambda b: worker_shape if b[1] is shape else b
+        mock_intersect.side_effect = lambda s, p, n, index: f"section@{p[2]}"
+
+        results = list(parallel.intersect_with_planes_parallel(shape, planes, 2))
+
+        assert results == [("blob", f"section@{z}") for z in range(3)]
+        for call in mock_intersect.call_args_list:
+            assert call.args[0] is worker_shape
+            assert call.kwargs["index"] is mock_index.return_value
+        mock_index.assert_called_once_with(worker_shape)
+
+    @staticmethod
+    def test_none_shape_raises():
+        """Test that a missing shape is rejected."""
+        with pytest.raises(ValueError, match="Shape cannot be None"):
+            list(parallel.intersect_with_planes_parallel(None, [], 2))
+
+    @staticmethod
+    @patch("intersector.operations.parallel.log", MagicMock())
+    @patch("intersector.operations.parallel._PLANE_WINDOW", 2)
+    @patch("intersector.operations.parallel.ProcessPoolExecutor")
+    @patch("intersector.operations.parallel.shape_from_bytes", side_effect=str)
+    @patch("intersector.operations.parallel.shape_to_bytes", return_value=b"blob")
+    def test_planes_are_handed_over_a_window_at_a_time(
+        _mock_to_bytes, _mock_from_bytes, mock_pool
+    ):
+        """Test that a plane set is sliced rather than converted whole."""
+        pool = mock_pool.return_value.__enter__.return_value
+        pool.map.side_effect = lambda fn, items, chunksize: [
+            (point[2], 1, None) for point, _ in items
+        ]
+        planes = PlaneSet([((0, 0, z), (0, 0, 1)) for z in range(5)])
+
+        results = list(parallel.intersect_with_planes_parallel("shape", planes, 2))
+
+        assert results == ["0.0", "1.0", "2.0", "3.0", "4.0"]
+        windows = [call.args[1] for call in pool.map.call_args_list]
+        assert [len(window) for window in windows] == [2, 2, 1]
+        assert all(isinstance(window, PlaneSet) for window in windows)
+
+
+class _TupleIterator:
+    """Stand-in for TopoDS_Iterator over a compound faked as a tuple."""
+
+    def __init__(self, compound):
+        self._items = list(compound)
+
+    def More(self):  # noqa: N802
+        """Return whether children remain.
+
+        Returns:
+            bool: True while the iterator has a current child.
+
+        """
+        return bool(self._items)
+
+    def Value(self):  # noqa: N802
+        """Return the current child.
+
+        Returns:
+            object: The current child.
+
+        """
+        return self._items[0]
+
+    def Next(self):  # noqa: N802
+        """Advance to the next child."""
+        self._items.pop(0)
+
+
+class _TupleExplorer(_TupleIterator):
+    """Stand-in for TopExp_Explorer over a list of shapes."""
+
+    def Current(self):  # noqa: N802
+        """Return the current shape.
+
+        Returns:
+            object: The current shape.
+
+        """
+        return self.Value()
+
+
+class TestIntersectWithPlaneParallel:
+    """Tests for the intersect_with_plane_parallel function."""
+
+    @staticmethod
+    @patch("intersector.operations.parallel.log", MagicMock())
+    @patch("intersector.operations.parallel.ProcessPoolExecutor", _InlineExecutor)
+    @patch("intersector.operations.parallel.TopoDS_Iterator", _TupleIterator)
+    @patch("intersector.operations.parallel.shape_from_bytes", side_effect=tuple)
+    @patch("intersector.operations.parallel.shape_to_bytes", side_effect=tuple)
+    @patch("intersector.operations.parallel.combine_shapes", side_effect=tuple)
+    @patch("intersector.operations.parallel.BoxIndex")
+    @patch("intersector.operations.parallel.shape_parts")
+    @patch("intersector.operations.parallel.intersect_with_plane")
+    def test_crossed_solids_are_spread_and_merged(  # noqa: PLR0913, PLR0917
+        mock_intersect,
+        mock_parts,
+        mock_index,
+        _mock_combine,
+        _mock_to_bytes,
+        _mock_from_bytes,
+    ):
+        """Test that every crossed solid is sectioned exactly once."""
+        solids = [f"solid{i}" for i in range(10)]
+        mock_parts.return_value = [*solids, "far"]
+        mock_index.return_value.candidate_shapes.return_value = solids
+        mock_intersect.side_effect = lambda parts, p, n: tuple(
+            f"cut:{s}" for s in parts
+        )
+
+        result = parallel.intersect_with_plane_parallel(
+            "shape", (0, 0, 0), (0, 0, 1), workers=2
+        )
+
+        mock_index.assert_called_once_with([*solids, "far"])
+        # Two workers get four batches each, capped by the ten solids.
+        assert mock_intersect.call_count == 8  # noqa: PLR2004
+        sections = [edge for batch in result for edge in batch]
+        assert sorted(sections) == sorted(f"cut:{s}" for s in solids)
+
+    @staticmethod
+    @patch("intersector.operations.parallel.ProcessPoolExecutor")
+    @patch("intersector.operations.parallel.combine_shapes", side_effect=tuple)
+    @patch("intersector.operations.parallel.BoxIndex")
+    @patch("intersector.operations.parallel.shape_parts", return_value=["a", "b"])
+    @patch("intersector.operations.parallel.intersect_with_plane")
+    def test_single_crossed_solid_runs_in_process(
+        mock_intersect, _mock_parts, mock_index, _mock_combine, mock_pool
+    ):
+        """Test that no pool is started for fewer than two crossed parts."""
+        mock_index.return_value.candidate_shapes.return_value = ["a"]
+
+        result = parallel.intersect_with_plane_parallel(
+            "shape", (0, 0, 0), (0, 0, 1), workers=4
+        )
+
+        assert result is mock_intersect.return_value
+        mock_intersect.assert_called_once_with(("a",), (0, 0, 0), (0, 0, 1))
+        mock_pool.assert_not_called()
+
+
+class TestShapeParts:
+    """Tests for the shape_parts function."""
+
+    @staticmethod
+    @patch("intersector.operations.parallel.combine_shapes", side_effect=tuple)
+    def test_free_edges_and_vertices_form_one_part(_mock_combine):
+        """Test that the shapes outside any face are kept as their own part."""
+        found = {
+            (parallel.TopAbs_SOLID, None): ["solid"],
+            (parallel.TopAbs_FACE, parallel.TopAbs_SOLID): ["face"],
+            (parallel.TopAbs_EDGE, parallel.TopAbs_FACE): ["edge", "wire edge"],
+            (parallel.TopAbs_VERTEX, parallel.TopAbs_EDGE): ["vertex"],
+        }
+
+        def explorer(_shape, kind, avoid=None):
+            return _TupleExplorer(found[kind, avoid])
+
+        with patch.object(parallel, "TopExp_Explorer", side_effect=explorer):
+            parts = parallel.shape_parts("shape")
+
+        assert parts == ["solid", "face", ("edge", "wire edge", "vertex")]
+
+
+class TestMemoryBudget:
+    """Tests for the memory budget of the parallel intersections."""
+
+    @staticmethod
+    @patch("intersector.operations.parallel.log", MagicMock())
+    @patch("intersector.operations.parallel.ProcessPoolExecutor")
+    @patch("intersector.operations.parallel.count_faces", return_value=1)
+    @patch("intersector.operations.parallel.shape_to_bytes", return_value=b"blob")
+    def test_budget_caps_workers(_mock_to_bytes, _mock_faces, mock_pool):
+        """Test that only the workers whose shape fits in the budget start."""
+        footprint = parallel.estimate_footprint(len(b"blob"), 1)
+        scheduler = parallel.MemoryScheduler(2 * footprint, max_tasks_per_worker=3)
+        pool = mock_pool.return_value.__enter__.return_value
+        pool.map.return_value = []
+
+        planes = [((0, 0, z), (0, 0, 1)) for z in range(64)]
+        list(parallel.intersect_with_planes_parallel("shape", planes, 8, scheduler))
+
+        kwargs = mock_pool.call_args.kwargs
+        assert kwargs["max_workers"] == 2  # noqa: PLR2004
+        assert kwargs["max_tasks_per_child"] == 3  # noqa: PLR2004
+        # The chunks are sized for the two workers, not the eight requested.
+        assert pool.map.call_args.kwargs["chunksize"] == 8  # noqa: PLR2004
+
+    @staticmethod
+    @patch("intersector.operations.parallel.log", MagicMock())
+    @patch("intersector.operations.parallel.ProcessPoolExecutor")
+    @patch("intersector.operations.parallel.count_faces", return_value=1)
+    @patch("intersector.operations.parallel.shape_to_bytes", return_value=b"blob")
+    @patch("intersector.operations.parallel.combine_shapes", side_effect=tuple)
+    @patch("intersector.operations.parallel.BoxIndex")
+    @patch("intersector.operations.parallel.shape_parts")
+    def test_budget_sizes_part_batches(  # noqa: PLR0913, PLR0917
+        mock_parts, mock_index, _mock_combine, _mock_to_bytes, _mock_faces, mock_pool
+    ):
+        """Test that the part batches are sized for the workers that start."""
+        parts = [f"solid{i}" for i in range(20)]
+        mock_parts.return_value = parts
+        mock_index.return_value.candidate_shapes.return_value = parts
+        footprint = parallel.estimate_footprint(len(b"blob"), 1)
+        scheduler = parallel.MemoryScheduler(2 * footprint)
+        pool = mock_pool.return_value.__enter__.return_value
+        pool.map.return_value = []
+
+        parallel.intersect_with_plane_parallel(
+            "shape", (0, 0, 0), (0, 0, 1), 8, scheduler
+        )
+
+        assert mock_pool.call_args.kwargs["max_workers"] == 2  # noqa: PLR2004
+        # Four batches per started worker, not per requested one.
+        assert len(pool.map.call_args.args[1]) == 8  # noqa: PLR2004
@@ -39,3 +39,69 @@ class TestParsePlaneInput:
         setup_logging()  # Ensure logging is set up for the test
         with pytest.raises(ValueError, match="Plane format must be 'x,y,z:nx,ny,nz'"):
             parsing.parse_plane_input(plane_str)
+
+
+class TestParsePlanesFile:
+    """Unit tests for the parse_planes_file() function."""
+
+    @staticmethod
+    def test_parse_planes_file_skips_comments_and_blanks(tmp_path):
+        """Test that comments and blank lines are ignored."""
+        planes_file = tmp_path / "planes.txt"
+        planes_file.write_text("# header\n0,0,0:0,0,1\n\n  1,2,3:1,0,0  \n")
+
+        planes = parsing.parse_planes_file(str(planes_file))
+
+        assert planes == [
+            ((0.0, 0.0, 0.0), (0.0, 0.0, 1.0)),
+            ((1.0, 2.0, 3.0), (1.0, 0.0, 0.0)),
+        ]
+
+    @staticmethod
+    def test_parse_planes_file_reports_line_number(tmp_path):
+        """Test that an invalid line is reported with its line number."""
+        setup_logging()
+        planes_file = tmp_path / "planes.txt"
+        planes_file.write_text("0,0,0:0,0,1\n0,0:0,0,1\n")
+
+        with pytest.raises(ValueError, match="planes.txt:2"):
+            parsing.parse_planes_file(str(planes_file))
+
+
+class TestParseVectorInput:
+    """Unit tests for the parse_vector_input() function."""
+
+    @staticmethod
+    def test_parse_vector_input_valid():
+        """Test that a valid vector string is correctly parsed."""
+        assert parsing.parse_vector_input("1,-2,0.5") == (1.0, -2.0, 0.5)
+
+    @staticmethod
+    @pytest.mark.parametrize("vector_str", ["", "1,2", "1,2,3,4", "a,b,c"])
+    def test_parse_vector_input_invalid(vector_str):
+        """Test that invalid vector strings raise ValueError."""
+        setup_logging()
+        with pytest.raises(ValueError, match="Vector format must be 'x,y,z'"):
+            parsing.parse_vector_input(vector_str)
+
+
+class TestOutputFormatFromPath:
+    """Unit tests for the output_format_from_path() function."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("path", "fmt"),
+        [
+            ("out.stp", "step"),
+            ("out.STEP", "step"),
+            ("dir/sections.npz", "npz"),
+            ("a.json", "json"),
+            ("a.svg", "svg"),
+            ("a.dxf", "dxf"),
+            ("a.txt", None),
+            ("noext", None),
+        ],
+    )
+    def test_output_format_from_path(path, fmt):
+        """Test that formats are inferred from the file extension."""
+        assert parsing.output_format_from_path(path) == fmt
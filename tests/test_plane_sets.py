@@ -0,0 +1,164 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.utils.plane_sets."""
+
+import numpy as np
+import pytest
+
+from intersector.utils import plane_sets
+from intersector.utils.logger import setup_logging
+
+EXPECTED = np.array([[(0, 0, 0), (0, 0, 1)], [(1, 2, 3), (1, 0, 0)]], float)
+
+
+class TestLoadPlanes:
+    """Tests for the load_planes function."""
+
+    @staticmethod
+    def test_text_file(tmp_path):
+        """Test plane strings, with comments and blank lines."""
+        path = tmp_path / "planes.txt"
+        path.write_text("# header\n0,0,0:0,0,1\n\n  1,2,3:1,0,0  \n")
+
+        np.testing.assert_array_equal(plane_sets.load_planes(str(path)), EXPECTED)
+
+    @staticmethod
+    def test_text_file_colon_in_comment(tmp_path):
+        """Test that a ':' in a comment line is ignored."""
+        path = tmp_path / "planes.txt"
+        path.write_text("# point:normal\n0,0,0:0,0,1\n1,2,3:1,0,0\n")
+
+        np.testing.assert_array_equal(plane_sets.load_planes(str(path)), EXPECTED)
+
+    @staticmethod
+    def test_text_file_reports_line_number(tmp_path):
+        """Test that an invalid plane string is reported with its line."""
+        setup_logging()
+        path = tmp_path / "planes.txt"
+        path.write_text("0,0,0:0,0,1\n0,0:0,0,1\n")
+
+        with pytest.raises(ValueError, match="planes.txt:2"):
+            plane_sets.load_planes(str(path))
+
+    @staticmethod
+    def test_text_file_misplaced_colon(tmp_path):
+        """Test that fields cannot move across a misplaced ':'."""
+        setup_logging()
+        path = tmp_path / "planes.txt"
+        path.write_text("0,0,0:0,0,1\n0,0:0,0,1,5\n")
+
+        with pytest.raises(ValueError, match="planes.txt:2"):
+            plane_sets.load_planes(str(path))
+
+    @staticmethod
+    def test_csv_with_header(tmp_path):
+        """Test CSV rows after a header line."""
+        path = tmp_path / "planes.CSV"
+        path.write_text("px,py,pz,nx,ny,nz\n0,0,0,0,0,1\n1,2,3,1,0,0\n")
+
+        np.testing.assert_array_equal(plane_sets.load_planes(str(path)), EXPECTED)
+
+    @staticmethod
+    def test_csv_wrong_column_count(tmp_path):
+        """Test that a short CSV row is rejected."""
+        path = tmp_path / "planes.csv"
+        path.write_text("0,0,0,0,0,1\n1,2,3,1,0\n")
+
+        with pytest.raises(ValueError, match="planes.csv"):
+            plane_sets.load_planes(str(path))
+
+    @staticmethod
+    @pytest.mark.parametrize("shape", [(2, 2, 3), (2, 6)])
+    def test_npy(tmp_path, shape):
+        """Test NPY arrays in both accepted layouts."""
+        path = tmp_path / "planes.npy"
+        np.save(path, EXPECTED.reshape(shape))
+
+        np.testing.assert_array_equal(plane_sets.load_planes(str(path)), EXPECTED)
+
+    @staticmethod
+    def test_npy_wrong_shape(tmp_path):
+        """Test that an NPY array of another shape is rejected."""
+        path = tmp_path / "planes.npy"
+        np.save(path, np.zeros((4, 3)))
+
+        with pytest.raises(ValueError, match=r"\(N, 2, 3\)"):
+            plane_sets.load_planes(str(path))
+
+
+class TestValidatePlanes:
+    """Tests for the validate_planes function."""
+
+    @staticmethod
+    def test_normals_are_normalized():
+        """Test that normals become unit vectors and points are kept."""
+        planes = plane_sets.validate_planes([[(1, 2, 3), (0, 0, 5)]])
+
+        np.testing.assert_allclose(planes, [[(1, 2, 3), (0, 0, 1)]])
+
+    @staticmethod
+    def test_empty():
+        """Test that no plane gives an empty (0, 2, 3) array."""
+        assert plane_sets.validate_planes([]).shape == (0, 2, 3)
+
+    @staticmethod
+    def test_zero_normal():
+        """Test that a zero normal is reported with its index."""
+        planes = [[(0, 0, 0), (0, 0, 1)], [(0, 0, 1), (0, 0, 0)]]
+
+        with pytest.raises(ValueError, match="zero normal.*index 1"):
+            plane_sets.validate_planes(planes)
+
+    @staticmethod
+    def test_nan():
+        """Test that NaN values are reported with their index."""
+        planes = [[(np.nan, 0, 0), (0, 0, 1)]]
+
+        with pytest.raises(ValueError, match="NaN.*index 0"):
+            plane_sets.validate_planes(planes)
+
+
+class TestPlaneSet:
+    """Tests for the PlaneSet class."""
+
+    @staticmethod
+    def test_sequence_of_tuples(monkeypatch):
+        """Test that a PlaneSet behaves like a list of (point, normal) tuples."""
+        monkeypatch.setattr(plane_sets, "ITER_CHUNK", 1)
+        planes = plane_sets.PlaneSet(EXPECTED)
+
+        pairs = [((0.0, 0.0, 0.0), (0.0, 0.0, 1.0)), ((1.0, 2.0, 3.0), (1.0, 0.0, 0.0))]
+        assert len(planes) == len(pairs)
+        assert list(planes) == pairs
+        assert planes[-1] == pairs[-1]
+        assert list(planes[1:]) == pairs[1:]
+
+    @staticmethod
+    def test_from_pairs_validates():
+        """Test that from_pairs normalizes and checks the planes."""
+        planes = plane_sets.PlaneSet.from_pairs([((0, 0, 0), (2, 0, 0))])
+
+        assert planes[0] == ((0.0, 0.0, 0.0), (1.0, 0.0, 0.0))
+        with pytest.raises(ValueError, match="zero normal"):
+            plane_sets.PlaneSet.from_pairs([((0, 0, 0), (0, 0, 0))])
+
+
+class TestParsePlaneList:
+    """Tests for the parse_plane_list function."""
+
+    @staticmethod
+    def test_strings_and_pairs():
+        """Test that strings and pairs give normalized tuples."""
+        planes = plane_sets.parse_plane_list(["0,0,1:0,0,2", [(1, 2, 3), (4, 0, 0)]])
+
+        assert planes == [
+            ((0.0, 0.0, 1.0), (0.0, 0.0, 1.0)),
+            ((1.0, 2.0, 3.0), (1.0, 0.0, 0.0)),
+        ]
+
+    @staticmethod
+    @pytest.mark.parametrize("planes", [[], "0,0,0:0,0,1", [[(0, 0), (0, 0, 1)]]])
+    def test_invalid_input(planes):
+        """Test that empty, non-list and short inputs are rejected."""
+        with pytest.raises(ValueError, match="planes|Invalid plane"):
+            plane_sets.parse_plane_list(planes)
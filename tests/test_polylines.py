@@ -0,0 +1,97 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.utils.polylines."""
+
+import json
+
+import numpy as np
+import pytest
+
+from intersector.utils import polylines
+
+SQUARE = np.array([(0, 0, 5), (1, 0, 5), (1, 1, 5), (0, 1, 5), (0, 0, 5)], float)
+SEGMENT = np.array([(0, 0, 5), (2, 0, 5)], float)
+SECTIONS = [
+    ((0.0, 0.0, 5.0), (0.0, 0.0, 1.0), [SQUARE, SEGMENT]),
+    ((0.0, 0.0, 6.0), (0.0, 0.0, 1.0), []),
+]
+
+
+class TestPlaneFrame:
+    """Tests for the plane_frame function."""
+
+    @staticmethod
+    @pytest.mark.parametrize("normal", [(0, 0, 1), (1, 1, 0), (0.2, -3, 1)])
+    def test_frame_is_orthonormal(normal):
+        """Test that u, v and the normal form an orthonormal basis."""
+        u, v = polylines.plane_frame(normal)
+        n = np.asarray(normal, float) / np.linalg.norm(normal)
+
+        np.testing.assert_allclose(
+            np.array([u, v, n]) @ np.array([u, v, n]).T, np.eye(3), atol=1e-12
+        )
+
+
+class TestExportPolylines:
+    """Tests for the export_polylines function."""
+
+    @staticmethod
+    def test_npz_uses_contiguous_arrays(tmp_path):
+        """Test that the NPZ output stores points with offset tables."""
+        path = tmp_path / "out.npz"
+
+        assert polylines.export_polylines(SECTIONS, str(path), "npz")
+
+        with np.load(path) as data:
+            np.testing.assert_array_equal(data["points"], np.vstack([SQUARE, SEGMENT]))
+            np.testing.assert_array_equal(data["polyline_offsets"], [0, 5, 7])
+            np.testing.assert_array_equal(data["section_offsets"], [0, 2, 2])
+            assert data["planes"].shape == (2, 6)
+
+    @staticmethod
+    def test_json_round_trip(tmp_path):
+        """Test that the JSON output holds every section and polyline."""
+        path = tmp_path / "out.json"
+
+        assert polylines.export_polylines(SECTIONS, str(path), "json")
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert [len(s["polylines"]) for s in data["sections"]] == [2, 0]
+        assert data["sections"][0]["polylines"][1] == SEGMENT.tolist()
+
+    @staticmethod
+    def test_svg_has_one_polyline_per_edge(tmp_path):
+        """Test that the SVG output draws each polyline."""
+        path = tmp_path / "out.svg"
+
+        assert polylines.export_polylines(SECTIONS, str(path), "svg")
+
+        svg = path.read_text(encoding="utf-8")
+        assert svg.count("<polyline ") == 2  # noqa: PLR2004
+        assert 'id="section_002"' in svg
+
+    @staticmethod
+    def test_dxf_closes_closed_polylines(tmp_path):
+        """Test that closed loops become closed 3D polylines in DXF."""
+        path = tmp_path / "out.dxf"
+
+        assert polylines.export_polylines(SECTIONS, str(path), "dxf")
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        flags = [lines[i + 6] for i, line in enumerate(lines) if line == "POLYLINE"]
+        assert flags == ["9", "8"]
+        assert lines.count("VERTEX") == 4 + 2
+        assert lines[-1] == "EOF"
+
+    @staticmethod
+    def test_unwritable_path_returns_false(tmp_path):
+        """Test that a write failure is reported, not raised."""
+        path = tmp_path / "missing" / "out.json"
+
+        assert polylines.export_polylines(SECTIONS, str(path), "json") is False
+
+    @staticmethod
+    def test_unknown_format_raises():
+        """Test that an unsupported format is rejected."""
+        with pytest.raises(ValueError, match="Unsupported"):
+            polylines.export_polylines(SECTIONS, "out.obj", "obj")
@@ -0,0 +1,104 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.utils.profiling."""
+
+import json
+
+import pytest
+
+from intersector.utils import profiling
+
+
+@pytest.fixture(name="profiler")
+def fixture_profiler():
+    """Install a profiler for the duration of a test.
+
+    Yields:
+        Profiler: The installed profiler.
+
+    """
+    yield profiling.start()
+    profiling.stop()
+
+
+class TestPhase:
+    """Tests for the phase context manager."""
+
+    @staticmethod
+    def test_nothing_is_recorded_without_profiler():
+        """Test that phases are no-ops until profiling starts."""
+        profiling.stop()
+        with profiling.phase("idle"):
+            pass
+
+        profiler = profiling.start()
+        profiling.stop()
+        assert profiler.events == []
+
+    @staticmethod
+    def test_phases_are_recorded_even_on_error(profiler):
+        """Test that a failing phase is still recorded, nested ones first.
+
+        Raises:
+            RuntimeError: Inside the outer phase, on purpose.
+
+        """
+        with pytest.raises(RuntimeError):
+            with profiling.phase("outer"):
+                with profiling.phase("inner"):
+                    pass
+                raise RuntimeError("boom")
+
+        inner, outer = profiler.events
+        assert (inner["name"], outer["name"]) == ("inner", "outer")
+        assert outer["start_s"] <= inner["start_s"]
+        assert outer["wall_s"] >= inner["wall_s"] >= 0.0
+
+    @staticmethod
+    def test_phase_decorates_functions(profiler):
+        """Test that phase can wrap a function."""
+        calls = []
+
+        @profiling.phase("work")
+        def work():
+            calls.append(len(calls))
+
+        work()
+        work()
+        assert profiler.summary()["phases"]["work"]["count"] == len(calls)
+
+
+class TestProfiler:
+    """Tests for the Profiler class."""
+
+    @staticmethod
+    def test_summary_aggregates_by_name():
+        """Test that phases with the same name are summed."""
+        profiler = profiling.Profiler()
+        profiler.record("read", 0.0, 1.0, 0.5)
+        profiler.record("read", 1.0, 2.0, 1.5)
+        profiler.record("write", 3.0, 0.25, 0.25)
+
+        phases = profiler.summary()["phases"]
+
+        assert phases["read"]["count"] == 2  # noqa: PLR2004
+        assert phases["read"]["wall_s"] == pytest.approx(3.0)
+        assert phases["read"]["cpu_s"] == pytest.approx(2.0)
+        assert phases["write"]["count"] == 1
+
+    @staticmethod
+    def test_write_produces_chrome_trace(tmp_path):
+        """Test that complete events are written in microseconds."""
+        profiler = profiling.Profiler()
+        profiler.record("section.Build", 0.5, 0.25, 0.2)
+        summary_path, trace_path = tmp_path / "p.json", tmp_path / "p.trace.json"
+
+        profiler.write(str(summary_path), str(trace_path))
+
+        (event,) = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+        assert event["ph"] == "X"
+        assert event["name"] == "section.Build"
+        assert event["ts"] == pytest.approx(500_000)
+        assert event["dur"] == pytest.approx(250_000)
+        summary = json.loads(summary_path.read_text(encoding="utf-8"))
+        assert "section.Build" in summary["phases"]
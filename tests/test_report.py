@@ -0,0 +1,57 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.utils.report."""
+
+import csv
+import json
+
+import pytest
+
+from intersector.utils import report
+
+ROWS = [
+    dict.fromkeys(report.SUMMARY_FIELDS, 1.0) | {"valid": True, "loops": 2},
+    dict.fromkeys(report.SUMMARY_FIELDS) | {"valid": False, "loops": 0},
+]
+
+
+class TestExportSummary:
+    """Tests for the export_summary function."""
+
+    @staticmethod
+    def test_csv_has_one_row_per_section(tmp_path):
+        """Test that the CSV table has a header and one row per section."""
+        path = tmp_path / "summary.csv"
+
+        assert report.export_summary(ROWS, str(path))
+
+        with open(path, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert list(rows[0]) == report.SUMMARY_FIELDS
+        assert [(r["valid"], r["loops"], r["umin"]) for r in rows] == [
+            ("True", "2", "1.0"),
+            ("False", "0", ""),
+        ]
+
+    @staticmethod
+    def test_json_keeps_types(tmp_path):
+        """Test that the JSON table keeps numbers, booleans and nulls."""
+        path = tmp_path / "summary.JSON"
+
+        assert report.export_summary(ROWS, str(path))
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        assert data["fields"] == report.SUMMARY_FIELDS
+        assert data["sections"] == ROWS
+
+    @staticmethod
+    def test_unknown_extension_raises(tmp_path):
+        """Test that only .json and .csv summaries are accepted."""
+        with pytest.raises(ValueError, match="Unsupported summary file"):
+            report.export_summary(ROWS, str(tmp_path / "summary.txt"))
+
+    @staticmethod
+    def test_write_failure_returns_false(tmp_path):
+        """Test that an unwritable path is reported, not raised."""
+        assert not report.export_summary(ROWS, str(tmp_path / "missing" / "s.csv"))
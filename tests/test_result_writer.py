@@ -0,0 +1,105 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.utils.result_writer."""
+
+import threading
+
+import pytest
+
+from intersector.utils.result_writer import BackgroundWriter, numbered_path
+
+
+class TestNumberedPath:
+    """Tests for the numbered_path function."""
+
+    @staticmethod
+    def test_single_result_keeps_path():
+        """Test that a lone result is written to the path itself."""
+        assert numbered_path("out.stp", 1, 1) == "out.stp"
+
+    @staticmethod
+    def test_width_follows_total():
+        """Test zero padding to at least three digits."""
+        assert numbered_path("out.stp", 7, 12) == "out_007.stp"
+        assert numbered_path("out.stp", 7, 1200) == "out_0007.stp"
+
+
+class TestBackgroundWriter:
+    """Tests for the BackgroundWriter class."""
+
+    @staticmethod
+    def test_results_are_numbered_in_order():
+        """Test that several results go to numbered files, in order."""
+        written = []
+
+        with BackgroundWriter(
+            lambda r, p: written.append((r, p)) or True, "o.npz", 3
+        ) as w:
+            for result in "abc":
+                w.put(result)
+
+        assert written == [("a", "o_001.npz"), ("b", "o_002.npz"), ("c", "o_003.npz")]
+        assert w.paths == ["o_001.npz", "o_002.npz", "o_003.npz"]
+        assert w.count == 3  # noqa: PLR2004
+
+    @staticmethod
+    def test_single_result_is_not_numbered():
+        """Test that a lone result is written to the output path."""
+        writer = BackgroundWriter(lambda r, p: True, "o.stp", 10)
+        writer.put("a")
+
+        assert writer.close() == ["o.stp"]
+
+    @staticmethod
+    def test_put_blocks_when_queue_is_full():
+        """Test backpressure: put waits while max_pending results are queued."""
+        release = threading.Event()
+        writer = BackgroundWriter(lambda r, p: release.wait(5), "o.stp", max_pending=1)
+        writer.put("a")  # held back until a second result arrives
+        writer.put("b")  # a is picked up and blocks on release; b fills the queue
+
+        blocked = threading.Thread(target=writer.put, args=("c",))
+        blocked.start()
+        blocked.join(0.2)
+        assert blocked.is_alive()
+
+        release.set()
+        blocked.join(5)
+        assert not blocked.is_alive()
+        assert len(writer.close()) == 3  # noqa: PLR2004
+
+    @staticmethod
+    def test_failed_write_drops_the_rest():
+        """Test that results after a failed write are not written."""
+        calls = []
+
+        def write(result, path):
+            calls.append(path)
+            return result != "b"
+
+        writer = BackgroundWriter(write, "o.stp")
+        for result in "abc":
+            writer.put(result)
+
+        assert writer.close() == ["o_001.stp"]
+        assert writer.failed == ["o_002.stp"]
+        assert calls == ["o_001.stp", "o_002.stp"]
+
+    @staticmethod
+    def test_write_exception_is_reraised():
+        """Test that an exception in the writer thread reaches close()."""
+
+        def write(result, path):
+            raise RuntimeError("disk on fire")
+
+        writer = BackgroundWriter(write, "o.stp")
+        writer.put("a")
+
+        with pytest.raises(RuntimeError, match="disk on fire"):
+            writer.close()
+
+    @staticmethod
+    def test_max_pending_must_be_positive():
+        """Test that an empty queue bound is rejected."""
+        with pytest.raises(ValueError, match="max_pending"):
+            BackgroundWriter(lambda r, p: True, "o.stp", max_pending=0)
@@ -0,0 +1,141 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.utils.scheduler."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from intersector.utils import scheduler
+from intersector.utils.scheduler import (
+    BYTES_PER_FACE,
+    BYTES_PER_FILE_BYTE,
+    MemoryScheduler,
+    count_step_faces,
+    estimate_footprint,
+    step_footprint,
+)
+
+STEP_TEXT = (
+    "ISO-10303-21;\nDATA;\n"
+    "#1=ADVANCED_FACE('',(#2),#3,.T.);\n"
+    "#4=advanced_face('',(#5),#6,.F.);\n"
+    "#7=FACE_SURFACE('',(#8),#9,.T.);\n"
+    "#10=ADVANCED_BREP_SHAPE_REPRESENTATION('',(#11),#12);\n"
+    "ENDSEC;\nEND-ISO-10303-21;\n"
+)
+
+
+class TestFootprint:
+    """Tests for the footprint estimates."""
+
+    @staticmethod
+    def test_count_step_faces(tmp_path):
+        """Test that face entities are counted in any case."""
+        path = tmp_path / "part.stp"
+        path.write_text(STEP_TEXT)
+
+        assert count_step_faces(str(path)) == 3  # noqa: PLR2004
+
+    @staticmethod
+    def test_count_step_faces_across_chunks(tmp_path):
+        """Test that entity names split between reads are counted once."""
+        path = tmp_path / "part.stp"
+        path.write_text(STEP_TEXT * 5)
+
+        with patch.object(scheduler, "_READ_CHUNK", 7):
+            assert count_step_faces(str(path)) == 15  # noqa: PLR2004
+
+    @staticmethod
+    def test_step_footprint(tmp_path):
+        """Test that the estimate combines the file size and face count."""
+        path = tmp_path / "part.stp"
+        path.write_bytes(STEP_TEXT.encode())
+
+        assert step_footprint(str(path)) == estimate_footprint(len(STEP_TEXT), 3)
+        assert estimate_footprint(10, 2) == (
+            10 * BYTES_PER_FILE_BYTE + 2 * BYTES_PER_FACE
+        )
+
+
+class TestMemoryScheduler:
+    """Tests for the MemoryScheduler class."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"budget": -1}, {"workers": 0}, {"max_tasks_per_worker": 0}],
+    )
+    def test_invalid_settings_raise(kwargs):
+        """Test that negative budgets and non-positive counts are rejected."""
+        with pytest.raises(ValueError, match="cannot be negative|must be positive"):
+            MemoryScheduler(**kwargs)
+
+    @staticmethod
+    def test_workers_for_caps_to_budget():
+        """Test that workers are capped to the jobs fitting in the budget."""
+        assert MemoryScheduler(100, workers=8).workers_for(30) == 3  # noqa: PLR2004
+        assert MemoryScheduler(100, workers=2).workers_for(30) == 2  # noqa: PLR2004
+        assert MemoryScheduler(100).workers_for(500, 4) == 1
+        assert MemoryScheduler(workers=8).workers_for(500) == 8  # noqa: PLR2004
+
+    @staticmethod
+    def test_pool_options_recycle_workers():
+        """Test that a task limit recycles spawned workers."""
+        assert not MemoryScheduler().pool_options()
+
+        options = MemoryScheduler(max_tasks_per_worker=5).pool_options()
+
+        assert options["max_tasks_per_child"] == 5  # noqa: PLR2004
+        assert options["mp_context"].get_start_method() == "spawn"
+
+    @staticmethod
+    def test_map_keeps_order_and_records_peak_rss():
+        """Test that results come back in job order with the worker peaks."""
+        with (
+            ThreadPoolExecutor(4) as pool,
+            patch.object(scheduler, "peak_rss", return_value=123),
+        ):
+            jobs = MemoryScheduler(executor=pool)
+            results = list(jobs.map(str.upper, [("a",), ("b",), ("c",)], [1, 1, 1]))
+
+        assert results == ["A", "B", "C"]
+        assert set(jobs.peak_rss.values()) == {123}
+
+    @staticmethod
+    def test_map_admits_jobs_within_budget():
+        """Test that a job waits until the jobs in flight leave it room."""
+        release = threading.Event()
+        started = {}
+
+        def job(name):
+            started[name] = release.is_set()
+            if name != "c":
+                assert release.wait(5)
+            return name
+
+        timer = threading.Timer(0.2, release.set)
+        with ThreadPoolExecutor(4) as pool:
+            jobs = MemoryScheduler(100, executor=pool)
+            timer.start()
+            results = list(jobs.map(job, [("a",), ("b",), ("c",)], [60, 30, 20]))
+        timer.join()
+
+        assert results == ["a", "b", "c"]
+        # "a" and "b" fit together; "c" only starts once one of them is done.
+        assert started == {"a": False, "b": False, "c": True}
+
+    @staticmethod
+    def test_oversize_job_runs_alone():
+        """Test that a job over the whole budget still runs, with a warning."""
+        with (
+            ThreadPoolExecutor(2) as pool,
+            patch.object(scheduler, "log") as mock_log,
+        ):
+            jobs = MemoryScheduler(10, executor=pool)
+            results = list(jobs.map(str.upper, [("a",), ("b",)], [50, 5]))
+
+        assert results == ["A", "B"]
+        mock_log.warning.assert_called_once()
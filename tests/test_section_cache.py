@@ -0,0 +1,151 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.utils.section_cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from intersector.utils import section_cache, step_cache
+
+
+@pytest.fixture(name="fake_bintools")
+def fixture_fake_bintools():
+    """Replace BinTools with a fake writing the shape name to the file.
+
+    Yields:
+        MagicMock: The patched bintools module.
+
+    """
+
+    def fake_write(shape, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(shape)
+
+    with (
+        patch.object(step_cache, "bintools") as mock_bintools,
+        patch.object(step_cache, "TopoDS_Shape") as mock_shape_class,
+    ):
+        mock_bintools.Write.side_effect = fake_write
+        mock_shape_class.return_value.IsNull.return_value = False
+        yield mock_bintools
+
+
+class Recorder:
+    """Compute callable recording the planes it is asked to section."""
+
+    def __init__(self):
+        """Start without any call."""
+        self.calls = []
+
+    def __call__(self, planes):
+        """Record the planes and return one named result per plane.
+
+        Returns:
+            list[str]: A result name per plane.
+
+        """
+        self.calls.append(list(planes))
+        return [f"section{len(self.calls)}_{i}" for i in range(len(planes))]
+
+
+class TestSectionCache:
+    """Tests for the SectionCache class."""
+
+    @staticmethod
+    def test_key_depends_on_shape_plane_and_settings(tmp_path):
+        """Test that only the shape, canonical plane and settings matter."""
+        cache = section_cache.SectionCache(str(tmp_path))
+        key = cache.key("shape", (0, 0, 3), (0, 0, 1))
+
+        assert cache.key("shape", (5, 5, 3), (0, 0, -2)) == key
+        assert cache.key("other", (0, 0, 3), (0, 0, 1)) != key
+        assert cache.key("shape", (0, 0, 4), (0, 0, 1)) != key
+        assert cache.key("shape", (0, 0, 3), (0, 0, 1), "engine:v2") != key
+
+    @staticmethod
+    def test_key_depends_on_section_path(tmp_path):
+        """Test that sections spread over solids are not served for others."""
+        cache = section_cache.SectionCache(str(tmp_path))
+        plane = ("shape", (0, 0, 3), (0, 0, 1))
+        solids = section_cache.section_settings("brep", "solids")
+
+        assert cache.key(*plane, section_cache.section_settings()) == cache.key(*plane)
+        assert cache.key(*plane, solids) != cache.key(*plane)
+        with pytest.raises(ValueError, match="Unknown section path"):
+            section_cache.section_settings("brep", "faces")
+
+    @staticmethod
+    @pytest.mark.usefixtures("fake_bintools")
+    def test_second_run_only_reads(tmp_path):
+        """Test that a repeated run computes nothing and counts hits."""
+        cache = section_cache.SectionCache(str(tmp_path))
+        planes = [((0, 0, 1), (0, 0, 1)), ((0, 0, 2), (0, 0, 1))]
+        compute = Recorder()
+
+        first = list(cache.sections("shape", planes, compute))
+        second = list(cache.sections("shape", planes[::-1], compute))
+
+        assert first == ["section1_0", "section1_1"]
+        assert len(second) == len(planes)
+        assert compute.calls == [planes, []]
+        stats = cache.stats()
+        assert (stats["entries"], stats["hits"], stats["misses"]) == (2, 2, 2)
+
+    @staticmethod
+    @pytest.mark.usefixtures("fake_bintools")
+    def test_only_missing_planes_are_computed_once(tmp_path):
+        """Test that equivalent planes in one batch share a computation."""
+        cache = section_cache.SectionCache(str(tmp_path))
+        list(cache.sections("shape", [((0, 0, 1), (0, 0, 1))], Recorder()))
+        planes = [
+            ((0, 0, 1), (0, 0, 1)),
+            ((0, 0, 2), (0, 0, 1)),
+            ((4, 4, 2), (0, 0, -1)),
+        ]
+        compute = Recorder()
+
+        results = list(cache.sections("shape", planes, compute))
+
+        assert compute.calls == [[planes[1]]]
+        assert len(results) == len(planes)
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (2, 2)
+
+    @staticmethod
+    @patch.object(step_cache, "log")
+    def test_unreadable_entry_is_recomputed(_mock_log, fake_bintools, tmp_path):
+        """Test that a corrupt entry counts as a miss and is stored again."""
+        cache = section_cache.SectionCache(str(tmp_path))
+        planes = [((0, 0, 1), (0, 0, 1))]
+        list(cache.sections("shape", planes, Recorder()))
+        fake_bintools.Read.side_effect = RuntimeError("corrupt")
+        compute = Recorder()
+
+        results = list(cache.sections("shape", planes, compute))
+
+        assert results == ["section2_0"]
+        assert compute.calls == [[], planes]
+        stats = cache.stats()
+        assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 0, 2)
+
+    @staticmethod
+    @pytest.mark.usefixtures("fake_bintools")
+    def test_eviction_keeps_the_cap(tmp_path):
+        """Test that entries beyond the size cap are evicted after the batch."""
+        cache = section_cache.SectionCache(str(tmp_path), max_bytes=12)
+        planes = [((0, 0, z), (0, 0, 1)) for z in range(3)]
+
+        list(cache.sections("shape", planes, Recorder()))
+
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["bytes"] <= 12  # noqa: PLR2004
+
+    @staticmethod
+    def test_invalid_tolerance(tmp_path):
+        """Test that a tolerance outside (0, 1) is rejected."""
+        with pytest.raises(ValueError, match="Tolerance"):
+            section_cache.SectionCache(str(tmp_path), tolerance=-1)
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            section_cache.SectionCache(str(tmp_path), tolerance=2)
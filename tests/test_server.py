@@ -0,0 +1,227 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.server."""
+
+import asyncio
+import base64
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from intersector import server
+
+
+@pytest.fixture(name="srv")
+def fixture_srv():
+    """Create a server running its jobs on a thread pool.
+
+    Yields:
+        IntersectionServer: The server, closed after the test.
+
+    """
+    instance = server.IntersectionServer(executor=ThreadPoolExecutor(2))
+    yield instance
+    instance.close()
+
+
+def _load(srv, path="part.stp", shape_id=None):
+    with (
+        patch.object(server, "read_step") as mock_read,
+        patch.object(server, "shape_to_bytes") as mock_to_bytes,
+        patch.object(server, "log", MagicMock()),
+    ):
+        mock_read.return_value = MagicMock(name="shape")
+        mock_to_bytes.return_value = b"brep"
+        request = {"op": "load", "path": path}
+        if shape_id:
+            request["id"] = shape_id
+        return asyncio.run(srv.handle(request))
+
+
+class TestIntersectionServer:
+    """Tests for the IntersectionServer class."""
+
+    @staticmethod
+    def test_load_registers_shape_under_file_stem(srv):
+        """Test that a loaded shape is listed under its file stem."""
+        assert _load(srv, "models/part.stp") == {"ok": True, "id": "part"}
+        assert asyncio.run(srv.handle({"op": "list"})) == {
+            "ok": True,
+            "shapes": ["part"],
+        }
+        assert os.path.exists(srv.shapes["part"]["brep"])
+
+    @staticmethod
+    def test_reload_replaces_resident_file(srv):
+        """Test that loading an id again drops the previous BRep file."""
+        _load(srv, shape_id="a")
+        first = srv.shapes["a"]["brep"]
+        _load(srv, shape_id="a")
+
+        assert not os.path.exists(first)
+        assert os.path.exists(srv.shapes["a"]["brep"])
+
+    @staticmethod
+    @patch.object(server, "section_job")
+    def test_section_returns_text_formats_inline(mock_job, srv):
+        """Test that JSON results are returned as text."""
+        _load(srv)
+        mock_job.return_value = [b'{"sections": []}']
+
+        response = asyncio.run(
+            srv.handle({"op": "section", "id": "part", "planes": ["0,0,1:0,0,1"]})
+        )
+
+        assert response == {"ok": True, "format": "json", "text": '{"sections": []}'}
+        args = mock_job.call_args.args
+        assert args[1:] == ([((0, 0, 1), (0, 0, 1))], "brep", "json", 0.01, True)
+
+    @staticmethod
+    @patch.object(server, "section_job")
+    def test_section_returns_binary_formats_per_plane(mock_job, srv):
+        """Test that NPZ results are base64-encoded, one per plane."""
+        _load(srv)
+        mock_job.return_value = [b"\x00one", b"\x00two"]
+
+        response = asyncio.run(
+            srv.handle(
+                {
+                    "op": "section",
+                    "id": "part",
+                    "planes": [[[0, 0, 0], [0, 0, 1]], [[0, 0, 1], [0, 0, 1]]],
+                    "format": "npz",
+                    "combine": False,
+                }
+            )
+        )
+
+        assert [base64.b64decode(r["data"]) for r in response["results"]] == [
+            b"\x00one",
+            b"\x00two",
+        ]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("request_", "error"),
+        [
+            ({"op": "section", "id": "missing", "planes": ["0,0,0:0,0,1"]}, "id"),
+            ({"op": "section", "id": "part", "planes": []}, "non-empty"),
+            ({"op": "section", "id": "part", "planes": [[1, 2]]}, "Invalid plane"),
+            ({"op": "section", "id": "part", "planes": ["0,0,0:0,0,0"]}, "zero normal"),
+            (
+                {
+                    "op": "section",
+                    "id": "part",
+                    "planes": ["0,0,0:0,0,1"],
+                    "format": "x",
+                },
+                "format",
+            ),
+            (
+                {
+                    "op": "section",
+                    "id": "part",
+                    "planes": ["0,0,0:0,0,1"],
+                    "engine": "mesh",
+                    "format": "step",
+                },
+                "polyline",
+            ),
+            ({"op": "explode"}, "Unknown op"),
+            ({"op": ["section"]}, "Unknown op"),
+            ({"op": "section", "id": ["a"], "planes": ["0,0,0:0,0,1"]}, "'id'"),
+            ({"op": "unload", "id": {"a": 1}}, "'id'"),
+            ({"op": "load", "path": "part.stp", "id": [1]}, "'id'"),
+            (
+                {"op": "section", "id": "part", "planes": ["0,0,0:0,0,1"]}
+                | {"format": ["json"]},
+                "'format'",
+            ),
+            (
+                {"op": "section", "id": "part", "planes": ["0,0,0:0,0,1"]}
+                | {"deflection": [0.1]},
+                "'deflection'",
+            ),
+            (["not", "an", "object"], "not a JSON object"),
+        ],
+    )
+    def test_invalid_requests_return_errors(srv, request_, error):
+        """Test that invalid requests are answered with an error."""
+        _load(srv)
+
+        response = asyncio.run(srv.handle(request_))
+
+        assert response["ok"] is False
+        assert error in response["error"]
+
+    @staticmethod
+    def test_unreadable_step_file_returns_error(srv):
+        """Test that a failed load leaves the registry unchanged."""
+        with patch.object(server, "read_step", return_value=None):
+            response = asyncio.run(srv.handle({"op": "load", "path": "bad.stp"}))
+
+        assert response["ok"] is False
+        assert srv.shapes == {}
+
+    @staticmethod
+    def test_unix_socket_round_trip(srv, tmp_path):
+        """Test that requests and responses are exchanged as JSON lines."""
+        socket_path = str(tmp_path / "s.sock")
+
+        async def exchange():
+            listener = await srv.start(socket_path)
+            async with listener:
+                reader, writer = await asyncio.open_unix_connection(socket_path)
+                writer.write(b'{"op": "ping"}\nnot json\n')
+                await writer.drain()
+                replies = [json.loads(await reader.readline()) for _ in range(2)]
+                writer.close()
+                await writer.wait_closed()
+            return replies
+
+        ping, invalid = asyncio.run(exchange())
+
+        assert ping == {"ok": True}
+        assert invalid["ok"] is False
+        assert "Invalid request" in invalid["error"]
+
+
+class TestSectionJob:
+    """Tests for the section_job worker function."""
+
+    @staticmethod
+    @patch.object(server, "_write_output", side_effect=lambda s, *_: repr(s).encode())
+    @patch.object(server, "_brep_sections")
+    def test_empty_planes_get_empty_outputs(mock_sections, _mock_write):
+        """Test that uncombined results keep one output per plane."""
+        planes = [((0, 0, 0), (0, 0, 1)), ((0, 0, 9), (0, 0, 1))]
+        mock_sections.return_value = [((0, 0, 0), (0, 0, 1), "cut")]
+
+        outputs = server.section_job("s.brep", planes, "brep", "json", 0.01, False)
+
+        assert outputs == [
+            repr([((0, 0, 0), (0, 0, 1), "cut")]).encode(),
+            b"[]",
+        ]
+
+    @staticmethod
+    @patch.object(server, "_write_output", return_value=b"")
+    @patch.object(server, "_brep_sections", return_value=[])
+    def test_unloaded_shapes_are_evicted(_mock_sections, _mock_write, tmp_path):
+        """Test that a job drops the worker entries of removed BRep files."""
+        live = tmp_path / "live.brep"
+        live.write_bytes(b"brep")
+        gone = str(tmp_path / "gone.brep")
+        with (
+            patch.dict(server._worker_shapes, {str(live): "a", gone: "b"}),
+            patch.dict(server._worker_sessions, {gone: "session"}),
+            patch.dict(server._worker_meshes, {(gone, 0.01): "mesh"}),
+        ):
+            server.section_job(str(live), [], "brep", "json", 0.01, True)
+
+            assert server._worker_shapes == {str(live): "a"}
+            assert not server._worker_sessions
+            assert not server._worker_meshes
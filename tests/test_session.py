@@ -0,0 +1,145 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.operations.session."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from intersector.operations import session
+from intersector.operations.face_index import FaceIndex
+
+
+def _index(count, seed=0):
+    """Build a face index over random boxes without OpenCascade.
+
+    Returns:
+        FaceIndex: An index whose faces are the numbers ``0..count-1``.
+
+    """
+    rng = np.random.default_rng(seed)
+    index = FaceIndex.__new__(FaceIndex)
+    index.shapes = list(range(count))
+    index.centers = rng.uniform(0.0, 10.0, (count, 3))
+    index.half_sizes = rng.uniform(0.0, 2.0, (count, 3))
+    index.half_sizes[::7] = 0.0  # flat faces, e.g. planar caps
+    index._lower = (index.centers - index.half_sizes).min(axis=0)  # noqa: SLF001
+    index._upper = (index.centers + index.half_sizes).max(axis=0)  # noqa: SLF001
+    return index
+
+
+@pytest.fixture(name="mocks")
+def fixture_mocks():
+    """Replace the section boolean and compound builder.
+
+    Yields:
+        tuple[MagicMock, MagicMock]: The ``intersect_with_plane`` and
+            ``combine_shapes`` mocks.
+
+    """
+    with (
+        patch.object(session, "intersect_with_plane") as mock_intersect,
+        patch.object(session, "combine_shapes", side_effect=list) as mock_combine,
+    ):
+        yield mock_intersect, mock_combine
+
+
+class TestSectionSession:
+    """Tests for the SectionSession class."""
+
+    @staticmethod
+    def test_dragged_plane_matches_a_full_scan(mocks):  # noqa: ARG004
+        """Test that incremental updates cross the same faces as a full scan."""
+        index = _index(200)
+        section_session = session.SectionSession(MagicMock(), index=index)
+        rng = np.random.default_rng(1)
+        offsets = np.concatenate(
+            [np.linspace(-1, 12, 40), np.linspace(12, 3, 25), rng.uniform(-1, 12, 30)]
+        )
+        offsets = np.append(offsets, index.extents((0, 0, 1))[0][:5])
+
+        for offset in offsets:
+            section_session.section((0.0, 0.0, offset), (0, 0, 2))
+
+            expected = index.candidate_faces((0.0, 0.0, offset), (0, 0, 1))
+            assert section_session.crossed_faces() == expected
+
+    @staticmethod
+    def test_small_moves_only_update_nearby_faces(mocks):  # noqa: ARG004
+        """Test that a small step visits far fewer faces than the index holds."""
+        index = _index(500)
+        section_session = session.SectionSession(MagicMock(), index=index)
+
+        section_session.section((0, 0, 5.0), (0, 0, 1))
+        assert section_session.changed == len(index)
+        section_session.section((0, 0, 5.5), (0, 0, 1))
+
+        assert 0 < section_session.changed < len(index) // 10
+
+    @staticmethod
+    def test_only_crossed_faces_are_sectioned(mocks):
+        """Test that the boolean only receives the crossed faces."""
+        mock_intersect, _ = mocks
+        index = _index(50)
+        section_session = session.SectionSession(MagicMock(), index=index)
+
+        result = section_session.section((0, 0, 5.0), (0, 0, 1))
+
+        assert result is mock_intersect.return_value
+        (faces, point, normal), _ = mock_intersect.call_args
+        assert faces == index.candidate_faces((0, 0, 5.0), (0, 0, 1))
+        assert (point, normal) == ((0, 0, 5.0), (0.0, 0.0, 1.0))
+
+    @staticmethod
+    def test_revisited_positions_are_cached(mocks):
+        """Test that going back to a position reuses its result."""
+        mock_intersect, _ = mocks
+        mock_intersect.side_effect = lambda *_: object()
+        section_session = session.SectionSession(
+            MagicMock(), index=_index(50), max_cached=2
+        )
+
+        first = section_session.section((0, 0, 4.0), (0, 0, 1))
+        section_session.section((0, 0, 5.0), (0, 0, 1))
+
+        assert section_session.section((0, 0, 4.0), (0, 0, 1)) is first
+        assert mock_intersect.call_count == 2  # noqa: PLR2004
+
+        section_session.section((0, 0, 6.0), (0, 0, 1))
+        section_session.section((0, 0, 5.0), (0, 0, 1))
+        assert mock_intersect.call_count == 4  # noqa: PLR2004
+
+    @staticmethod
+    def test_new_normal_prepares_again(mocks):  # noqa: ARG004
+        """Test that changing the plane direction re-projects the faces."""
+        index = _index(100)
+        section_session = session.SectionSession(MagicMock(), index=index)
+
+        section_session.section((0, 0, 5.0), (0, 0, 1))
+        section_session.section((5.0, 0, 0), (1, 0, 0))
+
+        assert section_session.crossed_faces() == index.candidate_faces(
+            (5.0, 0, 0), (1, 0, 0)
+        )
+        assert section_session.changed == len(index)
+
+    @staticmethod
+    def test_plane_missing_every_face(mocks):
+        """Test that a plane outside the shape skips the boolean."""
+        mock_intersect, mock_combine = mocks
+        section_session = session.SectionSession(MagicMock(), index=_index(20))
+
+        assert section_session.section((0, 0, 100.0), (0, 0, 1)) == []
+        mock_intersect.assert_not_called()
+        mock_combine.assert_called_once_with([])
+
+    @staticmethod
+    def test_invalid_arguments_raise():
+        """Test that a missing shape or a zero normal is rejected."""
+        with pytest.raises(ValueError, match="Shape cannot be None"):
+            session.SectionSession(None)
+
+        section_session = session.SectionSession(MagicMock(), index=_index(5))
+        with pytest.raises(ValueError, match="zero vector"):
+            section_session.section((0, 0, 0), (0, 0, 0))
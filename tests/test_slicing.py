@@ -0,0 +1,81 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.operations.slicing."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from intersector.operations import slicing
+
+
+class TestLayerOffsets:
+    """Tests for the layer_offsets function."""
+
+    @staticmethod
+    def test_planes_sit_in_the_middle_of_each_layer():
+        """Test offsets are centered in layers covering the range."""
+        assert slicing.layer_offsets(0.0, 1.0, 0.25) == [0.125, 0.375, 0.625, 0.875]
+
+    @staticmethod
+    def test_thin_range_yields_one_plane():
+        """Test that a range thinner than half a step still gets one plane."""
+        assert slicing.layer_offsets(0.0, 0.1, 1.0) == [0.05]
+
+    @staticmethod
+    def test_no_plane_on_the_range_end():
+        """Test that a partial top layer gets a plane in its middle."""
+        assert slicing.layer_offsets(0.0, 10.0, 4.0) == [2.0, 6.0, 9.0]
+
+    @staticmethod
+    def test_thin_top_layer_is_kept():
+        """Test that a top layer thinner than half a step is still cut."""
+        assert slicing.layer_offsets(0.0, 4.5, 2.0) == [1.0, 3.0, 4.25]
+
+    @staticmethod
+    def test_non_positive_step_raises():
+        """Test that a zero step is rejected."""
+        with pytest.raises(ValueError, match="step must be positive"):
+            slicing.layer_offsets(0.0, 1.0, 0.0)
+
+
+class TestSliceShape:
+    """Tests for the slice_shape function."""
+
+    @staticmethod
+    @patch("intersector.operations.slicing.log", MagicMock())
+    @patch("intersector.operations.slicing.combine_shapes", side_effect=list)
+    @patch("intersector.operations.slicing.intersect_with_plane")
+    @patch("intersector.operations.slicing.FaceIndex")
+    def test_each_plane_only_sees_faces_it_spans(
+        mock_index_class, mock_intersect, _mock_combine
+    ):
+        """Test that the sweep hands each plane only the faces it crosses."""
+        index = mock_index_class.return_value
+        index.faces = ["high", "all", "low"]
+        index.__len__.return_value = len(index.faces)
+        index.extents.return_value = (
+            np.array([1.8, 0.0, 0.0]),
+            np.array([3.0, 3.0, 1.2]),
+        )
+        mock_intersect.side_effect = lambda faces, p, n: sorted(faces)
+
+        layers = list(slicing.slice_shape(MagicMock(), (0, 0, 2), 1.0))
+
+        assert [point for point, _, _ in layers] == [
+            (0.0, 0.0, 0.5),
+            (0.0, 0.0, 1.5),
+            (0.0, 0.0, 2.5),
+        ]
+        assert [result for _, _, result in layers] == [
+            ["all", "low"],
+            ["all"],
+            ["all", "high"],
+        ]
+
+    @staticmethod
+    def test_zero_direction_raises():
+        """Test that a zero slicing direction is rejected."""
+        with pytest.raises(ValueError, match="zero vector"):
+            list(slicing.slice_shape(MagicMock(), (0, 0, 0), 1.0))
@@ -0,0 +1,165 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.utils.step_cache."""
+
+import contextlib
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from intersector.utils import step_cache
+
+
+@pytest.fixture(name="fake_bintools")
+def fixture_fake_bintools():
+    """Replace BinTools with a fake writing the shape name to the file.
+
+    Yields:
+        MagicMock: The patched bintools module.
+
+    """
+
+    def fake_write(shape, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(shape)
+
+    with (
+        patch.object(step_cache, "bintools") as mock_bintools,
+        patch.object(step_cache, "TopoDS_Shape") as mock_shape_class,
+    ):
+        mock_bintools.Write.side_effect = fake_write
+        mock_shape_class.return_value.IsNull.return_value = False
+        yield mock_bintools
+
+
+def _step_file(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+class TestStepCache:
+    """Tests for the StepCache class."""
+
+    @staticmethod
+    def test_key_depends_on_content_only(tmp_path):
+        """Test that files with the same content share a key."""
+        cache = step_cache.StepCache(str(tmp_path / "cache"))
+        a = _step_file(tmp_path, "a.stp", "SOLID")
+        b = _step_file(tmp_path, "b.stp", "SOLID")
+        c = _step_file(tmp_path, "c.stp", "OTHER")
+
+        assert cache.key(a) == cache.key(b)
+        assert cache.key(a) != cache.key(c)
+
+    @staticmethod
+    @pytest.mark.usefixtures("fake_bintools")
+    def test_miss_then_hit(tmp_path):
+        """Test that a stored shape is found again and counted."""
+        cache = step_cache.StepCache(str(tmp_path / "cache"))
+        key = cache.key(_step_file(tmp_path, "a.stp", "SOLID"))
+
+        assert cache.load(key) is None
+        assert cache.store(key, "shape") is True
+        assert cache.load(key) is not None
+
+        stats = cache.stats()
+        assert (stats["entries"], stats["hits"], stats["misses"]) == (1, 1, 1)
+
+    @staticmethod
+    @patch.object(step_cache, "log", MagicMock())
+    def test_unreadable_entry_is_removed(fake_bintools, tmp_path):
+        """Test that a corrupt entry is dropped and counted as a miss."""
+        cache = step_cache.StepCache(str(tmp_path / "cache"))
+        cache.store("key", "shape")
+        fake_bintools.Read.side_effect = RuntimeError("corrupt")
+
+        assert cache.load("key") is None
+        assert "key" not in cache
+        assert (cache.stats()["hits"], cache.stats()["misses"]) == (0, 1)
+
+    @staticmethod
+    @pytest.mark.usefixtures("fake_bintools")
+    def test_least_recently_used_entry_is_evicted(tmp_path):
+        """Test that eviction keeps the cache under its cap, oldest first."""
+        cache = step_cache.StepCache(str(tmp_path / "cache"), max_bytes=10)
+        cache.store("old", "12345")
+        cache.store("used", "12345")
+        os.utime(cache._path("old"), (0, 0))
+        os.utime(cache._path("used"), (1, 1))
+        cache.load("old")
+
+        cache.store("new", "12345")
+
+        assert os.path.exists(cache._path("old"))
+        assert not os.path.exists(cache._path("used"))
+        assert os.path.exists(cache._path("new"))
+
+    @staticmethod
+    @pytest.mark.usefixtures("fake_bintools")
+    def test_entries_removed_by_another_process_are_skipped(tmp_path):
+        """Test that entries vanishing between listing and removal are ignored."""
+        cache = step_cache.StepCache(str(tmp_path / "cache"), max_bytes=4)
+        for key in ("gone", "old", "new"):
+            cache.store(key, "12345", evict=False)
+        scandir = os.scandir
+
+        @contextlib.contextmanager
+        def racing_scandir(path):
+            with scandir(path) as it:
+                entries = list(it)
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(cache._path("gone"))
+            yield iter(entries)
+
+        with patch.object(step_cache.os, "scandir", racing_scandir):
+            assert cache.stats()["entries"] == 2  # noqa: PLR2004
+            with patch.object(step_cache.os, "remove", side_effect=FileNotFoundError):
+                assert cache.evict() == 0
+                cache.clear()
+            assert cache.evict() == 2  # noqa: PLR2004
+
+    @staticmethod
+    @pytest.mark.usefixtures("fake_bintools")
+    def test_entry_larger_than_cap_is_not_kept(tmp_path):
+        """Test that store reports an entry evicted right away."""
+        cache = step_cache.StepCache(str(tmp_path / "cache"), max_bytes=2)
+
+        assert cache.store("big", "12345") is False
+        assert cache.stats()["entries"] == 0
+
+    @staticmethod
+    @pytest.mark.usefixtures("fake_bintools")
+    def test_clear_removes_entries_and_stats(tmp_path):
+        """Test that clear empties the cache."""
+        cache = step_cache.StepCache(str(tmp_path / "cache"))
+        cache.store("key", "shape")
+        cache.load("key")
+
+        cache.clear()
+
+        assert cache.stats() == {
+            "entries": 0,
+            "bytes": 0,
+            "max_bytes": cache.max_bytes,
+            "hits": 0,
+            "misses": 0,
+        }
+
+    @staticmethod
+    @patch.object(step_cache, "log", MagicMock())
+    @patch.object(step_cache, "bintools")
+    def test_write_failure_is_not_fatal(mock_bintools, tmp_path):
+        """Test that a failing BRep write leaves no entry behind."""
+        cache = step_cache.StepCache(str(tmp_path / "cache"))
+        mock_bintools.Write.side_effect = RuntimeError("disk")
+
+        assert cache.store("key", MagicMock()) is False
+        assert os.listdir(cache.directory) == []
+
+    @staticmethod
+    def test_negative_size_raises():
+        """Test that a negative size cap is rejected."""
+        with pytest.raises(ValueError, match="negative"):
+            step_cache.StepCache("cache", max_bytes=-1)
@@ -0,0 +1,75 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.operations.streaming."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from intersector.operations import streaming
+
+PLANES = [((0, 0, 0), (0, 0, 1)), ((0, 0, 5), (0, 0, 1))]
+
+
+def _roots(*names):
+    return [(i, len(names), name) for i, name in enumerate(names, start=1)]
+
+
+class TestSectionStepStreaming:
+    """Tests for the section_step_streaming function."""
+
+    @staticmethod
+    @patch.object(streaming, "log", MagicMock())
+    @patch.object(streaming, "FaceIndex", MagicMock())
+    @patch.object(streaming, "combine_shapes", side_effect=tuple)
+    @patch.object(streaming, "is_intersection_valid", side_effect=bool)
+    @patch.object(streaming, "intersect_with_plane")
+    @patch.object(streaming, "iter_step_roots")
+    def test_partial_sections_are_merged_per_plane(
+        mock_roots, mock_intersect, _mock_valid, _mock_combine
+    ):
+        """Test that each plane gathers its sections over all roots."""
+        mock_roots.return_value = _roots("a", "b")
+        # Plane z=5 only cuts root b.
+        mock_intersect.side_effect = lambda s, p, n, index: (
+            f"{s}@{p[2]}" if s == "b" or p[2] == 0 else ""
+        )
+
+        merged = streaming.section_step_streaming("plant.stp", PLANES)
+
+        assert merged == [("a@0", "b@0"), ("b@5",)]
+
+    @staticmethod
+    @patch.object(streaming, "log", MagicMock())
+    @patch.object(streaming, "is_intersection_valid", return_value=True)
+    @patch.object(streaming, "intersect_with_plane", return_value="cut")
+    @patch.object(streaming, "section_polylines")
+    @patch.object(streaming, "iter_step_roots")
+    def test_polylines_are_sampled_root_by_root(
+        mock_roots, mock_polylines, _mock_intersect, _mock_valid
+    ):
+        """Test that sections are sampled before the next root is read."""
+        mock_roots.return_value = _roots("a", "b")
+        mock_polylines.side_effect = lambda result, deflection: [np.zeros((2, 3))]
+
+        merged = streaming.section_step_streaming(
+            "plant.stp", PLANES[:1], polylines=True
+        )
+
+        assert len(merged[0]) == mock_polylines.call_count == len(_roots("a", "b"))
+
+    @staticmethod
+    @patch.object(streaming, "log", MagicMock())
+    @patch.object(streaming, "TriangleMesh")
+    @patch.object(streaming, "iter_step_roots")
+    def test_mesh_engine_concatenates_segments(mock_roots, mock_mesh_class):
+        """Test that mesh segments of all roots are concatenated."""
+        mock_roots.return_value = _roots("a", "b")
+        mock_mesh_class.from_shape.return_value.sections.side_effect = [
+            [np.zeros((1, 2, 3)), np.zeros((0, 2, 3))],
+            [np.zeros((2, 2, 3)), np.zeros((0, 2, 3))],
+        ]
+
+        merged = streaming.section_step_streaming("plant.stp", PLANES, "mesh")
+
+        assert [len(m) for m in merged] == [3, 0]
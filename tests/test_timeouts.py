@@ -0,0 +1,157 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.operations.timeouts.
+
+The worker processes are forked rather than spawned, so they inherit the
+patched functions.
+"""
+
+import multiprocessing
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from intersector.operations import timeouts
+from intersector.operations.timeouts import (
+    TimedSectioner,
+    intersect_with_planes_timeout,
+)
+
+SLOW_Z = 9
+
+
+def _section(shape, point, normal, index):
+    """Return a fake section, hanging on the plane at ``SLOW_Z``.
+
+    Returns:
+        str: The section, named after the plane height.
+
+    Raises:
+        ValueError: For a plane with a negative height.
+
+    """
+    del shape, normal, index
+    if point[2] == SLOW_Z:
+        time.sleep(30)
+    if point[2] < 0:
+        raise ValueError("Bad geometry")
+    return f"section@{point[2]}"
+
+
+@pytest.fixture(name="worker")
+def _worker():
+    """Patch the OpenCascade calls of the worker and the fallback.
+
+    Yields:
+        MagicMock: The patched TriangleMesh.
+
+    """
+    with (
+        patch.object(timeouts, "_CONTEXT", multiprocessing.get_context("fork")),
+        patch.object(timeouts, "intersect_with_plane", _section),
+        patch.object(timeouts, "FaceIndex"),
+        patch.object(timeouts, "shape_to_bytes", side_effect=str.encode),
+        patch.object(timeouts, "shape_from_bytes", side_effect=bytes.decode),
+        patch.object(timeouts, "segments_to_shape", side_effect=len),
+        patch.object(timeouts, "combine_shapes", side_effect=list),
+        patch.object(timeouts, "TriangleMesh") as mock_mesh,
+        patch.object(timeouts, "BRepBuilderAPI_Copy") as mock_copy,
+        patch.object(timeouts, "log", MagicMock()),
+    ):
+        mock_copy.return_value.Shape.side_effect = lambda: "copy"
+        mock_mesh.from_shape.return_value.section.return_value = np.zeros((3, 2, 3))
+        yield mock_mesh
+
+
+class TestTimedSectioner:
+    """Tests for the TimedSectioner class."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"timeout": 0}, "Timeout must be positive"),
+            ({"timeout": 1, "fallback": "retry"}, "Unknown timeout fallback"),
+            ({"timeout": 1, "deflection": 0}, "Deflection must be positive"),
+        ],
+    )
+    def test_invalid_settings_raise(kwargs, message):
+        """Test that bad budgets, fallbacks and deflections are rejected."""
+        with pytest.raises(ValueError, match=message):
+            TimedSectioner("shape", **kwargs)
+
+    @staticmethod
+    @pytest.mark.usefixtures("worker")
+    def test_fast_sections_are_exact():
+        """Test that sections within the budget come from the worker."""
+        with TimedSectioner("shape", timeout=10) as sectioner:
+            assert sectioner.section((0, 0, 1), (0, 0, 1)) == ("section@1", False)
+            assert sectioner.section((0, 0, 2), (0, 0, 1)) == ("section@2", False)
+            assert sectioner.timed_out == 0
+
+    @staticmethod
+    def test_slow_section_falls_back_to_mesh(worker):
+        """Test that a hung section is killed and approximated."""
+        with TimedSectioner("shape", timeout=0.5, deflection=0.2) as sectioner:
+            start = time.perf_counter()
+            result = sectioner.section((0, 0, SLOW_Z), (0, 0, 1))
+
+            assert time.perf_counter() - start < 10  # noqa: PLR2004
+            assert result == (3, True)
+            # The caller's shape is not tessellated.
+            worker.from_shape.assert_called_once_with("copy", 0.2)
+            # A fresh worker takes the next plane.
+            assert sectioner.section((0, 0, 1), (0, 0, 1)) == ("section@1", False)
+            assert sectioner.timed_out == 1
+
+    @staticmethod
+    def test_slow_section_can_be_skipped(worker):
+        """Test that the skip fallback leaves the plane empty."""
+        with TimedSectioner("shape", timeout=0.5, fallback="skip") as sectioner:
+            assert sectioner.section((0, 0, SLOW_Z), (0, 0, 1)) == ([], True)
+        worker.from_shape.assert_not_called()
+
+    @staticmethod
+    @pytest.mark.usefixtures("worker")
+    def test_hung_load_raises():
+        """Test that a worker stuck loading the shape is killed."""
+        with (
+            patch.object(timeouts, "_LOAD_TIMEOUT", 0.5),
+            patch.object(timeouts, "FaceIndex", lambda shape: time.sleep(30)),
+            TimedSectioner("shape", timeout=0.1) as sectioner,
+        ):
+            start = time.perf_counter()
+            with pytest.raises(RuntimeError, match="did not load the shape"):
+                sectioner.section((0, 0, 1), (0, 0, 1))
+
+            assert time.perf_counter() - start < 10  # noqa: PLR2004
+            assert sectioner._process is None  # noqa: SLF001
+
+    @staticmethod
+    @pytest.mark.usefixtures("worker")
+    def test_worker_errors_are_reraised():
+        """Test that a failing section raises in the caller."""
+        with TimedSectioner("shape", timeout=10) as sectioner:
+            with pytest.raises(ValueError, match="Bad geometry"):
+                sectioner.section((0, 0, -1), (0, 0, 1))
+            assert sectioner.section((0, 0, 1), (0, 0, 1)) == ("section@1", False)
+
+
+class TestIntersectWithPlanesTimeout:
+    """Tests for the intersect_with_planes_timeout function."""
+
+    @staticmethod
+    @pytest.mark.usefixtures("worker")
+    def test_results_keep_order_and_report_timeouts():
+        """Test that the planes over the budget are reported by position."""
+        planes = [((0, 0, z), (0, 0, 1)) for z in (1, SLOW_Z, 2)]
+        timed_out = []
+
+        results = list(
+            intersect_with_planes_timeout("shape", planes, 0.5, timed_out=timed_out)
+        )
+
+        assert results == ["section@1", 3, "section@2"]
+        assert timed_out == [1]
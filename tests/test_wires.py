@@ -0,0 +1,178 @@
+# Copyright (c) 2025 Yannis Arapakis
+# Licensed under the MIT License. See LICENSE file for details.
+"""Unit tests for intersector.operations.wires."""
+
+import numpy as np
+import pytest
+
+from intersector.operations import wires
+
+Z = (0.0, 0.0, 1.0)
+
+
+def _polygon(count, radius=1.0, center=(0.0, 0.0)):
+    """Return the vertices of a regular polygon in the XY plane.
+
+    Returns:
+        numpy.ndarray: ``(count, 3)`` counterclockwise vertices.
+
+    """
+    angles = np.linspace(0.0, 2 * np.pi, count, endpoint=False)
+    return np.column_stack(
+        [
+            center[0] + radius * np.cos(angles),
+            center[1] + radius * np.sin(angles),
+            np.zeros(count),
+        ]
+    )
+
+
+def _segments(points):
+    """Split a closed polygon into its ``(2, 3)`` edge segments.
+
+    Returns:
+        list[numpy.ndarray]: One segment per polygon edge.
+
+    """
+    return list(np.stack([points, np.roll(points, -1, axis=0)], axis=1))
+
+
+class TestChainSegments:
+    """Tests for the chain_segments function."""
+
+    @staticmethod
+    def test_shuffled_and_flipped_pieces_form_one_loop():
+        """Test that a scrambled closed polygon is chained back in order."""
+        count = 20000
+        segments = np.array(_segments(_polygon(count)))
+        rng = np.random.default_rng(0)
+        order = rng.permutation(count)
+        flip = rng.random(count) < 0.5  # noqa: PLR2004
+        pieces = segments[order]
+        pieces[flip] = pieces[flip][:, ::-1]
+
+        ((steps, closed),) = wires.chain_segments(pieces[:, 0], pieces[:, 1])
+
+        assert closed
+        assert sorted(i for i, _ in steps) == list(range(count))
+        walked = np.array([pieces[i][::-1] if rev else pieces[i] for i, rev in steps])
+        np.testing.assert_allclose(walked[:, 1], np.roll(walked[:, 0], -1, axis=0))
+
+    @staticmethod
+    def test_open_chain_starts_at_a_free_end():
+        """Test that an open chain is walked from one of its ends."""
+        points = np.array([(0, 0, 0), (1, 0, 0), (2, 0, 0), (3, 0, 0)], dtype=float)
+        starts, ends = points[[1, 0, 2]], points[[2, 1, 3]]
+
+        ((steps, closed),) = wires.chain_segments(starts, ends)
+
+        assert not closed
+        assert [i for i, _ in steps] in ([1, 0, 2], [2, 0, 1])
+
+    @staticmethod
+    def test_ends_within_tolerance_are_joined():
+        """Test that nearly coincident end points are welded."""
+        starts = [(0, 0, 0), (1 + 1e-7, 0, 0)]
+        ends = [(1, 0, 0), (0, 1e-7, 0)]
+
+        ((_, closed),) = wires.chain_segments(starts, ends, tolerance=1e-6)
+        apart = wires.chain_segments(starts, ends, tolerance=1e-9)
+
+        assert closed
+        assert [c for _, c in apart] == [False, False]
+
+    @staticmethod
+    def test_ends_across_a_cell_boundary_are_joined():
+        """Test that close end points in neighbouring grid cells are welded."""
+        points = np.array([(5e-5, 0, 0), (9e-4, 0, 0), (1.1e-3, 0, 0)])
+
+        vertices = wires._weld(points, 1e-3)
+        apart = wires._weld(np.array([(0, 0, 0), (1.9e-3, 0, 0)]), 1e-3)
+
+        assert len(set(vertices.tolist())) == 1
+        assert len(set(apart.tolist())) == 2  # noqa: PLR2004
+
+    @staticmethod
+    def test_loop_closes_across_a_cell_boundary():
+        """Test that a loop whose ends straddle a cell boundary is closed."""
+        # The first piece starts in the same cell as the loop, but too far
+        # from both of its ends to be joined with them.
+        starts = [(5e-5, 9e-4, 0), (9e-4, 0, 0), (1, 0, 0)]
+        ends = [(0, 5, 0), (1, 0, 0), (1.1e-3, 0, 0)]
+
+        chains = wires.chain_segments(starts, ends, tolerance=1e-3)
+
+        assert sorted((len(steps), closed) for steps, closed in chains) == [
+            (1, False),
+            (2, True),
+        ]
+
+    @staticmethod
+    def test_single_closed_piece():
+        """Test that a piece ending where it starts is a closed chain."""
+        assert wires.chain_segments([(1, 0, 0)], [(1, 0, 0)]) == [([(0, False)], True)]
+
+    @staticmethod
+    def test_empty_input_and_bad_tolerance():
+        """Test the degenerate inputs."""
+        assert wires.chain_segments([], []) == []
+        with pytest.raises(ValueError, match="Tolerance must be positive"):
+            wires.chain_segments([(0, 0, 0)], [(1, 0, 0)], tolerance=0)
+
+
+class TestChainPolylines:
+    """Tests for the chain_polylines function."""
+
+    @staticmethod
+    def test_shared_points_are_not_repeated():
+        """Test that joined polylines keep each shared point once."""
+        polylines = [
+            np.array([(1, 0, 0), (1.5, 0.5, 0), (2, 0, 0)], dtype=float),
+            np.array([(0, 0, 0), (1, 0, 0)], dtype=float),
+        ]
+
+        ((points, closed),) = wires.chain_polylines(polylines)
+
+        assert not closed
+        assert len(points) == 4  # noqa: PLR2004
+        assert {tuple(points[0]), tuple(points[-1])} == {(0, 0, 0), (2, 0, 0)}
+
+
+class TestFaces:
+    """Tests for the loop nesting and face ordering."""
+
+    @staticmethod
+    def test_signed_area_follows_orientation():
+        """Test the area sign of counterclockwise and clockwise polygons."""
+        square = _polygon(4, radius=np.sqrt(2))
+
+        assert wires.signed_area(square, Z) == pytest.approx(4.0)
+        assert wires.signed_area(square[::-1], Z) == pytest.approx(-4.0)
+        assert wires.signed_area(square, (0, 0, -1)) == pytest.approx(-4.0)
+
+    @staticmethod
+    def test_holes_and_islands():
+        """Test that loops alternate between outer boundaries and holes."""
+        loops = [
+            _polygon(32, radius=1.0),
+            _polygon(32, radius=10.0),
+            _polygon(32, radius=5.0),
+            _polygon(32, radius=1.0, center=(7.0, 0.0)),
+        ]
+
+        faces = wires.nest_loops(loops, Z)
+
+        assert faces == [(1, [2, 3]), (0, [])]
+
+    @staticmethod
+    def test_face_polylines_orient_outer_and_holes():
+        """Test that outer loops turn counterclockwise and holes clockwise."""
+        segments = _segments(_polygon(16, radius=5.0)[::-1])
+        segments += _segments(_polygon(16, radius=1.0))
+        segments.append(np.array([(20, 0, 0), (21, 0, 0)], dtype=float))
+
+        outer, hole = wires.face_polylines(segments, Z)
+
+        assert wires.signed_area(outer, Z) > 0
+        assert wires.signed_area(hole, Z) < 0
+        assert np.abs(outer).max() == pytest.approx(5.0)